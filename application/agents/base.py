@@ -18,7 +18,10 @@ from application.llm.handlers.base import (
     ToolCall,
     _bound_tool_response_for_llm,
 )
-from application.guardrails.config import DEFAULT_BLOCK_MESSAGE as GUARDRAIL_DEFAULT_MESSAGE
+from application.guardrails.config import (
+    DEFAULT_BLOCK_MESSAGE as GUARDRAIL_DEFAULT_MESSAGE,
+    AgentConfig,
+)
 from application.guardrails.runtime import (
     build_engine as build_guardrail_engine,
     resolve_config as resolve_guardrails_config,
@@ -28,6 +31,12 @@ from application.guardrails.types import Action, Stage, resolve_tool_result
 from application.llm.handlers.handler_creator import LLMHandlerCreator
 from application.llm.llm_creator import LLMCreator
 from application.logging import build_stack_data, log_activity, LogContext
+from application.semantic_cache import (
+    context_fingerprint,
+    get_semantic_cache,
+    resolve_threshold,
+    resolve_ttl as resolve_semantic_cache_ttl,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +46,7 @@ class BaseAgent(ABC):
     _guardrail_engine = None
     _guardrail_engine_built = False
     guardrails_config = None
+    semantic_cache_config = None
     request_id = None
 
     def __init__(
@@ -170,6 +180,7 @@ class BaseAgent(ABC):
         self._guardrail_engine = None
         self._guardrail_engine_built = False
         self._guardrail_cache: Dict = {}
+        self.semantic_cache_config = AgentConfig.parse(agent_config).semantic_cache
 
 
     # ---- Guardrails ----
@@ -289,8 +300,91 @@ class BaseAgent(ABC):
             )
             self.flush_guardrail_audit()
             return
-        yield from self._gen_inner(query, log_context)
-        yield from self._emit_responses_metadata()
+        replayed = yield from self._gen_with_semantic_cache(query, log_context)
+        if not replayed:
+            yield from self._emit_responses_metadata()
+
+    # ---- Semantic answer cache ----
+
+    def _semantic_cache_context(self) -> Optional[str]:
+        """Context fingerprint when this turn may use the semantic cache.
+
+        Only self-contained first turns qualify: history, attachments and
+        structured output all shape the answer beyond the question.
+        """
+        config = self.semantic_cache_config
+        if config is None or not config.enabled or not self.agent_id:
+            return None
+        if (
+            self.chat_history
+            or self.attachments
+            or self.multimodal_content
+            or self.compressed_summary
+            or self.json_schema is not None
+            or self.json_object
+        ):
+            return None
+        return context_fingerprint(
+            self.upstream_model_id, self.prompt, self.retrieved_docs, self.llm_params
+        )
+
+    def _gen_with_semantic_cache(
+        self, query: str, log_context: LogContext
+    ) -> Generator[Dict, None, bool]:
+        """Run ``_gen_inner``, or replay a cached answer to a similar question.
+
+        Returns True when the answer was replayed from the cache.
+        """
+        context = self._semantic_cache_context()
+        cache = get_semantic_cache() if context else None
+        if cache is None:
+            yield from self._gen_inner(query, log_context)
+            return False
+
+        from application.vectorstore.base import get_embeddings
+
+        config = self.semantic_cache_config
+        agent_id = str(self.agent_id)
+        ttl = config.ttl_seconds or resolve_semantic_cache_ttl()
+        threshold = (
+            config.threshold if config.threshold is not None else resolve_threshold()
+        )
+        try:
+            embed = get_embeddings().embed_query
+            hit = cache.lookup(agent_id, context, query, embed, threshold, ttl)
+        except Exception as e:
+            logger.warning("Semantic cache lookup failed: %s", e)
+            embed, hit = None, None
+        logger.info(
+            "semantic_cache_lookup",
+            extra={
+                "agent_id": agent_id,
+                "hit": hit is not None,
+                "score": round(hit.score, 4) if hit is not None else None,
+            },
+        )
+        if hit is not None:
+            yield {"answer": hit.answer}
+            yield {"sources": self.retrieved_docs}
+            yield {"tool_calls": []}
+            return True
+
+        answer: List[str] = []
+        cacheable = embed is not None
+        for event in self._gen_inner(query, log_context):
+            if isinstance(event, dict):
+                if "answer" in event:
+                    answer.append(event["answer"])
+                elif "error" in event:
+                    cacheable = False
+            yield event
+        # Tool results can be live data; only self-contained answers are kept.
+        if cacheable and answer and not self.tool_calls:
+            try:
+                cache.store(agent_id, context, query, "".join(answer), embed, ttl)
+            except Exception as e:
+                logger.warning("Semantic cache store failed: %s", e)
+        return False
 
     def _emit_responses_metadata(self) -> Generator[Dict, None, None]:
         """Surface Responses continuity and usage for durable next turns."""
@@ -579,9 +673,15 @@ class BaseAgent(ABC):
 
     def _calculate_current_context_tokens(self, messages: List[Dict]) -> int:
         from application.api.answer.services.compression.token_counter import (
-            TokenCounter,
+            MessageTokenTally,
         )
-        return TokenCounter.count_message_tokens(messages)
+
+        # One tally per agent: the tool loop re-checks the same growing list
+        # before every call, and only new or replaced messages get recounted.
+        tally = getattr(self, "_context_token_tally", None)
+        if tally is None:
+            tally = self._context_token_tally = MessageTokenTally()
+        return tally.count(messages)
 
     def _check_context_limit(self, messages: List[Dict]) -> bool:
         from application.core.model_utils import get_token_limit
@@ -605,6 +705,21 @@ class BaseAgent(ABC):
             logger.error(f"Error checking context limit: {str(e)}", exc_info=True)
             return False
 
+    def _context_headroom(self, messages: List[Dict]) -> Optional[int]:
+        """Tokens left before :meth:`_check_context_limit` trips; ``None`` if unknown."""
+        from application.core.model_utils import get_token_limit
+
+        try:
+            current_tokens = self._calculate_current_context_tokens(messages)
+            context_limit = get_token_limit(
+                self.model_id, user_id=self.model_user_id or self.user
+            )
+        except Exception as e:
+            logger.error(f"Error measuring context headroom: {str(e)}", exc_info=True)
+            return None
+        threshold = int(context_limit * settings.COMPRESSION_THRESHOLD_PERCENTAGE)
+        return threshold - current_tokens
+
     def _validate_context_size(self, messages: List[Dict]) -> None:
         from application.core.model_utils import get_token_limit
 
@@ -668,8 +783,10 @@ class BaseAgent(ABC):
         (the usual culprit) and raises when even that cannot fit — BEFORE
         the usage decorators run, so a hopeless payload costs nothing.
         """
+        from application.api.answer.services.compression.token_counter import (
+            TokenCounter,
+        )
         from application.core.model_utils import get_token_limit
-        from application.utils import num_tokens_from_string
 
         context_limit = get_token_limit(
             self.model_id, user_id=self.model_user_id or self.user
@@ -688,7 +805,7 @@ class BaseAgent(ABC):
                 if (
                     message.get("role") == "tool"
                     and isinstance(content, str)
-                    and num_tokens_from_string(content) > per_message_cap
+                    and TokenCounter.count_text(content) > per_message_cap
                 ):
                     message["content"] = self._truncate_text_middle(
                         content, per_message_cap
@@ -1,3 +1,5 @@
+import importlib
+import inspect
 import logging
 import re
 import uuid
@@ -13,6 +15,7 @@ from application.agents.default_tools import (
     resolve_tool_by_id,
     synthesized_default_tools,
 )
+from application.agents.tools.base import Tool
 from application.agents.tools.tool_action_parser import ToolActionParser
 from application.agents.tools.tool_manager import ToolManager
 from application.guardrails.types import Stage as GuardrailStage, resolve_tool_result
@@ -56,6 +59,29 @@ def _dedupable_tool_names() -> frozenset:
     return frozenset(BUILTIN_AGENT_TOOLS) | frozenset(getattr(settings, "DEFAULT_CHAT_TOOLS", None) or [])
 
 
+# Tool module name -> its Tool subclass's ``parallel_safe`` flag.
+_PARALLEL_SAFE: Dict[str, bool] = {}
+
+
+def _tool_is_parallel_safe(tool_name: str) -> bool:
+    """``parallel_safe`` of the Tool class in ``application.agents.tools.<tool_name>``."""
+    if tool_name in _PARALLEL_SAFE:
+        return _PARALLEL_SAFE[tool_name]
+    safe = False
+    if tool_name.isidentifier():
+        try:
+            module = importlib.import_module(f"application.agents.tools.{tool_name}")
+        except ImportError:
+            module = None
+        if module is not None:
+            for _, obj in inspect.getmembers(module, inspect.isclass):
+                if issubclass(obj, Tool) and obj is not Tool and obj.__module__ == module.__name__:
+                    safe = obj.parallel_safe is True
+                    break
+    _PARALLEL_SAFE[tool_name] = safe
+    return safe
+
+
 def _requires_approval(tool: Dict, action: Dict) -> bool:
     """Effective approval gate for one action of a tool row.
 
@@ -831,6 +857,35 @@ class ToolExecutor:
 
         return None
 
+    def is_parallel_safe(self, tools_dict: Dict, call, llm_class_name: str) -> bool:
+        """Whether ``call`` may run concurrently with its parallel-safe siblings.
+
+        Only resolvable calls to a server-side tool whose class sets
+        ``parallel_safe`` qualify; ``api_tool`` and client-side tools never do,
+        and MCP tools only while the session pool is on.
+        Pauses are not considered here — callers check those separately.
+        """
+        parser = ToolActionParser(llm_class_name, name_mapping=self._name_to_tool)
+        tool_id, action_name, _ = parser.parse_args(call)
+        if tool_id is None or action_name is None or tool_id not in tools_dict:
+            return False
+        tool_data = tools_dict[tool_id]
+        if tool_data.get("client_side"):
+            return False
+        tool_name = tool_data.get("name")
+        if not isinstance(tool_name, str) or tool_name == "api_tool":
+            return False
+        if not _tool_is_parallel_safe(tool_name):
+            return False
+        if tool_name == "mcp_tool":
+            from application.agents.tools.mcp_tool import MCPTool
+
+            # Loaded in query mode (see ``_get_or_load_tool``); without the
+            # session pool each call opens its own loop on the shared client.
+            config = dict(tool_data.get("config") or {}, query_mode=True)
+            return MCPTool.uses_session_pool(config)
+        return True
+
     def _remote_device_requires_approval(
         self,
         tool_data: Dict,
@@ -3,6 +3,11 @@ from abc import ABC, abstractmethod
 
 class Tool(ABC):
     internal: bool = False
+    # True for tools whose actions have no side effects a sibling call could
+    # observe and that tolerate concurrent ``execute_action`` calls on one
+    # instance. Calls to them in the same parallel batch may run at once
+    # (see ``LLMHandler.handle_tool_calls``); every other tool runs serially.
+    parallel_safe: bool = False
 
     @abstractmethod
     def execute_action(self, action_name: str, **kwargs):
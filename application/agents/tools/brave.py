@@ -14,6 +14,8 @@ class BraveSearchTool(Tool):
     Requires an API key for authentication.
     """
 
+    parallel_safe = True
+
     def __init__(self, config):
         self.config = config
         self.token = config.get("token", "")
@@ -8,6 +8,8 @@ class CryptoPriceTool(Tool):
     A tool for retrieving cryptocurrency prices using the CryptoCompare public API
     """
 
+    parallel_safe = True
+
     def __init__(self, config):
         self.config = config
 
@@ -17,6 +17,8 @@ class DuckDuckGoSearchTool(Tool):
     A tool for performing web and image searches using DuckDuckGo.
     """
 
+    parallel_safe = True
+
     def __init__(self, config):
         self.config = config
         self.timeout = config.get("timeout", DEFAULT_TIMEOUT)
@@ -0,0 +1,330 @@
+"""Long-lived MCP client sessions on one background event loop per process.
+
+``MCPTool`` used to spin up a fresh event loop for every operation and open
+``async with client`` around it, so each ``call_tool`` paid a full transport
+connect plus MCP ``initialize`` handshake — ten calls to a remote server in
+one agent turn meant ten handshakes. This module keeps initialized sessions
+open instead:
+
+* one daemon thread runs an asyncio loop; synchronous callers submit
+  coroutines to it with :meth:`MCPSessionManager.run`;
+* one session per ``MCPTool._cache_key``, bounded by
+  ``MCP_SESSION_POOL_MAX`` (least recently used closed first);
+* a session idle for ``MCP_SESSION_HEALTHCHECK_SECONDS`` is pinged before
+  reuse and reopened if the ping fails;
+* a session idle for ``MCP_SESSION_IDLE_SECONDS`` is closed by a periodic
+  sweep;
+* an error that is not a tool / protocol error closes the session, and
+  read-only operations are retried once on a fresh one. ``call_tool`` is not
+  retried — the server may already have run it.
+
+A FastMCP ``Client`` is bound to the loop it connected on, so a pooled client
+is only ever touched from the manager's loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import mcp.shared.exceptions as mcp_exceptions
+from fastmcp.exceptions import ClientError, FastMCPError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 64
+DEFAULT_IDLE_SECONDS = 300
+DEFAULT_HEALTHCHECK_SECONDS = 60
+
+# The server answered: the session itself is fine.
+_SESSION_OK_ERRORS = tuple(
+    exc
+    for exc in (
+        FastMCPError,
+        ClientError,
+        getattr(mcp_exceptions, "McpError", None),
+        getattr(mcp_exceptions, "MCPError", None),
+    )
+    if exc is not None
+)
+
+
+def _int_setting(name: str, default: int) -> int:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+@dataclass
+class _Session:
+    client: Any
+    last_used: float
+    opened: bool = False
+    # Operations currently running on the session; the sweep skips it then.
+    active: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class MCPSessionManager:
+    """Pool of connected FastMCP clients driven by a private event loop."""
+
+    def __init__(
+        self,
+        max_sessions: int,
+        idle_seconds: float,
+        healthcheck_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self.healthcheck_seconds = healthcheck_seconds
+        self._clock = clock
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self.handshakes = 0
+        self.reuses = 0
+        self.reconnects = 0
+        self.evictions = 0
+
+    # -- Loop thread -----------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._pid != os.getpid():
+                # Forked child: the parent's loop thread did not come along,
+                # and its connections belong to the parent.
+                self._loop = None
+                self._thread = None
+                self._sessions = OrderedDict()
+            if self._loop is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._serve, args=(loop,), name="mcp-sessions", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            return self._loop
+
+    def _serve(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        if self.idle_seconds > 0:
+            loop.call_later(self._sweep_interval(), self._schedule_sweep)
+        loop.run_forever()
+
+    def _sweep_interval(self) -> float:
+        return max(1.0, min(60.0, self.idle_seconds / 2))
+
+    def _schedule_sweep(self) -> None:
+        loop = asyncio.get_running_loop()
+        loop.create_task(self._sweep())
+        loop.call_later(self._sweep_interval(), self._schedule_sweep)
+
+    def run(
+        self,
+        key: str,
+        client: Any,
+        operation: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+        *,
+        retry: bool = False,
+    ) -> Any:
+        """Run ``operation()`` on the pooled session for ``key``; block for it.
+
+        Args:
+            client: The FastMCP client for ``key``. A session opened on a
+                different client object (rebuilt after re-auth or cache
+                expiry) is closed and replaced.
+            operation: Coroutine factory using ``client``'s open session.
+            retry: Re-run once on a fresh session after a connection-level
+                failure. Only for operations safe to repeat.
+
+        Raises:
+            concurrent.futures.TimeoutError: After ``timeout`` seconds; the
+                operation is cancelled.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("MCPSessionManager.run called from its own loop")
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(key, client, operation, retry), loop
+        )
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    # -- On the loop -----------------------------------------------------
+
+    async def _run(self, key: str, client: Any, operation, retry: bool) -> Any:
+        session = await self._acquire(key, client)
+        session.active += 1
+        try:
+            return await operation()
+        except _SESSION_OK_ERRORS:
+            raise
+        except Exception as e:
+            await self._discard(key, session)
+            if not retry:
+                raise
+            logger.info("MCP session %s failed (%s); reconnecting", key, e)
+            self.reconnects += 1
+            fresh = await self._acquire(key, client)
+            fresh.active += 1
+            try:
+                return await operation()
+            finally:
+                fresh.active -= 1
+                fresh.last_used = self._clock()
+        finally:
+            session.active -= 1
+            session.last_used = self._clock()
+
+    async def _acquire(self, key: str, client: Any) -> _Session:
+        session = self._sessions.get(key)
+        if session is not None and session.client is not client:
+            await self._discard(key, session)
+            session = None
+        if session is None:
+            session = _Session(client, self._clock())
+            self._sessions[key] = session
+            await self._evict_over_bound()
+        self._sessions.move_to_end(key)
+        async with session.lock:
+            if session.opened and not client.is_connected():
+                await self._close(session)
+            if session.opened and self._clock() - session.last_used >= self.healthcheck_seconds:
+                try:
+                    await client.ping()
+                except Exception as e:
+                    logger.info("MCP session %s failed its health check: %s", key, e)
+                    self.reconnects += 1
+                    await self._close(session)
+            if session.opened:
+                self.reuses += 1
+            else:
+                try:
+                    await client.__aenter__()
+                except BaseException:
+                    if self._sessions.get(key) is session:
+                        del self._sessions[key]
+                    raise
+                session.opened = True
+                self.handshakes += 1
+            session.last_used = self._clock()
+        return session
+
+    async def _close(self, session: _Session) -> None:
+        if not session.opened:
+            return
+        session.opened = False
+        try:
+            await session.client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug("Closing MCP session failed: %s", e)
+
+    async def _discard(self, key: str, session: _Session) -> None:
+        if self._sessions.get(key) is session:
+            del self._sessions[key]
+        await self._close(session)
+
+    async def _evict_over_bound(self) -> None:
+        while len(self._sessions) > self.max_sessions:
+            _, session = self._sessions.popitem(last=False)
+            self.evictions += 1
+            await self._close(session)
+
+    async def _sweep(self) -> None:
+        cutoff = self._clock() - self.idle_seconds
+        idle = [
+            (key, session)
+            for key, session in self._sessions.items()
+            if session.last_used < cutoff and not session.active and not session.lock.locked()
+        ]
+        for key, session in idle:
+            self.evictions += 1
+            await self._discard(key, session)
+
+    # -- Introspection / shutdown ----------------------------------------
+
+    def sweep(self) -> None:
+        """Close idle sessions now rather than at the next periodic sweep."""
+        loop = self._ensure_loop()
+        asyncio.run_coroutine_threadsafe(self._sweep(), loop).result()
+
+    def close(self) -> None:
+        """Close every session and stop the loop thread."""
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None or not thread.is_alive():
+            return
+
+        async def _close_all():
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            for session in sessions:
+                await self._close(session)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close_all(), loop).result(timeout=10)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=10)
+            self._loop = None
+            self._thread = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self._sessions),
+            "handshakes": self.handshakes,
+            "reuses": self.reuses,
+            "reconnects": self.reconnects,
+            "evictions": self.evictions,
+        }
+
+
+_MANAGER: Optional[MCPSessionManager] = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def resolve_max_sessions() -> int:
+    """Session pool bound from settings, defensively — 0 disables pooling."""
+    return _int_setting("MCP_SESSION_POOL_MAX", DEFAULT_MAX_SESSIONS)
+
+
+def get_session_manager() -> Optional[MCPSessionManager]:
+    """Return this process's session manager, or ``None`` when disabled."""
+    global _MANAGER
+    if _MANAGER is not None:
+        return _MANAGER
+    max_sessions = resolve_max_sessions()
+    if max_sessions <= 0:
+        return None
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = MCPSessionManager(
+                max_sessions,
+                _int_setting("MCP_SESSION_IDLE_SECONDS", DEFAULT_IDLE_SECONDS),
+                _int_setting("MCP_SESSION_HEALTHCHECK_SECONDS", DEFAULT_HEALTHCHECK_SECONDS),
+            )
+    return _MANAGER
+
+
+def session_stats() -> Dict[str, int]:
+    """Counters for the process manager; all zeros when it is disabled."""
+    manager = get_session_manager()
+    if manager is None:
+        return {"sessions": 0, "handshakes": 0, "reuses": 0, "reconnects": 0, "evictions": 0}
+    return manager.stats()
@@ -1,6 +1,7 @@
 import asyncio
 import base64
 import concurrent.futures
+import hashlib
 import json
 import logging
 import time
@@ -20,6 +21,8 @@ from pydantic import AnyHttpUrl, ValidationError
 from redis import Redis
 
 from application.agents.tools.base import Tool
+from application.agents.tools import mcp_tools_cache
+from application.agents.tools.mcp_sessions import get_session_manager
 from application.api.user.tasks import mcp_oauth_task
 from application.cache import get_redis_instance
 from application.core.settings import settings
@@ -38,6 +41,11 @@ class MCPTool(Tool):
     Connect to remote Model Context Protocol (MCP) servers to access dynamic tools and resources.
     """
 
+    # Only while calls go through the session pool (see ``uses_session_pool``):
+    # its single loop multiplexes them. A per-operation connect would enter
+    # one shared ``Client`` from several threads' loops at once.
+    parallel_safe = True
+
     def __init__(self, config: Dict[str, Any], user_id: Optional[str] = None):
         """
         Initialize the MCP Tool with configuration.
@@ -120,6 +128,12 @@ class MCPTool(Tool):
 
         return f"{settings.API_URL.rstrip('/')}/api/mcp_server/callback"
 
+    @staticmethod
+    def _fingerprint(secret: str) -> str:
+        # The key names a shared client and its pooled session, so two
+        # credentials must never collide on it (a token prefix can).
+        return hashlib.sha256(str(secret).encode("utf-8")).hexdigest()[:16]
+
     def _generate_cache_key(self) -> str:
         """Generate a unique cache key for this MCP server configuration."""
         auth_key = ""
@@ -133,13 +147,14 @@ class MCPTool(Tool):
             token = self.auth_credentials.get(
                 "bearer_token", ""
             ) or self.auth_credentials.get("access_token", "")
-            auth_key = f"bearer:{token[:10]}..." if token else "bearer:none"
+            auth_key = f"bearer:{self._fingerprint(token)}" if token else "bearer:none"
         elif self.auth_type == "api_key":
             api_key = self.auth_credentials.get("api_key", "")
-            auth_key = f"apikey:{api_key[:10]}..." if api_key else "apikey:none"
+            auth_key = f"apikey:{self._fingerprint(api_key)}" if api_key else "apikey:none"
         elif self.auth_type == "basic":
             username = self.auth_credentials.get("username", "")
-            auth_key = f"basic:{username}"
+            password = self.auth_credentials.get("password", "")
+            auth_key = f"basic:{username}:{self._fingerprint(password)}"
         else:
             auth_key = "none"
         return f"{self.server_url}#{self.transport_type}#{auth_key}"
@@ -182,7 +197,11 @@ class MCPTool(Tool):
             ) or self.auth_credentials.get("access_token", "")
             if token:
                 auth = BearerAuth(token)
-        self._client = Client(transport, auth=auth)
+        self._client = Client(
+            transport,
+            auth=auth,
+            message_handler=mcp_tools_cache.ToolListChangedHandler(self._cache_key),
+        )
         _mcp_clients_cache[self._cache_key] = {
             "client": self._client,
             "created_at": time.time(),
@@ -260,22 +279,26 @@ class MCPTool(Tool):
         if not self._client:
             raise Exception("FastMCP client not initialized")
         async with self._client:
-            if operation == "ping":
-                return await self._client.ping()
-            elif operation == "list_tools":
-                tools_response = await self._client.list_tools()
-                self.available_tools = self._format_tools(tools_response)
-                return self.available_tools
-            elif operation == "call_tool":
-                tool_name = args[0]
-                tool_args = kwargs
-                return await self._client.call_tool(tool_name, tool_args)
-            elif operation == "list_resources":
-                return await self._client.list_resources()
-            elif operation == "list_prompts":
-                return await self._client.list_prompts()
-            else:
-                raise Exception(f"Unknown operation: {operation}")
+            return await self._execute_operation(operation, *args, **kwargs)
+
+    async def _execute_operation(self, operation: str, *args, **kwargs):
+        """Execute operation on the client's already-open session."""
+        if operation == "ping":
+            return await self._client.ping()
+        elif operation == "list_tools":
+            tools_response = await self._client.list_tools()
+            self.available_tools = self._format_tools(tools_response)
+            return self.available_tools
+        elif operation == "call_tool":
+            tool_name = args[0]
+            tool_args = kwargs
+            return await self._client.call_tool(tool_name, tool_args)
+        elif operation == "list_resources":
+            return await self._client.list_resources()
+        elif operation == "list_prompts":
+            return await self._client.list_prompts()
+        else:
+            raise Exception(f"Unknown operation: {operation}")
 
     _ERROR_MAP = [
         (concurrent.futures.TimeoutError, lambda op, t, _: f"Timed out after {t}s"),
@@ -289,7 +312,35 @@ class MCPTool(Tool):
         ("SSL", "certificate"): "SSL/TLS error",
     }
 
+    @staticmethod
+    def uses_session_pool(config: Dict[str, Any]) -> bool:
+        """Whether a tool built from ``config`` runs its operations on the session pool.
+
+        Interactive OAuth stays per-operation: its connect can wait minutes
+        for the user to authorize, which must not hold up the shared loop.
+        """
+        if config.get("auth_type", "none") == "oauth" and not config.get("query_mode", False):
+            return False
+        return get_session_manager() is not None
+
+    def _session_manager(self):
+        """The process MCP session pool, or ``None`` to connect per operation."""
+        config = {"auth_type": self.auth_type, "query_mode": self.query_mode}
+        return get_session_manager() if self.uses_session_pool(config) else None
+
     def _run_async_operation(self, operation: str, *args, **kwargs):
+        manager = self._session_manager() if self._client else None
+        if manager is not None:
+            try:
+                return manager.run(
+                    self._cache_key,
+                    self._client,
+                    lambda: self._execute_operation(operation, *args, **kwargs),
+                    timeout=self.timeout,
+                    retry=operation != "call_tool",
+                )
+            except Exception as e:
+                raise self._map_error(operation, e) from e
         try:
             try:
                 asyncio.get_running_loop()
@@ -302,7 +353,6 @@ class MCPTool(Tool):
                 return self._run_in_new_loop(operation, *args, **kwargs)
         except Exception as e:
             raise self._map_error(operation, e) from e
-            raise self._map_error(operation, e) from e
 
     def _run_in_new_loop(self, operation, *args, **kwargs):
         loop = asyncio.new_event_loop()
@@ -325,24 +375,46 @@ class MCPTool(Tool):
         logger.error("MCP %s failed: %s", operation, exc)
         return exc
 
-    def discover_tools(self) -> List[Dict]:
+    def discover_tools(self, force_refresh: bool = False) -> List[Dict]:
         """
         Discover available tools from the MCP server using FastMCP.
 
+        Listings are cached in Redis (see ``mcp_tools_cache``); a stale one is
+        returned at once and relisted in the background.
+
+        Args:
+            force_refresh: List the server's tools live and overwrite the cache.
+
         Returns:
             List of tool definitions from the server
         """
         if not self.server_url:
             return []
+        if not force_refresh:
+            cached = mcp_tools_cache.read_tools(self._cache_key)
+            if cached is not None:
+                tools, stale = cached
+                if stale:
+                    if not self._client:
+                        self._setup_client()
+                    mcp_tools_cache.refresh_in_background(
+                        self._cache_key, self._list_tools
+                    )
+                self.available_tools = tools
+                return self.available_tools
         if not self._client:
             self._setup_client()
         try:
-            tools = self._run_async_operation("list_tools")
-            self.available_tools = tools
+            self.available_tools = self._list_tools()
             return self.available_tools
         except Exception as e:
             raise Exception(f"Failed to discover tools from MCP server: {str(e)}")
 
+    def _list_tools(self) -> List[Dict]:
+        tools = self._run_async_operation("list_tools")
+        mcp_tools_cache.write_tools(self._cache_key, tools)
+        return tools
+
     def execute_action(self, action_name: str, **kwargs) -> Any:
         if not self.server_url:
             raise Exception("No MCP server configured")
@@ -463,7 +535,7 @@ class MCPTool(Tool):
             ping_error = str(e)
 
         try:
-            tools = self.discover_tools()
+            tools = self.discover_tools(force_refresh=True)
         except Exception as e:
             return {
                 "success": False,
@@ -507,7 +579,7 @@ class MCPTool(Tool):
             self._client = None
             self._setup_client()
             try:
-                tools = self.discover_tools()
+                tools = self.discover_tools(force_refresh=True)
                 return {
                     "success": True,
                     "message": f"Connected — found {len(tools)} tool{'s' if len(tools) != 1 else ''}.",
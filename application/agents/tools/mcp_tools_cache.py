@@ -0,0 +1,200 @@
+"""Redis-backed cache of MCP ``tools/list`` results, shared across processes.
+
+``MCPTool.discover_tools`` asked the remote server for its full tool list on
+every call, so saving a server right after testing it listed the tools twice
+and every web/worker process repeated the round trip. Listings are now kept
+in Redis under a digest of ``MCPTool._cache_key`` (server URL, transport and
+credential fingerprint — two credentials never share an entry):
+
+* for ``MCP_TOOLS_CACHE_TTL`` seconds an entry is served as is;
+* for a further ``MCP_TOOLS_CACHE_STALE_SECONDS`` it is still served, while
+  one process — whichever wins a short Redis lock — relists in the
+  background;
+* a server's ``notifications/tools/list_changed``, received on a pooled
+  session (see ``mcp_sessions``), deletes the entry;
+* ``discover_tools(force_refresh=True)`` skips the read and rewrites it.
+
+Without Redis every call lists live, as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastmcp.client.messages import MessageHandler
+
+from application.cache import get_redis_instance
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300
+DEFAULT_STALE_SECONDS = 3600
+_KEY_PREFIX = "mcp_tools:"
+# Upper bound on one background relist; the lock frees itself after it.
+_REFRESH_LOCK_SECONDS = 60
+
+_stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "invalidations": 0}
+
+_REFRESHER: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_REFRESHER_PID: Optional[int] = None
+_REFRESHER_LOCK = threading.Lock()
+
+
+def _int_setting(name: str, default: int) -> int:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def resolve_ttl() -> int:
+    """Seconds a listing is served without revalidation — 0 disables the cache."""
+    return _int_setting("MCP_TOOLS_CACHE_TTL", DEFAULT_TTL)
+
+
+def resolve_stale_seconds() -> int:
+    """Seconds past the TTL a listing is still served while it is refreshed."""
+    return _int_setting("MCP_TOOLS_CACHE_STALE_SECONDS", DEFAULT_STALE_SECONDS)
+
+
+def tools_cache_key(cache_key: str) -> str:
+    digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+    return f"{_KEY_PREFIX}{digest}"
+
+
+def _redis():
+    if resolve_ttl() <= 0:
+        return None
+    return get_redis_instance()
+
+
+def read_tools(cache_key: str) -> Optional[Tuple[List[Dict], bool]]:
+    """Return ``(tools, stale)`` for a cached listing, or ``None`` on a miss."""
+    redis_client = _redis()
+    if redis_client is None:
+        return None
+    try:
+        raw = redis_client.get(tools_cache_key(cache_key))
+    except Exception as e:
+        logger.error("Error reading MCP tools cache: %s", e)
+        return None
+    if raw is None:
+        _stats["misses"] += 1
+        return None
+    try:
+        entry = json.loads(raw)
+        tools = entry["tools"]
+        age = time.time() - float(entry["fetched_at"])
+    except (ValueError, KeyError, TypeError):
+        _stats["misses"] += 1
+        return None
+    if not isinstance(tools, list):
+        _stats["misses"] += 1
+        return None
+    stale = age >= resolve_ttl()
+    _stats["stale_hits" if stale else "hits"] += 1
+    return tools, stale
+
+
+def write_tools(cache_key: str, tools: List[Dict]) -> None:
+    redis_client = _redis()
+    if redis_client is None:
+        return
+    try:
+        payload = json.dumps({"tools": tools, "fetched_at": time.time()}, default=str)
+    except (TypeError, ValueError) as e:
+        logger.warning("MCP tool listing is not cacheable: %s", e)
+        return
+    try:
+        redis_client.set(
+            tools_cache_key(cache_key),
+            payload,
+            ex=resolve_ttl() + resolve_stale_seconds(),
+        )
+    except Exception as e:
+        logger.error("Error writing MCP tools cache: %s", e)
+
+
+def invalidate_tools(cache_key: str) -> None:
+    redis_client = get_redis_instance()
+    if redis_client is None:
+        return
+    try:
+        redis_client.delete(tools_cache_key(cache_key))
+        _stats["invalidations"] += 1
+    except Exception as e:
+        logger.error("Error invalidating MCP tools cache: %s", e)
+
+
+def _refresher() -> concurrent.futures.ThreadPoolExecutor:
+    global _REFRESHER, _REFRESHER_PID
+    with _REFRESHER_LOCK:
+        if _REFRESHER is None or _REFRESHER_PID != os.getpid():
+            _REFRESHER = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="mcp-tools-refresh"
+            )
+            _REFRESHER_PID = os.getpid()
+        return _REFRESHER
+
+
+def refresh_in_background(
+    cache_key: str, fetch: Callable[[], List[Dict]]
+) -> Optional[concurrent.futures.Future]:
+    """Relist a stale entry off the request path, once across processes.
+
+    Args:
+        fetch: Lists the server's tools and writes them back to the cache.
+
+    Returns:
+        The refresh future, or ``None`` when another process holds the lock.
+    """
+    redis_client = _redis()
+    if redis_client is None:
+        return None
+    lock_key = f"{tools_cache_key(cache_key)}:refresh"
+    try:
+        if not redis_client.set(lock_key, "1", nx=True, ex=_REFRESH_LOCK_SECONDS):
+            return None
+    except Exception as e:
+        logger.error("Error locking MCP tools cache refresh: %s", e)
+        return None
+
+    def _run():
+        try:
+            fetch()
+            _stats["refreshes"] += 1
+        except Exception as e:
+            logger.warning("Background MCP tool relist failed: %s", e)
+        finally:
+            try:
+                redis_client.delete(lock_key)
+            except Exception:
+                pass
+
+    return _refresher().submit(_run)
+
+
+def cache_stats() -> Dict[str, int]:
+    return dict(_stats)
+
+
+class ToolListChangedHandler(MessageHandler):
+    """Drops the cached listing when the server says its tools changed."""
+
+    def __init__(self, cache_key: str) -> None:
+        self.cache_key = cache_key
+
+    async def on_tool_list_changed(self, message) -> None:
+        logger.info("MCP server reported a tool list change; dropping cached listing")
+        # Off the loop: it is shared by every pooled session.
+        await asyncio.to_thread(invalidate_tools, self.cache_key)
@@ -109,6 +109,8 @@ class ReadWebpageTool(Tool):
     A tool to fetch the HTML content of a URL and convert it to Markdown.
     """
 
+    parallel_safe = True
+
     def __init__(self, config=None):
         """
         Initializes the tool.
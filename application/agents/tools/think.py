@@ -37,6 +37,7 @@ class ThinkTool(Tool):
     """
 
     internal = True
+    parallel_safe = True
 
     def __init__(self, config=None):
         pass
@@ -0,0 +1,52 @@
+"""0031 embedding_cache — content-addressed chunk embeddings for re-ingest.
+
+Syncs and reingests re-embed every chunk of a source even when almost none of
+its pages changed. This table maps (embeddings model, hash of the normalized
+chunk text) to the vector that model produced, so the ingest pipeline only
+calls the embedder for chunks it has never seen. See
+``application/parser/embedding_cache.py``.
+
+Vectors are stored as little-endian float32 bytes rather than ``vector(n)``:
+the cache is model-agnostic and never searched, only looked up by key.
+``last_used`` is bumped on hits (at most daily) and indexed for the
+retention sweep.
+Idempotent both ways.
+
+Revision ID: 0031_embedding_cache
+Revises: 0030_superseded_messages
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0031_embedding_cache"
+down_revision: Union[str, None] = "0030_superseded_messages"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            model text NOT NULL,
+            text_hash text NOT NULL,
+            vector bytea NOT NULL,
+            last_used timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (model, text_hash)
+        );
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used
+            ON embedding_cache (last_used);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_embedding_cache_last_used;")
+    op.execute("DROP TABLE IF EXISTS embedding_cache;")
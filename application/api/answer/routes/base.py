@@ -28,7 +28,6 @@ from application.storage.db.repositories.conversations import (
     HeartbeatState,
     MessageUpdateOutcome,
 )
-from application.storage.db.repositories.token_usage import TokenUsageRepository
 from application.storage.db.repositories.user_logs import UserLogsRepository
 from application.storage.db.session import db_readonly, db_session
 from application.events.publisher import publish_user_event
@@ -37,6 +36,7 @@ from application.streaming.message_journal import (
     BatchedJournalWriter,
     record_event,
 )
+from application.usage_quota import rolling_usage
 from application.utils import check_required_fields
 
 logger = logging.getLogger(__name__)
@@ -153,24 +153,14 @@ class BaseAnswerResource:
             agent.get("request_limit") or settings.DEFAULT_AGENT_LIMITS["request_limit"]
         )
 
-        end_date = datetime.datetime.now(datetime.timezone.utc)
-        start_date = end_date - datetime.timedelta(hours=24)
-
         if limited_token_mode or limited_request_mode:
             with db_readonly() as conn:
-                token_repo = TokenUsageRepository(conn)
-                if limited_token_mode:
-                    daily_token_usage = token_repo.sum_tokens_in_range(
-                        start=start_date, end=end_date, api_key=api_key,
-                    )
-                else:
-                    daily_token_usage = 0
-                if limited_request_mode:
-                    daily_request_usage = token_repo.count_in_range(
-                        start=start_date, end=end_date, api_key=api_key,
-                    )
-                else:
-                    daily_request_usage = 0
+                daily_token_usage, daily_request_usage = rolling_usage(
+                    conn,
+                    api_key,
+                    tokens=limited_token_mode,
+                    requests=limited_request_mode,
+                )
         else:
             daily_token_usage = 0
             daily_request_usage = 0
@@ -1,13 +1,57 @@
-"""Token counting utilities for compression."""
+"""Token counting utilities for compression.
 
+The agent loop re-counts the whole message list before every tool call and
+in each context-window shrink pass, and most of those messages have not
+changed since the last count. Counts are therefore memoized by a digest of
+the text (``TOKEN_COUNT_CACHE_SIZE`` entries, LRU), uncached texts are
+encoded as one batch, and :class:`MessageTokenTally` keeps a running total
+over a message list that only recounts the messages whose content changed.
+"""
+
+import hashlib
 import logging
-from typing import Any, Dict, List
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
-from application.utils import num_tokens_from_string
+from application.utils import num_tokens_from_strings
 from application.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_SIZE = 65536
+
+_CACHE: "OrderedDict[bytes, int]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def resolve_cache_size() -> int:
+    """Token-count cache bound from settings, defensively — 0 disables it."""
+    value = getattr(settings, "TOKEN_COUNT_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return DEFAULT_CACHE_SIZE
+
+
+def _digest(text: str) -> bytes:
+    # Hashing is far cheaper than BPE and keeps no copy of the text alive.
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+def clear_token_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _CACHE_STATS["hits"] = 0
+        _CACHE_STATS["misses"] = 0
+
+
+def token_cache_stats() -> Dict[str, int]:
+    with _CACHE_LOCK:
+        return {**_CACHE_STATS, "entries": len(_CACHE)}
+
 
 class TokenCounter:
     """Centralized token counting for conversations and messages."""
@@ -18,6 +62,43 @@ class TokenCounter:
     # so the threshold check stays conservative.
     _IMAGE_PART_TOKEN_ESTIMATE = 1500
 
+    @staticmethod
+    def count_texts(texts: List[str]) -> List[int]:
+        """Token counts for ``texts``, memoized; misses are encoded as one batch."""
+        size = resolve_cache_size()
+        if size <= 0:
+            return num_tokens_from_strings(texts)
+        counts: List[Optional[int]] = [None] * len(texts)
+        missing: List[Tuple[int, bytes]] = []
+        with _CACHE_LOCK:
+            for i, text in enumerate(texts):
+                if not isinstance(text, str) or not text:
+                    counts[i] = 0
+                    continue
+                key = _digest(text)
+                cached = _CACHE.get(key)
+                if cached is None:
+                    missing.append((i, key))
+                else:
+                    _CACHE.move_to_end(key)
+                    counts[i] = cached
+            _CACHE_STATS["hits"] += len(texts) - len(missing)
+            _CACHE_STATS["misses"] += len(missing)
+        if missing:
+            fresh = num_tokens_from_strings([texts[i] for i, _ in missing])
+            with _CACHE_LOCK:
+                for (i, key), tokens in zip(missing, fresh):
+                    counts[i] = tokens
+                    _CACHE[key] = tokens
+                while len(_CACHE) > size:
+                    _CACHE.popitem(last=False)
+        return counts
+
+    @staticmethod
+    def count_text(text: str) -> int:
+        """Memoized ``num_tokens_from_string``."""
+        return TokenCounter.count_texts([text])[0]
+
     @staticmethod
     def count_message_tokens(messages: List[Dict]) -> int:
         """
@@ -29,20 +110,36 @@ class TokenCounter:
         Returns:
             Total token count
         """
-        total_tokens = 0
-        for message in messages:
-            content = message.get("content", "")
+        return sum(TokenCounter.count_contents([m.get("content", "") for m in messages]))
+
+    @staticmethod
+    def count_contents(contents: List[Any]) -> List[int]:
+        """Token count of each message ``content`` (text or structured parts)."""
+        fixed = [0] * len(contents)
+        texts: List[str] = []
+        owners: List[int] = []
+        for i, content in enumerate(contents):
             if isinstance(content, str):
-                total_tokens += num_tokens_from_string(content)
+                texts.append(content)
+                owners.append(i)
             elif isinstance(content, list):
                 # Handle structured content (tool calls, image parts, etc.)
                 for item in content:
-                    if isinstance(item, dict):
-                        total_tokens += TokenCounter._count_content_part(item)
-        return total_tokens
+                    if not isinstance(item, dict):
+                        continue
+                    estimate = TokenCounter._content_part_estimate(item)
+                    if estimate is None:
+                        texts.append(str(item))
+                        owners.append(i)
+                    else:
+                        fixed[i] += estimate
+        for i, tokens in zip(owners, TokenCounter.count_texts(texts)):
+            fixed[i] += tokens
+        return fixed
 
     @staticmethod
-    def _count_content_part(item: Dict) -> int:
+    def _content_part_estimate(item: Dict) -> Optional[int]:
+        """Flat estimate for an attachment part; ``None`` for a text-like part."""
         # Image/file attachments are billed by the provider per image,
         # not proportional to the inline bytes/base64 string.
         # ``str(item)`` on a 1MB image inflates the count by ~10000x,
@@ -63,7 +160,14 @@ class TokenCounter:
         }:
             return TokenCounter._IMAGE_PART_TOKEN_ESTIMATE
 
-        return num_tokens_from_string(str(item))
+        return None
+
+    @staticmethod
+    def _count_content_part(item: Dict) -> int:
+        estimate = TokenCounter._content_part_estimate(item)
+        if estimate is not None:
+            return estimate
+        return TokenCounter.count_text(str(item))
 
     @staticmethod
     def count_query_tokens(
@@ -79,16 +183,16 @@ class TokenCounter:
         Returns:
             Total token count
         """
-        total_tokens = 0
+        texts: List[str] = []
 
         for query in queries:
             # Count prompt and response tokens
             if "prompt" in query:
-                total_tokens += num_tokens_from_string(query["prompt"])
+                texts.append(query["prompt"])
             if "response" in query:
-                total_tokens += num_tokens_from_string(query["response"])
+                texts.append(query["response"])
             if "thought" in query:
-                total_tokens += num_tokens_from_string(query.get("thought", ""))
+                texts.append(query.get("thought", ""))
 
             # Count tool call tokens
             if include_tool_calls and "tool_calls" in query:
@@ -99,9 +203,9 @@ class TokenCounter:
                         f"Args: {tool_call.get('arguments')} | "
                         f"Response: {tool_call.get('result')}"
                     )
-                    total_tokens += num_tokens_from_string(tool_call_string)
+                    texts.append(tool_call_string)
 
-        return total_tokens
+        return sum(TokenCounter.count_texts(texts))
 
     @staticmethod
     def count_conversation_tokens(
@@ -131,3 +235,47 @@ class TokenCounter:
         except Exception as e:
             logger.error(f"Error calculating conversation tokens: {str(e)}")
             return 0
+
+
+class MessageTokenTally:
+    """Running token total over a message list.
+
+    :meth:`count` compares each position with what it saw last time and
+    recounts only messages whose ``content`` object changed — an appended
+    tool result or a content replaced by truncation — so checking the same
+    growing list before every tool call costs one pass of identity checks
+    plus the new text. Structured (list) content can be mutated in place,
+    so it is always recounted, through the memoized part counts.
+    """
+
+    def __init__(self) -> None:
+        # Per position: the content object counted and its tokens.
+        self._slots: List[Tuple[Any, int]] = []
+        self.total = 0
+
+    def count(self, messages: List[Dict]) -> int:
+        stale: List[int] = []
+        for i, message in enumerate(messages):
+            content = message.get("content", "")
+            if (
+                i < len(self._slots)
+                and isinstance(content, str)
+                and self._slots[i][0] is content
+            ):
+                continue
+            stale.append(i)
+        for _, tokens in self._slots[len(messages):]:
+            self.total -= tokens
+        del self._slots[len(messages):]
+        if stale:
+            contents = [messages[i].get("content", "") for i in stale]
+            for i, content, tokens in zip(
+                stale, contents, TokenCounter.count_contents(contents)
+            ):
+                if i < len(self._slots):
+                    self.total -= self._slots[i][1]
+                    self._slots[i] = (content, tokens)
+                else:
+                    self._slots.append((content, tokens))
+                self.total += tokens
+        return self.total
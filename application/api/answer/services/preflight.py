@@ -0,0 +1,130 @@
+"""Dependency-aware runner for the steps that prepare a chat turn.
+
+``StreamProcessor`` used to configure the agent, pick the model, resolve
+sources, load history, read attachments, retrieve documents and pre-fetch
+tools strictly one after another, although most of those are independent
+database or network round trips. A ``Preflight`` runs each named step as
+soon as the steps it declares in ``after`` have finished, so independent
+ones overlap (attachments with agent configuration and history, tool
+pre-fetch with retrieval).
+
+Steps run on a per-run thread pool of ``PREFLIGHT_CONCURRENCY`` workers in
+a copy of the caller's contextvars context, so request-scoped log bindings
+still stamp their records. With a concurrency of 1 they run inline in the
+order they were added, which must therefore be a valid dependency order.
+The first failing step's exception is re-raised once the steps already
+running have finished; steps depending on it never start.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_concurrency() -> int:
+    """``PREFLIGHT_CONCURRENCY`` read defensively; 1 when unset or unusable."""
+    from application.core.settings import settings
+
+    value = getattr(settings, "PREFLIGHT_CONCURRENCY", 1)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 1:
+        return value
+    return 1
+
+
+@dataclass
+class _Step:
+    name: str
+    fn: Callable[[], Any]
+    after: Tuple[str, ...]
+
+
+@dataclass
+class Preflight:
+    """Named steps with dependencies; ``run`` returns their results by name.
+
+    Steps may be added after a ``run``: the next ``run`` executes only the
+    new ones and may depend on any step that already finished.
+    """
+
+    steps: List[_Step] = field(default_factory=list)
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, name: str, fn: Callable[[], Any], after: Tuple[str, ...] = ()) -> None:
+        known = {step.name for step in self.steps}
+        missing = [dep for dep in after if dep not in known]
+        if name in known or missing:
+            raise ValueError(
+                f"Pre-flight step {name!r} is a duplicate or depends on unknown {missing}"
+            )
+        self.steps.append(_Step(name, fn, tuple(after)))
+
+    def _timed(self, step: _Step) -> Any:
+        started = time.monotonic()
+        try:
+            return step.fn()
+        finally:
+            self.timings_ms[step.name] = round((time.monotonic() - started) * 1000, 1)
+
+    def run(self, concurrency: int | None = None) -> Dict[str, Any]:
+        if concurrency is None:
+            concurrency = resolve_concurrency()
+        pending = [step for step in self.steps if step.name not in self.results]
+        started = time.monotonic()
+        try:
+            if concurrency <= 1 or len(pending) <= 1:
+                for step in pending:
+                    self.results[step.name] = self._timed(step)
+            else:
+                self._run_concurrently(pending, concurrency)
+        finally:
+            elapsed = (time.monotonic() - started) * 1000
+            self.timings_ms["total"] = round(self.timings_ms.get("total", 0.0) + elapsed, 1)
+        return dict(self.results)
+
+    def _run_concurrently(self, pending: List[_Step], concurrency: int) -> None:
+        running: Dict[concurrent.futures.Future, _Step] = {}
+        failure: BaseException | None = None
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(concurrency, len(pending)),
+            thread_name_prefix="preflight",
+        ) as pool:
+            while pending or running:
+                if failure is None:
+                    ready = [s for s in pending if all(d in self.results for d in s.after)]
+                    for step in ready:
+                        pending.remove(step)
+                        future = pool.submit(
+                            contextvars.copy_context().run, self._timed, step
+                        )
+                        running[future] = step
+                if not running:
+                    break
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    step = running.pop(future)
+                    try:
+                        self.results[step.name] = future.result()
+                    except BaseException as e:
+                        if failure is None:
+                            failure = e
+        if failure is not None:
+            raise failure
+
+    def log(self, label: str) -> None:
+        """Emit one record carrying every step's wall time in milliseconds."""
+        logger.info(
+            "%s: %s",
+            label,
+            ", ".join(f"{name}={ms}ms" for name, ms in self.timings_ms.items()),
+            extra={"preflight_ms": dict(self.timings_ms)},
+        )
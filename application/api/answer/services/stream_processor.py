@@ -9,6 +9,7 @@ from application.agents.default_tools import synthesized_default_tools
 from application.api.answer.services.compression import CompressionOrchestrator
 from application.api.answer.services.compression.token_counter import TokenCounter
 from application.api.answer.services.conversation_service import ConversationService
+from application.api.answer.services.preflight import Preflight
 from application.prompts.composer import compose_preset, is_composed_preset
 from application.api.answer.services.prompt_renderer import (
     PromptRenderer,
@@ -104,6 +105,9 @@ def get_prompt(prompt_id: str, prompts_collection=None) -> str:
 
 
 class StreamProcessor:
+    # Pre-flight steps of this turn and their timings, set by initialize().
+    preflight: Optional[Preflight] = None
+
     def __init__(
         self, request_data: Dict[str, Any], decoded_token: Optional[Dict[str, Any]]
     ):
@@ -149,13 +153,29 @@ class StreamProcessor:
         self._agent_data: Optional[Dict[str, Any]] = None
 
     def initialize(self):
-        """Initialize all required components for processing"""
-        self._configure_agent()
-        self._validate_and_set_model()
-        self._configure_source()
-        self._configure_retriever()
-        self._load_conversation_history()
-        self._process_attachments()
+        """Initialize all required components for processing.
+
+        Steps are added in their sequential order; run concurrently,
+        source resolution runs alongside model selection and attachment
+        loading, and history — trimmed to the model's context window —
+        alongside retriever configuration. Attachments wait for the agent
+        step, which rewrites ``initial_user_id`` to the key owner for API-key
+        requests.
+        """
+        self.preflight = Preflight()
+        self.preflight.add("agent", self._configure_agent)
+        self.preflight.add("model", self._validate_and_set_model, after=("agent",))
+        self.preflight.add("source", self._configure_source, after=("agent",))
+        self.preflight.add(
+            "retriever", self._configure_retriever, after=("model", "source")
+        )
+        self.preflight.add(
+            "history", self._load_conversation_history, after=("model",)
+        )
+        self.preflight.add(
+            "attachments", self._process_attachments, after=("agent",)
+        )
+        self.preflight.run()
 
     def build_agent(self, question: str):
         """One call to go from request data to a ready-to-run agent.
@@ -165,57 +185,41 @@ class StreamProcessor:
         """
         self.initialize()
 
+        # Retrieval and tool pre-fetch are independent of each other; they
+        # join initialize()'s steps so all timings land in one record.
+        preflight = self.preflight or Preflight()
+        preflight.add("docs", lambda: self._pre_fetch_agent_docs(question))
+        preflight.add("tools", self.pre_fetch_tools)
+        results = preflight.run()
+        preflight.log("Pre-flight timings")
+        return self.create_agent(**results["docs"], tools_data=results["tools"])
+
+    def _pre_fetch_agent_docs(self, question: str) -> Dict[str, Any]:
+        """Pre-fetch documents and return the matching ``create_agent`` kwargs.
+
+        Sources are partitioned by exposure (D11): the ``prefetch`` subset is
+        retrieved into the prompt and the ``agentic_tool`` subset is exposed
+        via the search tool, one agent mixing both modes. With no source
+        opting into ``agentic_tool`` (the default, or when no per-source
+        detail is known), agentic/research agents pre-fetch nothing and
+        search all sources on demand, while classic agents fall back to the
+        unscoped pre-fetch and add no search tool.
+        """
         agent_type = self.agent_config.get("agent_type", "classic")
-
-        # Agentic/research agents (D11): partition sources by exposure. With no
-        # source opting into ``agentic_tool`` the agent behaves exactly as today
-        # (no pre-fetch; the LLM searches all sources on demand). When at least
-        # one source is ``agentic_tool``, pre-fetch the ``prefetch`` subset into
-        # the prompt and expose only the ``agentic_tool`` subset via the search
-        # tool — one agent mixing both modes.
-        if agent_type in ("agentic", "research"):
-            _, agentic_sources = self._exposure_partition()
-            if agentic_sources:
-                docs_together, docs_list = self.pre_fetch_docs(
-                    question, exposure="prefetch"
-                )
-                tools_data = self.pre_fetch_tools()
-                return self.create_agent(
-                    docs_together=docs_together,
-                    docs=docs_list,
-                    tools_data=tools_data,
-                    agentic_sources=agentic_sources,
-                )
-            tools_data = self.pre_fetch_tools()
-            return self.create_agent(tools_data=tools_data)
-
-        # Classic agents (D11): partition sources by exposure. Pre-fetch the
-        # ``prefetch`` subset into the prompt and expose the ``agentic_tool``
-        # subset via the internal_search tool. ``agentic_sources`` is empty when
-        # no source opts into ``agentic_tool`` (the default) or when no
-        # per-source detail is known (single-source / no-config requests). In
-        # that case fall back to the unscoped pre-fetch and add no search tool —
-        # behavior is byte-identical to today's classic.
         _, agentic_sources = self._exposure_partition()
         if agentic_sources:
             docs_together, docs_list = self.pre_fetch_docs(
                 question, exposure="prefetch"
             )
-            tools_data = self.pre_fetch_tools()
-            return self.create_agent(
-                docs_together=docs_together,
-                docs=docs_list,
-                tools_data=tools_data,
-                agentic_sources=agentic_sources,
-            )
-
+            return {
+                "docs_together": docs_together,
+                "docs": docs_list,
+                "agentic_sources": agentic_sources,
+            }
+        if agent_type in ("agentic", "research"):
+            return {}
         docs_together, docs_list = self.pre_fetch_docs(question)
-        tools_data = self.pre_fetch_tools()
-        return self.create_agent(
-            docs_together=docs_together,
-            docs=docs_list,
-            tools_data=tools_data,
-        )
+        return {"docs_together": docs_together, "docs": docs_list}
 
     def build_continuation_from_messages(self, messages, tool_actions):
         """Rebuild a tool continuation from the request messages (STATELESS).
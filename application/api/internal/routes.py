@@ -10,6 +10,7 @@ from application.storage.db.base_repository import looks_like_uuid
 from application.storage.db.repositories.sources import SourcesRepository
 from application.storage.db.session import db_session
 from application.storage.storage_creator import StorageCreator
+from application.vectorstore.faiss import FAISS_INDEX, replace_index_files
 
 
 logger = logging.getLogger(__name__)
@@ -51,7 +52,7 @@ def download_file():
 
 @internal.route("/api/upload_index", methods=["POST"])
 def upload_index_files():
-    """Upload two files(index.faiss, index.pkl) to the user's folder."""
+    """Upload two files(index.faiss, index.docs or index.pkl) to the user's folder."""
     if "user" not in request.form:
         return {"status": "no user"}
     user = request.form["user"]
@@ -106,18 +107,24 @@ def upload_index_files():
         file_faiss = request.files["file_faiss"]
         if file_faiss.filename == "":
             return {"status": "no file name"}
-        if "file_pkl" not in request.files:
-            logger.error("No file_pkl part")
+        # The sidecar arrives as index.docs from current workers, or as the
+        # legacy index.pkl from older ones.
+        if "file_docs" in request.files:
+            sidecar_field, sidecar_name = "file_docs", "index.docs"
+        elif "file_pkl" in request.files:
+            sidecar_field, sidecar_name = "file_pkl", "index.pkl"
+        else:
+            logger.error("No file_docs or file_pkl part")
             return {"status": "no file"}
-        file_pkl = request.files["file_pkl"]
-        if file_pkl.filename == "":
+        file_sidecar = request.files[sidecar_field]
+        if file_sidecar.filename == "":
             return {"status": "no file name"}
 
-        # Save index files to storage
-        faiss_storage_path = f"{index_base_path}/index.faiss"
-        pkl_storage_path = f"{index_base_path}/index.pkl"
-        storage.save_file(file_faiss, faiss_storage_path)
-        storage.save_file(file_pkl, pkl_storage_path)
+        replace_index_files(
+            storage,
+            index_base_path,
+            {FAISS_INDEX: file_faiss, sidecar_name: file_sidecar},
+        )
 
     now = datetime.datetime.now(datetime.timezone.utc)
     update_fields = {
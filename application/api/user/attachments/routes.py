@@ -550,11 +550,8 @@ class LiveSpeechToTextChunk(Resource):
 
             session_language = session_state.get("language") or settings.STT_LANGUAGE
             stt_instance = STTCreator.create_stt(settings.STT_PROVIDER)
-            transcript = stt_instance.transcribe(
-                temp_path,
-                language=session_language,
-                timestamps=False,
-                diarize=False,
+            transcript = stt_instance.transcribe_chunk(
+                temp_path, language=session_language
             )
             if not session_state.get("language") and transcript.get("language"):
                 session_state["language"] = transcript["language"]
@@ -53,6 +53,7 @@ class GetChunks(Resource):
             "per_page": "Number of chunks per page",
             "path": "Optional: Filter chunks by relative file path",
             "search": "Optional: Search term to filter chunks by title or content",
+            "after": "Optional: next_after from the previous page; lets the store seek instead of skipping",
         },
     )
     def get(self):
@@ -65,6 +66,7 @@ class GetChunks(Resource):
         per_page = int(request.args.get("per_page", 10))
         path = request.args.get("path")
         search_term = request.args.get("search", "").strip().lower()
+        after = request.args.get("after") or None
 
         if not doc_id:
             return make_response(jsonify({"error": "Invalid doc_id"}), 400)
@@ -80,33 +82,13 @@ class GetChunks(Resource):
         resolved_id = str(doc["id"])
         try:
             store = get_vector_store(resolved_id)
-            chunks = store.get_chunks()
-
-            filtered_chunks = []
-            for chunk in chunks:
-                metadata = chunk.get("metadata", {})
-
-                if path:
-                    chunk_source = metadata.get("source", "")
-                    chunk_file_path = metadata.get("file_path", "")
-                    source_match = chunk_source and chunk_source.endswith(path)
-                    file_path_match = chunk_file_path and chunk_file_path.endswith(path)
-
-                    if not (source_match or file_path_match):
-                        continue
-                if search_term:
-                    text_match = search_term in chunk.get("text", "").lower()
-                    title_match = search_term in metadata.get("title", "").lower()
-
-                    if not (text_match or title_match):
-                        continue
-                filtered_chunks.append(chunk)
-            chunks = filtered_chunks
-
-            total_chunks = len(chunks)
-            start = (page - 1) * per_page
-            end = start + per_page
-            paginated_chunks = chunks[start:end]
+            paginated_chunks, total_chunks = store.get_chunks_page(
+                offset=max(page - 1, 0) * per_page,
+                limit=max(per_page, 0),
+                path_suffix=path or None,
+                search=search_term or None,
+                after=after,
+            )
 
             return make_response(
                 jsonify(
@@ -117,6 +99,11 @@ class GetChunks(Resource):
                         "chunks": paginated_chunks,
                         "path": path if path else None,
                         "search": search_term if search_term else None,
+                        "next_after": (
+                            paginated_chunks[-1].get("doc_id")
+                            if paginated_chunks
+                            else None
+                        ),
                     }
                 ),
                 200,
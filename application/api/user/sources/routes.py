@@ -257,11 +257,16 @@ class DeleteOldIndexes(Resource):
         try:
             if settings.VECTOR_STORE == "faiss":
                 index_path = f"indexes/{resolved_id}"
-                # index.pkl is the legacy sidecar; index.json the current one.
-                # Older sources have only the former, so clear whichever exist.
-                for index_file in ("index.faiss", "index.json", "index.pkl"):
+                # index.docs is the current sidecar; index.json and index.pkl
+                # its predecessors. Older sources have only those, so clear
+                # whichever exist, plus any unsaved delta segments.
+                for index_file in (
+                    "index.faiss", "index.docs", "index.json", "index.pkl", "index.bm25"
+                ):
                     if storage.file_exists(f"{index_path}/{index_file}"):
                         storage.delete_file(f"{index_path}/{index_file}")
+                for segment in storage.list_files(f"{index_path}/index.delta"):
+                    storage.delete_file(segment)
             else:
                 vectorstore = VectorCreator.create_vectorstore(
                     settings.VECTOR_STORE, source_id=resolved_id
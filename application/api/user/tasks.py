@@ -636,6 +636,12 @@ def setup_periodic_tasks(sender, **kwargs):
         reap_stale_workflow_runs.s(),
         name="reap-stale-workflow-runs",
     )
+    # Bound the Postgres embedding cache; a no-op unless it is the backend.
+    sender.add_periodic_task(
+        timedelta(hours=24),
+        cleanup_embedding_cache.s(),
+        name="cleanup-embedding-cache",
+    )
 
 
 # Bound time limits so a hung OAuth discovery (user never finishes the
@@ -824,6 +830,44 @@ def cleanup_guardrail_events(self):
     return {"deleted": deleted, "ttl_days": ttl_days}
 
 
+@celery.task(bind=True, acks_late=False)
+def backfill_pgvector_tsvector(self):
+    """Fill and index the pgvector keyword-search column of a legacy table.
+
+    Queued by ``ensure_vector_schema`` at boot while the work is pending; a
+    no-op once done, and concurrent copies defer to the one holding the lock.
+    """
+    from application.storage.db.bootstrap import backfill_vector_tsvector
+
+    return backfill_vector_tsvector(logger=logger)
+
+
+@celery.task(bind=True, acks_late=False)
+def cleanup_embedding_cache(self):
+    """Delete ``embedding_cache`` vectors no ingest has hit recently.
+
+    The SQLite backend bounds itself by row count; the shared Postgres table
+    is bounded here instead, by ``EMBEDDING_CACHE_RETENTION_DAYS`` since a
+    vector was last reused.
+    """
+    from application.core.settings import settings
+    if not settings.POSTGRES_URI:
+        return {"deleted": 0, "skipped": "POSTGRES_URI not set"}
+    if (settings.EMBEDDING_CACHE_BACKEND or "").lower() != "postgres":
+        return {"deleted": 0, "skipped": "embedding cache backend is not postgres"}
+
+    from application.storage.db.engine import get_engine
+    from application.storage.db.repositories.embedding_cache import (
+        EmbeddingCacheRepository,
+    )
+
+    ttl_days = settings.EMBEDDING_CACHE_RETENTION_DAYS
+    engine = get_engine()
+    with engine.begin() as conn:
+        deleted = EmbeddingCacheRepository(conn).cleanup_unused_since(ttl_days)
+    return {"deleted": deleted, "ttl_days": ttl_days}
+
+
 @celery.task(bind=True, acks_late=False)
 def cleanup_orphan_memories(self):
     """Sweep orphan memories left by the 0009 FK-to-trigger orphan window.
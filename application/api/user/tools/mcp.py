@@ -180,6 +180,11 @@ class MCPServerSave(Resource):
                 "status": fields.Boolean(
                     required=False, default=True, description="Tool status"
                 ),
+                "refresh": fields.Boolean(
+                    required=False,
+                    default=False,
+                    description="Relist tools from the server instead of the cache",
+                ),
             },
         )
     )
@@ -241,7 +246,7 @@ class MCPServerSave(Resource):
                 actions_metadata = result.get("tools", [])
             elif auth_type == "none" or auth_credentials:
                 mcp_tool = MCPTool(config=mcp_config, user_id=user)
-                mcp_tool.discover_tools()
+                mcp_tool.discover_tools(force_refresh=bool(data.get("refresh")))
                 actions_metadata = mcp_tool.get_actions_metadata()
             else:
                 raise Exception(
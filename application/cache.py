@@ -2,7 +2,7 @@ import hashlib
 import json
 import logging
 import socket as _socket
-import time
+import zlib
 from threading import Lock
 
 import redis
@@ -101,6 +101,97 @@ def _is_stream_payload(raw: str) -> bool:
     return isinstance(decoded, dict) and isinstance(decoded.get("chunks"), list)
 
 
+# Stream entries are written as ``_STREAM_ENTRY_MAGIC`` + zlib-compressed
+# ``{"version": 2, "chunks": [...], "chunk_count": n}``, where ``chunks`` are
+# replay frames: runs of consecutive text deltas joined up to
+# ``STREAM_CACHE_FRAME_CHARS``, with dict chunks (thoughts, ...) kept in
+# place as frame boundaries. Version 1 and pre-v1 JSON entries stay readable.
+_STREAM_ENTRY_MAGIC = b"\x00sc2z:"
+_STREAM_ENTRY_VERSION = 2
+DEFAULT_STREAM_FRAME_CHARS = 2048
+DEFAULT_STREAM_MAX_BYTES = 512 * 1024
+
+
+def _int_setting(name: str, default: int) -> int:
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def _coalesce_chunks(chunks: list, frame_chars: int) -> list:
+    """Join runs of string chunks into frames of roughly ``frame_chars``.
+
+    Non-string chunks are emitted unchanged and in order; ``frame_chars``
+    of 0 leaves the chunk list as is.
+    """
+    if frame_chars <= 0:
+        return list(chunks)
+    frames, pending, pending_chars = [], [], 0
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            if pending:
+                frames.append("".join(pending))
+                pending, pending_chars = [], 0
+            frames.append(chunk)
+            continue
+        pending.append(chunk)
+        pending_chars += len(chunk)
+        if pending_chars >= frame_chars:
+            frames.append("".join(pending))
+            pending, pending_chars = [], 0
+    if pending:
+        frames.append("".join(pending))
+    return frames
+
+
+def _encode_stream_entry(chunks: list) -> bytes | None:
+    """Compressed replay entry for ``chunks``, or ``None`` when over the size cap."""
+    frames = _coalesce_chunks(
+        chunks, _int_setting("STREAM_CACHE_FRAME_CHARS", DEFAULT_STREAM_FRAME_CHARS)
+    )
+    payload = json.dumps(
+        {"version": _STREAM_ENTRY_VERSION, "chunks": frames, "chunk_count": len(chunks)},
+        separators=(",", ":"),
+    )
+    entry = _STREAM_ENTRY_MAGIC + zlib.compress(payload.encode("utf-8"))
+    if len(entry) > _int_setting("STREAM_CACHE_MAX_BYTES", DEFAULT_STREAM_MAX_BYTES):
+        return None
+    return entry
+
+
+def _decode_stream_entry(raw: bytes) -> list | None:
+    """Replay frames for a cached stream value, or ``None`` if it is unusable."""
+    if raw.startswith(_STREAM_ENTRY_MAGIC):
+        decoded = json.loads(zlib.decompress(raw[len(_STREAM_ENTRY_MAGIC):]))
+        if (
+            isinstance(decoded, dict)
+            and decoded.get("version") == _STREAM_ENTRY_VERSION
+            and isinstance(decoded.get("chunks"), list)
+        ):
+            return decoded["chunks"]
+        return None
+    decoded = json.loads(raw.decode("utf-8"))
+    if (
+        isinstance(decoded, dict)
+        and decoded.get("version") == 1
+        and isinstance(decoded.get("chunks"), list)
+    ):
+        chunks = decoded["chunks"]
+    elif isinstance(decoded, list) and not any(
+        isinstance(chunk, str) and "_RespChoice" in chunk for chunk in decoded
+    ):
+        # Backward-compatible read for pre-v1 string-only entries.
+        # Protocol-object reprs are deliberately rejected and refreshed
+        # from upstream.
+        chunks = decoded
+    else:
+        return None
+    return _coalesce_chunks(
+        chunks, _int_setting("STREAM_CACHE_FRAME_CHARS", DEFAULT_STREAM_FRAME_CHARS)
+    )
+
+
 _redis_instance = None
 _redis_creation_failed = False
 _instance_lock = Lock()
@@ -237,7 +328,7 @@ def gen_cache(func):
         if redis_client:
             try:
                 cached_response = redis_client.get(cache_key)
-                if cached_response:
+                if cached_response and not cached_response.startswith(_STREAM_ENTRY_MAGIC):
                     decoded = cached_response.decode("utf-8")
                     if not _is_stream_payload(decoded):
                         return decoded
@@ -274,30 +365,14 @@ def stream_cache(func):
             try:
                 cached_response = redis_client.get(cache_key)
                 if cached_response:
-                    decoded = json.loads(cached_response.decode("utf-8"))
-                    if (
-                        isinstance(decoded, dict)
-                        and decoded.get("version") == 1
-                        and isinstance(decoded.get("chunks"), list)
-                    ):
-                        cached_chunks = decoded["chunks"]
-                    elif isinstance(decoded, list) and not any(
-                        isinstance(chunk, str)
-                        and "_RespChoice" in chunk
-                        for chunk in decoded
-                    ):
-                        # Backward-compatible read for pre-v1 string-only
-                        # entries. Protocol-object reprs are deliberately
-                        # rejected and refreshed from upstream.
-                        cached_chunks = decoded
-                    else:
-                        cached_chunks = None
-
-                    if cached_chunks is not None:
-                        logger.info(f"Cache hit for stream key: {cache_key}")
-                        for chunk in cached_chunks:
-                            yield chunk
-                            time.sleep(0.03)  # Simulate streaming delay
+                    frames = _decode_stream_entry(cached_response)
+                    if frames is not None:
+                        # No artificial pacing: a hit should release its
+                        # worker thread as fast as the client can read.
+                        logger.info(
+                            f"Cache hit for stream key: {cache_key} ({len(frames)} frames)"
+                        )
+                        yield from frames
                         return
                     redis_client.delete(cache_key)
             except Exception as e:
@@ -328,9 +403,12 @@ def stream_cache(func):
 
         if redis_client and cacheable and had_content:
             try:
-                payload = {"version": 1, "chunks": stream_cache_data}
-                redis_client.set(cache_key, json.dumps(payload), ex=1800)
-                logger.info(f"Stream cache saved for key: {cache_key}")
+                entry = _encode_stream_entry(stream_cache_data)
+                if entry is None:
+                    logger.info(f"Stream too large to cache for key: {cache_key}")
+                else:
+                    redis_client.set(cache_key, entry, ex=1800)
+                    logger.info(f"Stream cache saved for key: {cache_key}")
             except Exception as e:
                 logger.error(f"Error setting stream cache: {e}", exc_info=True)
 
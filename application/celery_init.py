@@ -53,6 +53,20 @@ def _dispose_db_engine_on_fork(*args, **kwargs):
     dispose_engine()
 
 
+@worker_process_init.connect
+def _preload_stt_model(*args, **kwargs):
+    """Warm the faster-whisper model in each worker child when configured.
+
+    Runs in a daemon thread so the load never holds up the worker; a task
+    that needs the model before it finishes waits on the pool's load lock.
+    """
+    from application.stt.model_pool import preload_default_model
+
+    threading.Thread(
+        target=preload_default_model, daemon=True, name="stt-preload"
+    ).start()
+
+
 # Most tasks in this repo accept ``user`` where the log context wants
 # ``user_id``; map task parameter names to context keys explicitly.
 _TASK_PARAM_TO_CTX_KEY: dict[str, str] = {
@@ -45,10 +45,58 @@ class Settings(BaseSettings):
 
     LLM_PROVIDER: str = "docsgpt"
     LLM_NAME: Optional[str] = None  # if LLM_PROVIDER is openai, LLM_NAME can be gpt-4 or gpt-3.5-turbo
+    # Process-wide pool of provider SDK clients over keep-alive HTTP connections; 0 disables.
+    # Idle entries are closed after LLM_CLIENT_POOL_IDLE_SECONDS (longer than the SDKs' 600s timeout).
+    LLM_CLIENT_POOL_MAX_CLIENTS: int = 64
+    LLM_CLIENT_POOL_IDLE_SECONDS: int = 900
+    LLM_HTTP_MAX_CONNECTIONS: int = 100  # per provider endpoint
+    LLM_HTTP_MAX_KEEPALIVE: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 60.0
+    LLM_HTTP2: bool = True  # only takes effect when the optional ``h2`` package is installed
     EMBEDDINGS_NAME: str = "huggingface_sentence-transformers/all-mpnet-base-v2"
     EMBEDDINGS_BASE_URL: Optional[str] = None  # Remote embeddings API URL (OpenAI-compatible)
     EMBEDDINGS_KEY: Optional[str] = None  # api key for embeddings (if using openai, just copy API_KEY)
     EMBEDDINGS_MAX_INPUT_TOKENS: Optional[int] = None  # truncate each remote embed input to N tokens (overflow lost)
+    # Remote embeddings client: inputs per upstream request, optional per-request token budget
+    # (e.g. TEI --max-batch-tokens), and requests in flight per process over one keep-alive pool.
+    EMBEDDINGS_REQUEST_BATCH_SIZE: int = 64
+    EMBEDDINGS_REQUEST_MAX_TOKENS: Optional[int] = None
+    EMBEDDINGS_MAX_CONCURRENT_REQUESTS: int = 4
+    # Window (ms) in which concurrent embed_query calls are merged into one request; 0 disables.
+    EMBEDDINGS_QUERY_COALESCE_MS: int = 0
+    # Ingest embed batching. Above 1, chunks are grouped into batches sent
+    # through one ``embed_documents`` call and checkpointed per batch, with
+    # the next batch embedded while the current one is written to the store.
+    # 1 keeps the one-chunk-per-call loop.
+    INGEST_EMBED_BATCH_SIZE: int = 1
+    INGEST_EMBED_BATCH_MAX_TOKENS: int = 8000  # per-batch cap (tiktoken count); 0 = count bound only
+    INGEST_EMBED_PREFETCH: int = 1  # batches embedded ahead of the one being stored
+    # Parallel file parsing in SimpleDirectoryReader. Above 1, an upload's files are parsed
+    # (and token-counted) on that many forked worker processes, each loading its own parser
+    # models; 0 or 1 parses serially in the ingest worker. A file that runs past the timeout
+    # (seconds, 0 = none) or grows its worker past the memory headroom (MiB over the size at
+    # fork, 0 = unlimited) is skipped as unreadable and the worker replaced. Not used under
+    # INGEST_STREAMING, whose parse stage runs on a thread and so parses serially.
+    INGEST_PARSE_PROCESSES: int = 0
+    INGEST_PARSE_FILE_TIMEOUT: int = 600
+    INGEST_PARSE_MEMORY_HEADROOM_MB: int = 0
+    # Streaming upload ingest. When on, files are chunked and embedded as they are parsed, with
+    # parse, chunk, embed and store running concurrently instead of one stage after another;
+    # at most INGEST_STREAM_QUEUE_FILES parsed files wait between the parse and chunk stages
+    # and between the chunk and embed stages.
+    INGEST_STREAMING: bool = False
+    INGEST_STREAM_QUEUE_FILES: int = 4
+    # Content-addressed cache of chunk embeddings, checked before the embedder at ingest so
+    # syncs only embed changed chunks. "sqlite" (local file, LRU-bounded), "postgres", or None.
+    EMBEDDING_CACHE_BACKEND: Optional[str] = None
+    EMBEDDING_CACHE_PATH: str = "embedding_cache.sqlite3"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 1_000_000  # sqlite backend row cap
+    EMBEDDING_CACHE_RETENTION_DAYS: int = 90  # postgres backend: drop vectors unused this long
+    # Cache of embed_query results on the shared embeddings instances: an in-process LRU
+    # (0 disables the whole cache) plus, optionally, the CACHE_REDIS_URL Redis as a shared tier.
+    QUERY_EMBEDDING_CACHE_SIZE: int = 2048
+    QUERY_EMBEDDING_CACHE_TTL: int = 24 * 60 * 60  # seconds, both tiers
+    QUERY_EMBEDDING_CACHE_REDIS: bool = False
     # Optional directory of operator-supplied model YAMLs, loaded after the
     # built-in catalog under application/core/models/. Later wins on
     # duplicate model id. See application/core/models/README.md.
@@ -90,6 +138,11 @@ class Settings(BaseSettings):
         "token_limit": 50000,
         "request_limit": 500,
     }
+    # Rolling 24h API-key usage is kept in Redis buckets of this width and
+    # rebuilt from token_usage at most this often; 0 queries Postgres on
+    # every rate-limited request instead.
+    USAGE_QUOTA_BUCKET_SECONDS: int = 300
+    USAGE_QUOTA_RECONCILE_SECONDS: int = 3600
     UPLOAD_FOLDER: str = "inputs"
     # Public upload request cap is applied by Flask before multipart parsing.
     # The per-file cap is also enforced while copying each controlled stream.
@@ -132,6 +185,27 @@ class Settings(BaseSettings):
     AGENT_IMAGE_MAX_BYTES: int = 5_000_000
     AGENT_IMAGE_MAX_PIXELS: int = 16_777_216
     VECTOR_STORE: str = "faiss"  #  "faiss" or "elasticsearch" or "qdrant" or "milvus" or "lancedb" or "pgvector"
+    # Per-process LRU of decoded FAISS indexes, bounded by serialized bytes; 0 disables.
+    # Entries are revalidated against the storage version (mtime/ETag) on every load.
+    FAISS_INDEX_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    # FAISS index type: "flat" (exact scan), "ivf_flat", "ivf_pq", "hnsw", or "auto" — flat
+    # below FAISS_ANN_MIN_VECTORS, FAISS_ANN_INDEX above. Existing indexes migrate on their next save.
+    FAISS_INDEX_TYPE: str = "auto"
+    FAISS_ANN_INDEX: str = "hnsw"
+    FAISS_ANN_MIN_VECTORS: int = 100_000
+    FAISS_TRAIN_SAMPLE_SIZE: int = 100_000  # vectors sampled to train IVF quantizers
+    # IVF probes per query. ``None`` derives sqrt(nlist) from each index; set an integer to pin it.
+    FAISS_IVF_NPROBE: Optional[int] = None
+    FAISS_HNSW_M: int = 32
+    FAISS_HNSW_EF_SEARCH: int = 64
+    # Persist an in-process BM25 index (index.bm25) with each FAISS source so hybrid
+    # retrieval gets a keyword half; off makes FaissStore.keyword_search return [].
+    FAISS_KEYWORD_INDEX: bool = True
+    # Also write the langchain-format index.pkl on save, for an older DocsGPT reading the same storage.
+    FAISS_WRITE_PICKLE_SIDECAR: bool = False
+    # Single-chunk edits append a delta segment instead of re-uploading the index; after this
+    # many segments the next edit compacts them into a full save. 0 saves in full every time.
+    FAISS_DELTA_MAX_SEGMENTS: int = 32
     # Allow-list of retriever keys an agent may use. Values must match the
     # ``RetrieverCreator.retrievers`` registry keys (``classic`` / ``default``),
     # NOT the legacy ``classic_rag`` label which never matched the registry.
@@ -151,6 +225,17 @@ class Settings(BaseSettings):
     GRAPHRAG_EXTRACTION_MODEL: Optional[str] = None
     # Hard cap on chunks extracted per source (cost control).
     GRAPHRAG_MAX_CHUNKS_FOR_EXTRACTION: int = 2000
+    # Extraction LLM calls in flight per source; 1 extracts chunk by chunk.
+    GRAPHRAG_EXTRACTION_CONCURRENCY: int = 4
+    # Extraction calls per minute per LLM provider, shared by the process's
+    # extractions; 0 = unlimited.
+    GRAPHRAG_EXTRACTION_REQUESTS_PER_MINUTE: int = 0
+    # Finished chunks whose graph writes and checkpoints share a transaction.
+    GRAPHRAG_EXTRACTION_WRITE_BATCH: int = 16
+    # Sources whose PPR adjacency is cached per process, and how long an entry
+    # is trusted when Redis (which carries graph versions) is unavailable.
+    GRAPHRAG_ADJACENCY_CACHE_SOURCES: int = 32
+    GRAPHRAG_ADJACENCY_CACHE_TTL: int = 300
     AGENT_NAME: str = "classic"
     FALLBACK_LLM_PROVIDER: Optional[str] = None  # provider for fallback llm
     FALLBACK_LLM_NAME: Optional[str] = None  # model name for fallback llm
@@ -178,12 +263,34 @@ class Settings(BaseSettings):
 
     # LLM Cache
     CACHE_REDIS_URL: str = "redis://localhost:6379/2"
+    # Stream-cache hits replay text coalesced into frames of up to this many
+    # characters, with no artificial delay; entries are stored zlib-compressed
+    # and skipped when larger than the byte cap.
+    STREAM_CACHE_FRAME_CHARS: int = 2048
+    STREAM_CACHE_MAX_BYTES: int = 512 * 1024
+    # Semantic answer cache for agents that opt in via config.semantic_cache:
+    # first-turn answers replayed for questions at or above the cosine
+    # threshold under the same prompt and retrieved documents (TTL 0 disables).
+    SEMANTIC_CACHE_TTL: int = 24 * 60 * 60
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 256  # per agent and retrieved-document set
 
     API_URL: str = "http://localhost:7091"  # backend url for celery worker
 
     # Public base URL for user-facing endpoint references in prompts
     PUBLIC_API_BASE_URL: Optional[str] = None
     MCP_OAUTH_REDIRECT_URI: Optional[str] = None  # public callback URL for MCP OAuth
+    # Initialized MCP client sessions kept open on a background event loop and
+    # reused across tool calls (0 connects per operation). Sessions idle past
+    # the health-check age are pinged before reuse; past the idle age, closed.
+    MCP_SESSION_POOL_MAX: int = 64
+    MCP_SESSION_IDLE_SECONDS: int = 300
+    MCP_SESSION_HEALTHCHECK_SECONDS: int = 60
+    # MCP tool listings cached in Redis per server config (0 lists live every
+    # time). Past the TTL a listing is served for up to the stale window while
+    # one process relists in the background.
+    MCP_TOOLS_CACHE_TTL: int = 300
+    MCP_TOOLS_CACHE_STALE_SECONDS: int = 3600
     INTERNAL_KEY: Optional[str] = None  # internal api key for worker-to-backend auth
 
     API_KEY: Optional[str] = None  # LLM api key (used by LLM_PROVIDER)
@@ -243,6 +350,9 @@ class Settings(BaseSettings):
     # IVFFlat probes for vector search. ``None`` derives sqrt(lists) from the
     # index itself; set an integer to pin it. Higher = better recall, more scan.
     PGVECTOR_IVFFLAT_PROBES: Optional[int] = None
+    # Rows per UPDATE when filling the keyword-search tsvector column of a
+    # ``documents`` table created before that column existed.
+    PGVECTOR_TSV_BACKFILL_BATCH_SIZE: int = 5000
     # Milvus vectorstore config
     MILVUS_COLLECTION_NAME: Optional[str] = "docsgpt"
     MILVUS_URI: Optional[str] = "./milvus_local.db"  # milvus lite version as default
@@ -284,9 +394,22 @@ class Settings(BaseSettings):
     STT_MAX_FILE_SIZE_MB: int = 50
     STT_ENABLE_TIMESTAMPS: bool = False
     STT_ENABLE_DIARIZATION: bool = False
+    # faster_whisper models load once per process and are shared by requests.
+    STT_PRELOAD_MODEL: bool = False  # load at web/worker start, not on first use
+    STT_MAX_CONCURRENT_TRANSCRIPTIONS: int = 2  # per loaded model
+    # Live chunks arriving within this window run back to back as one group
+    # (0, the default, transcribes each chunk directly under a slot).
+    STT_LIVE_BATCH_WINDOW_MS: int = 0
+    STT_LIVE_BATCH_SIZE: int = 8
 
     # Tool pre-fetch settings
     ENABLE_TOOL_PREFETCH: bool = True
+    # Threads per request running a parallel batch of ``parallel_safe`` tool calls
+    # (web search, page reads) at once; 1 runs every call in sequence.
+    TOOL_CALL_CONCURRENCY: int = 4
+    # Threads per request running independent pre-flight steps (history,
+    # attachments, retrieval, tool pre-fetch) at once; 1 runs them in sequence.
+    PREFLIGHT_CONCURRENCY: int = 4
 
     # When True, OpenAI Responses API calls are persisted server-side
     # (store=true) so a previous_response_id can chain turns. When False
@@ -330,6 +453,7 @@ class Settings(BaseSettings):
     COMPRESSION_MAX_HISTORY_POINTS: int = 3  # Keep only last N compression points to prevent DB bloat
     COMPRESSION_RECENT_FIELD_MAX_TOKENS: int = 8000  # Per-field cap on the verbatim tail kept after a compression point (0 disables)
     TOOL_RESULT_MAX_TOKENS: int = 20000  # Cap on a single tool result entering the LLM context (0 disables); journal/DB keep the full result
+    TOKEN_COUNT_CACHE_SIZE: int = 65536  # Memoized per-text token counts (LRU, keyed by digest) reused across context checks (0 disables)
 
     # Agent Guardrails
     # Master switch. When False, no guardrail stage runs regardless of what an
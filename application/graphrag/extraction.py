@@ -10,6 +10,15 @@ Cost controls: gleanings off (exactly one ``.gen()`` per chunk), a hard
 chunk cap, a resumable ``graph_ingest_progress`` checkpoint (an idempotent retry
 never re-bills), and concat-merge of entity descriptions (no LLM summary pass).
 
+Throughput: up to ``GRAPHRAG_EXTRACTION_CONCURRENCY`` extraction calls are in
+flight at once, each admitted by a per-provider token bucket
+(``GRAPHRAG_EXTRACTION_REQUESTS_PER_MINUTE``, shared by every extraction in the
+process). Finished chunks are written in groups of up to
+``GRAPHRAG_EXTRACTION_WRITE_BATCH``: one ``embed_documents`` call for all their
+names, one transaction for their nodes and edges, one for their checkpoints.
+A chunk is only marked ``done`` once its writes have committed, so a crash
+re-extracts at most the group in flight.
+
 The extraction LLM is built through ``LLMCreator`` and tagged
 ``_token_usage_source="graph_extraction"`` + ``_request_id`` so ``gen_token_usage``
 writes a ``token_usage`` row per call attributed to the source owner, identical
@@ -18,10 +27,15 @@ to every other LLM call in the app.
 
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
+import queue
 import re
-from typing import Any, Callable, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from application.core.settings import settings
 from application.llm.llm_creator import LLMCreator
@@ -32,6 +46,9 @@ from application.vectorstore.base import EmbeddingsSingleton, get_embeddings  #
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EXTRACTION_CONCURRENCY = 4
+DEFAULT_WRITE_BATCH = 16
+
 _CHUNK_ID_KEYS = ("doc_id", "chunk_id", "id")
 _CHUNK_TEXT_KEYS = ("text", "page_content")
 
@@ -63,6 +80,71 @@ def _resolve_max_chunks(config: SourceConfig) -> int:
     return config.graph.max_chunks or settings.GRAPHRAG_MAX_CHUNKS_FOR_EXTRACTION
 
 
+def _int_setting(name: str, default: int) -> int:
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def _resolve_concurrency() -> int:
+    """Extraction calls allowed in flight per source (at least 1)."""
+    return max(
+        1,
+        _int_setting(
+            "GRAPHRAG_EXTRACTION_CONCURRENCY", DEFAULT_EXTRACTION_CONCURRENCY
+        ),
+    )
+
+
+def _resolve_write_batch() -> int:
+    """Most finished chunks written per transaction (at least 1)."""
+    return max(1, _int_setting("GRAPHRAG_EXTRACTION_WRITE_BATCH", DEFAULT_WRITE_BATCH))
+
+
+class _TokenBucket:
+    """Blocking token bucket: ``rate`` admissions per second, bursts of ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_RATE_LIMITERS: Dict[Tuple[str, int], _TokenBucket] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def _rate_limiter(provider: Optional[str]) -> Optional[_TokenBucket]:
+    """The process-wide bucket for ``provider``, or ``None`` when unlimited."""
+    per_minute = _int_setting("GRAPHRAG_EXTRACTION_REQUESTS_PER_MINUTE", 0)
+    if per_minute <= 0:
+        return None
+    key = (str(provider or ""), per_minute)
+    with _RATE_LIMITERS_LOCK:
+        bucket = _RATE_LIMITERS.get(key)
+        if bucket is None:
+            bucket = _TokenBucket(per_minute / 60.0, _resolve_concurrency())
+            _RATE_LIMITERS[key] = bucket
+        return bucket
+
+
 def _build_extraction_llm(
     model_id: Optional[str], user: Optional[str], request_id: Optional[str]
 ):
@@ -163,8 +245,11 @@ def extract_graph_for_source(
     reported under ``skipped_over_cap``. A malformed response or an LLM error on
     a single chunk marks it ``failed`` and continues — the pipeline never crashes.
 
-    Each chunk is written in a single transaction with one batched embedding
-    call (entity + relationship-endpoint names together).
+    Extraction calls run concurrently (bounded and rate limited, see the
+    module docstring); finished chunks are written in groups, each group in a
+    single transaction with one batched embedding call (entity +
+    relationship-endpoint names together). Progress is reported per chunk
+    once its group has been checkpointed.
 
     Args:
         source_id: The source whose graph is being built.
@@ -197,14 +282,29 @@ def extract_graph_for_source(
 
     embedding = get_embeddings()
 
-    llm = _build_extraction_llm(
-        _resolve_extraction_model(config), user, request_id
-    )
+    model_id = _resolve_extraction_model(config)
+    concurrency = _resolve_concurrency()
+    write_batch = _resolve_write_batch()
+    limiter = _rate_limiter(settings.LLM_PROVIDER)
+
+    # LLM instances carry per-call usage state, so each in-flight call gets
+    # its own; at most ``concurrency`` are ever built.
+    idle_llms: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+    idle_llms.put(_build_extraction_llm(model_id, user, request_id))
 
-    nodes = 0
-    edges = 0
-    chunks_processed = 0
-    failed_chunks = 0
+    def _extract(text: str):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            llm = idle_llms.get_nowait()
+        except queue.Empty:
+            llm = _build_extraction_llm(model_id, user, request_id)
+        try:
+            return _extract_chunk(llm, text)
+        finally:
+            idle_llms.put(llm)
+
+    totals = {"nodes": 0, "edges": 0, "chunks_processed": 0, "failed_chunks": 0}
     total = len(to_process)
 
     def _report():
@@ -213,63 +313,150 @@ def extract_graph_for_source(
         try:
             progress_cb(
                 {
-                    "current": chunks_processed + failed_chunks,
+                    "current": totals["chunks_processed"] + totals["failed_chunks"],
                     "total": total,
-                    "nodes": nodes,
-                    "edges": edges,
+                    "nodes": totals["nodes"],
+                    "edges": totals["edges"],
                 }
             )
         except Exception as exc:
             logger.debug("graph progress callback failed: %s", exc)
 
-    for chunk, chunk_id in to_process:
-        text = _chunk_text(chunk)
-        if not text:
-            store.mark_chunk(source_id, chunk_id, "done")
-            chunks_processed += 1
+    def _flush(batch: List[Tuple[str, Any]]):
+        written = _write_extractions(
+            store,
+            embedding,
+            source_id,
+            [(cid, extracted) for cid, extracted in batch if extracted is not None],
+        )
+        statuses = [
+            (chunk_id, "done" if chunk_id in written else "failed")
+            for chunk_id, _ in batch
+        ]
+        store.mark_chunks(source_id, statuses)
+        for chunk_id, status in statuses:
+            if status == "done":
+                chunk_nodes, chunk_edges = written.get(chunk_id, (0, 0))
+                totals["nodes"] += chunk_nodes
+                totals["edges"] += chunk_edges
+                totals["chunks_processed"] += 1
+            else:
+                totals["failed_chunks"] += 1
             _report()
-            continue
 
-        extracted = _extract_chunk(llm, text)
-        if extracted is None:
-            store.mark_chunk(source_id, chunk_id, "failed")
-            failed_chunks += 1
-            _report()
-            continue
+    pool = (
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="graphrag")
+        if concurrency > 1
+        else None
+    )
+    try:
+        # Chunks are submitted up front (the pool bounds what is in flight)
+        # and written back in source order.
+        work: List[Tuple[str, Any]] = []
+        for chunk, chunk_id in to_process:
+            text = _chunk_text(chunk)
+            if not text:
+                work.append((chunk_id, None))
+            elif pool is not None:
+                ctx = contextvars.copy_context()
+                work.append((chunk_id, pool.submit(ctx.run, _extract, text)))
+            else:
+                work.append((chunk_id, text))
+
+        batch: List[Tuple[str, Any]] = []
+        for index, (chunk_id, job) in enumerate(work):
+            if job is None:
+                # Empty chunk: nothing to extract, checkpoint it as done.
+                batch.append((chunk_id, {"entities": [], "relationships": []}))
+            elif isinstance(job, Future):
+                batch.append((chunk_id, job.result()))
+            else:
+                batch.append((chunk_id, _extract(job)))
+            following = work[index + 1][1] if index + 1 < len(work) else None
+            # Write when the group is full, at the end, or when the next
+            # result is still in flight — finished chunks never wait on it.
+            if (
+                len(batch) >= write_batch
+                or index + 1 == len(work)
+                or (isinstance(following, Future) and not following.done())
+            ):
+                _flush(batch)
+                batch = []
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
 
+    try:
+        store.set_node_degrees(source_id)
+    except Exception as exc:
+        logger.warning("set_node_degrees failed for source %s: %s", source_id, exc)
+
+    return {
+        "nodes": totals["nodes"],
+        "edges": totals["edges"],
+        "chunks_processed": totals["chunks_processed"],
+        "skipped_over_cap": skipped_over_cap,
+        "failed_chunks": totals["failed_chunks"],
+    }
+
+
+def _write_extractions(
+    store,
+    embedding,
+    source_id: str,
+    extractions: List[Tuple[str, Dict[str, List[Dict[str, Any]]]]],
+) -> Dict[str, Tuple[int, int]]:
+    """Write a group of chunk extractions; returns ``chunk_id -> (nodes, edges)``.
+
+    The group shares one embedding call and one transaction. If either fails
+    the chunks are retried one at a time so a single bad chunk only fails
+    itself; chunks missing from the result failed to write.
+    """
+    if not extractions:
+        return {}
+    items = [
+        (
+            chunk_id,
+            _build_entities(extracted["entities"]),
+            _build_relationships(extracted["relationships"]),
+        )
+        for chunk_id, extracted in extractions
+    ]
+    try:
+        name_embeddings = _embed_names(
+            embedding,
+            [e for _, entities, _ in items for e in entities],
+            [r for _, _, relationships in items for r in relationships],
+        )
+        counts = store.apply_chunks(source_id, items, name_embeddings)
+        return {chunk_id: count for (chunk_id, _, _), count in zip(items, counts)}
+    except Exception as exc:
+        if len(items) == 1:
+            logger.warning(
+                "Graph extraction write failed for chunk %s, skipping: %s",
+                items[0][0],
+                exc,
+            )
+            return {}
+        logger.warning(
+            "Grouped graph write of %d chunks failed, retrying one by one: %s",
+            len(items),
+            exc,
+        )
+    written: Dict[str, Tuple[int, int]] = {}
+    for chunk_id, entities, relationships in items:
         try:
-            entities = _build_entities(extracted["entities"])
-            relationships = _build_relationships(extracted["relationships"])
             name_embeddings = _embed_names(embedding, entities, relationships)
-            chunk_nodes, chunk_edges = store.apply_chunk(
+            written[chunk_id] = store.apply_chunk(
                 source_id, chunk_id, entities, relationships, name_embeddings
             )
-            nodes += chunk_nodes
-            edges += chunk_edges
-            store.mark_chunk(source_id, chunk_id, "done")
-            chunks_processed += 1
         except Exception as exc:
             logger.warning(
                 "Graph extraction write failed for chunk %s, skipping: %s",
                 chunk_id,
                 exc,
             )
-            store.mark_chunk(source_id, chunk_id, "failed")
-            failed_chunks += 1
-        _report()
-
-    try:
-        store.set_node_degrees(source_id)
-    except Exception as exc:
-        logger.warning("set_node_degrees failed for source %s: %s", source_id, exc)
-
-    return {
-        "nodes": nodes,
-        "edges": edges,
-        "chunks_processed": chunks_processed,
-        "skipped_over_cap": skipped_over_cap,
-        "failed_chunks": failed_chunks,
-    }
+    return written
 
 
 def _build_entities(raw_entities: Any) -> List[Dict[str, Any]]:
@@ -315,10 +502,10 @@ def _embed_names(
     entities: List[Dict[str, Any]],
     relationships: List[Dict[str, Any]],
 ) -> Dict[str, List[float]]:
-    """Embed every distinct name in a chunk (entities + endpoints) in one call.
+    """Embed every distinct name (entities + endpoints) in one call.
 
     Returns a ``normalized_name -> embedding`` map. One batched ``embed_documents``
-    per chunk instead of a call per relationship endpoint.
+    per write group instead of a call per chunk or per relationship endpoint.
     """
     name_by_norm: Dict[str, str] = {}
     for entity in entities:
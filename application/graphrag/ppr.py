@@ -0,0 +1,315 @@
+"""Vectorized Personalized PageRank over cached per-source adjacency.
+
+``GraphRAGRetriever`` used to build a ``networkx.Graph`` from the fetched
+subgraph on every query and run ``nx.pagerank`` — pure-Python construction and
+iteration on the request path, repeated per graph source. Each source's graph
+is now held as a ``SourceAdjacency``: the transposed, row-normalized CSR
+transition matrix plus per-node IDF weights, built once from
+``GraphStore.get_source_graph`` and kept in a process-wide LRU.
+
+Freshness: ``GraphStore`` calls ``invalidate_adjacency`` after every write that
+changes a source's graph (``apply_chunks``, ``set_node_degrees``,
+``delete_by_source``). That drops the local entry and bumps the source's
+version counter in Redis, which readers in other processes compare against the
+version their entry was built at. Without Redis an entry is trusted for at most
+``GRAPHRAG_ADJACENCY_CACHE_TTL`` seconds.
+
+``personalized_pagerank`` runs the power iteration as sparse mat-mat products,
+one column per seed vector, matching ``nx.pagerank`` (``alpha=0.85``, dangling
+mass returned to the personalization, L1 tolerance ``N * tol``).
+``pagerank_across_sources`` stacks several sources block-diagonally and solves
+them all in the same iterations.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from application.cache import get_redis_instance
+
+logger = logging.getLogger(__name__)
+
+ALPHA = 0.85
+MAX_ITER = 100
+TOL = 1.0e-6
+DEFAULT_CACHE_SOURCES = 32
+DEFAULT_CACHE_TTL = 300
+_VERSION_KEY_PREFIX = "graphrag:graph_version:"
+
+
+def _int_setting(name: str, default: int) -> int:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def _idf(doc_freq: Any) -> float:
+    """Node-specificity weight: rarer entities (low ``doc_freq``) score higher."""
+    return 1.0 / math.log(1.0 + max(int(doc_freq or 0), 0) + 1.0)
+
+
+@dataclass
+class SourceAdjacency:
+    """One source's graph, ready for PPR.
+
+    ``transition_t`` is the transpose of the row-stochastic transition matrix
+    (so ``transition_t @ x`` is one walk step), ``dangling`` marks nodes with
+    no outgoing weight, and ``idf`` holds each node's ``_idf(doc_freq)``.
+    """
+
+    node_ids: List[str]
+    index: Dict[str, int]
+    transition_t: sparse.csr_matrix
+    dangling: np.ndarray
+    idf: np.ndarray
+    version: Optional[str] = None
+    built_at: float = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self.node_ids)
+
+    def personalization(self, seeds: Mapping[str, float]) -> np.ndarray:
+        """Seed weights as a vector over this graph's nodes (unknown ids dropped)."""
+        vector = np.zeros(self.size)
+        for node_id, weight in seeds.items():
+            position = self.index.get(node_id)
+            if position is not None:
+                vector[position] = max(0.0, float(weight))
+        return vector
+
+    def scores(self, ranks: np.ndarray, limit: Optional[int] = None) -> Dict[str, float]:
+        """``node_id -> rank * idf`` for the ``limit`` best nodes with mass."""
+        weighted = ranks * self.idf
+        candidates = np.flatnonzero(weighted > 0)
+        if limit is not None and len(candidates) > limit:
+            top = np.argpartition(weighted[candidates], -limit)[-limit:]
+            candidates = candidates[top]
+        return {self.node_ids[i]: float(weighted[i]) for i in candidates}
+
+
+def build_adjacency(
+    nodes: Sequence[Mapping[str, Any]], edges: Sequence[Mapping[str, Any]]
+) -> SourceAdjacency:
+    """Build a ``SourceAdjacency`` from node and edge dicts.
+
+    Edges are undirected, as in the ``networkx.Graph`` this replaces: a
+    missing or zero weight counts as 1.0, negative weights as 0, and when a
+    pair is linked more than once the heaviest edge wins. Edges to unknown
+    nodes are ignored.
+    """
+    node_ids = [str(node["id"]) for node in nodes]
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    size = len(node_ids)
+    idf = np.array([_idf(node.get("doc_freq", 0)) for node in nodes], dtype=float)
+
+    src, dst, weight = [], [], []
+    for edge in edges:
+        a = index.get(str(edge["src_node_id"]))
+        b = index.get(str(edge["dst_node_id"]))
+        if a is None or b is None:
+            continue
+        src.append(a)
+        dst.append(b)
+        weight.append(max(0.0, float(edge.get("weight") or 1.0)))
+    src_arr = np.array(src, dtype=np.int64)
+    dst_arr = np.array(dst, dtype=np.int64)
+    weight_arr = np.array(weight, dtype=float)
+
+    # Both directions of every edge; a self-loop is a single arc.
+    loop = src_arr == dst_arr
+    rows = np.concatenate([src_arr, dst_arr[~loop]])
+    cols = np.concatenate([dst_arr, src_arr[~loop]])
+    values = np.concatenate([weight_arr, weight_arr[~loop]])
+    if len(rows):
+        # Keep the heaviest of duplicate arcs instead of summing them.
+        keys = rows * max(size, 1) + cols
+        order = np.lexsort((values, keys))
+        keys = keys[order]
+        last = np.append(keys[1:] != keys[:-1], True)
+        keep = order[last]
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+
+    adjacency = sparse.csr_matrix((values, (rows, cols)), shape=(size, size))
+    out_weight = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    inverse = np.zeros(size)
+    inverse[~dangling] = 1.0 / out_weight[~dangling]
+    transition_t = (sparse.diags(inverse) @ adjacency).T.tocsr()
+    return SourceAdjacency(
+        node_ids=node_ids,
+        index=index,
+        transition_t=transition_t,
+        dangling=dangling,
+        idf=idf,
+    )
+
+
+def personalized_pagerank(
+    transition_t: sparse.spmatrix,
+    dangling: np.ndarray,
+    personalization: np.ndarray,
+    *,
+    sizes: Optional[np.ndarray] = None,
+    alpha: float = ALPHA,
+    max_iter: int = MAX_ITER,
+    tol: float = TOL,
+) -> np.ndarray:
+    """Power-iterate PPR for every column of ``personalization`` at once.
+
+    Args:
+        transition_t: Transposed row-stochastic transition matrix (N x N).
+        dangling: Boolean mask of nodes with no outgoing weight.
+        personalization: N x K non-negative seed weights, one column per
+            walk. An all-zero column personalizes uniformly over all N nodes.
+        sizes: Per-column node count for the convergence test; defaults to N.
+
+    Returns:
+        N x K matrix of stationary distributions (each column sums to 1).
+    """
+    size, columns = personalization.shape
+    if size == 0 or columns == 0:
+        return np.zeros((size, columns))
+    p = np.array(personalization, dtype=float)
+    totals = p.sum(axis=0)
+    empty = totals <= 0
+    if empty.any():
+        p[:, empty] = 1.0
+        totals[empty] = size
+    p /= totals
+    if sizes is None:
+        sizes = np.full(columns, size)
+    x = p.copy()
+    for _ in range(max_iter):
+        previous = x
+        x = alpha * (transition_t @ x + p * x[dangling].sum(axis=0)) + (1 - alpha) * p
+        if (np.abs(x - previous).sum(axis=0) < sizes * tol).all():
+            return x
+    logger.debug("PPR did not converge in %d iterations", max_iter)
+    return x
+
+
+def pagerank_across_sources(
+    walks: Sequence[Tuple[SourceAdjacency, Mapping[str, float]]],
+) -> List[np.ndarray]:
+    """Solve one seeded PPR per ``(adjacency, seeds)`` pair in a single pass.
+
+    The sources are stacked block-diagonally with one column per walk, so
+    each walk only ever moves (and teleports) within its own source. Returns
+    each walk's rank vector over its source's nodes, in order.
+    """
+    if not walks:
+        return []
+    if any(adjacency.size == 0 for adjacency, _ in walks):
+        solvable = [
+            i for i, (adjacency, _) in enumerate(walks) if adjacency.size > 0
+        ]
+        solved = dict(zip(solvable, pagerank_across_sources([walks[i] for i in solvable])))
+        return [solved.get(i, np.zeros(0)) for i in range(len(walks))]
+    offsets = np.cumsum([0] + [adjacency.size for adjacency, _ in walks])
+    total = int(offsets[-1])
+    personalization = np.zeros((total, len(walks)))
+    for column, (adjacency, seeds) in enumerate(walks):
+        start, end = offsets[column], offsets[column + 1]
+        block = adjacency.personalization(seeds)
+        # Uniform within the source when no seed carries weight.
+        personalization[start:end, column] = block if block.any() else 1.0
+    if len(walks) == 1:
+        transition_t, dangling = walks[0][0].transition_t, walks[0][0].dangling
+    else:
+        transition_t = sparse.block_diag(
+            [adjacency.transition_t for adjacency, _ in walks], format="csr"
+        )
+        dangling = np.concatenate([adjacency.dangling for adjacency, _ in walks])
+    ranks = personalized_pagerank(
+        transition_t,
+        dangling,
+        personalization,
+        sizes=np.array([adjacency.size for adjacency, _ in walks]),
+    )
+    return [
+        ranks[offsets[column] : offsets[column + 1], column]
+        for column in range(len(walks))
+    ]
+
+
+_CACHE: "OrderedDict[str, SourceAdjacency]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _version_key(source_id: str) -> str:
+    return f"{_VERSION_KEY_PREFIX}{source_id}"
+
+
+def _current_version(source_id: str) -> Optional[str]:
+    """The source's graph version from Redis, or ``None`` without Redis."""
+    redis_client = get_redis_instance()
+    if redis_client is None:
+        return None
+    try:
+        raw = redis_client.get(_version_key(source_id))
+    except Exception as e:
+        logger.debug("Graph version lookup failed for %s: %s", source_id, e)
+        return None
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return raw or "0"
+
+
+def _fresh(entry: SourceAdjacency, version: Optional[str]) -> bool:
+    if version is not None:
+        return entry.version == version
+    ttl = _int_setting("GRAPHRAG_ADJACENCY_CACHE_TTL", DEFAULT_CACHE_TTL)
+    return time.monotonic() - entry.built_at < ttl
+
+
+def get_adjacency(store, source_id: str) -> SourceAdjacency:
+    """The cached adjacency for ``source_id``, (re)built from ``store`` when stale."""
+    version = _current_version(source_id)
+    with _CACHE_LOCK:
+        entry = _CACHE.get(source_id)
+        if entry is not None and _fresh(entry, version):
+            _CACHE.move_to_end(source_id)
+            return entry
+    graph = store.get_source_graph(source_id)
+    entry = build_adjacency(graph.get("nodes", []), graph.get("edges", []))
+    entry.version = version
+    entry.built_at = time.monotonic()
+    capacity = _int_setting("GRAPHRAG_ADJACENCY_CACHE_SOURCES", DEFAULT_CACHE_SOURCES)
+    if capacity > 0:
+        with _CACHE_LOCK:
+            _CACHE[source_id] = entry
+            _CACHE.move_to_end(source_id)
+            while len(_CACHE) > capacity:
+                _CACHE.popitem(last=False)
+    return entry
+
+
+def invalidate_adjacency(source_id: str) -> None:
+    """Drop ``source_id``'s cached adjacency here and in every other process."""
+    with _CACHE_LOCK:
+        _CACHE.pop(source_id, None)
+    redis_client = get_redis_instance()
+    if redis_client is None:
+        return
+    try:
+        redis_client.incr(_version_key(source_id))
+    except Exception as e:
+        logger.warning("Could not bump graph version for %s: %s", source_id, e)
+
+
+def clear_adjacency_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
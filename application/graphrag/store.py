@@ -15,11 +15,12 @@ from __future__ import annotations
 
 import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from psycopg.types.json import Jsonb
 
 from application.core.settings import settings
+from application.graphrag.ppr import invalidate_adjacency
 from application.vectorstore import pgconn
 
 DEFAULT_NAME_EMBEDDING_DIM = 768
@@ -501,55 +502,94 @@ class GraphStore:
         are not bumped here — the caller runs ``set_node_degrees`` once at the
         end. Returns ``(nodes_upserted, edges_added)``.
         """
+        return self.apply_chunks(
+            source_id, [(chunk_id, entities, relationships)], name_embeddings
+        )[0]
+
+    def apply_chunks(
+        self,
+        source_id: str,
+        items: Sequence[
+            Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]
+        ],
+        name_embeddings: Dict[str, List[float]],
+    ) -> List[tuple[int, int]]:
+        """Write several chunks' extractions in one transaction.
+
+        ``items`` are ``(chunk_id, entities, relationships)`` triples, each
+        written exactly as ``apply_chunk`` would; ``name_embeddings`` covers
+        the names of every item. All or nothing — on error the transaction is
+        rolled back and the error re-raised. Returns ``(nodes_upserted,
+        edges_added)`` per item, in order.
+        """
         self._ensure_tables_once()
         conn = self._get_connection()
         cursor = conn.cursor()
-        node_ids: Dict[str, str] = {}
-        edges_added = 0
         try:
-            for entity in entities:
-                normalized_name = entity["normalized_name"]
-                node_id = self._upsert_node(
-                    cursor,
-                    source_id,
-                    entity["name"],
-                    normalized_name,
-                    entity.get("type"),
-                    entity.get("description"),
-                    name_embeddings.get(normalized_name),
-                )
-                node_ids[normalized_name] = node_id
-                self._link_node_chunk(cursor, source_id, node_id, chunk_id)
-
-            for rel in relationships:
-                src_id = self._resolve_endpoint(
-                    cursor, source_id, rel.get("source"), node_ids, name_embeddings
+            counts = [
+                self._apply_chunk(
+                    cursor, source_id, chunk_id, entities, relationships,
+                    name_embeddings,
                 )
-                dst_id = self._resolve_endpoint(
-                    cursor, source_id, rel.get("target"), node_ids, name_embeddings
-                )
-                if src_id is None or dst_id is None:
-                    continue
-                self._add_edge(
-                    cursor,
-                    source_id,
-                    src_id,
-                    dst_id,
-                    type=rel.get("type"),
-                    description=rel.get("description"),
-                    weight=float(rel.get("weight") or 1.0),
-                    source_chunk_ids=[chunk_id],
-                )
-                edges_added += 1
-
+                for chunk_id, entities, relationships in items
+            ]
             conn.commit()
-            return len(entities), edges_added
+            invalidate_adjacency(source_id)
+            return counts
         except Exception:
             conn.rollback()
             raise
         finally:
             cursor.close()
 
+    def _apply_chunk(
+        self,
+        cursor,
+        source_id: str,
+        chunk_id: str,
+        entities: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]],
+        name_embeddings: Dict[str, List[float]],
+    ) -> tuple[int, int]:
+        """Write one chunk's entities and relationships on an open cursor (no commit)."""
+        node_ids: Dict[str, str] = {}
+        edges_added = 0
+        for entity in entities:
+            normalized_name = entity["normalized_name"]
+            node_id = self._upsert_node(
+                cursor,
+                source_id,
+                entity["name"],
+                normalized_name,
+                entity.get("type"),
+                entity.get("description"),
+                name_embeddings.get(normalized_name),
+            )
+            node_ids[normalized_name] = node_id
+            self._link_node_chunk(cursor, source_id, node_id, chunk_id)
+
+        for rel in relationships:
+            src_id = self._resolve_endpoint(
+                cursor, source_id, rel.get("source"), node_ids, name_embeddings
+            )
+            dst_id = self._resolve_endpoint(
+                cursor, source_id, rel.get("target"), node_ids, name_embeddings
+            )
+            if src_id is None or dst_id is None:
+                continue
+            self._add_edge(
+                cursor,
+                source_id,
+                src_id,
+                dst_id,
+                type=rel.get("type"),
+                description=rel.get("description"),
+                weight=float(rel.get("weight") or 1.0),
+                source_chunk_ids=[chunk_id],
+            )
+            edges_added += 1
+        return len(entities), edges_added
+
     def _resolve_endpoint(
         self,
         cursor,
@@ -709,6 +749,69 @@ class GraphStore:
             cursor.close()
             conn.rollback()
 
+    def search_nodes_by_embedding_many(
+        self, source_ids: List[str], query_embedding: List[float], k: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """``search_nodes_by_embedding`` for several sources in one round trip.
+
+        A ``LATERAL`` join runs the per-source top-``k`` once per id, so each
+        source still gets its own ``k`` nearest nodes (a single global top-k
+        would let one large graph crowd the others out).
+
+        Args:
+            source_ids: Sources to search; empty/falsy entries are ignored.
+            query_embedding: Query vector shared by every source.
+            k: Nodes per source.
+
+        Returns:
+            dict: ``{source_id: rows}`` keyed by the caller's id spelling, with
+            an empty list for a source without matches — or for every source
+            when the query fails, as ``search_nodes_by_embedding`` does.
+        """
+        ids = [str(s) for s in source_ids if s]
+        if not ids:
+            return {}
+        results: Dict[str, List[Dict[str, Any]]] = {source_id: [] for source_id in ids}
+        by_canonical = {source_id.lower(): source_id for source_id in ids}
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT s.source_id, n.id, n.name, n.description, n.distance
+                FROM unnest(%s::uuid[]) AS s(source_id)
+                CROSS JOIN LATERAL (
+                    SELECT id, name, description,
+                           (name_embedding <=> %s::vector) AS distance
+                    FROM graph_nodes
+                    WHERE source_id = s.source_id AND name_embedding IS NOT NULL
+                    ORDER BY name_embedding <=> %s::vector
+                    LIMIT %s
+                ) AS n
+                ORDER BY s.source_id, n.distance;
+                """,
+                (ids, query_embedding, query_embedding, k),
+            )
+            for row in cursor.fetchall():
+                returned = str(row[0])
+                results.setdefault(
+                    by_canonical.get(returned.lower(), returned), []
+                ).append(
+                    {
+                        "id": str(row[1]),
+                        "name": row[2],
+                        "description": row[3],
+                        "distance": row[4],
+                    }
+                )
+            return results
+        except Exception as e:
+            logging.error(f"Error searching nodes by embedding: {e}")
+            return {source_id: [] for source_id in ids}
+        finally:
+            cursor.close()
+            conn.rollback()
+
     def get_subgraph(
         self, source_id: str, node_ids: List[str], hops: int = 1
     ) -> Dict[str, List[Dict[str, Any]]]:
@@ -803,6 +906,48 @@ class GraphStore:
             cursor.close()
             conn.rollback()
 
+    def get_source_graph(self, source_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Every node (id, doc_freq) and edge (endpoints, weight) of a source.
+
+        The input for the cached PPR adjacency (``application.graphrag.ppr``),
+        fetched once per graph version rather than per query. Unlike the other
+        readers this raises on error, so a failed fetch is never cached as an
+        empty graph.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT id, doc_freq FROM graph_nodes WHERE source_id = %s;",
+                (source_id,),
+            )
+            nodes = [
+                {"id": str(row[0]), "doc_freq": row[1]} for row in cursor.fetchall()
+            ]
+            cursor.execute(
+                """
+                SELECT src_node_id, dst_node_id, weight
+                FROM graph_edges
+                WHERE source_id = %s;
+                """,
+                (source_id,),
+            )
+            edges = [
+                {
+                    "src_node_id": str(row[0]),
+                    "dst_node_id": str(row[1]),
+                    "weight": row[2],
+                }
+                for row in cursor.fetchall()
+            ]
+            return {"nodes": nodes, "edges": edges}
+        except Exception as e:
+            logging.error(f"Error getting source graph: {e}")
+            raise
+        finally:
+            cursor.close()
+            conn.rollback()
+
     def get_graph_overview(
         self, source_id: str, limit: int = GRAPH_OVERVIEW_DEFAULT_LIMIT
     ) -> Dict[str, List[Dict[str, Any]]]:
@@ -1018,6 +1163,7 @@ class GraphStore:
                 (source_id, source_id, source_id),
             )
             conn.commit()
+            invalidate_adjacency(source_id)
         except Exception as e:
             conn.rollback()
             logging.error(f"Error setting node degrees: {e}")
@@ -1026,22 +1172,33 @@ class GraphStore:
             cursor.close()
 
     def mark_chunk(self, source_id: str, chunk_id: str, status: str):
+        self.mark_chunks(source_id, [(chunk_id, status)])
+
+    def mark_chunks(
+        self, source_id: str, statuses: Sequence[Tuple[str, str]]
+    ) -> None:
+        """Record ``(chunk_id, status)`` checkpoints in one transaction."""
+        if not statuses:
+            return
         self._ensure_tables_once()
         conn = self._get_connection()
         cursor = conn.cursor()
         try:
-            cursor.execute(
+            cursor.executemany(
                 """
                 INSERT INTO graph_ingest_progress (source_id, chunk_id, status)
                 VALUES (%s, %s, %s)
                 ON CONFLICT (source_id, chunk_id) DO UPDATE SET status = EXCLUDED.status;
                 """,
-                (source_id, str(chunk_id), status),
+                [
+                    (source_id, str(chunk_id), status)
+                    for chunk_id, status in statuses
+                ],
             )
             conn.commit()
         except Exception as e:
             conn.rollback()
-            logging.error(f"Error marking chunk: {e}")
+            logging.error(f"Error marking chunks: {e}")
             raise
         finally:
             cursor.close()
@@ -1102,6 +1259,7 @@ class GraphStore:
                     f"DELETE FROM {table} WHERE source_id = %s;", (source_id,)
                 )
             conn.commit()
+            invalidate_adjacency(source_id)
         except Exception as e:
             conn.rollback()
             logging.error(f"Error deleting graph by source: {e}")
@@ -1,4 +1,4 @@
-"""Pydantic contract for ``agents.config.guardrails``.
+"""Pydantic contract for ``agents.config`` (guardrails, semantic cache).
 
 Validation policy mirrors ``storage/db/source_config.py``: strict on write
 (``model_validate`` raises), lenient on read (``parse`` falls back to
@@ -206,12 +206,41 @@ class GuardrailsConfig(BaseModel):
         return parsed
 
 
+class SemanticCacheConfig(BaseModel):
+    """Per-agent opt-in to ``application.semantic_cache``.
+
+    ``threshold`` and ``ttl_seconds`` override the instance defaults
+    (``SEMANTIC_CACHE_THRESHOLD`` / ``SEMANTIC_CACHE_TTL``) when set.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = False
+    threshold: Optional[float] = None
+    ttl_seconds: Optional[int] = None
+
+    @field_validator("threshold")
+    @classmethod
+    def _bounded_threshold(cls, value: Optional[float]) -> Optional[float]:
+        if value is not None and not 0.5 <= value <= 1.0:
+            raise ValueError("must be between 0.5 and 1.0")
+        return value
+
+    @field_validator("ttl_seconds")
+    @classmethod
+    def _bounded_ttl(cls, value: Optional[int]) -> Optional[int]:
+        if value is not None and not 60 <= value <= 30 * 24 * 3600:
+            raise ValueError("must be between 60 and 2592000")
+        return value
+
+
 class AgentConfig(BaseModel):
     """Per-agent behavior contract stored in ``agents.config``."""
 
     model_config = ConfigDict(extra="forbid")
 
     guardrails: GuardrailsConfig = GuardrailsConfig()
+    semantic_cache: SemanticCacheConfig = SemanticCacheConfig()
 
     @classmethod
     def parse(cls, raw: Optional[dict]) -> "AgentConfig":
@@ -221,4 +250,13 @@ class AgentConfig(BaseModel):
         try:
             return cls.model_validate(raw)
         except Exception:
-            return cls(guardrails=GuardrailsConfig.parse(raw.get("guardrails")))
+            try:
+                semantic_cache = SemanticCacheConfig.model_validate(
+                    raw.get("semantic_cache") or {}
+                )
+            except Exception:
+                semantic_cache = SemanticCacheConfig()
+            return cls(
+                guardrails=GuardrailsConfig.parse(raw.get("guardrails")),
+                semantic_cache=semantic_cache,
+            )
@@ -70,3 +70,14 @@ logconfig_dict = {
 def on_starting(server):  # pragma: no cover — gunicorn hook
     """Ensure gunicorn's own loggers use the configured handlers."""
     logging.config.dictConfig(logconfig_dict)
+
+
+def post_worker_init(worker):  # pragma: no cover — gunicorn hook
+    """Warm the faster-whisper model (``STT_PRELOAD_MODEL``) off the serving path."""
+    import threading
+
+    from application.stt.model_pool import preload_default_model
+
+    threading.Thread(
+        target=preload_default_model, daemon=True, name="stt-preload"
+    ).start()
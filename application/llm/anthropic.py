@@ -7,6 +7,7 @@ from anthropic import Anthropic
 
 from application.core.settings import settings
 from application.llm.base import BaseLLM
+from application.llm.client_pool import get_client_pool
 from application.storage.storage_creator import StorageCreator
 
 logger = logging.getLogger(__name__)
@@ -90,8 +91,19 @@ class AnthropicLLM(BaseLLM):
         self.api_key = api_key or settings.ANTHROPIC_API_KEY or settings.API_KEY
         self.user_api_key = user_api_key
 
+        pool = get_client_pool()
+        if pool is not None:
+            api_key = self.api_key
+            self.anthropic = pool.sdk_client(
+                self.provider_name,
+                base_url,
+                api_key,
+                lambda http: Anthropic(
+                    api_key=api_key, base_url=base_url or None, http_client=http
+                ),
+            )
         # Use custom base_url if provided
-        if base_url:
+        elif base_url:
             self.anthropic = Anthropic(api_key=self.api_key, base_url=base_url)
         else:
             self.anthropic = Anthropic(api_key=self.api_key)
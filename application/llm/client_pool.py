@@ -0,0 +1,313 @@
+"""Process-wide pool of LLM provider clients and their HTTP connections.
+
+``LLMCreator.create_llm`` builds a fresh LLM object per request, and each
+provider SDK used to build a fresh ``httpx.Client`` with it — so every chat
+turn paid a TCP and TLS handshake to the provider and threw the connection
+away afterwards. This pool keeps both alive across requests:
+
+* one ``httpx.Client`` per ``(provider, base_url)``, bounded by
+  ``LLM_HTTP_MAX_CONNECTIONS`` / ``LLM_HTTP_MAX_KEEPALIVE``, whose keep-alive
+  connections every credential for that endpoint shares; and
+* one SDK client per ``(provider, base_url, credential fingerprint)`` built on
+  top of it, so the SDK's own setup is paid once too.
+
+User-supplied (BYOM) base URLs get a client from
+:func:`~application.security.safe_url.pinned_httpx_client`, keyed apart from
+unpinned ones so a pinned connection is never shared with anything else.
+Only unpinned clients speak HTTP/2, and only when ``h2`` is installed.
+
+An entry unused for ``LLM_CLIENT_POOL_IDLE_SECONDS`` is closed on the next
+pool access. Past ``LLM_CLIENT_POOL_MAX_CLIENTS`` the least recently used
+entry is dropped but not closed, since an LLM built from it may still be
+streaming; its connections go when the last reference does.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Defaults when a setting is missing or unusable.
+DEFAULT_MAX_CLIENTS = 64
+DEFAULT_IDLE_SECONDS = 900
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+HttpKey = Tuple[str, str, bool]
+
+
+@dataclass
+class _Entry:
+    client: Any
+    last_used: float
+    # For an SDK entry, the pooled HTTP client it was built on (if any).
+    http_key: Optional[HttpKey] = None
+
+
+def _int_setting(name: str, default: int) -> int:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def _float_setting(name: str, default: float) -> float:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+        return float(value)
+    return default
+
+
+def credential_fingerprint(api_key: Optional[str]) -> str:
+    """Short digest of ``api_key`` — enough to key on, never the key itself."""
+    if not api_key:
+        return ""
+    return hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()[:16]
+
+
+def _http2_available() -> bool:
+    from application.core.settings import settings
+
+    if getattr(settings, "LLM_HTTP2", True) is not True:
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+class LLMClientPool:
+    """Thread-safe registry of pooled HTTP clients and the SDK clients on them."""
+
+    def __init__(self, max_clients: int, idle_seconds: float,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_clients = max_clients
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._http: "OrderedDict[HttpKey, _Entry]" = OrderedDict()
+        self._sdk: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.requests = 0
+        self.connections = 0
+
+    # -- HTTP clients ----------------------------------------------------
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=_int_setting("LLM_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS) or None,
+            max_keepalive_connections=_int_setting("LLM_HTTP_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE),
+            keepalive_expiry=_float_setting("LLM_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY),
+        )
+
+    def _build_http_client(self, base_url: str, pinned: bool) -> httpx.Client:
+        if pinned:
+            from application.security.safe_url import pinned_httpx_client
+
+            client = pinned_httpx_client(base_url, limits=self._limits())
+        else:
+            # Matches the SDKs' own default client: 600s timeout, redirects followed.
+            client = httpx.Client(
+                limits=self._limits(),
+                http2=_http2_available(),
+                timeout=600.0,
+                follow_redirects=True,
+            )
+        client.event_hooks = {"request": [self._on_request], "response": []}
+        return client
+
+    def _on_request(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.requests += 1
+        request.extensions = {**request.extensions, "trace": self._on_trace}
+
+    def _on_trace(self, event: str, info: Dict[str, Any]) -> None:
+        # httpcore fires this only when it dials; a reused connection skips it.
+        if event == "connection.connect_tcp.complete":
+            with self._lock:
+                self.connections += 1
+
+    def http_client(self, provider: str, base_url: Optional[str], *,
+                    pinned: bool = False) -> httpx.Client:
+        """Return the shared ``httpx.Client`` for ``provider`` at ``base_url``.
+
+        Raises:
+            UnsafeUserUrlError: If ``pinned`` and ``base_url`` fails the
+                SSRF guard.
+        """
+        key: HttpKey = (provider, base_url or "", pinned)
+        with self._lock:
+            self._sweep()
+            entry = self._touch(self._http, key)
+            if entry is not None:
+                return entry.client
+        # Built outside the lock: a pinned client resolves DNS.
+        client = self._build_http_client(base_url, pinned)
+        with self._lock:
+            entry = self._touch(self._http, key)
+            if entry is not None:
+                client.close()
+                return entry.client
+            self._insert(self._http, key, _Entry(client, self._clock()))
+        return client
+
+    # -- SDK clients -----------------------------------------------------
+
+    def sdk_client(
+        self,
+        provider: str,
+        base_url: Optional[str],
+        api_key: Optional[str],
+        factory: Callable[[Optional[httpx.Client]], Any],
+        *,
+        http_client: Optional[httpx.Client] = None,
+    ) -> Any:
+        """Return the shared SDK client for this endpoint and credential.
+
+        Args:
+            factory: Builds the SDK client around the ``httpx.Client`` it is
+                given; called once per key.
+            http_client: The client to build on instead of the unpinned one
+                for this endpoint — typically a pinned client from
+                :meth:`http_client`, which then stays open while the SDK
+                client is in use.
+        """
+        if http_client is None:
+            http_client = self.http_client(provider, base_url)
+        http_key = self._http_key_of(http_client)
+        key = (provider, base_url or "", credential_fingerprint(api_key), id(http_client))
+        with self._lock:
+            entry = self._touch(self._sdk, key)
+            if entry is not None:
+                self.hits += 1
+                return entry.client
+        client = factory(http_client)
+        with self._lock:
+            entry = self._touch(self._sdk, key)
+            if entry is not None:
+                self.hits += 1
+                return entry.client
+            self.misses += 1
+            self._insert(self._sdk, key, _Entry(client, self._clock(), http_key))
+        return client
+
+    def _http_key_of(self, http_client: httpx.Client) -> Optional[HttpKey]:
+        """Key of ``http_client`` if the pool owns it, else ``None``."""
+        with self._lock:
+            for key, entry in self._http.items():
+                if entry.client is http_client:
+                    return key
+        return None
+
+    # -- Bookkeeping (caller holds the lock) ------------------------------
+
+    def _touch(self, entries: "OrderedDict", key) -> Optional[_Entry]:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        entry.last_used = self._clock()
+        entries.move_to_end(key)
+        if entry.http_key is not None and entry.http_key in self._http:
+            self._touch(self._http, entry.http_key)
+        return entry
+
+    def _insert(self, entries: "OrderedDict", key, entry: _Entry) -> None:
+        entries[key] = entry
+        while len(entries) > self.max_clients:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def _sweep(self) -> None:
+        """Drop idle SDK clients, then close idle HTTP clients.
+
+        An SDK client in use keeps its HTTP client fresh (see ``_touch``), so
+        the HTTP clients closed here have no recently used SDK client on top.
+        """
+        cutoff = self._clock() - self.idle_seconds
+        while self._sdk and next(iter(self._sdk.values())).last_used < cutoff:
+            self._sdk.popitem(last=False)
+            self.evictions += 1
+        while self._http and next(iter(self._http.values())).last_used < cutoff:
+            _, entry = self._http.popitem(last=False)
+            self.evictions += 1
+            try:
+                entry.client.close()
+            except Exception as e:
+                logger.debug("Closing idle LLM HTTP client failed: %s", e)
+
+    def close(self) -> None:
+        """Close every pooled HTTP client and forget all entries."""
+        with self._lock:
+            http = list(self._http.values())
+            self._http.clear()
+            self._sdk.clear()
+        for entry in http:
+            try:
+                entry.client.close()
+            except Exception as e:
+                logger.debug("Closing LLM HTTP client failed: %s", e)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "requests": self.requests,
+                "connections": self.connections,
+                "reused_connections": max(self.requests - self.connections, 0),
+                "http_clients": len(self._http),
+                "sdk_clients": len(self._sdk),
+            }
+
+
+_POOL: Optional[LLMClientPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def resolve_max_clients() -> int:
+    """Pool bound from settings, defensively — 0 disables pooling."""
+    return _int_setting("LLM_CLIENT_POOL_MAX_CLIENTS", DEFAULT_MAX_CLIENTS)
+
+
+def get_client_pool() -> Optional[LLMClientPool]:
+    """Return this process's client pool, or ``None`` when it is disabled."""
+    global _POOL
+    if _POOL is not None:
+        return _POOL
+    max_clients = resolve_max_clients()
+    if max_clients <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = LLMClientPool(
+                max_clients,
+                _int_setting("LLM_CLIENT_POOL_IDLE_SECONDS", DEFAULT_IDLE_SECONDS),
+            )
+    return _POOL
+
+
+def pool_stats() -> Dict[str, int]:
+    """Counters for the process pool; all zeros when it is disabled."""
+    pool = get_client_pool()
+    if pool is None:
+        return {
+            "hits": 0, "misses": 0, "evictions": 0, "requests": 0,
+            "connections": 0, "reused_connections": 0,
+            "http_clients": 0, "sdk_clients": 0,
+        }
+    return pool.stats()
@@ -6,6 +6,7 @@ from google.genai import types
 from application.core.settings import settings
 
 from application.llm.base import BaseLLM
+from application.llm.client_pool import get_client_pool
 from application.llm.handlers.google import _decode_thought_signature
 from application.storage.storage_creator import StorageCreator
 
@@ -21,7 +22,20 @@ class GoogleLLM(BaseLLM):
         self.api_key = api_key or settings.GOOGLE_API_KEY or settings.API_KEY
         self.user_api_key = user_api_key
 
-        self.client = genai.Client(api_key=self.api_key)
+        pool = get_client_pool()
+        if pool is not None:
+            api_key = self.api_key
+            self.client = pool.sdk_client(
+                self.provider_name,
+                None,
+                api_key,
+                lambda http: genai.Client(
+                    api_key=api_key,
+                    http_options=types.HttpOptions(httpx_client=http),
+                ),
+            )
+        else:
+            self.client = genai.Client(api_key=self.api_key)
         self.storage = StorageCreator.get_storage()
 
     def get_supported_attachment_types(self):
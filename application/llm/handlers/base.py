@@ -1,7 +1,9 @@
+import contextvars
 import json
 import logging
 import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, Generator, List, Optional, Union
 
@@ -60,6 +62,35 @@ def _bound_tool_response_for_llm(tool_response: Any) -> Any:
     return text[:keep] + marker + text[-keep:]
 
 
+def _tool_call_concurrency() -> int:
+    """``TOOL_CALL_CONCURRENCY`` read defensively; 1 when unset or unusable."""
+    from application.core.settings import settings
+
+    value = getattr(settings, "TOOL_CALL_CONCURRENCY", 1)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 1:
+        return value
+    return 1
+
+
+def _drain_tool_action(agent, tools_dict: Dict, call) -> tuple:
+    """Run one tool call to completion off the request thread.
+
+    Returns ``(events, outcome, error)``: the status events the executor
+    yielded, its ``(result, call_id)`` return value, and the exception it
+    raised (``outcome`` is then ``None``).
+    """
+    events: List[Dict] = []
+    try:
+        gen = agent._execute_tool_action(tools_dict, call)
+        while True:
+            try:
+                events.append(next(gen))
+            except StopIteration as e:
+                return events, e.value, None
+    except Exception as e:
+        return events, None, e
+
+
 @dataclass
 class ToolCall:
     """Represents a tool/function call from the LLM."""
@@ -853,6 +884,91 @@ class LLMHandler(ABC):
             )
             return False, None
 
+    def _parallel_wave(
+        self, agent, tool_calls: List["ToolCall"], start: int, tools_dict: Dict,
+        pause_cache: Dict[int, Optional[Dict]],
+    ) -> List[int]:
+        """Indexes of the run of calls from ``start`` that may execute at once.
+
+        A run is consecutive calls that neither pause nor touch a tool other
+        than a ``parallel_safe`` one; it stops at the first call that does, so
+        the calls around it keep their serial order. Pause checks made here
+        are stored in ``pause_cache`` for the main loop to reuse.
+        """
+        executor = agent.tool_executor
+        if not callable(getattr(executor, "is_parallel_safe", None)):
+            return []
+        llm_class = agent.llm.__class__.__name__
+        wave: List[int] = []
+        for j in range(start, len(tool_calls)):
+            call = tool_calls[j]
+            if executor.is_parallel_safe(tools_dict, call, llm_class) is not True:
+                break
+            pause_cache[j] = executor.check_pause(tools_dict, call, llm_class)
+            if pause_cache[j]:
+                break
+            wave.append(j)
+        return wave if len(wave) > 1 else []
+
+    def _wave_budget(self, agent, messages: List[Dict], size: int) -> int:
+        """How many calls of a ``size`` wave fit the remaining context.
+
+        A wave runs its calls before the per-call context check sees their
+        results, so a call the check would then skip has already executed.
+        Each result enters the context capped at ``TOOL_RESULT_MAX_TOKENS``,
+        which bounds what a wave can add; the wave is cut to the calls whose
+        worst case fits the headroom. Uncapped results can't be bounded, so
+        the calls then run one at a time. Agents that can't report headroom
+        keep the whole wave.
+        """
+        from application.core.settings import settings
+
+        headroom_fn = getattr(agent, "_context_headroom", None)
+        headroom = headroom_fn(messages) if callable(headroom_fn) else None
+        if not isinstance(headroom, int) or isinstance(headroom, bool):
+            return size
+        per_call = int(getattr(settings, "TOOL_RESULT_MAX_TOKENS", 0) or 0)
+        if per_call <= 0:
+            return 1
+        return max(1, min(size, headroom // per_call))
+
+    def _run_parallel_wave(
+        self, agent, tool_calls: List["ToolCall"], wave: List[int], tools_dict: Dict,
+        limit: int,
+    ) -> Dict[int, tuple]:
+        """Execute the calls at ``wave`` concurrently; outcomes keyed by index.
+
+        Each worker runs in a copy of the request's context so context-bound
+        state (app context, logging context) is visible to the tool. Rows the
+        executor recorded are put back in call order afterwards, so the
+        persisted tool calls read as if the batch ran serially.
+        """
+        executor = agent.tool_executor
+        recorded = getattr(executor, "tool_calls", None)
+        first_new = len(recorded) if isinstance(recorded, list) else None
+        with ThreadPoolExecutor(
+            max_workers=min(limit, len(wave)), thread_name_prefix="tool-call"
+        ) as pool:
+            futures = {
+                j: pool.submit(
+                    contextvars.copy_context().run,
+                    _drain_tool_action, agent, tools_dict, tool_calls[j],
+                )
+                for j in wave
+            }
+            outcomes = {j: future.result() for j, future in futures.items()}
+        if first_new is not None:
+            order = {}
+            for j in wave:
+                outcome = outcomes[j][1]
+                call_id = outcome[1] if outcome else tool_calls[j].id
+                order.setdefault(call_id, j)
+            recorded[first_new:] = sorted(
+                recorded[first_new:],
+                key=lambda row: order.get(row.get("call_id"), len(tool_calls)),
+            )
+        return outcomes
+
     def handle_tool_calls(
         self,
         agent,
@@ -901,6 +1017,13 @@ class LLMHandler(ABC):
         # "No tool output found for function call <first unpaired call>".
         batch_assistant: Optional[Dict[str, Any]] = None
 
+        # Consecutive ``parallel_safe`` calls (web searches, page reads) run
+        # concurrently as a wave when TOOL_CALL_CONCURRENCY allows; their
+        # events and messages are still emitted below in call order.
+        concurrency = _tool_call_concurrency()
+        wave_outcomes: Dict[int, tuple] = {}
+        pause_cache: Dict[int, Optional[Dict]] = {}
+
         def _declare_call(tool_call_obj: Dict[str, Any]) -> None:
             """Add ``tool_call_obj`` to the batch's assistant message,
             creating (and appending) that message on first use."""
@@ -919,7 +1042,9 @@ class LLMHandler(ABC):
             batch_assistant["tool_calls"].append(tool_call_obj)
 
         for i, call in enumerate(tool_calls):
-            # Check context limit before executing tool call
+            # Check context limit before executing tool call. This runs for
+            # calls that already ran in a wave too: their results are about
+            # to be appended, so they get the same compress-or-skip decision.
             if hasattr(agent, '_check_context_limit') and agent._check_context_limit(updated_messages):
                 # Context limit reached - attempt mid-execution compression
                 compression_attempted = False
@@ -1029,11 +1154,22 @@ class LLMHandler(ABC):
                     agent.context_limit_reached = True
                     break
 
+            if concurrency > 1 and i not in wave_outcomes and i not in pause_cache:
+                wave = self._parallel_wave(agent, tool_calls, i, tools_dict, pause_cache)
+                wave = wave[: self._wave_budget(agent, updated_messages, len(wave))]
+                if len(wave) > 1:
+                    wave_outcomes.update(
+                        self._run_parallel_wave(agent, tool_calls, wave, tools_dict, concurrency)
+                    )
+
             # ---- Pause check: approval / client-side execution ----
             llm_class = agent.llm.__class__.__name__
-            pause_info = agent.tool_executor.check_pause(
-                tools_dict, call, llm_class
-            )
+            if i in pause_cache:
+                pause_info = pause_cache.pop(i)
+            else:
+                pause_info = agent.tool_executor.check_pause(
+                    tools_dict, call, llm_class
+                )
             if pause_info:
                 # Headless (scheduled / webhook): synthesize a denial tool message
                 # so the LLM finishes gracefully instead of stalling on a pause
@@ -1133,13 +1269,20 @@ class LLMHandler(ABC):
             assistant_appended = False
             try:
                 self.tool_calls.append(call)
-                tool_executor_gen = agent._execute_tool_action(tools_dict, call)
-                while True:
-                    try:
-                        yield next(tool_executor_gen)
-                    except StopIteration as e:
-                        tool_response, call_id = e.value
-                        break
+                if i in wave_outcomes:
+                    events, outcome, error = wave_outcomes.pop(i)
+                    yield from events
+                    if error is not None:
+                        raise error
+                    tool_response, call_id = outcome
+                else:
+                    tool_executor_gen = agent._execute_tool_action(tools_dict, call)
+                    while True:
+                        try:
+                            yield next(tool_executor_gen)
+                        except StopIteration as e:
+                            tool_response, call_id = e.value
+                            break
                 # The journal / persisted conversation received the full
                 # result inside the executor; the model gets a bounded copy.
                 tool_response = _bound_tool_response_for_llm(tool_response)
@@ -30,6 +30,7 @@ class LLMCreator:
         ``decoded_token`` represents the caller.
         """
         from application.core.model_registry import ModelRegistry
+        from application.llm.client_pool import get_client_pool
         from application.security.safe_url import (
             UnsafeUserUrlError,
             pinned_httpx_client,
@@ -98,11 +99,15 @@ class LLMCreator:
                     # binds the SDK's outbound socket to the validated IP
                     # (preserves Host / SNI). Future BYOM providers must
                     # opt in explicitly — only openai_compatible takes
-                    # http_client today.
+                    # http_client today. The pool keeps one pinned client
+                    # (and its keep-alive connections) per base URL.
                     if plugin.name == "openai_compatible":
+                        pool = get_client_pool()
                         try:
-                            kwargs["http_client"] = pinned_httpx_client(
-                                base_url
+                            kwargs["http_client"] = (
+                                pool.http_client(plugin.name, base_url, pinned=True)
+                                if pool is not None
+                                else pinned_httpx_client(base_url)
                             )
                         except UnsafeUserUrlError as e:
                             raise ValueError(
@@ -10,6 +10,7 @@ from openai import BadRequestError, OpenAI
 
 from application.core.settings import settings
 from application.llm.base import BaseLLM
+from application.llm.client_pool import get_client_pool
 from application.storage.storage_creator import StorageCreator
 
 # Placeholder sent to OpenAI-compatible backends that require no credentials.
@@ -227,7 +228,21 @@ class OpenAILLM(BaseLLM):
 
         # http_client (set by LLMCreator for BYOM) is a DNS-rebinding-safe
         # httpx.Client; without it the SDK re-resolves DNS per request.
-        if http_client is not None:
+        # With the client pool on, the SDK client and its keep-alive
+        # connections are shared across requests to the same endpoint.
+        pool = get_client_pool()
+        if pool is not None:
+            api_key = self.api_key
+            self.client = pool.sdk_client(
+                self.provider_name,
+                effective_base_url,
+                api_key,
+                lambda http: OpenAI(
+                    api_key=api_key, base_url=effective_base_url, http_client=http
+                ),
+                http_client=http_client,
+            )
+        elif http_client is not None:
             self.client = OpenAI(
                 api_key=self.api_key,
                 base_url=effective_base_url,
@@ -0,0 +1,296 @@
+"""Content-addressed cache of chunk embeddings for the ingest pipeline.
+
+A nightly sync of a crawled site re-embeds every chunk even when almost no
+page changed. The cache maps (embeddings model, SHA-256 of the normalized
+chunk text) to the vector that model produced, and
+:class:`CachingEmbeddings` consults it before calling the real embedder, so
+only new or edited chunks cost an embedding call.
+
+``EMBEDDING_CACHE_BACKEND`` selects where vectors live:
+
+* ``sqlite`` — a local file (``EMBEDDING_CACHE_PATH``) bounded to
+  ``EMBEDDING_CACHE_MAX_ENTRIES`` rows, least-recently-used rows evicted.
+  Per host, so it suits a single worker box.
+* ``postgres`` — the ``embedding_cache`` table in the user-data database,
+  shared by every worker; bounded by the ``cleanup_embedding_cache`` beat.
+* unset — no caching; the pipeline embeds exactly as before.
+
+Cache failures are never fatal: a lookup or write that raises is logged and
+the affected chunks are simply embedded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SQLITE = "sqlite"
+POSTGRES = "postgres"
+
+# SQLite's default host-parameter limit is 999; stay well under it.
+_SQLITE_BATCH = 500
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of a chunk for hashing.
+
+    NFC-normalized, NUL-free, whitespace runs collapsed and ends stripped —
+    so re-extraction noise (trailing newlines, reflowed spaces) still hits.
+    """
+    text = unicodedata.normalize("NFC", (text or "").replace("\x00", ""))
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def encode_vector(vector: List[float]) -> bytes:
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def decode_vector(data: bytes) -> List[float]:
+    return np.frombuffer(data, dtype="<f4").tolist()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Per-ingest hit/miss counters, reported in the completion event."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class SQLiteEmbeddingCache:
+    """Embedding cache in a local SQLite file, bounded by row count.
+
+    Opened in WAL mode with a generous busy timeout so several worker
+    processes on one host can share the file.
+
+    Rows are counted once per process and the count is then estimated from
+    this process's own puts, so the table is only recounted when the estimate
+    passes ``max_entries``. Eviction trims a further tenth below the cap so
+    the next recount is that many puts away. Rows other processes add go
+    unseen until then, which makes the cap approximate on a shared file.
+    """
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used "
+            "ON embedding_cache (last_used)"
+        )
+        # Upper bound on the table's rows: puts count as inserts even when
+        # they replace a row. Recounted exactly before any eviction.
+        self._rows = self._count()
+
+    def get_many(self, model: str, text_hashes: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(text_hashes), _SQLITE_BATCH):
+                batch = text_hashes[start:start + _SQLITE_BATCH]
+                marks = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embedding_cache "
+                    f"WHERE model = ? AND text_hash IN ({marks})",
+                    [model, *batch],
+                ).fetchall()
+                if not rows:
+                    continue
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? "
+                    "WHERE model = ? AND text_hash = ?",
+                    [(now, model, text_hash) for text_hash, _ in rows],
+                )
+                found.update((text_hash, decode_vector(blob)) for text_hash, blob in rows)
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        if not vectors:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(model, text_hash, vector, last_used) VALUES (?, ?, ?, ?)",
+                [(model, h, encode_vector(v), now) for h, v in vectors.items()],
+            )
+            self._rows += len(vectors)
+            if self._rows > self.max_entries:
+                self._evict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM embedding_cache").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Trim least-recently-used rows once over ``max_entries``; caller holds the lock."""
+        self._rows = self._count()
+        if self._rows <= self.max_entries:
+            return
+        low_water = self.max_entries - self.max_entries // 10
+        cursor = self._conn.execute(
+            "DELETE FROM embedding_cache WHERE (model, text_hash) IN ("
+            "SELECT model, text_hash FROM embedding_cache "
+            "ORDER BY last_used LIMIT ?)",
+            (self._rows - low_water,),
+        )
+        self._rows -= cursor.rowcount
+
+
+class PostgresEmbeddingCache:
+    """Embedding cache in the user-data Postgres ``embedding_cache`` table."""
+
+    def get_many(self, model: str, text_hashes: List[str]) -> Dict[str, List[float]]:
+        from application.storage.db.repositories.embedding_cache import (
+            EmbeddingCacheRepository,
+        )
+        from application.storage.db.session import db_session
+
+        with db_session() as conn:
+            rows = EmbeddingCacheRepository(conn).get_many(model, text_hashes)
+        return {text_hash: decode_vector(blob) for text_hash, blob in rows.items()}
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        from application.storage.db.repositories.embedding_cache import (
+            EmbeddingCacheRepository,
+        )
+        from application.storage.db.session import db_session
+
+        with db_session() as conn:
+            EmbeddingCacheRepository(conn).put_many(
+                model, [(h, encode_vector(v)) for h, v in vectors.items()]
+            )
+
+
+def model_key() -> str:
+    """Cache namespace for the configured embedder.
+
+    The model name plus anything else that changes its output for the same
+    text — a different remote endpoint or input truncation must not share
+    vectors.
+    """
+    from application.core.settings import settings
+
+    parts = [str(settings.EMBEDDINGS_NAME)]
+    for name in ("EMBEDDINGS_BASE_URL", "EMBEDDINGS_MAX_INPUT_TOKENS"):
+        value = getattr(settings, name, None)
+        if isinstance(value, (str, int)) and not isinstance(value, bool) and value:
+            parts.append(f"{name.lower()}={value}")
+    return "|".join(parts)
+
+
+_CACHE: Optional[Any] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[Any]:
+    """Return this process's embedding cache, or ``None`` when disabled."""
+    global _CACHE
+    from application.core.settings import settings
+
+    backend = getattr(settings, "EMBEDDING_CACHE_BACKEND", None)
+    if not isinstance(backend, str) or not backend:
+        return None
+    backend = backend.lower()
+    if _CACHE is not None:
+        return _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            if backend == SQLITE:
+                _CACHE = SQLiteEmbeddingCache(
+                    settings.EMBEDDING_CACHE_PATH,
+                    settings.EMBEDDING_CACHE_MAX_ENTRIES,
+                )
+            elif backend == POSTGRES:
+                _CACHE = PostgresEmbeddingCache()
+            else:
+                logger.warning("Unknown EMBEDDING_CACHE_BACKEND %r; caching disabled", backend)
+                return None
+    return _CACHE
+
+
+class CachingEmbeddings:
+    """Wraps an embeddings object so ``embed_documents`` reads through the cache.
+
+    Only ``embed_documents`` is cached — it is what the ingest pipeline
+    calls. Duplicate texts within one call are embedded once. Counters are
+    updated only after the embedder succeeds, so a retried batch is not
+    double-counted.
+    """
+
+    def __init__(self, embeddings: Any, cache: Any, model: str) -> None:
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model
+        self.stats = EmbeddingCacheStats()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.embeddings, name)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [content_hash(text) for text in texts]
+        try:
+            found = self.cache.get_many(self.model, sorted(set(keys)))
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}", exc_info=True)
+            found = {}
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            fresh = dict(zip(missing.keys(), vectors))
+            try:
+                self.cache.put_many(self.model, fresh)
+            except Exception as e:
+                logger.warning(f"Embedding cache write failed: {e}", exc_info=True)
+            found = {**found, **fresh}
+
+        self.stats.misses += len(missing)
+        self.stats.hits += len(texts) - len(missing)
+        return [found[key] for key in keys]
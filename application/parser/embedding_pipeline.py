@@ -1,15 +1,27 @@
 import os
 import logging
-from typing import Any, List, Optional
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from retry import retry
 from tqdm import tqdm
 from application.core.settings import settings
 from application.events.publisher import publish_user_event
+from application.parser.embedding_cache import (
+    CachingEmbeddings,
+    get_embedding_cache,
+    model_key,
+)
 from application.parser.file.base_parser import DocumentParseError
 from application.storage.db.repositories.ingest_chunk_progress import (
     IngestChunkProgressRepository,
 )
 from application.storage.db.session import db_session
+from application.utils import num_tokens_from_string
+from application.vectorstore.base import get_embeddings
 from application.vectorstore.vector_creator import VectorCreator
 
 
@@ -39,33 +51,230 @@ def sanitize_content(content: str) -> str:
     return content.replace('\x00', '')
 
 
+def _prepare_doc(doc: Any, source_id: str) -> Any:
+    """Sanitize ``doc`` and stamp its source id, in place; returns ``doc``."""
+    doc.page_content = sanitize_content(doc.page_content)
+    doc.metadata["source_id"] = str(source_id)
+    return doc
+
+
+# How often a blocked ``pipeline_stage`` producer rechecks for shutdown.
+_STAGE_POLL_SECONDS = 0.5
+
+_NO_TEXT_MESSAGE = (
+    "No text could be extracted from this file. It may be empty, "
+    "image-only, or in an unsupported format."
+)
+
+
+def _has_text(doc: Any) -> bool:
+    return bool(
+        str(getattr(doc, "text", getattr(doc, "page_content", doc)) or "").strip()
+    )
+
+
 # Per-chunk inline retry. Aggressive defaults (tries=10, delay=60) blocked
 # the loop for up to 9 min per chunk and wedged the heartbeat: lower the
 # tail so a transient failure fails-fast and the chunk-progress checkpoint
 # resumes cleanly on next dispatch.
 @retry(tries=3, delay=5, backoff=2)
-def add_text_to_store_with_retry(store: Any, doc: Any, source_id: str) -> None:
+def add_text_to_store_with_retry(
+    store: Any, doc: Any, source_id: str, embeddings: Any = None
+) -> None:
     """Add a document's text and metadata to the vector store with retry logic.
     
     Args:
         store: The vector store object.
         doc: The document to be added.
         source_id: Unique identifier for the source.
+        embeddings: When given (the embedding cache is on), the chunk is
+            embedded through it and the vector handed to the store;
+            otherwise the store embeds it itself.
         
     Raises:
         Exception: If document addition fails after all retry attempts.
     """
     try:
         # Sanitize content to remove NUL characters that cause ingestion failures
-        doc.page_content = sanitize_content(doc.page_content)
-        
-        doc.metadata["source_id"] = str(source_id)
-        store.add_texts([doc.page_content], metadatas=[doc.metadata])
+        _prepare_doc(doc, source_id)
+        if embeddings is None:
+            store.add_texts([doc.page_content], metadatas=[doc.metadata])
+        else:
+            store.add_texts(
+                [doc.page_content],
+                metadatas=[doc.metadata],
+                vectors=embeddings.embed_documents([doc.page_content]),
+            )
     except Exception as e:
         logging.error(f"Failed to add document with retry: {e}", exc_info=True)
         raise
 
 
+@retry(tries=3, delay=5, backoff=2)
+def embed_batch_with_retry(embeddings: Any, texts: List[str]) -> List[List[float]]:
+    """Embed one batch of chunk texts with a single ``embed_documents`` call.
+
+    Same retry envelope as :func:`add_text_to_store_with_retry`: short, so a
+    persistent failure surfaces and the per-batch checkpoint resumes it.
+    """
+    try:
+        return embeddings.embed_documents(texts)
+    except Exception as e:
+        logging.error(f"Failed to embed batch with retry: {e}", exc_info=True)
+        raise
+
+
+@retry(tries=3, delay=5, backoff=2)
+def add_batch_to_store_with_retry(
+    store: Any, docs: List[Any], vectors: List[List[float]]
+) -> None:
+    """Write a batch of prepared documents and their precomputed vectors.
+
+    Args:
+        store: The vector store object.
+        docs: Documents already passed through :func:`_prepare_doc`.
+        vectors: Embeddings of ``docs``, row-aligned.
+    """
+    try:
+        store.add_texts(
+            [doc.page_content for doc in docs],
+            metadatas=[doc.metadata for doc in docs],
+            vectors=vectors,
+        )
+    except Exception as e:
+        logging.error(f"Failed to add batch with retry: {e}", exc_info=True)
+        raise
+
+
+def _group_batches(
+    indexed_docs: Iterable[Tuple[int, Any]], max_items: int, max_tokens: int,
+) -> Iterator[Tuple[int, List[Any]]]:
+    """Group consecutive ``(index, doc)`` pairs into ``(first_index, docs)`` batches.
+
+    A batch closes at ``max_items`` chunks or once adding the next chunk
+    would push it past ``max_tokens`` (``0`` disables the token bound). A
+    single chunk larger than the token bound still gets its own batch —
+    truncation is the embedder's concern, not the planner's. Batches are
+    yielded as they fill, so the input may be a stream.
+    """
+    batch: List[Any] = []
+    lo, tokens = 0, 0
+    for idx, doc in indexed_docs:
+        size = num_tokens_from_string(doc.page_content) if max_tokens > 0 else 0
+        if batch and (
+            len(batch) >= max_items or (max_tokens > 0 and tokens + size > max_tokens)
+        ):
+            yield lo, batch
+            batch, tokens = [], 0
+        if not batch:
+            lo = idx
+        batch.append(doc)
+        tokens += size
+    if batch:
+        yield lo, batch
+
+
+def _plan_batches(
+    docs: List[Any], start: int, max_items: int, max_tokens: int,
+) -> List[Tuple[int, int]]:
+    """Split ``docs[start:]`` into ``[lo, hi)`` ranges for batched embedding.
+
+    Batch boundaries follow :func:`_group_batches`.
+    """
+    indexed = ((idx, docs[idx]) for idx in range(start, len(docs)))
+    return [
+        (lo, lo + len(batch))
+        for lo, batch in _group_batches(indexed, max_items, max_tokens)
+    ]
+
+
+def _embed_and_store_batched(
+    store: Any,
+    docs: List[Any],
+    loop_start: int,
+    source_id: str,
+    batch_size: int,
+    report_progress: Any,
+    embeddings: Any = None,
+) -> Tuple[Optional[Exception], Optional[int]]:
+    """Batched, pipelined variant of the per-chunk embed loop.
+
+    Embedding runs on a single background thread up to
+    ``INGEST_EMBED_PREFETCH`` batches ahead, so batch N+1 is being embedded
+    while batch N is written to the store. Each stored batch commits one
+    checkpoint at its last index, keeping the ``attempt_id`` / ``last_index``
+    resume semantics of the per-chunk loop at batch granularity.
+
+    ``embeddings`` defaults to the configured model; the caller passes a
+    :class:`CachingEmbeddings` when the embedding cache is on.
+
+    Returns:
+        ``(error, failed_index)`` — both ``None`` when every batch landed.
+        ``failed_index`` is the first chunk of the batch that failed.
+    """
+    batches = _plan_batches(
+        docs,
+        loop_start,
+        batch_size,
+        settings.INGEST_EMBED_BATCH_MAX_TOKENS,
+    )
+    if not batches:
+        return None, None
+
+    if embeddings is None:
+        embeddings = _get_ingest_embeddings()
+    prefetch = max(0, settings.INGEST_EMBED_PREFETCH)
+    batch_iter = iter(batches)
+    pending: deque = deque()
+    error: Optional[Exception] = None
+    failed_idx: Optional[int] = None
+
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="ingest-embed"
+    ) as executor, tqdm(
+        desc="Embedding 🦖",
+        unit="docs",
+        total=len(docs) - loop_start,
+        bar_format="{l_bar}{bar}| Time Left: {remaining}",
+    ) as bar:
+
+        def _submit_next() -> None:
+            batch = next(batch_iter, None)
+            if batch is None:
+                return
+            lo, hi = batch
+            texts = [_prepare_doc(docs[i], source_id).page_content for i in range(lo, hi)]
+            pending.append((lo, hi, executor.submit(embed_batch_with_retry, embeddings, texts)))
+
+        for _ in range(prefetch + 1):
+            _submit_next()
+
+        while pending:
+            lo, hi, future = pending.popleft()
+            try:
+                vectors = future.result()
+                # Refill the window before the store write so the embedder
+                # stays busy while this batch lands.
+                _submit_next()
+                report_progress(hi)
+                add_batch_to_store_with_retry(store, docs[lo:hi], vectors)
+                _record_progress(source_id, last_index=hi - 1, embedded_chunks=hi)
+                bar.update(hi - lo)
+            except Exception as e:
+                error, failed_idx = e, lo
+                logging.error(
+                    f"Error embedding documents {lo}-{hi - 1}: {e}", exc_info=True
+                )
+                for *_, queued in pending:
+                    queued.cancel()
+                break
+    return error, failed_idx
+
+
+def _get_ingest_embeddings() -> Any:
+    return get_embeddings(settings.EMBEDDINGS_NAME, os.getenv("EMBEDDINGS_KEY"))
+
+
 def _init_progress_and_resume_index(
     source_id: str, total_chunks: int, attempt_id: Optional[str],
 ) -> int:
@@ -102,12 +311,25 @@ def _init_progress_and_resume_index(
     return int(last_index) + 1
 
 
-def _record_progress(source_id: str, last_index: int, embedded_chunks: int) -> None:
-    """Best-effort checkpoint after each chunk; logged but never raised."""
+def _record_progress(
+    source_id: str,
+    last_index: int,
+    embedded_chunks: int,
+    total_chunks: Optional[int] = None,
+) -> None:
+    """Best-effort checkpoint after each chunk; logged but never raised.
+
+    ``total_chunks`` also moves the row's total (the streaming path learns
+    it as chunks arrive).
+    """
+    extra = {} if total_chunks is None else {"total_chunks": total_chunks}
     try:
         with db_session() as conn:
             IngestChunkProgressRepository(conn).record_chunk(
-                source_id, last_index=last_index, embedded_chunks=embedded_chunks
+                source_id,
+                last_index=last_index,
+                embedded_chunks=embedded_chunks,
+                **extra,
             )
     except Exception as e:
         logging.warning(
@@ -147,6 +369,146 @@ def assert_index_complete(source_id: str) -> None:
         )
 
 
+def _create_store(source_id: str, is_resume: bool, seed_doc: Any) -> Tuple[Any, bool]:
+    """Open the vector store for an embed run.
+
+    Returns ``(store, seeded)``; ``seeded`` is true when ``seed_doc`` was
+    embedded into a fresh FAISS index to construct it, so the caller's loop
+    starts after it.
+    """
+    if settings.VECTOR_STORE == "faiss":
+        if is_resume:
+            # Load the existing FAISS index from storage so chunks
+            # already embedded by the prior attempt survive the
+            # save_local rewrite at the end of this run.
+            store = VectorCreator.create_vectorstore(
+                settings.VECTOR_STORE,
+                source_id=source_id,
+                embeddings_key=os.getenv("EMBEDDINGS_KEY"),
+            )
+            return store, False
+        # FAISS requires at least one doc to construct the store;
+        # seed with the first chunk and let the loop pick up after it.
+        store = VectorCreator.create_vectorstore(
+            settings.VECTOR_STORE,
+            docs_init=[seed_doc],
+            source_id=source_id,
+            embeddings_key=os.getenv("EMBEDDINGS_KEY"),
+        )
+        return store, True
+    store = VectorCreator.create_vectorstore(
+        settings.VECTOR_STORE,
+        source_id=source_id,
+        embeddings_key=os.getenv("EMBEDDINGS_KEY"),
+    )
+    # Only wipe the index on a fresh run — a resume must keep the
+    # chunks that earlier attempts already embedded.
+    if not is_resume:
+        store.delete_index()
+    return store, False
+
+
+def _progress_reporter(
+    task_status: Any,
+    user_id: Optional[str],
+    source_id: str,
+    progress_start: int,
+    progress_end: int,
+) -> Any:
+    """Build ``report(embedded, total)``, mapping the embed loop into the band."""
+    last_published_pct = -1
+    source_id_str = str(source_id)
+    progress_span = progress_end - progress_start
+
+    def _report_progress(embedded: int, total: int) -> None:
+        nonlocal last_published_pct
+        # Map the embed loop into [progress_start, progress_end].
+        progress = progress_start + int((embedded / total) * progress_span)
+        task_status.update_state(state="PROGRESS", meta={"current": progress})
+
+        # SSE push for sub-second upload-toast updates. Throttled to one
+        # event per percent so a 10k-chunk ingest emits ~100 events,
+        # not 10k. The Celery update_state above stays the source of
+        # truth for the polling-fallback path.
+        if user_id and progress > last_published_pct:
+            publish_user_event(
+                user_id,
+                "source.ingest.progress",
+                {
+                    "current": progress,
+                    "total": total,
+                    "embedded_chunks": embedded,
+                    "stage": "embedding",
+                },
+                scope={"kind": "source", "id": source_id_str},
+            )
+            last_published_pct = progress
+
+    return _report_progress
+
+
+def _caching_embeddings() -> Optional[CachingEmbeddings]:
+    # Content-addressed embedding cache: unchanged chunks of a re-synced
+    # source reuse their stored vectors instead of calling the embedder.
+    cache = get_embedding_cache()
+    if cache is None:
+        return None
+    return CachingEmbeddings(_get_ingest_embeddings(), cache, model_key())
+
+
+def _save_store(
+    store: Any,
+    folder_name: str,
+    source_id: str,
+    chunk_error: Optional[Exception],
+    failed_idx: Optional[int],
+    total: int,
+) -> None:
+    """Flush the store after the embed loop, then re-raise a chunk failure."""
+    if chunk_error is not None:
+        logging.info(f"Saving progress at document {failed_idx} out of {total}")
+        try:
+            store.save_local(folder_name)
+            logging.info("Progress saved successfully")
+        except Exception as save_error:
+            logging.error(f"CRITICAL: Failed to save progress: {save_error}", exc_info=True)
+            # Continue without breaking to attempt final save
+
+    # Save the vector store
+    if settings.VECTOR_STORE == "faiss":
+        try:
+            store.save_local(folder_name)
+            logging.info("Vector store saved successfully.")
+        except Exception as e:
+            logging.error(f"CRITICAL: Failed to save final vector store: {e}", exc_info=True)
+            raise OSError(f"Unable to save vector store to {folder_name}: {e}") from e
+    else:
+        logging.info("Vector store saved successfully.")
+
+    # Re-raise after the partial save: the chunks that *did* embed are
+    # flushed to disk and recorded in ``ingest_chunk_progress``, so a
+    # Celery autoretry resumes via ``_read_resume_index`` and only
+    # re-runs the failed-and-after chunks. Without the raise, the
+    # task body returns success and ``with_idempotency`` finalises
+    # ``task_dedup`` as ``completed`` for a partial index — poisoning
+    # the cache for 24h.
+    if chunk_error is not None:
+        raise EmbeddingPipelineError(
+            f"embed failure at chunk {failed_idx}/{total} "
+            f"for source {source_id}"
+        ) from chunk_error
+
+
+def _cache_stats(
+    cached_embeddings: Optional[CachingEmbeddings], source_id: str,
+) -> Optional[Dict[str, Any]]:
+    if cached_embeddings is None:
+        return None
+    cache_stats = cached_embeddings.stats.as_dict()
+    logging.info(f"Embedding cache for source {source_id}: {cache_stats}")
+    return cache_stats
+
+
 def embed_and_store_documents(
     docs: List[Any],
     folder_name: str,
@@ -157,7 +519,7 @@ def embed_and_store_documents(
     user_id: Optional[str] = None,
     progress_start: int = 0,
     progress_end: int = 100,
-) -> None:
+) -> Optional[Dict[str, Any]]:
     """Embeds documents and stores them in a vector store.
 
     Resumable across Celery autoretries of the *same* task: when
@@ -186,11 +548,14 @@ def embed_and_store_documents(
             chunk. Defaults to ``100``.
 
     Returns:
-        None
+        Embedding-cache counters (``hits`` / ``misses`` / ``hit_rate``) for
+        this run when ``EMBEDDING_CACHE_BACKEND`` is set, else ``None``.
+        Workers attach them to the ``source.ingest.completed`` event.
 
     Raises:
         OSError: If unable to create folder or save vector store.
-        EmbeddingPipelineError: If a chunk fails after retries.
+        EmbeddingPipelineError: If a chunk (or, with
+            ``INGEST_EMBED_BATCH_SIZE > 1``, a batch) fails after retries.
     """
     # Ensure the folder exists
     if not os.path.exists(folder_name):
@@ -200,20 +565,14 @@ def embed_and_store_documents(
     # (empty upload, whitespace-only, an image-only PDF with no OCR) used to
     # reach here as a one-element list of "" and ingest as a healthy source,
     # putting an embedding of the empty string into the index.
-    docs = [
-        d for d in docs
-        if str(getattr(d, "text", getattr(d, "page_content", d)) or "").strip()
-    ]
+    docs = [d for d in docs if _has_text(d)]
     if not docs:
         # ``DocumentParseError``, not ``ValueError``: an empty or image-only
         # file yields nothing on every attempt, so this must reach the Celery
         # tasks' ``dont_autoretry_for`` and fail once. As a bare ``ValueError``
         # it was swept up by ``autoretry_for=(Exception,)`` and re-failed
         # identically across the whole backoff envelope.
-        raise DocumentParseError(
-            "No text could be extracted from this file. It may be empty, "
-            "image-only, or in an unsupported format."
-        )
+        raise DocumentParseError(_NO_TEXT_MESSAGE)
 
     total_docs = len(docs)
     # Atomic upsert that preserves checkpoint state on attempt-id match
@@ -225,45 +584,18 @@ def embed_and_store_documents(
     is_resume = resume_index > 0
 
     # Initialize vector store
-    if settings.VECTOR_STORE == "faiss":
-        if is_resume:
-            # Load the existing FAISS index from storage so chunks
-            # already embedded by the prior attempt survive the
-            # save_local rewrite at the end of this run.
-            store = VectorCreator.create_vectorstore(
-                settings.VECTOR_STORE,
-                source_id=source_id,
-                embeddings_key=os.getenv("EMBEDDINGS_KEY"),
-            )
-            loop_start = resume_index
-        else:
-            # FAISS requires at least one doc to construct the store;
-            # seed with ``docs[0]`` and let the loop pick up at index 1.
-            store = VectorCreator.create_vectorstore(
-                settings.VECTOR_STORE,
-                docs_init=[docs[0]],
-                source_id=source_id,
-                embeddings_key=os.getenv("EMBEDDINGS_KEY"),
-            )
-            # Record the seeded chunk so single-doc ingests don't fail
-            # ``assert_index_complete`` — the loop never runs for
-            # ``total_docs == 1`` and would otherwise leave
-            # ``embedded_chunks`` at 0 / ``last_index`` at -1. The loop
-            # body's per-iteration ``_record_progress`` overshoots
-            # correctly for multi-chunk runs (counts seed + iterations),
-            # so writing this checkpoint up-front is a no-op for those.
-            _record_progress(source_id, last_index=0, embedded_chunks=1)
-            loop_start = 1
+    store, seeded = _create_store(source_id, is_resume, docs[0])
+    if seeded:
+        # Record the seeded chunk so single-doc ingests don't fail
+        # ``assert_index_complete`` — the loop never runs for
+        # ``total_docs == 1`` and would otherwise leave
+        # ``embedded_chunks`` at 0 / ``last_index`` at -1. The loop
+        # body's per-iteration ``_record_progress`` overshoots
+        # correctly for multi-chunk runs (counts seed + iterations),
+        # so writing this checkpoint up-front is a no-op for those.
+        _record_progress(source_id, last_index=0, embedded_chunks=1)
+        loop_start = 1
     else:
-        store = VectorCreator.create_vectorstore(
-            settings.VECTOR_STORE,
-            source_id=source_id,
-            embeddings_key=os.getenv("EMBEDDINGS_KEY"),
-        )
-        # Only wipe the index on a fresh run — a resume must keep the
-        # chunks that earlier attempts already embedded.
-        if not is_resume:
-            store.delete_index()
         loop_start = resume_index
 
     if is_resume and loop_start >= total_docs:
@@ -278,78 +610,282 @@ def embed_and_store_documents(
     # Process and embed documents
     chunk_error: Exception | None = None
     failed_idx: int | None = None
-    last_published_pct = -1
-    source_id_str = str(source_id)
-    progress_span = progress_end - progress_start
-    for idx in tqdm(
-        range(loop_start, total_docs),
-        desc="Embedding 🦖",
-        unit="docs",
-        total=total_docs - loop_start,
-        bar_format="{l_bar}{bar}| Time Left: {remaining}",
-    ):
-        doc = docs[idx]
+    report = _progress_reporter(
+        task_status, user_id, source_id, progress_start, progress_end,
+    )
+
+    def _report_progress(embedded: int) -> None:
+        report(embedded, total_docs)
+
+    cached_embeddings = _caching_embeddings()
+
+    batch_size = int(settings.INGEST_EMBED_BATCH_SIZE or 1)
+    if batch_size > 1:
+        chunk_error, failed_idx = _embed_and_store_batched(
+            store, docs, loop_start, source_id, batch_size, _report_progress,
+            embeddings=cached_embeddings,
+        )
+    else:
+        for idx in tqdm(
+            range(loop_start, total_docs),
+            desc="Embedding 🦖",
+            unit="docs",
+            total=total_docs - loop_start,
+            bar_format="{l_bar}{bar}| Time Left: {remaining}",
+        ):
+            doc = docs[idx]
+            try:
+                _report_progress(idx + 1)
+
+                # Add document to vector store
+                if cached_embeddings is None:
+                    add_text_to_store_with_retry(store, doc, source_id)
+                else:
+                    add_text_to_store_with_retry(
+                        store, doc, source_id, embeddings=cached_embeddings
+                    )
+                _record_progress(source_id, last_index=idx, embedded_chunks=idx + 1)
+            except Exception as e:
+                chunk_error = e
+                failed_idx = idx
+                logging.error(f"Error embedding document {idx}: {e}", exc_info=True)
+                break
+
+    _save_store(store, folder_name, source_id, chunk_error, failed_idx, total_docs)
+    return _cache_stats(cached_embeddings, source_id)
+
+
+def _close(iterator: Any) -> None:
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+def pipeline_stage(
+    items: Iterable[Any], maxsize: int, *, name: str,
+) -> Iterator[Any]:
+    """Iterate ``items`` on a background thread, handing them over a bounded queue.
+
+    Nesting stages — ``pipeline_stage(chunk(pipeline_stage(parse())))`` —
+    runs each on its own thread with at most ``maxsize`` items waiting
+    between neighbours, so a fast stage only gets that far ahead of a slow
+    one. An exception raised while iterating ``items`` reaches the consumer
+    after the items produced before it. Closing the returned generator stops
+    the stage, closes ``items`` and waits for the thread.
+    """
+    handoff: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+    end = object()
+
+    def _put(entry: Tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                handoff.put(entry, timeout=_STAGE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        iterator = iter(items)
         try:
-            # Map the embed loop into [progress_start, progress_end].
-            progress = progress_start + int(
-                ((idx + 1) / total_docs) * progress_span
+            for item in iterator:
+                if not _put((True, item)):
+                    return
+            _put((True, end))
+        except BaseException as e:
+            _put((False, e))
+        finally:
+            _close(iterator)
+
+    thread = threading.Thread(target=_produce, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            ok, item = handoff.get()
+            if not ok:
+                raise item
+            if item is end:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def embed_and_store_stream(
+    chunks: Iterable[Any],
+    folder_name: str,
+    source_id: str,
+    task_status: Any,
+    *,
+    attempt_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    progress_start: int = 0,
+    progress_end: int = 100,
+) -> Optional[Dict[str, Any]]:
+    """Streaming form of :func:`embed_and_store_documents`.
+
+    ``chunks`` is consumed as it is produced — typically the tail of a
+    parse → chunk chain of :func:`pipeline_stage` generators — so the
+    source never has to sit in memory as one list. Chunks are grouped into
+    ``INGEST_EMBED_BATCH_SIZE`` / ``INGEST_EMBED_BATCH_MAX_TOKENS`` batches
+    and embedded on an ``ingest-embed`` stage thread up to
+    ``INGEST_EMBED_PREFETCH`` batches ahead of the store writes, which run
+    on the calling thread.
+
+    The total chunk count is only known once ``chunks`` is exhausted. Until
+    then the checkpoint row carries one more chunk than has been seen, so
+    the source keeps reading as ``processing``, and no embed progress is
+    reported — the caller's earlier stage still owns the bar. Resume works
+    as in the list form: chunk indices follow the order of ``chunks``
+    (blank ones dropped), and a same-attempt retry skips those already
+    embedded.
+
+    Args:
+        chunks: Vector-format documents, in a deterministic order.
+        folder_name, source_id, task_status, attempt_id, user_id,
+        progress_start, progress_end: As for
+            :func:`embed_and_store_documents`.
+
+    Returns:
+        Embedding-cache counters, as for :func:`embed_and_store_documents`.
+
+    Raises:
+        DocumentParseError: If ``chunks`` holds no text at all.
+        EmbeddingPipelineError: If a batch fails to embed or store after
+            retries.
+        Exception: Whatever an upstream stage raised, unchanged.
+    """
+    if not os.path.exists(folder_name):
+        os.makedirs(folder_name)
+
+    seen = 0
+    exhausted = False
+
+    def _nonblank():
+        nonlocal seen, exhausted
+        iterator = iter(chunks)
+        try:
+            for doc in iterator:
+                if _has_text(doc):
+                    seen += 1
+                    yield _prepare_doc(doc, source_id)
+            exhausted = True
+        finally:
+            _close(iterator)
+
+    def _open_total() -> int:
+        return seen if exhausted else seen + 1
+
+    docs = _nonblank()
+    try:
+        first = next(docs, None)
+        if first is None:
+            # Same terminal error as the list form; see there.
+            raise DocumentParseError(_NO_TEXT_MESSAGE)
+
+        # Created on the first chunk so an upload that parses to nothing
+        # never leaves a progress row behind.
+        resume_index = _init_progress_and_resume_index(
+            source_id, _open_total(), attempt_id,
+        )
+        is_resume = resume_index > 0
+        store, seeded = _create_store(source_id, is_resume, first)
+        if seeded:
+            _record_progress(
+                source_id, last_index=0, embedded_chunks=1,
+                total_chunks=_open_total(),
             )
-            task_status.update_state(state="PROGRESS", meta={"current": progress})
-
-            # SSE push for sub-second upload-toast updates. Throttled to one
-            # event per percent so a 10k-chunk ingest emits ~100 events,
-            # not 10k. The Celery update_state above stays the source of
-            # truth for the polling-fallback path.
-            if user_id and progress > last_published_pct:
-                publish_user_event(
-                    user_id,
-                    "source.ingest.progress",
-                    {
-                        "current": progress,
-                        "total": total_docs,
-                        "embedded_chunks": idx + 1,
-                        "stage": "embedding",
-                    },
-                    scope={"kind": "source", "id": source_id_str},
-                )
-                last_published_pct = progress
+            loop_start = 1
+        else:
+            loop_start = resume_index
 
-            # Add document to vector store
-            add_text_to_store_with_retry(store, doc, source_id)
-            _record_progress(source_id, last_index=idx, embedded_chunks=idx + 1)
-        except Exception as e:
-            chunk_error = e
-            failed_idx = idx
-            logging.error(f"Error embedding document {idx}: {e}", exc_info=True)
-            logging.info(f"Saving progress at document {idx} out of {total_docs}")
-            try:
-                store.save_local(folder_name)
-                logging.info("Progress saved successfully")
-            except Exception as save_error:
-                logging.error(f"CRITICAL: Failed to save progress: {save_error}", exc_info=True)
-                # Continue without breaking to attempt final save
-            break
+        report = _progress_reporter(
+            task_status, user_id, source_id, progress_start, progress_end,
+        )
+        cached_embeddings = _caching_embeddings()
+        embeddings = (
+            _get_ingest_embeddings() if cached_embeddings is None
+            else cached_embeddings
+        )
+        batch_size = max(1, int(settings.INGEST_EMBED_BATCH_SIZE or 1))
+        max_tokens = settings.INGEST_EMBED_BATCH_MAX_TOKENS
 
-    # Save the vector store
-    if settings.VECTOR_STORE == "faiss":
+        def _pending():
+            if loop_start == 0:
+                yield 0, first
+            for idx, doc in enumerate(docs, start=1):
+                if idx >= loop_start:
+                    yield idx, doc
+
+        def _embedded():
+            pending = _pending()
+            with closing(pending), closing(
+                _group_batches(pending, batch_size, max_tokens)
+            ) as batches:
+                for lo, batch in batches:
+                    try:
+                        vectors = embed_batch_with_retry(
+                            embeddings, [doc.page_content for doc in batch]
+                        )
+                    except Exception as e:
+                        yield lo, batch, e
+                        return
+                    yield lo, batch, vectors
+
+        chunk_error: Optional[Exception] = None
+        failed_idx: Optional[int] = None
+        embedded = pipeline_stage(
+            _embedded(),
+            max(0, settings.INGEST_EMBED_PREFETCH),
+            name="ingest-embed",
+        )
         try:
-            store.save_local(folder_name)
-            logging.info("Vector store saved successfully.")
-        except Exception as e:
-            logging.error(f"CRITICAL: Failed to save final vector store: {e}", exc_info=True)
-            raise OSError(f"Unable to save vector store to {folder_name}: {e}") from e
-    else:
-        logging.info("Vector store saved successfully.")
+            with closing(embedded), tqdm(
+                desc="Embedding 🦖",
+                unit="docs",
+                bar_format="{l_bar}{bar}| Time Left: {remaining}",
+            ) as bar:
+                for lo, batch, vectors in embedded:
+                    if isinstance(vectors, Exception):
+                        chunk_error, failed_idx = vectors, lo
+                        break
+                    try:
+                        add_batch_to_store_with_retry(store, batch, vectors)
+                    except Exception as e:
+                        chunk_error, failed_idx = e, lo
+                        break
+                    hi = lo + len(batch)
+                    _record_progress(
+                        source_id, last_index=hi - 1, embedded_chunks=hi,
+                        total_chunks=_open_total(),
+                    )
+                    if exhausted:
+                        report(hi, seen)
+                    bar.update(len(batch))
+        except Exception:
+            # A parse or chunk stage failed: keep what already landed so a
+            # retry of this attempt resumes from the checkpoint, and let
+            # the stage's own error through.
+            try:
+                _save_store(store, folder_name, source_id, None, None, seen)
+            except OSError:
+                logging.error("Could not save the partial vector store", exc_info=True)
+            raise
+    finally:
+        _close(docs)
 
-    # Re-raise after the partial save: the chunks that *did* embed are
-    # flushed to disk and recorded in ``ingest_chunk_progress``, so a
-    # Celery autoretry resumes via ``_read_resume_index`` and only
-    # re-runs the failed-and-after chunks. Without the raise, the
-    # task body returns success and ``with_idempotency`` finalises
-    # ``task_dedup`` as ``completed`` for a partial index — poisoning
-    # the cache for 24h.
     if chunk_error is not None:
-        raise EmbeddingPipelineError(
-            f"embed failure at chunk {failed_idx}/{total_docs} "
-            f"for source {source_id}"
-        ) from chunk_error
+        logging.error(
+            f"Error embedding documents from {failed_idx}: {chunk_error}",
+            exc_info=chunk_error,
+        )
+    else:
+        _record_progress(
+            source_id, last_index=seen - 1, embedded_chunks=seen,
+            total_chunks=seen,
+        )
+        report(seen, seen)
+    _save_store(store, folder_name, source_id, chunk_error, failed_idx, seen)
+    return _cache_stats(cached_embeddings, source_id)
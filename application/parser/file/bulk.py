@@ -1,7 +1,9 @@
 """Simple reader that reads files of different formats from a directory."""
 import logging
+from contextlib import closing
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from application.parser.file.base import BaseReader
 from application.parser.file.base_parser import BaseParser, DocumentParseError
@@ -15,6 +17,13 @@ from application.parser.file.json_parser import JSONParser
 from application.parser.file.pptx_parser import PPTXParser
 from application.parser.file.image_parser import ImageParser
 from application.parser.file.audio_parser import AudioParser
+from application.parser.file.parse_pool import (
+    fork_context,
+    parse_in_processes,
+    resolve_file_timeout,
+    resolve_memory_headroom_mb,
+    resolve_parse_processes,
+)
 from application.parser.schema.base import Document
 from application.stt.constants import SUPPORTED_AUDIO_EXTENSIONS
 from application.utils import num_tokens_from_string
@@ -150,6 +159,41 @@ def get_default_file_extractor(
         }
 
 
+def _parse_input_file(
+    file_extractor: Dict[str, BaseParser], errors: str, input_file: Path
+) -> Tuple[Union[str, List[str]], Dict, int]:
+    """Parse one file and count its tokens.
+
+    Runs in the calling process or in a parse worker (see
+    :mod:`application.parser.file.parse_pool`), so the tokenizer pass lands on
+    the same core as the parse.
+
+    Returns:
+        Tuple: ``(data, parser_metadata, token_count)``.
+
+    Raises:
+        DocumentParseError: if the parser cannot read the file.
+    """
+    suffix_lower = input_file.suffix.lower()
+    parser_metadata = {}
+    if suffix_lower in file_extractor:
+        parser = file_extractor[suffix_lower]
+        if not parser.parser_config_set:
+            parser.init_parser()
+        data = parser.parse_file(input_file, errors=errors)
+        parser_metadata = parser.get_file_metadata(input_file)
+    else:
+        # do standard read
+        with open(input_file, "r", errors=errors) as f:
+            data = f.read()
+
+    if isinstance(data, List):
+        file_tokens = sum(num_tokens_from_string(str(d)) for d in data)
+    else:
+        file_tokens = num_tokens_from_string(str(data))
+    return data, parser_metadata, file_tokens
+
+
 # For backwards compatibility
 DEFAULT_FILE_EXTRACTOR: Dict[str, BaseParser] = get_default_file_extractor()
 
@@ -256,39 +300,112 @@ class SimpleDirectoryReader(BaseReader):
 
         return new_input_files
 
-    def load_data(
+    def _iter_parsed(
+        self, report_progress: Callable[[int], None]
+    ) -> Iterator[Tuple[Path, Any]]:
+        """Parse every input file, yielding ``(path, outcome)`` in input order.
+
+        ``outcome`` is ``_parse_input_file``'s result or the
+        ``DocumentParseError`` it raised. With ``INGEST_PARSE_PROCESSES`` above
+        1 (and more than one file) the files are parsed on forked workers,
+        which also turn a per-file timeout, a memory-limit hit or a worker
+        crash into a ``DocumentParseError`` for that file; any other parser
+        exception is yielded for the caller to raise. Serially it propagates
+        as it always has.
+        """
+        parse = partial(_parse_input_file, self.file_extractor, self.errors)
+        processes = resolve_parse_processes(len(self.input_files))
+        if processes > 1 and fork_context() is not None:
+            yield from parse_in_processes(
+                parse,
+                self.input_files,
+                processes,
+                timeout=resolve_file_timeout(),
+                memory_headroom_mb=resolve_memory_headroom_mb(),
+                on_done=report_progress,
+                label=lambda path: path.name,
+            )
+            return
+
+        for file_index, input_file in enumerate(self.input_files):
+            try:
+                outcome = parse(input_file)
+            except DocumentParseError as e:
+                outcome = e
+            report_progress(file_index + 1)
+            yield input_file, outcome
+
+    def _collect(
+        self,
+        input_file: Path,
+        data: Union[str, List[str]],
+        parser_metadata: Dict,
+        file_tokens: int,
+        data_list: List[str],
+        metadata_list: List[Dict],
+    ) -> None:
+        """Record one parsed file's token count, text and metadata."""
+        full_path = str(input_file.resolve())
+        self.file_token_counts[full_path] = file_tokens
+
+        base_metadata = {
+            'title': input_file.name,
+            'token_count': file_tokens,
+        }
+        if parser_metadata:
+            base_metadata.update(parser_metadata)
+
+        if hasattr(self, 'input_dir'):
+            try:
+                relative_path = str(input_file.relative_to(self.input_dir))
+                base_metadata['source'] = relative_path
+            except ValueError:
+                base_metadata['source'] = str(input_file)
+        else:
+            base_metadata['source'] = str(input_file)
+
+        if self.file_metadata is not None:
+            custom_metadata = self.file_metadata(input_file.name)
+            base_metadata.update(custom_metadata)
+
+        if isinstance(data, List):
+            # Extend data_list with each item in the data list
+            data_list.extend([str(d) for d in data])
+            # copy(): chunking writes token_count into this dict in
+            # place, so a shared reference gives every chunk the last
+            # chunk's count.
+            metadata_list.extend([base_metadata.copy() for _ in data])
+        else:
+            data_list.append(str(data))
+            metadata_list.append(base_metadata.copy())
+
+    def iter_data(
         self,
-        concatenate: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-    ) -> List[Document]:
-        """Load data from the input directory.
+    ) -> Iterator[List[Document]]:
+        """Yield each input file's documents as soon as that file is parsed.
+
+        The streaming form of ``load_data``: files come out in input order,
+        one list per parsed file, so a caller can chunk and embed the first
+        files while later ones are still parsing instead of holding the
+        whole upload in memory. ``failed_files``, ``file_token_counts`` and
+        ``directory_structure`` are complete once the generator is
+        exhausted.
 
         Args:
-            concatenate (bool): whether to concatenate all files into one document.
-                If set to True, file metadata is ignored.
-                False by default.
-            progress_callback (Optional[Callable[[int, int], None]]): Called
-                after each file is parsed with ``(files_done, total_files)``.
-                Lets callers surface parse/OCR progress before embedding
-                begins. Exceptions raised by the callback are swallowed so
-                progress reporting can never fail ingestion.
+            progress_callback (Optional[Callable[[int, int], None]]): As for
+                ``load_data``.
 
-        Returns:
-            List[Document]: A list of documents.
+        Yields:
+            List[Document]: The documents of one parsed file.
 
         Raises:
-            DocumentParseError: if no input file could be parsed. Individual
-                unreadable files are skipped and recorded in ``failed_files``
-                so one corrupt document does not cost the caller the rest of
-                the batch; a single-file read (the attachment path) still
-                raises, since skipping there would only defer the failure to
-                an empty result.
+            DocumentParseError: after the last file, if none could be parsed
+                (see ``load_data``).
         """
-        data: Union[str, List[str]] = ""
-        data_list: List[str] = []
-        metadata_list = []
         self.file_token_counts = {}
         self.failed_files = []
+        parsed_any = False
 
         total_files = len(self.input_files)
 
@@ -300,72 +417,41 @@ class SimpleDirectoryReader(BaseReader):
             except Exception:
                 logging.warning("load_data progress callback failed", exc_info=True)
 
-        for file_index, input_file in enumerate(self.input_files):
-            suffix_lower = input_file.suffix.lower()
-            parser_metadata = {}
-            try:
-                if suffix_lower in self.file_extractor:
-                    parser = self.file_extractor[suffix_lower]
-                    if not parser.parser_config_set:
-                        parser.init_parser()
-                    data = parser.parse_file(input_file, errors=self.errors)
-                    parser_metadata = parser.get_file_metadata(input_file)
+        parsed = self._iter_parsed(report_progress)
+        with closing(parsed):
+            for input_file, outcome in parsed:
+                if isinstance(outcome, DocumentParseError):
+                    logging.warning(
+                        f"Skipping unreadable file {input_file.name}: {outcome}"
+                    )
+                    self.failed_files.append((input_file, str(outcome)))
+                    continue
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                data, parser_metadata, file_tokens = outcome
+                data_list: List[str] = []
+                metadata_list: List[Dict] = []
+                self._collect(
+                    input_file,
+                    data,
+                    parser_metadata,
+                    file_tokens,
+                    data_list,
+                    metadata_list,
+                )
+                parsed_any = parsed_any or bool(data_list)
+                if self.file_metadata is not None:
+                    yield [
+                        Document(d, extra_info=m)
+                        for d, m in zip(data_list, metadata_list)
+                    ]
                 else:
-                    # do standard read
-                    with open(input_file, "r", errors=self.errors) as f:
-                        data = f.read()
-            except DocumentParseError as e:
-                logging.warning(f"Skipping unreadable file {input_file.name}: {e}")
-                self.failed_files.append((input_file, str(e)))
-                report_progress(file_index + 1)
-                continue
-
-            # Calculate token count for this file
-            if isinstance(data, List):
-                file_tokens = sum(num_tokens_from_string(str(d)) for d in data)
-            else:
-                file_tokens = num_tokens_from_string(str(data))
-            
-            full_path = str(input_file.resolve())
-            self.file_token_counts[full_path] = file_tokens
-            
-            base_metadata = {
-                'title': input_file.name,
-                'token_count': file_tokens,
-            }
-            if parser_metadata:
-                base_metadata.update(parser_metadata)
-            
-            if hasattr(self, 'input_dir'):
-                try:
-                    relative_path = str(input_file.relative_to(self.input_dir))
-                    base_metadata['source'] = relative_path
-                except ValueError:
-                    base_metadata['source'] = str(input_file)
-            else:
-                base_metadata['source'] = str(input_file)
-
-            if self.file_metadata is not None:
-                custom_metadata = self.file_metadata(input_file.name)
-                base_metadata.update(custom_metadata)
-
-            if isinstance(data, List):
-                # Extend data_list with each item in the data list
-                data_list.extend([str(d) for d in data])
-                # copy(): chunking writes token_count into this dict in
-                # place, so a shared reference gives every chunk the last
-                # chunk's count.
-                metadata_list.extend([base_metadata.copy() for _ in data])
-            else:
-                data_list.append(str(data))
-                metadata_list.append(base_metadata.copy())
-
-            report_progress(file_index + 1)
+                    yield [Document(d) for d in data_list]
 
         # Every file failed: there is nothing to ingest, so this is a failed
         # read rather than an empty one. Callers (the attachment worker, the
         # ingest tasks) treat it as terminal and tell the user.
-        if self.failed_files and not data_list:
+        if self.failed_files and not parsed_any:
             if len(self.failed_files) == 1:
                 # Single-file read (the attachment path): the parser's own
                 # message reaches the user verbatim, so don't wrap it in
@@ -385,12 +471,45 @@ class SimpleDirectoryReader(BaseReader):
         else:
             self.directory_structure = {}
 
+    def load_data(
+        self,
+        concatenate: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Document]:
+        """Load data from the input directory.
+
+        Args:
+            concatenate (bool): whether to concatenate all files into one document.
+                If set to True, file metadata is ignored.
+                False by default.
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                after each file is parsed with ``(files_done, total_files)``.
+                Lets callers surface parse/OCR progress before embedding
+                begins. Exceptions raised by the callback are swallowed so
+                progress reporting can never fail ingestion. When files are
+                parsed on worker processes, ``files_done`` counts files in
+                the order they finish; documents are still returned in input
+                order.
+
+        Returns:
+            List[Document]: A list of documents.
+
+        Raises:
+            DocumentParseError: if no input file could be parsed. Individual
+                unreadable files are skipped and recorded in ``failed_files``
+                so one corrupt document does not cost the caller the rest of
+                the batch; a single-file read (the attachment path) still
+                raises, since skipping there would only defer the failure to
+                an empty result.
+        """
+        documents = [
+            document
+            for file_documents in self.iter_data(progress_callback=progress_callback)
+            for document in file_documents
+        ]
         if concatenate:
-            return [Document("\n".join(data_list))]
-        elif self.file_metadata is not None:
-            return [Document(d, extra_info=m) for d, m in zip(data_list, metadata_list)]
-        else:
-            return [Document(d) for d in data_list]
+            return [Document("\n".join(document.text for document in documents))]
+        return documents
 
     def build_directory_structure(self, base_path):
         """Build a dictionary representing the directory structure.
@@ -0,0 +1,306 @@
+"""Worker processes for ``SimpleDirectoryReader.load_data``.
+
+Parsing an upload (docling/OCR, pptx, epub, tabular) is CPU-bound Python, so
+a serial loop keeps one core of the ingest worker busy however many files the
+upload holds. ``parse_in_processes`` spreads the files over a small pool of
+forked workers instead:
+
+* each worker is a long-lived process with its own pipe, so the parent always
+  knows which file a worker holds and since when;
+* a file that runs past ``timeout`` seconds, or whose worker dies (an OOM
+  kill, a segfault in a native parser), is reported as a
+  ``DocumentParseError`` and its worker is replaced — one pathological PDF
+  costs one file, not the batch;
+* ``memory_headroom_mb`` caps how far a worker's address space may grow past
+  what it inherited at fork (``RLIMIT_AS``), so a runaway parse raises
+  ``MemoryError`` inside the worker instead of starving the host;
+* outcomes are yielded in input order whatever order workers finish in.
+
+Workers are forked: the parsers travel to them by inheritance rather than
+pickling, and load their models lazily in the child, so the parent never
+pays for a model it does not use. They are started through billiard, since
+Celery's prefork pool runs tasks in daemonic processes the stdlib refuses to
+fork children from, and only from the main thread: a reader driven from a
+pipeline thread parses serially rather than fork while other threads may
+hold locks the child would inherit.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from application.parser.file.base_parser import DocumentParseError
+
+try:
+    import billiard as _multiprocessing
+    from billiard.connection import wait
+except ImportError:  # billiard ships with Celery; plain installs use the stdlib
+    import multiprocessing as _multiprocessing
+    from multiprocessing.connection import wait
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FILE_TIMEOUT = 600
+DEFAULT_MEMORY_HEADROOM_MB = 0
+# Upper bound on how long the parent sleeps between timeout checks.
+_POLL_SECONDS = 0.5
+# Grace period for a worker to exit after the stop sentinel or SIGTERM.
+_JOIN_SECONDS = 2.0
+
+
+def _int_setting(name: str, default: int) -> int:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def resolve_parse_processes(n_files: int) -> int:
+    """Worker processes for ``n_files`` files — 1 or less means parse serially.
+
+    Always 0 off the main thread, where forking would copy whatever locks
+    the other threads hold; the streaming ingest starts its parse on the
+    main thread so its workers fork before the pipeline threads exist.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return 0
+    return min(_int_setting("INGEST_PARSE_PROCESSES", 0), n_files)
+
+
+def resolve_file_timeout() -> int:
+    """Seconds one file may take in a worker; 0 disables the limit."""
+    return _int_setting("INGEST_PARSE_FILE_TIMEOUT", DEFAULT_FILE_TIMEOUT)
+
+
+def resolve_memory_headroom_mb() -> int:
+    """MiB a worker may grow past its size at fork; 0 disables the guard."""
+    return _int_setting("INGEST_PARSE_MEMORY_HEADROOM_MB", DEFAULT_MEMORY_HEADROOM_MB)
+
+
+def fork_context():
+    """The ``fork`` multiprocessing context, or ``None`` where it is unavailable."""
+    try:
+        return _multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+def _limit_memory(headroom_mb: int) -> None:
+    """Cap this process's address space at its current size plus ``headroom_mb``."""
+    try:
+        import resource
+
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (ImportError, OSError, ValueError) as e:
+        logger.debug("Parse worker memory guard unavailable: %s", e)
+        return
+    limit = current + headroom_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _worker_main(conn, parse: Callable[[Any], Any], headroom_mb: int) -> None:
+    """Parse items from ``conn`` until the ``None`` sentinel, replying per item."""
+    if headroom_mb > 0:
+        _limit_memory(headroom_mb)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        index, item = task
+        try:
+            outcome = parse(item)
+        except Exception as e:
+            outcome = e
+        try:
+            conn.send((index, outcome))
+        except Exception as e:
+            # An unpicklable result or exception; report it by message.
+            conn.send((index, RuntimeError(f"{type(outcome).__name__}: {e}")))
+        if isinstance(outcome, MemoryError):
+            # Don't reuse a heap that just hit the cap; the parent replaces us.
+            return
+
+
+@dataclass
+class _Worker:
+    process: Any
+    conn: Any
+    index: Optional[int] = None
+    started: float = 0.0
+
+
+def _start_worker(ctx, parse, headroom_mb: int) -> _Worker:
+    parent_conn, child_conn = ctx.Pipe()
+    process = ctx.Process(
+        target=_worker_main,
+        args=(child_conn, parse, headroom_mb),
+        name="docsgpt-parse",
+        daemon=True,
+    )
+    process.start()
+    child_conn.close()
+    return _Worker(process=process, conn=parent_conn)
+
+
+def _stop_worker(worker: _Worker, *, graceful: bool) -> None:
+    if graceful:
+        try:
+            worker.conn.send(None)
+        except Exception:
+            graceful = False
+    if graceful:
+        worker.process.join(_JOIN_SECONDS)
+    if worker.process.is_alive():
+        worker.process.terminate()
+        worker.process.join(_JOIN_SECONDS)
+    if worker.process.is_alive():
+        # billiard's Process has no kill(); signal the pid directly.
+        os.kill(worker.process.pid, signal.SIGKILL)
+        worker.process.join()
+    worker.conn.close()
+
+
+def parse_in_processes(
+    parse: Callable[[Any], Any],
+    items: Sequence[Any],
+    processes: int,
+    *,
+    timeout: int = DEFAULT_FILE_TIMEOUT,
+    memory_headroom_mb: int = DEFAULT_MEMORY_HEADROOM_MB,
+    on_done: Optional[Callable[[int], None]] = None,
+    label: Callable[[Any], str] = str,
+) -> Iterator[Tuple[Any, Any]]:
+    """Run ``parse(item)`` for every item on forked workers.
+
+    Args:
+        parse: Called in a worker with one item; its return value must pickle.
+        items: Inputs, in the order outcomes are yielded.
+        processes: Worker count, capped at ``len(items)``.
+        timeout: Seconds per item before its worker is killed; 0 disables.
+        memory_headroom_mb: Per-worker address-space allowance over its size
+            at fork; 0 disables.
+        on_done: Called in the parent with the running count of finished
+            items, in completion order.
+        label: Item description for the timeout and crash messages.
+
+    Yields:
+        ``(item, outcome)`` in input order, where ``outcome`` is ``parse``'s
+        return value or the exception it raised. An item that timed out,
+        ran out of memory or crashed its worker yields a
+        ``DocumentParseError``.
+
+    Raises:
+        RuntimeError: when the ``fork`` start method is unavailable.
+    """
+    ctx = fork_context()
+    if ctx is None:
+        raise RuntimeError("parallel parsing needs the 'fork' start method")
+    items = list(items)
+    pending = deque(range(len(items)))
+    outcomes: Dict[int, Any] = {}
+    next_index = 0
+    done = 0
+    workers: List[_Worker] = []
+
+    def finish(worker: _Worker, outcome: Any) -> None:
+        nonlocal done
+        outcomes[worker.index] = outcome
+        worker.index = None
+        done += 1
+        if on_done is not None:
+            on_done(done)
+
+    def replace(worker: _Worker) -> None:
+        _stop_worker(worker, graceful=False)
+        workers[workers.index(worker)] = _start_worker(ctx, parse, memory_headroom_mb)
+
+    try:
+        for _ in range(max(1, min(processes, len(items)))):
+            workers.append(_start_worker(ctx, parse, memory_headroom_mb))
+        while next_index < len(items):
+            for worker in workers:
+                if worker.index is None and pending:
+                    worker.index = pending.popleft()
+                    worker.started = time.monotonic()
+                    worker.conn.send((worker.index, items[worker.index]))
+
+            busy = [worker for worker in workers if worker.index is not None]
+            wait_for = _POLL_SECONDS
+            if timeout > 0:
+                now = time.monotonic()
+                deadline = min(worker.started + timeout for worker in busy)
+                wait_for = max(0.0, min(wait_for, deadline - now))
+            wait([worker.conn for worker in busy], timeout=wait_for)
+
+            for worker in list(busy):
+                item = items[worker.index]
+                crashed = False
+                if worker.conn.poll():
+                    try:
+                        _, outcome = worker.conn.recv()
+                    except (EOFError, OSError):
+                        crashed = True
+                    else:
+                        if isinstance(outcome, MemoryError):
+                            logger.warning(
+                                "Parsing %s hit the worker memory limit", label(item)
+                            )
+                            finish(
+                                worker,
+                                DocumentParseError(
+                                    f"Parsing {label(item)} exceeded the parser "
+                                    "memory limit"
+                                ),
+                            )
+                            replace(worker)
+                        else:
+                            finish(worker, outcome)
+                        continue
+                if crashed or not worker.process.is_alive():
+                    worker.process.join(_JOIN_SECONDS)
+                    logger.warning(
+                        "Parse worker died on %s (exit code %s)",
+                        label(item),
+                        worker.process.exitcode,
+                    )
+                    finish(
+                        worker,
+                        DocumentParseError(
+                            f"{label(item)} crashed the parser "
+                            f"(exit code {worker.process.exitcode})"
+                        ),
+                    )
+                    replace(worker)
+                elif timeout > 0 and time.monotonic() - worker.started >= timeout:
+                    logger.warning(
+                        "Parsing %s exceeded %ss; killing its worker",
+                        label(item),
+                        timeout,
+                    )
+                    finish(
+                        worker,
+                        DocumentParseError(
+                            f"Parsing {label(item)} timed out after {timeout}s"
+                        ),
+                    )
+                    replace(worker)
+
+            while next_index in outcomes:
+                yield items[next_index], outcomes.pop(next_index)
+                next_index += 1
+    finally:
+        for worker in workers:
+            _stop_worker(worker, graceful=worker.index is None)
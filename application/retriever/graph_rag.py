@@ -1,43 +1,46 @@
 """GraphRAG local retriever — Personalized PageRank over a per-source graph.
 
-Rephrased query -> entity-name NN seeds -> bounded 1-2-hop fetch -> networkx
-Personalized PageRank (IDF-down-weighted hubs) -> chunks ranked by landed PPR
-mass -> shared token budget. No LLM call at query time beyond the (optional,
-reused) rephrase.
+Rephrased query -> entity-name NN seeds -> sparse Personalized PageRank over
+the source's cached adjacency (IDF-down-weighted hubs, see
+``application.graphrag.ppr``) -> chunks ranked by landed PPR mass -> shared
+token budget. No LLM call at query time beyond the (optional, reused) rephrase.
 
 Composes :class:`ClassicRAG` rather than subclassing: PPR doesn't fit the
 ``_fetch_candidates`` hook, but the composed instance supplies the rephrase, the
 token-budget loop, and the fallback for sources that have no graph.
 
 Per request the whole source group costs one node-count query, one query
-embedding, and one ClassicRAG run for all the graphless sources together — all
-over a single pooled connection shared with the vector store.
+embedding, one seed-node query, one batched PPR pass, and one ClassicRAG run for
+all the graphless sources together. The remaining per-source reads (adjacency
+rebuilds, chunk links and texts) fan out over the same bounded pool as
+ClassicRAG (:mod:`application.retriever.fanout`), each worker on its own pooled
+connection; results still merge in source order.
 """
 
 from __future__ import annotations
 
 import logging
-import math
-from typing import Any, Dict, List
-
-import networkx as nx
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from application.core.settings import settings
 from application.graphrag import graphrag_available
+from application.graphrag.ppr import (
+    SourceAdjacency,
+    get_adjacency,
+    pagerank_across_sources,
+)
 from application.graphrag.store import GraphStore
 from application.retriever.base import BaseRetriever
 from application.retriever.classic_rag import ClassicRAG
+from application.retriever.fanout import max_parallel_sources, run_source_jobs
 from application.retriever.labels import labels_from_metadata
 from application.utils import num_tokens_from_string
 from application.vectorstore.base import get_embeddings
+from application.vectorstore.pgconn import resolve_pool_max_size
 
 SEED_NODES = 10
-SUBGRAPH_HOPS = 1
-
-
-def _idf(doc_freq: Any) -> float:
-    """Node-specificity weight: rarer entities (low ``doc_freq``) score higher."""
-    return 1.0 / math.log(1.0 + max(int(doc_freq or 0), 0) + 1.0)
+# Nodes whose chunks are ranked per source: the best by PPR mass x IDF.
+MAX_SCORED_NODES = 500
 
 
 class GraphRAGRetriever(BaseRetriever):
@@ -95,33 +98,23 @@ class GraphRAGRetriever(BaseRetriever):
         embedding = get_embeddings()
         return embedding.embed_query(question)
 
-    def _ppr_scores(self, subgraph, seeds) -> Dict[str, float]:
-        """Run Personalized PageRank, then down-weight hub nodes by IDF.
-
-        ``seeds`` maps seed node id -> personalization weight (seed similarity).
-        After PPR, each node's mass is scaled by ``1/log(2 + doc_freq)`` so a
-        high-degree hub contributes less than a specific entity at equal mass.
+    def _ppr_scores(
+        self, walks: List[Tuple[SourceAdjacency, Dict[str, float]]]
+    ) -> List[Dict[str, float]]:
+        """Run Personalized PageRank per walk, then down-weight hub nodes by IDF.
+
+        Each walk pairs a source's adjacency with its seeds (seed node id ->
+        personalization weight, i.e. seed similarity); all walks are solved in
+        one batched pass. After PPR, each node's mass is scaled by
+        ``1/log(2 + doc_freq)`` so a high-degree hub contributes less than a
+        specific entity at equal mass. Only the ``MAX_SCORED_NODES`` best nodes
+        of each walk are returned.
         """
-        graph = nx.Graph()
-        for node in subgraph.get("nodes", []):
-            graph.add_node(node["id"], doc_freq=node.get("doc_freq", 0))
-        for edge in subgraph.get("edges", []):
-            src, dst = edge["src_node_id"], edge["dst_node_id"]
-            if src in graph and dst in graph:
-                weight = float(edge.get("weight") or 1.0)
-                graph.add_edge(src, dst, weight=weight)
-        if graph.number_of_nodes() == 0:
-            return {}
-
-        personalization = {n: seeds.get(n, 0.0) for n in graph.nodes}
-        if not any(personalization.values()):
-            personalization = None
-
-        ranks = nx.pagerank(graph, personalization=personalization, weight="weight")
-        return {
-            node: rank * _idf(graph.nodes[node].get("doc_freq", 0))
-            for node, rank in ranks.items()
-        }
+        ranks = pagerank_across_sources(walks)
+        return [
+            adjacency.scores(rank, limit=MAX_SCORED_NODES) if adjacency.size else {}
+            for (adjacency, _), rank in zip(walks, ranks)
+        ]
 
     def _rank_chunks(self, store, source_id, node_scores) -> List[str]:
         """Score chunks by summed (PPR mass x IDF) of their linked nodes; top candidates.
@@ -159,38 +152,81 @@ class GraphRAGRetriever(BaseRetriever):
         base = self.base_chunks if self.base_chunks is not None else self.chunks
         return max(1, base // max(1, len(self.vectorstores)))
 
-    def _graph_docs_for_source(
-        self, store, source_id, query_embedding: List[float]
-    ) -> List[Dict[str, Any]]:
-        """Local PPR retrieval for one source (caller guarantees it has a graph).
+    def _graph_workers(self, n_sources: int) -> int:
+        """Fan-out width for the per-source graph work.
 
-        Args:
-            store: Open :class:`GraphStore` shared by every source of this run.
-            source_id: Source to retrieve from.
-            query_embedding: Embedding of the rephrased question, computed once
-                by the caller for the whole retrieval.
+        ``RETRIEVAL_MAX_PARALLEL_SOURCES``, kept one below the pool size: every
+        worker checks its own connection out of the per-DSN pool the shared
+        store is already holding a slot of.
+        """
+        workers = max_parallel_sources(n_sources, settings)
+        pool_size = resolve_pool_max_size()
+        if pool_size > 0:
+            workers = min(workers, max(1, pool_size - 1))
+        return workers
+
+    def _per_source(
+        self, store, fn: Callable[[Any, str], Any], source_ids: List[str]
+    ) -> List[Optional[Any]]:
+        """Run ``fn(store, source_id)`` for every source, results in source order.
+
+        With one worker everything runs on the shared ``store``. Otherwise each
+        job opens its own :class:`GraphStore` — a separate pooled connection,
+        checked out only if the job touches the database — and closes it on
+        return. A raise marks that source failed (``None``) without affecting
+        the others.
         """
-        seed_rows = store.search_nodes_by_embedding(
-            source_id, query_embedding, k=SEED_NODES
-        )
-        if not seed_rows:
-            return []
 
-        seed_ids = [row["id"] for row in seed_rows]
-        # Clamp to >= 0: cosine distance can exceed 1 (negative similarity) for
-        # some embedding backends, and networkx pagerank produces garbage on
-        # negative personalization (and ZeroDivisionError when the weights sum
-        # to ~0). All-zero collapses to uniform PPR via the None guard below.
-        seeds = {
-            row["id"]: max(0.0, 1.0 - float(row.get("distance") or 0.0))
-            for row in seed_rows
-        }
+        def _guarded(target, source_id):
+            try:
+                return fn(target, source_id)
+            except Exception as e:
+                logging.error(
+                    f"GraphRAG retrieval failed for {source_id}, falling back: {e}",
+                    exc_info=True,
+                )
+                return None
 
-        subgraph = store.get_subgraph(source_id, seed_ids, hops=SUBGRAPH_HOPS)
-        node_scores = self._ppr_scores(subgraph, seeds)
-        if not node_scores:
-            return []
+        workers = self._graph_workers(len(source_ids))
+        if workers == 1:
+            return [_guarded(store, source_id) for source_id in source_ids]
+
+        def _job(source_id):
+            try:
+                own = GraphStore()
+            except Exception as e:
+                logging.error(
+                    f"GraphRAG store unavailable for {source_id}, falling back: {e}"
+                )
+                return None
+            try:
+                return _guarded(own, source_id)
+            finally:
+                try:
+                    own.close()
+                except Exception as e:
+                    logging.debug("Error closing GraphRAG source store: %s", e)
+
+        return run_source_jobs(_job, source_ids, workers=workers)
+
+    def _seed_rows(
+        self, store, source_ids: List[str], query_embedding: List[float]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Seed-node candidates per source: one query however many sources."""
+        if len(source_ids) == 1:
+            return {
+                source_ids[0]: store.search_nodes_by_embedding(
+                    source_ids[0], query_embedding, k=SEED_NODES
+                )
+            }
+        return store.search_nodes_by_embedding_many(
+            source_ids, query_embedding, k=SEED_NODES
+        )
 
+    def _docs_for_nodes(
+        self, store, source_id, node_scores: Dict[str, float]
+    ) -> List[Dict[str, Any]]:
+        """Rank ``source_id``'s chunks by ``node_scores`` and fill its top-k."""
         chunk_ids = self._rank_chunks(store, source_id, node_scores)
         chunk_data = store.get_chunk_texts(source_id, chunk_ids)
 
@@ -213,6 +249,81 @@ class GraphRAGRetriever(BaseRetriever):
             cumulative_tokens += doc_tokens
         return docs
 
+    def _graph_docs_for_sources(
+        self, store, source_ids: List[str], query_embedding: List[float]
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Local PPR retrieval for several sources (caller guarantees graphs).
+
+        Seeds for every source come from one query; adjacencies missing from
+        the cache are fetched concurrently; all walks share one batched PPR
+        pass; then each source's chunk ranking and text fetch run concurrently.
+
+        Args:
+            store: Open :class:`GraphStore` shared by every source of this run.
+            source_ids: Sources to retrieve from, in merge order.
+            query_embedding: Embedding of the rephrased question, computed once
+                by the caller for the whole retrieval.
+
+        Returns:
+            list: One entry per source, in ``source_ids`` order — its docs, or
+            ``None`` when its retrieval raised.
+        """
+        try:
+            seed_rows = self._seed_rows(store, source_ids, query_embedding)
+        except Exception as e:
+            logging.error(
+                f"GraphRAG seed search failed for {source_ids}, falling back: {e}",
+                exc_info=True,
+            )
+            return [None] * len(source_ids)
+
+        results: Dict[str, Optional[List[Dict[str, Any]]]] = {
+            source_id: [] for source_id in source_ids
+        }
+        # Clamp to >= 0: cosine distance can exceed 1 (negative similarity) for
+        # some embedding backends, and negative personalization is not a
+        # distribution. All-zero collapses to uniform PPR over the source.
+        seeds = {
+            source_id: {
+                row["id"]: max(0.0, 1.0 - float(row.get("distance") or 0.0))
+                for row in seed_rows.get(source_id) or []
+            }
+            for source_id in source_ids
+        }
+        seeded = [source_id for source_id in source_ids if seeds[source_id]]
+
+        walks, walked = [], []
+        for source_id, adjacency in zip(
+            seeded, self._per_source(store, get_adjacency, seeded)
+        ):
+            if adjacency is None:
+                results[source_id] = None
+            else:
+                walks.append((adjacency, seeds[source_id]))
+                walked.append(source_id)
+
+        node_scores = dict(zip(walked, self._ppr_scores(walks)))
+        scored = [source_id for source_id in walked if node_scores[source_id]]
+        for source_id, docs in zip(
+            scored,
+            self._per_source(
+                store,
+                lambda target, source_id: self._docs_for_nodes(
+                    target, source_id, node_scores[source_id]
+                ),
+                scored,
+            ),
+        ):
+            results[source_id] = docs
+        return [results[source_id] for source_id in source_ids]
+
+    def _graph_docs_for_source(
+        self, store, source_id, query_embedding: List[float]
+    ) -> List[Dict[str, Any]]:
+        """Retrieve one source through the batched graph path."""
+        (docs,) = self._graph_docs_for_sources(store, [source_id], query_embedding)
+        return docs or []
+
     def _classic_for_sources(self, source_ids) -> List[Dict[str, Any]]:
         """Reuse the composed ClassicRAG to retrieve a whole batch of sources.
 
@@ -294,17 +405,15 @@ class GraphRAGRetriever(BaseRetriever):
                 )
                 failed, graphed = list(graphed), []
 
-        for source_id in graphed:
-            try:
-                segments[graph_slots[source_id]] = self._graph_docs_for_source(
-                    store, source_id, query_embedding
-                )
-            except Exception as e:
-                logging.error(
-                    f"GraphRAG retrieval failed for {source_id}, falling back: {e}",
-                    exc_info=True,
-                )
-                failed.append(source_id)
+        if graphed:
+            for source_id, docs in zip(
+                graphed,
+                self._graph_docs_for_sources(store, graphed, query_embedding),
+            ):
+                if docs is None:
+                    failed.append(source_id)
+                else:
+                    segments[graph_slots[source_id]] = docs
 
         # Every remaining segment is a ClassicRAG fan-out, and each of its legs
         # checks out of the *same* per-DSN pool this store is holding. Hand the
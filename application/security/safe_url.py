@@ -554,6 +554,7 @@ def pinned_httpx_client(
     base_url: str,
     *,
     timeout: float = 600.0,
+    limits: httpx.Limits | None = None,
 ) -> httpx.Client:
     """Return an :class:`httpx.Client` whose connections are pinned to
     one validated IP, closing the DNS-rebinding TOCTOU window the naive
@@ -575,13 +576,19 @@ def pinned_httpx_client(
         timeout: Per-request timeout (seconds). Defaults to 600 to
             match the OpenAI SDK's default; callers should override
             for non-LLM workloads.
+        limits: Connection-pool bounds for the pinned transport;
+            httpx's defaults when omitted.
 
     Raises:
         UnsafeUserUrlError: If ``base_url`` fails the SSRF guard.
     """
 
     host, ip, _parts = _validate_and_pick_ip(base_url)
-    transport = _PinnedHTTPSTransport(host, ip)
+    transport = (
+        _PinnedHTTPSTransport(host, ip, limits=limits)
+        if limits is not None
+        else _PinnedHTTPSTransport(host, ip)
+    )
     # follow_redirects=False — the SSRF guard only inspects the
     # supplied URL; following 3xx would let a hostile upstream bounce
     # the in-network request to an internal address (cloud metadata,
@@ -0,0 +1,316 @@
+"""Opt-in, per-agent cache of answers keyed by question similarity.
+
+``gen_cache`` / ``stream_cache`` only hit on a byte-identical request, so a
+public widget answering thousands of paraphrases of the same FAQ paid for
+every one. An agent with ``config.semantic_cache.enabled`` instead embeds
+its normalized first-turn question and compares it with the questions
+already answered under the same *context* — agent generation, model,
+system prompt, sampling params and the exact retrieved-document set. An
+answer whose question scores at or above the threshold (cosine) is replayed
+without calling the LLM.
+
+Storage is plain Redis, no search module required: one hash per context
+bucket, ``semantic_cache:{agent_id}:{generation}:{context}``, mapping a
+digest of the normalized question to its float32 vector and answer. Context
+buckets are small (one retrieved-document set), so a lookup reads the bucket
+and scores it in NumPy. Buckets expire ``ttl`` seconds after their last
+write and are capped at ``SEMANTIC_CACHE_MAX_ENTRIES`` (oldest dropped).
+
+Invalidation bumps the agent's generation counter, which makes every older
+bucket unreachable until it expires; the worker does this whenever a source
+the agent uses is re-ingested. Redis errors are logged and read as misses.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from application.cache import get_redis_instance
+from application.vectorstore.query_embedding_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "semantic_cache:"
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_THRESHOLD = 0.95
+DEFAULT_MAX_ENTRIES = 256
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def context_fingerprint(
+    model: Optional[str],
+    system_prompt: Optional[str],
+    docs: Iterable[Dict[str, Any]],
+    llm_params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Digest of everything besides the question that shapes the answer.
+
+    Documents are identified by title, source and a digest of their text and
+    sorted, so retrieval order does not matter but re-ingested text does.
+    """
+    doc_ids = sorted(
+        (
+            str(doc.get("title") or ""),
+            str(doc.get("source") or ""),
+            _digest(str(doc.get("text") or "")),
+        )
+        for doc in docs
+        if isinstance(doc, dict)
+    )
+    payload = json.dumps(
+        {
+            "model": model or "",
+            "prompt": system_prompt or "",
+            "docs": doc_ids,
+            "params": llm_params or {},
+        },
+        sort_keys=True,
+        default=repr,
+    )
+    return _digest(payload)
+
+
+@dataclass
+class SemanticHit:
+    answer: str
+    question: str
+    score: float
+
+
+class SemanticCache:
+    """Similarity lookup and storage of answers over a Redis client."""
+
+    def __init__(
+        self,
+        redis_client,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.redis = redis_client
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.exact_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.errors = 0
+
+    # -- Keys ------------------------------------------------------------
+
+    def _generation(self, agent_id: str) -> int:
+        raw = self.redis.get(f"{KEY_PREFIX}{agent_id}:gen")
+        return int(raw) if raw else 0
+
+    def _bucket(self, agent_id: str, context: str) -> str:
+        return f"{KEY_PREFIX}{agent_id}:{self._generation(agent_id)}:{context}"
+
+    # -- Lookup / store --------------------------------------------------
+
+    def lookup(
+        self,
+        agent_id: str,
+        context: str,
+        question: str,
+        embed: Callable[[str], List[float]],
+        threshold: float,
+        ttl: int,
+    ) -> Optional[SemanticHit]:
+        """Return the best cached answer scoring ``>= threshold``, if any.
+
+        An identical normalized question is answered without embedding.
+        """
+        normalized = normalize_query(question)
+        try:
+            bucket = self._bucket(agent_id, context)
+            raw = self.redis.hget(bucket, _digest(normalized))
+            if raw is not None:
+                entry = self._decode(raw, ttl)
+                if entry is not None:
+                    self._count("exact_hits")
+                    return SemanticHit(entry["answer"], entry["question"], 1.0)
+            entries = [
+                entry
+                for entry in (self._decode(v, ttl) for v in self.redis.hvals(bucket))
+                if entry is not None
+            ]
+        except Exception as e:
+            logger.error("Error reading semantic cache: %s", e)
+            self._count("errors")
+            return None
+        if not entries:
+            self._count("misses")
+            return None
+        query = self._unit(embed(normalized))
+        if query is None:
+            self._count("misses")
+            return None
+        matrix = np.stack([entry["vector"] for entry in entries])
+        if matrix.shape[1] != query.shape[0]:
+            # Embeddings model changed under the bucket.
+            self._count("misses")
+            return None
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        if score < threshold:
+            self._count("misses")
+            return None
+        self._count("hits")
+        entry = entries[best]
+        return SemanticHit(entry["answer"], entry["question"], score)
+
+    def store(
+        self,
+        agent_id: str,
+        context: str,
+        question: str,
+        answer: str,
+        embed: Callable[[str], List[float]],
+        ttl: int,
+    ) -> None:
+        normalized = normalize_query(question)
+        vector = self._unit(embed(normalized))
+        if vector is None or not answer:
+            return
+        value = json.dumps(
+            {
+                "q": normalized,
+                "a": answer,
+                "t": self._clock(),
+                "v": base64.b64encode(vector.astype(np.float32).tobytes()).decode("ascii"),
+            }
+        )
+        try:
+            bucket = self._bucket(agent_id, context)
+            self.redis.hset(bucket, _digest(normalized), value)
+            self.redis.expire(bucket, ttl)
+            if self.redis.hlen(bucket) > self.max_entries:
+                self._trim(bucket)
+        except Exception as e:
+            logger.error("Error writing semantic cache: %s", e)
+            self._count("errors")
+            return
+        self._count("stores")
+
+    def invalidate(self, agent_id: str) -> None:
+        """Make every answer cached for ``agent_id`` unreachable."""
+        try:
+            self.redis.incr(f"{KEY_PREFIX}{agent_id}:gen")
+        except Exception as e:
+            logger.error("Error invalidating semantic cache: %s", e)
+
+    # -- Helpers ---------------------------------------------------------
+
+    def _trim(self, bucket: str) -> None:
+        stamped = []
+        for field, raw in self.redis.hgetall(bucket).items():
+            try:
+                stamped.append((float(json.loads(raw)["t"]), field))
+            except (ValueError, KeyError, TypeError):
+                stamped.append((0.0, field))
+        stamped.sort()
+        excess = len(stamped) - self.max_entries
+        if excess > 0:
+            self.redis.hdel(bucket, *[field for _, field in stamped[:excess]])
+
+    def _decode(self, raw, ttl: int) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(raw)
+            if self._clock() - float(entry["t"]) > ttl:
+                return None
+            vector = np.frombuffer(base64.b64decode(entry["v"]), dtype=np.float32)
+            return {"question": entry["q"], "answer": entry["a"], "vector": vector}
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _unit(vector) -> Optional[np.ndarray]:
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(array))
+        if not array.size or norm == 0.0:
+            return None
+        return array / norm
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "exact_hits": self.exact_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "errors": self.errors,
+        }
+
+
+_CACHE: Optional[SemanticCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def _setting(name: str, default, kind):
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, kind) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def resolve_ttl() -> int:
+    """Instance-wide answer lifetime — 0 disables the cache for every agent."""
+    return _setting("SEMANTIC_CACHE_TTL", DEFAULT_TTL, int)
+
+
+def resolve_threshold() -> float:
+    return float(_setting("SEMANTIC_CACHE_THRESHOLD", DEFAULT_THRESHOLD, (int, float)))
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Return the process cache, or ``None`` when disabled or Redis is absent."""
+    global _CACHE
+    if resolve_ttl() <= 0:
+        return None
+    if _CACHE is not None:
+        return _CACHE
+    redis_client = get_redis_instance()
+    if redis_client is None:
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = SemanticCache(
+                redis_client,
+                max_entries=_setting("SEMANTIC_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES, int),
+            )
+    return _CACHE
+
+
+def invalidate_agents(agent_ids: Iterable[str]) -> None:
+    """Drop the cached answers of every agent in ``agent_ids``."""
+    cache = get_semantic_cache()
+    if cache is None:
+        return
+    for agent_id in agent_ids:
+        cache.invalidate(str(agent_id))
+
+
+def semantic_cache_stats() -> Dict[str, int]:
+    """Counters for this process; all zeros when the cache is disabled."""
+    cache = get_semantic_cache()
+    if cache is None:
+        return {"hits": 0, "exact_hits": 0, "misses": 0, "stores": 0, "errors": 0}
+    return cache.stats()
@@ -60,6 +60,23 @@ class BaseStorage(ABC):
         finally:
             file_obj.close()
 
+    def get_file_version(self, path: str) -> Optional[str]:
+        """Return an opaque token that changes whenever the file's bytes do.
+
+        Lets callers that keep a decoded copy of a file (the FAISS index
+        cache) tell whether it is still current without downloading it.
+        Backends that cannot answer cheaply return ``None``, which callers
+        must treat as "unknown — do not cache".
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            A version token, or ``None`` when the file is missing or the
+            backend has no cheap way to fingerprint it.
+        """
+        return None
+
     def generate_presigned_url(
         self,
         path: str,
@@ -107,11 +107,7 @@ def ensure_vector_schema(*, logger: Optional[logging.Logger] = None) -> None:
         )
         return
 
-    dsn = getattr(settings, "PGVECTOR_CONNECTION_STRING", None)
-    if not dsn and getattr(settings, "POSTGRES_URI", None):
-        from application.core.db_uri import normalize_pgvector_connection_string
-
-        dsn = normalize_pgvector_connection_string(settings.POSTGRES_URI)
+    dsn = _vector_dsn(settings)
     if not dsn:
         log.info(
             "ensure_vector_schema: no pgvector connection string configured "
@@ -167,6 +163,7 @@ def ensure_vector_schema(*, logger: Optional[logging.Logger] = None) -> None:
             cursor.close()
 
         PGVectorStore.create_schema(conn, dimension=dim or DEFAULT_EMBEDDING_DIM)
+        backfill = PGVectorStore.tsvector_backfill_pending(conn)
         if graph_enabled:
             from application.graphrag.store import (
                 DEFAULT_NAME_EMBEDDING_DIM,
@@ -187,6 +184,9 @@ def ensure_vector_schema(*, logger: Optional[logging.Logger] = None) -> None:
                 "PGVECTOR_CONNECTION_STRING at the matching database."
             )
 
+        if backfill:
+            _enqueue_tsvector_backfill(log)
+
         log.info(
             "ensure_vector_schema: table 'documents' ready "
             "(dimension=%s, graph tables=%s) in %d ms.",
@@ -206,6 +206,82 @@ def ensure_vector_schema(*, logger: Optional[logging.Logger] = None) -> None:
         conn.close()
 
 
+def backfill_vector_tsvector(*, logger: Optional[logging.Logger] = None) -> dict:
+    """Fill and index the ``documents`` tsvector column of a pre-existing table.
+
+    Tables created before ``keyword_search`` moved to a precomputed tsvector
+    column get a plain one at boot (see ``PGVectorStore.create_schema``); this
+    populates it in small batches and builds its GIN index concurrently, so
+    neither readers nor ingest block on it. Run by the
+    ``backfill_pgvector_tsvector`` task, which :func:`ensure_vector_schema`
+    enqueues when the work is pending.
+
+    Args:
+        logger: Optional logger. Defaults to this module's logger.
+
+    Returns:
+        A summary dict: rows ``filled``, or ``skipped`` with the reason.
+    """
+    log = logger or logging.getLogger(__name__)
+
+    from application.core.settings import settings
+
+    if (settings.VECTOR_STORE or "").lower() != "pgvector":
+        return {"skipped": "VECTOR_STORE is not pgvector"}
+    dsn = _vector_dsn(settings)
+    if not dsn:
+        return {"skipped": "no pgvector connection string"}
+
+    import psycopg
+
+    from application.vectorstore.pgvector import PGVectorStore
+
+    started = time.monotonic()
+    conn = psycopg.connect(dsn, connect_timeout=10, autocommit=True)
+    try:
+        filled = PGVectorStore.backfill_tsvector(
+            conn, batch_size=settings.PGVECTOR_TSV_BACKFILL_BATCH_SIZE
+        )
+    finally:
+        conn.close()
+    if filled is None:
+        return {"skipped": "backfill already running or column missing"}
+    log.info(
+        "backfill_vector_tsvector: filled %d rows of 'documents' in %d ms.",
+        filled,
+        int((time.monotonic() - started) * 1000),
+    )
+    return {"filled": filled}
+
+
+def _vector_dsn(settings) -> Optional[str]:
+    """The pgvector DSN: explicit setting first, else derived from POSTGRES_URI."""
+    dsn = getattr(settings, "PGVECTOR_CONNECTION_STRING", None)
+    if not dsn and getattr(settings, "POSTGRES_URI", None):
+        from application.core.db_uri import normalize_pgvector_connection_string
+
+        dsn = normalize_pgvector_connection_string(settings.POSTGRES_URI)
+    return dsn
+
+
+def _enqueue_tsvector_backfill(log: logging.Logger) -> None:
+    """Queue the tsvector backfill by name; never fail boot over it.
+
+    Sent by name so the boot hook does not import the task module (and with
+    it the whole worker). Several processes booting at once may each enqueue
+    it; the backfill's advisory lock lets only one run.
+    """
+    try:
+        from application.celery_init import celery
+
+        celery.send_task("application.api.user.tasks.backfill_pgvector_tsvector")
+        log.info(
+            "ensure_vector_schema: queued the tsvector backfill for 'documents'."
+        )
+    except Exception as exc:  # noqa: BLE001 — keyword search still works unindexed
+        log.warning("ensure_vector_schema: could not queue tsvector backfill: %s", exc)
+
+
 def _ensure_database_exists(uri: str, log: logging.Logger) -> None:
     """Create the target database if a connection reveals it's missing.
 
@@ -26,6 +26,7 @@ from sqlalchemy import (
     Float,
     ForeignKeyConstraint,
     Index,
+    LargeBinary,
     Integer,
     MetaData,
     PrimaryKeyConstraint,
@@ -342,7 +343,7 @@ agents_table = Table(
     Column("tools", JSONB, nullable=False, server_default="[]"),
     Column("json_schema", JSONB),
     Column("models", JSONB),
-    # Per-agent behavior contract (AgentConfig — guardrails today). Empty
+    # Per-agent behavior contract (AgentConfig — guardrails, semantic cache). Empty
     # ``{}`` parses to guardrails-disabled.
     Column("config", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
     Column("default_model_id", Text),
@@ -854,6 +855,22 @@ ingest_chunk_progress_table = Table(
 )
 
 
+# Added in ``0031_embedding_cache``. Keyed by embeddings model plus the
+# SHA-256 of the normalized chunk text; ``vector`` is float32 bytes.
+embedding_cache_table = Table(
+    "embedding_cache",
+    metadata,
+    Column("model", Text, nullable=False),
+    Column("text_hash", Text, nullable=False),
+    Column("vector", LargeBinary, nullable=False),
+    Column("last_used", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    PrimaryKeyConstraint("model", "text_hash"),
+)
+
+# Drives the retention sweep in ``cleanup_unused_since``. Mirrors migration 0031.
+Index("ix_embedding_cache_last_used", embedding_cache_table.c.last_used)
+
+
 workflows_table = Table(
     "workflows",
     metadata,
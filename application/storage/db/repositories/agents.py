@@ -206,6 +206,19 @@ class AgentsRepository:
         )
         return [row_to_dict(r) for r in result.fetchall()]
 
+    def list_ids_for_source(self, source_id: str) -> list[str]:
+        """Ids of agents retrieving from ``source_id``, as primary or extra source."""
+        if not looks_like_uuid(str(source_id)):
+            return []
+        result = self._conn.execute(
+            text(
+                "SELECT id FROM agents WHERE source_id = CAST(:sid AS uuid) "
+                "OR CAST(:sid AS uuid) = ANY(extra_source_ids)"
+            ),
+            {"sid": str(source_id)},
+        )
+        return [str(row[0]) for row in result.fetchall()]
+
     def update_by_id(
         self, agent_id: str, fields: dict, expected_updated_at=None
     ) -> Optional[bool]:
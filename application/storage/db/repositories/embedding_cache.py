@@ -0,0 +1,79 @@
+"""Repository for ``embedding_cache``; content-addressed chunk embeddings."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import Connection, text
+
+
+class EmbeddingCacheRepository:
+    """Read/write helpers for ``embedding_cache``."""
+
+    def __init__(self, conn: Connection) -> None:
+        self._conn = conn
+
+    def get_many(self, model: str, text_hashes: List[str]) -> Dict[str, bytes]:
+        """Return ``{text_hash: vector_bytes}`` for the hashes that are cached.
+
+        Hits whose ``last_used`` is over a day old are touched so the
+        retention sweep only drops vectors no ingest has asked for. Retention
+        is counted in days, so a re-ingest of recently used chunks stays a
+        pure read.
+        """
+        if not text_hashes:
+            return {}
+        rows = self._conn.execute(
+            text(
+                """
+                SELECT text_hash, vector, last_used < now() - interval '1 day'
+                FROM embedding_cache
+                WHERE model = :model AND text_hash = ANY(:hashes)
+                """
+            ),
+            {"model": model, "hashes": list(text_hashes)},
+        ).fetchall()
+        stale = [row[0] for row in rows if row[2]]
+        if stale:
+            self._conn.execute(
+                text(
+                    """
+                    UPDATE embedding_cache SET last_used = now()
+                    WHERE model = :model AND text_hash = ANY(:hashes)
+                    """
+                ),
+                {"model": model, "hashes": stale},
+            )
+        return {row[0]: bytes(row[1]) for row in rows}
+
+    def put_many(self, model: str, rows: Iterable[Tuple[str, bytes]]) -> None:
+        """Upsert ``(text_hash, vector_bytes)`` rows for ``model``."""
+        params = [
+            {"model": model, "text_hash": text_hash, "vector": vector}
+            for text_hash, vector in rows
+        ]
+        if not params:
+            return
+        self._conn.execute(
+            text(
+                """
+                INSERT INTO embedding_cache (model, text_hash, vector, last_used)
+                VALUES (:model, :text_hash, :vector, now())
+                ON CONFLICT (model, text_hash) DO UPDATE SET
+                    vector = EXCLUDED.vector,
+                    last_used = now()
+                """
+            ),
+            params,
+        )
+
+    def cleanup_unused_since(self, days: int) -> int:
+        """Delete vectors no ingest has hit in ``days`` days; returns the count."""
+        result = self._conn.execute(
+            text(
+                "DELETE FROM embedding_cache "
+                "WHERE last_used < NOW() - CAST(:days || ' days' AS interval)"
+            ),
+            {"days": str(max(1, days))},
+        )
+        return result.rowcount or 0
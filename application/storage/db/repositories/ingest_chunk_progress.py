@@ -85,15 +85,25 @@ class IngestChunkProgressRepository:
         return row_to_dict(result.fetchone())
 
     def record_chunk(
-        self, source_id: str, last_index: int, embedded_chunks: int
+        self,
+        source_id: str,
+        last_index: int,
+        embedded_chunks: int,
+        total_chunks: Optional[int] = None,
     ) -> None:
-        """Persist progress after a chunk is embedded."""
+        """Persist progress after a chunk is embedded.
+
+        ``total_chunks`` also moves the row's total, for a streaming ingest
+        that only learns how many chunks the source has as it goes; ``None``
+        leaves the total ``init_progress`` set.
+        """
         self._conn.execute(
             text(
                 """
                 UPDATE ingest_chunk_progress
                 SET last_index = :last_index,
                     embedded_chunks = :embedded_chunks,
+                    total_chunks = COALESCE(:total_chunks, total_chunks),
                     last_updated = now()
                 WHERE source_id = CAST(:source_id AS uuid)
                 """
@@ -102,6 +112,9 @@ class IngestChunkProgressRepository:
                 "source_id": str(source_id),
                 "last_index": int(last_index),
                 "embedded_chunks": int(embedded_chunks),
+                "total_chunks": (
+                    int(total_chunks) if total_chunks is not None else None
+                ),
             },
         )
 
@@ -304,3 +304,63 @@ class TokenUsageRepository:
             params,
         )
         return result.scalar()
+
+    def usage_by_bucket(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        api_key: str,
+        bucket_seconds: int,
+    ) -> dict[int, tuple[int, int]]:
+        """Per-bucket ``(tokens, requests)`` for ``api_key`` in the range.
+
+        Buckets are ``floor(epoch / bucket_seconds)``. Tokens and requests
+        follow ``sum_tokens_in_range`` and ``count_in_range`` respectively,
+        so the bucket totals add up to those two aggregates; a request whose
+        rows span buckets is counted once, in the bucket of its first row.
+        Used to rebuild the Redis quota counters in ``usage_quota``.
+        """
+        result = self._conn.execute(
+            text(
+                """
+                WITH rows AS (
+                    SELECT
+                        floor(extract(epoch FROM timestamp) / :bucket_seconds)::bigint AS bucket,
+                        prompt_tokens + generated_tokens AS tokens,
+                        source,
+                        request_id
+                    FROM token_usage
+                    WHERE api_key = :api_key
+                      AND timestamp >= :start
+                      AND timestamp <= :end
+                ),
+                parts AS (
+                    SELECT bucket, SUM(tokens) AS tokens, 0 AS requests
+                    FROM rows GROUP BY bucket
+                    UNION ALL
+                    SELECT MIN(bucket), 0, 1
+                    FROM rows
+                    WHERE source = 'agent_stream' AND request_id IS NOT NULL
+                    GROUP BY request_id
+                    UNION ALL
+                    SELECT bucket, 0, COUNT(*)
+                    FROM rows
+                    WHERE source = 'agent_stream' AND request_id IS NULL
+                    GROUP BY bucket
+                )
+                SELECT bucket, SUM(tokens), SUM(requests)
+                FROM parts GROUP BY bucket
+                """
+            ),
+            {
+                "start": start,
+                "end": end,
+                "api_key": api_key,
+                "bucket_seconds": bucket_seconds,
+            },
+        )
+        return {
+            int(bucket): (int(tokens or 0), int(requests or 0))
+            for bucket, tokens, requests in result.fetchall()
+        }
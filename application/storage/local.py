@@ -1,7 +1,7 @@
 """Local file system implementation."""
 import os
 import shutil
-from typing import BinaryIO, List, Callable
+from typing import BinaryIO, Callable, List, Optional
 
 from application.storage.base import BaseStorage
 
@@ -68,6 +68,14 @@ class LocalStorage(BaseStorage):
         except FileNotFoundError as exc:
             raise FileNotFoundError(f"File not found: {full_path}") from exc
 
+    def get_file_version(self, path: str) -> Optional[str]:
+        """Fingerprint a local file by its modification time and size."""
+        try:
+            stat = os.stat(self._get_full_path(path))
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     def delete_file(self, path: str) -> bool:
         """Delete a file from local storage."""
         full_path = self._get_full_path(path)
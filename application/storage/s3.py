@@ -135,6 +135,15 @@ class S3Storage(BaseStorage):
             raise
         return int(metadata["ContentLength"])
 
+    def get_file_version(self, path: str) -> Optional[str]:
+        """Return the object's ETag via HEAD, or ``None`` when it is missing."""
+        path = self._validate_path(path)
+        try:
+            metadata = self.s3.head_object(Bucket=self.bucket_name, Key=path)
+        except ClientError:
+            return None
+        return metadata.get("ETag")
+
     def generate_presigned_url(
         self,
         path: str,
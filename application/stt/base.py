@@ -13,3 +13,15 @@ class BaseSTT(ABC):
         diarize: bool = False,
     ) -> Dict[str, Any]:
         pass
+
+    def transcribe_chunk(
+        self, file_path: Path, language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Transcribe one short live-dictation chunk.
+
+        Providers that can group concurrent chunks (see ``FasterWhisperSTT``)
+        override this; the default is a plain ``transcribe`` call.
+        """
+        return self.transcribe(
+            file_path, language=language, timestamps=False, diarize=False
+        )
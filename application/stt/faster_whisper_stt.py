@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Dict, Optional
 
 from application.stt.base import BaseSTT
+from application.stt.model_pool import get_model_pool
 
 
 class FasterWhisperSTT(BaseSTT):
@@ -16,22 +17,29 @@ class FasterWhisperSTT(BaseSTT):
         self.compute_type = compute_type
         self._model = None
 
+    @property
+    def _pool_key(self):
+        return (self.model_size, self.device, self.compute_type)
+
     def _get_model(self):
         if self._model is None:
-            try:
-                from faster_whisper import WhisperModel
-            except ImportError as exc:
-                raise ImportError(
-                    "faster-whisper is required to use the faster_whisper STT provider."
-                ) from exc
-
-            self._model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type,
-            )
+            self._model = get_model_pool().get(self._pool_key, self._load_model)
         return self._model
 
+    def _load_model(self):
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as exc:
+            raise ImportError(
+                "faster-whisper is required to use the faster_whisper STT provider."
+            ) from exc
+
+        return WhisperModel(
+            self.model_size,
+            device=self.device,
+            compute_type=self.compute_type,
+        )
+
     def transcribe(
         self,
         file_path: Path,
@@ -41,6 +49,29 @@ class FasterWhisperSTT(BaseSTT):
     ) -> Dict[str, object]:
         _ = diarize
         model = self._get_model()
+        with get_model_pool().slot(self._pool_key):
+            return self._transcribe_with(model, file_path, language, timestamps)
+
+    def transcribe_chunk(
+        self, file_path: Path, language: Optional[str] = None
+    ) -> Dict[str, object]:
+        model = self._get_model()
+        batcher = get_model_pool().batcher(self._pool_key)
+        if batcher is None:
+            return self.transcribe(file_path, language=language)
+        return batcher.run(
+            lambda: self._transcribe_with(model, file_path, language, False)
+        )
+
+    def _transcribe_with(
+        self,
+        model,
+        file_path: Path,
+        language: Optional[str],
+        timestamps: bool,
+    ) -> Dict[str, object]:
+        # ``segments_iter`` is lazy: decoding happens while it is consumed,
+        # so it must be drained before the caller releases its model slot.
         segments_iter, info = model.transcribe(
             str(file_path),
             language=language,
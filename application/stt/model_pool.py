@@ -0,0 +1,230 @@
+"""Process-wide pool of loaded faster-whisper models.
+
+``STTCreator.create_stt`` builds a fresh ``FasterWhisperSTT`` per request and
+each instance loaded its own ``WhisperModel`` from disk, so every upload,
+every audio file ingested by ``AudioParser`` and every 2-second
+``/stt/live/chunk`` request paid a full model load. Models now live here,
+keyed by ``(model_size, device, compute_type)``, loaded once per process
+(optionally at web/worker start, see ``preload_default_model``) and shared by
+every instance.
+
+* ``slot(key)`` bounds concurrent inferences per model to
+  ``STT_MAX_CONCURRENT_TRANSCRIPTIONS`` — extra callers wait instead of
+  oversubscribing the CPU threads CTranslate2 already uses per call.
+* ``batcher(key)`` groups live chunks that arrive within
+  ``STT_LIVE_BATCH_WINDOW_MS`` of each other (up to ``STT_LIVE_BATCH_SIZE``)
+  and runs each group back to back under a single slot. One serving thread
+  per slot gathers and runs groups, so while one group transcribes the next
+  is already forming and up to ``STT_MAX_CONCURRENT_TRANSCRIPTIONS`` groups
+  run at once. faster-whisper has no batched decode for separate clips, so
+  a group costs what its chunks cost one by one and a chunk waits behind
+  the ones grouped ahead of it; the window is therefore off by default and
+  only worth setting to cap how often a burst of chunks contends for slots.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ModelKey = Tuple[str, str, str]
+
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_BATCH_WINDOW_MS = 0
+DEFAULT_BATCH_SIZE = 8
+
+
+def _int_setting(name: str, default: int) -> int:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+class ChunkBatcher:
+    """Runs submitted calls in groups, each group under one model slot.
+
+    The batcher serves with as many threads as the model has slots. Only one
+    of them gathers at a time, so a group is never split between threads.
+    """
+
+    def __init__(
+        self,
+        pool: "WhisperModelPool",
+        key: ModelKey,
+        window_seconds: float,
+        max_batch: int,
+    ) -> None:
+        self._pool = pool
+        self._key = key
+        self._window = window_seconds
+        self._max_batch = max(1, max_batch)
+        self._queue: "queue.Queue[Tuple[Callable[[], Any], concurrent.futures.Future]]" = (
+            queue.Queue()
+        )
+        self._gather_lock = threading.Lock()
+        self.batches = 0
+        for _ in range(pool.max_concurrency):
+            threading.Thread(
+                target=self._serve, daemon=True, name="stt-chunk-batcher"
+            ).start()
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        """Queue ``fn`` with the current group and return its result."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._queue.put((fn, future))
+        return future.result()
+
+    def _gather(self) -> list:
+        """Block for the next call, then collect the rest of its group."""
+        with self._gather_lock:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.batches += 1
+        return batch
+
+    def _serve(self) -> None:
+        while True:
+            batch = self._gather()
+            with self._pool.slot(self._key):
+                for fn, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        future.set_result(fn())
+                    except BaseException as e:
+                        future.set_exception(e)
+
+
+class WhisperModelPool:
+    """Loaded models and their inference slots, shared by the process."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        batch_window_ms: int = DEFAULT_BATCH_WINDOW_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_window_ms = batch_window_ms
+        self.batch_size = batch_size
+        self._models: Dict[ModelKey, Any] = {}
+        self._slots: Dict[ModelKey, threading.BoundedSemaphore] = {}
+        self._batchers: Dict[ModelKey, ChunkBatcher] = {}
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, key: ModelKey, loader: Callable[[], Any]) -> Any:
+        """Return the model for ``key``, calling ``loader`` on first use only."""
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            model = self._models.get(key)
+            if model is None:
+                started = time.monotonic()
+                model = loader()
+                self._models[key] = model
+                self.loads += 1
+                logger.info(
+                    "Loaded faster-whisper model %s in %.1fs",
+                    key,
+                    time.monotonic() - started,
+                )
+        return model
+
+    @contextmanager
+    def slot(self, key: ModelKey) -> Iterator[None]:
+        """Hold one of the model's ``max_concurrency`` inference slots."""
+        with self._lock:
+            semaphore = self._slots.get(key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_concurrency)
+                self._slots[key] = semaphore
+        with semaphore:
+            yield
+
+    def batcher(self, key: ModelKey) -> Optional[ChunkBatcher]:
+        """The live-chunk batcher for ``key``, or ``None`` when batching is off."""
+        if self.batch_window_ms <= 0:
+            return None
+        with self._lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                batcher = ChunkBatcher(
+                    self, key, self.batch_window_ms / 1000, self.batch_size
+                )
+                self._batchers[key] = batcher
+            return batcher
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "models": len(self._models),
+            "loads": self.loads,
+            "chunk_batches": sum(b.batches for b in self._batchers.values()),
+        }
+
+
+_POOL: Optional[WhisperModelPool] = None
+_POOL_PID: Optional[int] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_model_pool() -> WhisperModelPool:
+    """Return this process's pool, building it from settings on first use."""
+    global _POOL, _POOL_PID
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_PID != os.getpid():
+            _POOL = WhisperModelPool(
+                max_concurrency=_int_setting(
+                    "STT_MAX_CONCURRENT_TRANSCRIPTIONS", DEFAULT_MAX_CONCURRENCY
+                ),
+                batch_window_ms=_int_setting(
+                    "STT_LIVE_BATCH_WINDOW_MS", DEFAULT_BATCH_WINDOW_MS
+                ),
+                batch_size=_int_setting("STT_LIVE_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+            )
+            _POOL_PID = os.getpid()
+        return _POOL
+
+
+def preload_default_model() -> None:
+    """Load the configured faster-whisper model now rather than on first use.
+
+    A no-op unless ``STT_PROVIDER`` is ``faster_whisper`` and
+    ``STT_PRELOAD_MODEL`` is enabled. Failures are logged; the model is then
+    loaded lazily as before.
+    """
+    from application.core.settings import settings
+
+    if getattr(settings, "STT_PRELOAD_MODEL", False) is not True:
+        return
+    if str(getattr(settings, "STT_PROVIDER", "")).lower() != "faster_whisper":
+        return
+    from application.stt.faster_whisper_stt import FasterWhisperSTT
+
+    try:
+        FasterWhisperSTT()._get_model()
+    except Exception as e:
+        logger.warning("Could not preload faster-whisper model: %s", e)
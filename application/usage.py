@@ -4,6 +4,7 @@ from typing import Any, Dict
 
 from application.storage.db.repositories.token_usage import TokenUsageRepository
 from application.storage.db.session import db_session
+from application.usage_quota import record_usage
 from application.utils import num_tokens_from_object_or_list, num_tokens_from_string
 
 logger = logging.getLogger(__name__)
@@ -119,6 +120,8 @@ def _persist_call_usage(llm, call_usage):
             },
         )
         return
+    source = getattr(llm, "_token_usage_source", None) or "agent_stream"
+    request_id = getattr(llm, "_request_id", None)
     try:
         with db_session() as conn:
             # ``timestamp`` is omitted so Postgres ``server_default
@@ -131,14 +134,20 @@ def _persist_call_usage(llm, call_usage):
                 agent_id=str(agent_id) if agent_id else None,
                 prompt_tokens=call_usage["prompt_tokens"],
                 generated_tokens=call_usage["generated_tokens"],
-                source=(
-                    getattr(llm, "_token_usage_source", None) or "agent_stream"
-                ),
-                request_id=getattr(llm, "_request_id", None),
+                source=source,
+                request_id=request_id,
                 model_id=getattr(llm, "_canonical_model_id", None),
             )
     except Exception:
         logger.exception("token_usage persist failed")
+        return
+    if user_api_key:
+        record_usage(
+            user_api_key,
+            call_usage["prompt_tokens"] + call_usage["generated_tokens"],
+            source,
+            request_id,
+        )
 
 
 def _prefer_provider_usage(llm: Any, call_usage: Dict[str, int]) -> Dict[str, int]:
@@ -0,0 +1,279 @@
+"""Rolling 24-hour usage counters for API-key quota checks, kept in Redis.
+
+``BaseAnswerResource.check_usage`` summed the last 24 hours of
+``token_usage`` rows for a rate-limited key on every request — an aggregate
+whose cost grows with the key's traffic, on the hottest path we serve.
+Keys now carry a Redis hash of per-bucket counters
+(``usage_quota:{digest}``, fields ``t:{bucket}`` for tokens and
+``r:{bucket}`` for requests, ``USAGE_QUOTA_BUCKET_SECONDS`` wide):
+
+* ``_persist_call_usage`` adds each call's tokens — and, for
+  ``agent_stream`` calls, one request per distinct ``request_id`` — with an
+  atomic Lua increment;
+* a quota check sums the buckets still inside the window with one Lua read
+  that also drops the expired ones.
+
+The counters are authoritative only while the key's ``:seeded`` marker
+exists. A check that finds no marker (first use, Redis restarted or
+flushed, or the marker's ``USAGE_QUOTA_RECONCILE_SECONDS`` lifetime ran
+out) runs one bucketed ``token_usage`` query, rebuilds the hash from it and
+sets the marker, so any drift is reconciled at that cadence. Increments
+arriving while the marker is absent are skipped — the rebuild reads them
+from Postgres. Without Redis, or with reconciliation set to 0, checks use
+the SQL aggregates as before.
+
+The oldest counted bucket may start up to one bucket width before the
+24-hour cutoff, so the counters err towards the stricter answer.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+from application.cache import get_redis_instance
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 24 * 60 * 60
+DEFAULT_BUCKET_SECONDS = 300
+DEFAULT_RECONCILE_SECONDS = 3600
+_KEY_PREFIX = "usage_quota:"
+# How long a request_id is remembered so its later LLM calls are not
+# counted again; far longer than any single agent run.
+_REQUEST_DEDUP_SECONDS = 3600
+
+# KEYS: counters, seeded marker, request_id marker.
+# ARGV: bucket, tokens, request mode (0 none, 1 always, 2 once per
+# request_id), counters TTL.
+_RECORD_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    return 0
+end
+if tonumber(ARGV[2]) > 0 then
+    redis.call('HINCRBY', KEYS[1], 't:' .. ARGV[1], ARGV[2])
+end
+if ARGV[3] == '1' or (ARGV[3] == '2' and redis.call(
+    'SET', KEYS[3], '1', 'NX', 'EX', %d)) then
+    redis.call('HINCRBY', KEYS[1], 'r:' .. ARGV[1], 1)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+""" % _REQUEST_DEDUP_SECONDS
+
+# KEYS: counters, seeded marker. ARGV: oldest bucket still in the window.
+# Returns {tokens, requests}, or nil when the counters are not seeded.
+_READ_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    return nil
+end
+local oldest = tonumber(ARGV[1])
+local fields = redis.call('HGETALL', KEYS[1])
+local tokens, requests, expired = 0, 0, {}
+for i = 1, #fields, 2 do
+    local bucket = tonumber(string.sub(fields[i], 3))
+    if bucket == nil or bucket < oldest then
+        table.insert(expired, fields[i])
+    elseif string.sub(fields[i], 1, 1) == 't' then
+        tokens = tokens + tonumber(fields[i + 1])
+    else
+        requests = requests + tonumber(fields[i + 1])
+    end
+end
+if #expired > 0 then
+    redis.call('HDEL', KEYS[1], unpack(expired))
+end
+return {tokens, requests}
+"""
+
+# KEYS: counters, seeded marker. ARGV: counters TTL, marker TTL, then
+# field/value pairs.
+_SEED_LUA = """
+redis.call('DEL', KEYS[1])
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('SET', KEYS[2], '1', 'EX', ARGV[2])
+return 1
+"""
+
+
+def _int_setting(name: str, default: int) -> int:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def resolve_reconcile_seconds() -> int:
+    """Seconds between rebuilds from ``token_usage`` — 0 disables the counters."""
+    return _int_setting("USAGE_QUOTA_RECONCILE_SECONDS", DEFAULT_RECONCILE_SECONDS)
+
+
+def resolve_bucket_seconds() -> int:
+    return max(1, _int_setting("USAGE_QUOTA_BUCKET_SECONDS", DEFAULT_BUCKET_SECONDS))
+
+
+def _keys(api_key: str) -> Tuple[str, str]:
+    digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    counters = f"{_KEY_PREFIX}{digest}"
+    return counters, f"{counters}:seeded"
+
+
+def _redis():
+    if resolve_reconcile_seconds() <= 0:
+        return None
+    return get_redis_instance()
+
+
+def _oldest_bucket(now: float, bucket_seconds: int) -> int:
+    return int(now - WINDOW_SECONDS) // bucket_seconds
+
+
+def _counters_ttl(bucket_seconds: int) -> int:
+    return WINDOW_SECONDS + bucket_seconds
+
+
+def record_usage(
+    api_key: Optional[str],
+    tokens: int,
+    source: Optional[str],
+    request_id: Optional[str],
+) -> None:
+    """Count one persisted ``token_usage`` row against ``api_key``.
+
+    Mirrors ``TokenUsageRepository.count_in_range``: only ``agent_stream``
+    rows are requests, counted once per ``request_id`` (rows without one
+    count individually).
+    """
+    if not api_key:
+        return
+    redis_client = _redis()
+    if redis_client is None:
+        return
+    bucket_seconds = resolve_bucket_seconds()
+    counters, seeded = _keys(api_key)
+    if source != "agent_stream":
+        mode = "0"
+    elif request_id:
+        mode = "2"
+    else:
+        mode = "1"
+    request_key = f"{counters}:req:{request_id or ''}"
+    try:
+        redis_client.eval(
+            _RECORD_LUA,
+            3,
+            counters,
+            seeded,
+            request_key,
+            int(time.time()) // bucket_seconds,
+            max(0, int(tokens)),
+            mode,
+            _counters_ttl(bucket_seconds),
+        )
+    except Exception as e:
+        logger.error("Error recording usage quota counters: %s", e)
+
+
+def _read_counters(redis_client, api_key: str) -> Optional[Tuple[int, int]]:
+    counters, seeded = _keys(api_key)
+    result = redis_client.eval(
+        _READ_LUA,
+        2,
+        counters,
+        seeded,
+        _oldest_bucket(time.time(), resolve_bucket_seconds()),
+    )
+    if not result:
+        return None
+    return int(result[0]), int(result[1])
+
+
+def _seed_counters(
+    redis_client, api_key: str, buckets: Dict[int, Tuple[int, int]]
+) -> None:
+    counters, seeded = _keys(api_key)
+    pairs = []
+    for bucket, (tokens, requests) in buckets.items():
+        if tokens:
+            pairs += [f"t:{bucket}", int(tokens)]
+        if requests:
+            pairs += [f"r:{bucket}", int(requests)]
+    redis_client.eval(
+        _SEED_LUA,
+        2,
+        counters,
+        seeded,
+        _counters_ttl(resolve_bucket_seconds()),
+        resolve_reconcile_seconds(),
+        *pairs,
+    )
+
+
+def rolling_usage(
+    conn, api_key: str, *, tokens: bool = True, requests: bool = True
+) -> Tuple[int, int]:
+    """Tokens and requests charged to ``api_key`` over the last 24 hours.
+
+    Args:
+        conn: A read-only connection, used only when the Redis counters are
+            missing, stale or unavailable.
+        tokens: Without Redis, skip the token sum (reported as 0) when False.
+        requests: Without Redis, skip the request count (reported as 0)
+            when False.
+
+    Returns:
+        ``(tokens, requests)``.
+    """
+    from application.storage.db.repositories.token_usage import (
+        TokenUsageRepository,
+    )
+
+    repo = TokenUsageRepository(conn)
+    end = datetime.datetime.now(datetime.timezone.utc)
+    redis_client = _redis()
+    if redis_client is not None:
+        try:
+            counts = _read_counters(redis_client, api_key)
+            if counts is not None:
+                return counts
+        except Exception as e:
+            logger.error("Error reading usage quota counters: %s", e)
+            redis_client = None
+
+    if redis_client is None:
+        start = end - datetime.timedelta(seconds=WINDOW_SECONDS)
+        return (
+            repo.sum_tokens_in_range(start=start, end=end, api_key=api_key)
+            if tokens
+            else 0,
+            repo.count_in_range(start=start, end=end, api_key=api_key)
+            if requests
+            else 0,
+        )
+
+    bucket_seconds = resolve_bucket_seconds()
+    oldest = _oldest_bucket(end.timestamp(), bucket_seconds)
+    buckets = repo.usage_by_bucket(
+        start=datetime.datetime.fromtimestamp(
+            oldest * bucket_seconds, tz=datetime.timezone.utc
+        ),
+        end=end,
+        api_key=api_key,
+        bucket_seconds=bucket_seconds,
+    )
+    try:
+        _seed_counters(redis_client, api_key, buckets)
+    except Exception as e:
+        logger.error("Error seeding usage quota counters: %s", e)
+    return (
+        sum(bucket_tokens for bucket_tokens, _ in buckets.values()),
+        sum(bucket_requests for _, bucket_requests in buckets.values()),
+    )
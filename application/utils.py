@@ -114,6 +114,25 @@ def num_tokens_from_string(string: str) -> int:
         return 0
 
 
+def num_tokens_from_strings(strings) -> list:
+    """Token counts for ``strings`` in order, encoding them as one batch.
+
+    Non-string entries count as 0, like :func:`num_tokens_from_string`.
+    """
+    counts = [0] * len(strings)
+    pending = [(i, s) for i, s in enumerate(strings) if isinstance(s, str) and s]
+    if not pending:
+        return counts
+    if len(pending) == 1:
+        i, s = pending[0]
+        counts[i] = num_tokens_from_string(s)
+        return counts
+    encoded = get_encoding().encode_ordinary_batch([s for _, s in pending])
+    for (i, _), tokens in zip(pending, encoded):
+        counts[i] = len(tokens)
+    return counts
+
+
 def num_tokens_from_object_or_list(thing):
     if isinstance(thing, list):
         return sum([num_tokens_from_object_or_list(x) for x in thing])
@@ -1,20 +1,78 @@
 import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from application.core.settings import settings
 from application.vectorstore.embeddings_openai import OpenAIEmbeddings
+from application.vectorstore.query_embedding_cache import install as install_query_cache
 from application.utils import get_encoding
 
 
+def _positive_int_setting(name: str, default: int) -> int:
+    """Positive int setting, or ``default`` (the suite mocks ``settings``)."""
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return default
+
+
+class _QueryCoalescer:
+    """Merge concurrent single-query embeds into one upstream request.
+
+    The first caller of a round becomes its leader: it waits ``window``
+    seconds for other threads to queue their queries, then sends them all as
+    one batch and hands each waiter its vector (or the shared exception).
+    """
+
+    def __init__(self, send, window: float):
+        self._send = send
+        self._window = window
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Future]] = []
+
+    def submit(self, text: str):
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((text, future))
+            leader = len(self._pending) == 1
+        if leader:
+            time.sleep(self._window)
+            with self._lock:
+                batch, self._pending = self._pending, []
+            try:
+                vectors = self._send([queued for queued, _ in batch])
+                if len(vectors) != len(batch):
+                    raise ValueError(
+                        f"Remote embeddings API returned {len(vectors)} vectors "
+                        f"for {len(batch)} inputs"
+                    )
+                for (_, waiter), vector in zip(batch, vectors):
+                    waiter.set_result(vector)
+            except Exception as e:
+                for _, waiter in batch:
+                    waiter.set_exception(e)
+        return future.result()
+
+
 class RemoteEmbeddings:
     """
     Wrapper for remote embeddings API (OpenAI-compatible).
     Used when EMBEDDINGS_BASE_URL is configured.
     Sends requests to {base_url}/v1/embeddings in OpenAI format.
+
+    Requests go through one keep-alive ``requests.Session`` per instance, at
+    most ``EMBEDDINGS_MAX_CONCURRENT_REQUESTS`` in flight. ``embed_documents``
+    splits its input into server-sized sub-batches
+    (``EMBEDDINGS_REQUEST_BATCH_SIZE`` inputs / ``EMBEDDINGS_REQUEST_MAX_TOKENS``
+    tokens) sent concurrently, and with ``EMBEDDINGS_QUERY_COALESCE_MS`` set,
+    concurrent ``embed_query`` calls from different threads share one request.
     """
 
     def __init__(self, api_url: str, model_name: str, api_key: str = None):
@@ -24,6 +82,34 @@ class RemoteEmbeddings:
         if api_key:
             self.headers["Authorization"] = f"Bearer {api_key}"
         self.dimension = 768
+        self._max_concurrency = _positive_int_setting(
+            "EMBEDDINGS_MAX_CONCURRENT_REQUESTS", 4
+        )
+        self._inflight = threading.BoundedSemaphore(self._max_concurrency)
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        coalesce_ms = getattr(settings, "EMBEDDINGS_QUERY_COALESCE_MS", 0)
+        self._coalescer = (
+            _QueryCoalescer(self.embed_documents, coalesce_ms / 1000.0)
+            if isinstance(coalesce_ms, (int, float))
+            and not isinstance(coalesce_ms, bool)
+            and coalesce_ms > 0
+            else None
+        )
+
+    def _get_session(self) -> requests.Session:
+        """Shared keep-alive session, pooled to the concurrency bound."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1, pool_maxsize=self._max_concurrency
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
 
     def _truncate_inputs(self, inputs):
         """Clip each input to ``EMBEDDINGS_MAX_INPUT_TOKENS`` tokens.
@@ -67,15 +153,45 @@ class RemoteEmbeddings:
             return [clip(text) for text in inputs]
         return clip(inputs)
 
+    def _plan_requests(self, inputs: List[str]) -> List[Tuple[int, int]]:
+        """Split already-truncated ``inputs`` into ``[lo, hi)`` request ranges.
+
+        A request closes at ``EMBEDDINGS_REQUEST_BATCH_SIZE`` inputs or, when
+        ``EMBEDDINGS_REQUEST_MAX_TOKENS`` is set (e.g. TEI's
+        ``--max-batch-tokens``), before the next input would exceed it. An
+        input over the budget on its own still gets a request of its own.
+        """
+        max_items = _positive_int_setting("EMBEDDINGS_REQUEST_BATCH_SIZE", 64)
+        max_tokens = _positive_int_setting("EMBEDDINGS_REQUEST_MAX_TOKENS", 0)
+        encoding = get_encoding() if max_tokens else None
+        ranges, lo, tokens = [], 0, 0
+        for idx, text in enumerate(inputs):
+            size = len(encoding.encode_ordinary(text)) if encoding else 0
+            if idx > lo and (
+                idx - lo >= max_items or (max_tokens and tokens + size > max_tokens)
+            ):
+                ranges.append((lo, idx))
+                lo, tokens = idx, 0
+            tokens += size
+        if lo < len(inputs):
+            ranges.append((lo, len(inputs)))
+        return ranges
+
     def _embed(self, inputs):
         """Send embedding request to remote API in OpenAI-compatible format."""
-        inputs = self._truncate_inputs(inputs)
+        return self._request(self._truncate_inputs(inputs))
+
+    def _request(self, inputs):
+        """POST one already-truncated request and parse the response."""
         payload = {"input": inputs}
         if self.model_name:
             payload["model"] = self.model_name
 
         url = f"{self.api_url}/v1/embeddings"
-        response = requests.post(url, headers=self.headers, json=payload, timeout=180)
+        with self._inflight:
+            response = self._get_session().post(
+                url, headers=self.headers, json=payload, timeout=180
+            )
         response.raise_for_status()
         result = response.json()
 
@@ -97,6 +213,13 @@ class RemoteEmbeddings:
 
     def embed_query(self, query: str):
         """Embed a single query string."""
+        if self._coalescer is not None:
+            vector = self._coalescer.submit(query)
+            if not isinstance(vector, list):
+                raise ValueError(
+                    f"Unexpected result structure after embedding query: {vector}"
+                )
+            return vector
         embeddings_list = self._embed(query)
         if (
             isinstance(embeddings_list, list)
@@ -111,10 +234,22 @@ class RemoteEmbeddings:
         )
 
     def embed_documents(self, documents: list):
-        """Embed a list of documents."""
+        """Embed a list of documents, in concurrent server-sized requests."""
         if not documents:
             return []
-        embeddings_list = self._embed(documents)
+        inputs = self._truncate_inputs(list(documents))
+        ranges = self._plan_requests(inputs)
+        if len(ranges) == 1:
+            embeddings_list = self._request(inputs)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(ranges), self._max_concurrency),
+                thread_name_prefix="remote-embed",
+            ) as executor:
+                parts = executor.map(
+                    lambda bounds: self._request(inputs[bounds[0]:bounds[1]]), ranges
+                )
+                embeddings_list = [vector for part in parts for vector in part]
         if self.dimension is None and embeddings_list:
             self.dimension = len(embeddings_list[0])
         return embeddings_list
@@ -136,6 +271,12 @@ def _get_embeddings_wrapper():
 
 
 class EmbeddingsSingleton:
+    """Process-wide embeddings instances, one per model.
+
+    Each instance is created with the query-embedding cache installed on its
+    ``embed_query`` (see :mod:`~application.vectorstore.query_embedding_cache`).
+    """
+
     _instances = {}
 
     @staticmethod
@@ -159,10 +300,13 @@ class EmbeddingsSingleton:
         api_key = embeddings_key if embeddings_key is not None else settings.EMBEDDINGS_KEY
         cache_key = f"remote_{settings.EMBEDDINGS_BASE_URL}_{embeddings_name}"
         if cache_key not in EmbeddingsSingleton._instances:
-            EmbeddingsSingleton._instances[cache_key] = RemoteEmbeddings(
-                api_url=settings.EMBEDDINGS_BASE_URL,
-                model_name=embeddings_name,
-                api_key=api_key,
+            EmbeddingsSingleton._instances[cache_key] = install_query_cache(
+                RemoteEmbeddings(
+                    api_url=settings.EMBEDDINGS_BASE_URL,
+                    model_name=embeddings_name,
+                    api_key=api_key,
+                ),
+                f"{cache_key}_{settings.EMBEDDINGS_MAX_INPUT_TOKENS}",
             )
         return EmbeddingsSingleton._instances[cache_key]
 
@@ -171,8 +315,9 @@ class EmbeddingsSingleton:
         if settings.EMBEDDINGS_BASE_URL:
             return EmbeddingsSingleton._remote_instance(embeddings_name)
         if embeddings_name not in EmbeddingsSingleton._instances:
-            EmbeddingsSingleton._instances[embeddings_name] = (
-                EmbeddingsSingleton._create_instance(embeddings_name, *args, **kwargs)
+            EmbeddingsSingleton._instances[embeddings_name] = install_query_cache(
+                EmbeddingsSingleton._create_instance(embeddings_name, *args, **kwargs),
+                embeddings_name,
             )
         return EmbeddingsSingleton._instances[embeddings_name]
 
@@ -288,6 +433,56 @@ def get_embeddings(
     return embedding_instance
 
 
+def chunk_matches(
+    chunk: Dict[str, Any],
+    path_suffix: Optional[str] = None,
+    search: Optional[str] = None,
+) -> bool:
+    """The chunk browser's filter, shared by every store that scans.
+
+    ``path_suffix`` matches the end of ``metadata.source`` or
+    ``metadata.file_path``; ``search`` is a case-insensitive substring of the
+    chunk text or ``metadata.title``.
+    """
+    metadata = chunk.get("metadata") or {}
+    if path_suffix:
+        source = metadata.get("source") or ""
+        file_path = metadata.get("file_path") or ""
+        if not (source.endswith(path_suffix) or file_path.endswith(path_suffix)):
+            return False
+    if search:
+        needle = search.lower()
+        text = (chunk.get("text") or "").lower()
+        title = (metadata.get("title") or "").lower()
+        if needle not in text and needle not in title:
+            return False
+    return True
+
+
+def page_of_chunks(
+    chunks: Iterable[Dict[str, Any]],
+    offset: int,
+    limit: int,
+    path_suffix: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """One page of the matching chunks plus their total, in a single pass.
+
+    Consumes ``chunks`` lazily and keeps only the requested page, so a store
+    that streams (a scroll, a cursor, a dict view) never holds the whole
+    source in memory.
+    """
+    page: List[Dict[str, Any]] = []
+    total = 0
+    for chunk in chunks:
+        if not chunk_matches(chunk, path_suffix, search):
+            continue
+        if offset <= total < offset + limit:
+            page.append(chunk)
+        total += 1
+    return page, total
+
+
 class BaseVectorStore(ABC):
     def __init__(self):
         pass
@@ -349,6 +544,35 @@ class BaseVectorStore(ABC):
         """Get all chunks from the vectorstore"""
         pass
 
+    def get_chunks_page(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        path_suffix: Optional[str] = None,
+        search: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of this source's chunks for the chunk browser.
+
+        Default filters :meth:`get_chunks` with :func:`chunk_matches`; stores
+        that can filter, count and page server-side override it so a page
+        never costs the whole source.
+
+        Args:
+            offset: Matching chunks to skip.
+            limit: Page size.
+            path_suffix: Keep chunks whose ``source``/``file_path`` ends with it.
+            search: Keep chunks whose text or title contains it (any case).
+            after: ``doc_id`` of the previous page's last chunk. Stores that
+                order by id may seek past it instead of skipping ``offset``
+                rows; the rest page by ``offset`` alone.
+
+        Returns:
+            ``(chunks, total)``: the page, in a stable order, and the number
+            of chunks matching the filters.
+        """
+        return page_of_chunks(self.get_chunks() or [], offset, limit, path_suffix, search)
+
     def add_chunk(self, text, metadata=None, *args, **kwargs):
         """Add a single chunk to the vectorstore"""
         pass
@@ -1,8 +1,20 @@
+import logging
+import re
+
 from application.vectorstore.base import BaseVectorStore
 from application.core.settings import settings
 from application.vectorstore.document_class import Document
 
 
+def _escape_wildcard(value):
+    """Make ``*``, ``?`` and ``\\`` literal inside a wildcard pattern."""
+    return re.sub(r"([*?\\])", r"\\\1", value)
+
+
+def _any_of(*clauses):
+    return {"bool": {"should": list(clauses), "minimum_should_match": 1}}
+
+
 class ElasticsearchStore(BaseVectorStore):
     _es_connection = None  # Class attribute to hold the Elasticsearch connection
 
@@ -174,9 +186,10 @@ class ElasticsearchStore(BaseVectorStore):
         embeddings = []
         ids = ids or [str(uuid.uuid4()) for _ in texts]
         requests = []
-        embeddings = self._get_embeddings(settings.EMBEDDINGS_NAME, self.embeddings_key)
-
-        vectors = embeddings.embed_documents(list(texts))
+        vectors = kwargs.pop("vectors", None)
+        if vectors is None:
+            embeddings = self._get_embeddings(settings.EMBEDDINGS_NAME, self.embeddings_key)
+            vectors = embeddings.embed_documents(list(texts))
 
         dims_length = len(vectors[0])
 
@@ -220,6 +233,62 @@ class ElasticsearchStore(BaseVectorStore):
         else:
             return []
 
+    def get_chunks_page(
+        self, offset=0, limit=10, path_suffix=None, search=None, after=None
+    ):
+        """One page of this source's chunks, filtered and counted by Elasticsearch.
+
+        The path suffix is a case-sensitive wildcard on the ``.keyword``
+        sub-fields. The search term is a case-insensitive wildcard on the
+        title and, for the text, on its analyzed terms, so a single word
+        still matches inside a longer one as the other stores' substring
+        search does. A term with spaces spans several tokens, which a
+        wildcard cannot, and falls back to a phrase match: it finds whole
+        words in sequence but not a fragment cut mid-word. Pages follow index
+        order and, like any ``from``/``size`` query, stop at the index's
+        ``max_result_window``.
+        """
+        filters = [{"match": {"metadata.source_id.keyword": self.source_id}}]
+        if path_suffix:
+            pattern = "*" + _escape_wildcard(path_suffix)
+            filters.append(_any_of(
+                {"wildcard": {"metadata.source.keyword": {"value": pattern}}},
+                {"wildcard": {"metadata.file_path.keyword": {"value": pattern}}},
+            ))
+        if search:
+            escaped = _escape_wildcard(search)
+            title = {"value": f"*{escaped}*", "case_insensitive": True}
+            if search.split() == [search]:
+                text = {"wildcard": {"text": {"value": f"*{escaped}*", "case_insensitive": True}}}
+            else:
+                text = {"match_phrase": {"text": search}}
+            filters.append(_any_of(
+                text,
+                {"wildcard": {"metadata.title.keyword": title}},
+            ))
+        try:
+            resp = self.docsearch.search(
+                index=self.index_name,
+                query={"bool": {"filter": filters}},
+                from_=offset,
+                size=limit,
+                sort=["_doc"],
+                source=["text", "metadata"],
+                track_total_hits=True,
+            )
+        except Exception as e:
+            logging.error(f"Error getting chunks page: {e}", exc_info=True)
+            return [], 0
+        chunks = [
+            {
+                "doc_id": hit["_id"],
+                "text": hit["_source"].get("text"),
+                "metadata": hit["_source"].get("metadata") or {},
+            }
+            for hit in resp["hits"]["hits"]
+        ]
+        return chunks, resp["hits"]["total"]["value"]
+
     def delete_index(self):
         self._es_connection.delete_by_query(index=self.index_name, query={"match": {
                                       "metadata.source_id.keyword": self.source_id}},)
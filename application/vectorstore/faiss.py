@@ -1,31 +1,64 @@
 import io
 import logging
+import mmap
 import os
 import tempfile
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
 
 import numpy as np
 
 from application.core.settings import settings
 from application.storage.storage_creator import StorageCreator
-from application.vectorstore.base import BaseVectorStore
+from application.vectorstore.base import BaseVectorStore, page_of_chunks
 from application.vectorstore.document_class import Document
 from application.vectorstore.faiss_docstore import (
-    dump_json_sidecar,
+    DELTA_ADD,
+    DELTA_DELETE,
+    dump_binary_sidecar,
+    dump_delta_segment,
     dump_pickle_sidecar,
+    load_binary_sidecar,
+    load_delta_segment,
     load_json_sidecar,
     load_pickle_sidecar,
 )
+from application.vectorstore.faiss_index_cache import CachedIndex, get_index_cache
+from application.vectorstore.faiss_index_factory import (
+    FLAT,
+    index_kind,
+    migrate_if_needed,
+    remove_rows,
+)
+from application.vectorstore.faiss_keyword_index import BM25Index
 
 logger = logging.getLogger(__name__)
 
-# Sidecar holding chunk text and the row->id mapping. ``index.json`` is what
-# this version writes; ``index.pkl`` is langchain's historical format, still
-# read forever (uploads arrive in it) and still written for backward compat.
+# Sidecar holding chunk text and the row->id mapping. ``index.docs`` is what
+# this version writes; ``index.json`` is the previous format, still read;
+# ``index.pkl`` is langchain's historical format, read forever (uploads arrive
+# in it) and written only when FAISS_WRITE_PICKLE_SIDECAR asks for it.
+BINARY_SIDECAR = "index.docs"
 JSON_SIDECAR = "index.json"
 PICKLE_SIDECAR = "index.pkl"
 FAISS_INDEX = "index.faiss"
+# BM25 keyword index backing ``keyword_search`` (hybrid retrieval). Optional:
+# indexes written before it existed build it from the docstore on first use.
+KEYWORD_INDEX = "index.bm25"
+# Append-only log of single-chunk edits made since the last full save, one
+# ``<sequence>-<nonce>.seg`` file per edit, replayed in order on load.
+DELTA_DIR = "index.delta"
+DELTA_SUFFIX = ".seg"
+DEFAULT_DELTA_MAX_SEGMENTS = 32
+
+
+def _delta_max_segments() -> int:
+    """Segments allowed to pile up before an edit compacts them; 0 disables."""
+    value = settings.FAISS_DELTA_MAX_SEGMENTS
+    if isinstance(value, int) and not isinstance(value, bool):
+        return max(value, 0)
+    return DEFAULT_DELTA_MAX_SEGMENTS
 
 
 def _dependable_faiss_import():
@@ -69,11 +102,50 @@ def get_vectorstore(path: str) -> str:
     return candidate
 
 
+def replace_index_files(storage, storage_path: str, uploads: Dict[str, Any]) -> None:
+    """Replace the index at ``storage_path`` with uploaded files, by file name.
+
+    Whatever belonged to the previous index and is not being replaced is
+    removed first: delta segments, the BM25 index and the other sidecar
+    formats. Otherwise a load would replay the old segments onto the new
+    index, serve keyword search from stale postings, or prefer an old
+    ``index.docs`` over an uploaded ``index.pkl``. Each upload's target is
+    unlinked before it is written so a process still mapping the old
+    sidecar keeps reading it rather than a truncated file.
+    """
+    stale = [
+        f"{storage_path}/{name}"
+        for name in (BINARY_SIDECAR, JSON_SIDECAR, PICKLE_SIDECAR, KEYWORD_INDEX)
+        if name not in uploads
+    ]
+    stale.extend(
+        path
+        for path in storage.list_files(f"{storage_path}/{DELTA_DIR}")
+        if isinstance(path, str) and path.endswith(DELTA_SUFFIX)
+    )
+    for path in stale:
+        if storage.file_exists(path):
+            storage.delete_file(path)
+    for name, upload in uploads.items():
+        target = f"{storage_path}/{name}"
+        storage.delete_file(target)
+        storage.save_file(upload, target)
+    FaissStore._invalidate_cache(storage_path)
+
+
 class FaissStore(BaseVectorStore):
     """Vector store backed by a local FAISS index.
 
-    Holds a flat L2 index plus an in-memory docstore mapping chunk ids to
-    their text and metadata, persisted through :class:`StorageCreator`.
+    Holds an L2 index plus an in-memory docstore mapping chunk ids to their
+    text and metadata, persisted through :class:`StorageCreator`. The index
+    type (flat, IVF or HNSW) follows ``FAISS_INDEX_TYPE``; see
+    :mod:`~application.vectorstore.faiss_index_factory`.
+    Loaded indexes are shared through the process-wide
+    :mod:`~application.vectorstore.faiss_index_cache`. A BM25 index over the
+    same chunks (:mod:`~application.vectorstore.faiss_keyword_index`) serves
+    :meth:`keyword_search`. :meth:`add_chunk` and :meth:`delete_chunk` persist
+    through the delta log (see :mod:`~application.vectorstore.faiss_docstore`)
+    rather than re-uploading the whole index.
     """
 
     # Ranks by L2 distance (lower is better), not cosine — so the number here
@@ -89,8 +161,22 @@ class FaissStore(BaseVectorStore):
         self.storage = StorageCreator.get_storage()
 
         self.index = None
-        self.documents: Dict[str, Dict[str, Any]] = {}
+        # A plain dict, or a BinaryDocstore decoding chunks from index.docs.
+        self.documents: MutableMapping[str, Dict[str, Any]] = {}
         self.index_to_docstore_id: Dict[int, str] = {}
+        # ``None`` until built; read from ``index.bm25`` (or derived from
+        # ``documents``) on first use.
+        self.keyword_index: Optional[BM25Index] = None
+        # Stored ``index.bm25`` matching the loaded state, not yet read.
+        self._keyword_path: Optional[str] = None
+        self._cached: Optional[CachedIndex] = None
+        # True while ``index``/``documents`` are the cache's shared objects;
+        # mutations must detach first (see ``_own_state``).
+        self._shared = False
+        # Delta segments applied on top of the stored base, and whether a
+        # base exists in storage for further segments to build on.
+        self._delta_segments: List[str] = []
+        self._persisted = False
 
         try:
             if docs_init:
@@ -114,50 +200,224 @@ class FaissStore(BaseVectorStore):
         faiss = _dependable_faiss_import()
         vectors = self.embeddings.embed_documents(texts)
         self.index = faiss.IndexFlatL2(len(vectors[0]))
+        self.keyword_index = BM25Index()
         self._append(texts, metadatas, vectors)
+        # Large seeds go straight to the configured ANN kind (trained on a
+        # sample) instead of waiting for the first save to migrate them.
+        self.index = migrate_if_needed(self.index)
 
     def _load_from_storage(self) -> None:
-        """Load the index and its sidecar, preferring JSON over the pickle."""
+        """Load the index, its sidecar and any delta segments written since.
+
+        The binary sidecar is preferred, then JSON, then the legacy pickle.
+        ``index.bm25`` is only read once a keyword search needs it.
+        """
         faiss = _dependable_faiss_import()
         faiss_path = f"{self.path}/{FAISS_INDEX}"
+        binary_path = f"{self.path}/{BINARY_SIDECAR}"
         json_path = f"{self.path}/{JSON_SIDECAR}"
         pickle_path = f"{self.path}/{PICKLE_SIDECAR}"
+        keyword_path = f"{self.path}/{KEYWORD_INDEX}"
 
         if not self.storage.file_exists(faiss_path):
             raise FileNotFoundError(f"Index files not found in storage at {self.path}")
 
-        if self.storage.file_exists(json_path):
+        if self.storage.file_exists(binary_path):
+            sidecar, loader = binary_path, load_binary_sidecar
+        elif self.storage.file_exists(json_path):
             sidecar, loader = json_path, load_json_sidecar
         elif self.storage.file_exists(pickle_path):
             sidecar, loader = pickle_path, load_pickle_sidecar
         else:
             raise FileNotFoundError(f"Index files not found in storage at {self.path}")
 
+        segments = self._list_delta_segments()
+        versioned = [faiss_path, sidecar]
+        has_keyword_index = self.storage.file_exists(keyword_path)
+        if has_keyword_index:
+            versioned.append(keyword_path)
+        versioned.extend(segments)
+        self._delta_segments = segments
+        self._persisted = True
+
+        cache = get_index_cache()
+        version = self._storage_version(*versioned) if cache else None
+        if version is not None:
+            cached = cache.get(self.path, version)
+            if cached is not None:
+                self.index = cached.index
+                self.documents = cached.documents
+                self.index_to_docstore_id = cached.index_to_docstore_id
+                self.keyword_index = cached.keyword_index
+                if has_keyword_index:
+                    self._keyword_path = keyword_path
+                self._cached = cached
+                self._shared = True
+                return
+
+        index_bytes = self.storage.get_file(faiss_path).read()
         with tempfile.TemporaryDirectory() as temp_dir:
             local_faiss = os.path.join(temp_dir, FAISS_INDEX)
             with open(local_faiss, "wb") as f:
-                f.write(self.storage.get_file(faiss_path).read())
+                f.write(index_bytes)
             self.index = faiss.read_index(local_faiss)
 
-        self.documents, self.index_to_docstore_id = loader(
-            self.storage.get_file(sidecar).read()
-        )
+        if loader is load_binary_sidecar:
+            sidecar_bytes = self._read_buffer(sidecar)
+        else:
+            sidecar_bytes = self.storage.get_file(sidecar).read()
+        self.documents, self.index_to_docstore_id = loader(sidecar_bytes)
+
+        if has_keyword_index:
+            self._keyword_path = keyword_path
+
+        delta_bytes = 0
+        doomed: Dict[str, None] = {}
+        for segment in segments:
+            data = self.storage.get_file(segment).read()
+            delta_bytes += len(data)
+            self._apply_delta(data, doomed)
+        if doomed:
+            self.delete_index(list(doomed))
+
+        if version is not None:
+            self._cached = CachedIndex(
+                version=version,
+                index=self.index,
+                documents=self.documents,
+                index_to_docstore_id=self.index_to_docstore_id,
+                nbytes=len(index_bytes) + len(sidecar_bytes) + delta_bytes,
+                keyword_index=self.keyword_index,
+            )
+            cache.put(self.path, self._cached)
+            self._shared = True
+
+    def _read_buffer(self, path: str):
+        """Contents of ``path``, memory-mapped when storage hands back a real file.
+
+        A mapped sidecar is decoded lazily by :class:`BinaryDocstore`, so
+        only the chunks a request touches are ever paged in. Saves unlink the
+        old file before writing (see ``_save_to_storage``), which keeps the
+        inode behind an existing mapping intact.
+        """
+        with self.storage.get_file(path) as f:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                # In-memory streams (S3) have no descriptor; empty files can't be mapped.
+                return f.read()
+
+    def _list_delta_segments(self) -> List[str]:
+        """Storage paths of this source's delta segments, oldest first."""
+        paths = [
+            path
+            for path in self.storage.list_files(f"{self.path}/{DELTA_DIR}")
+            if isinstance(path, str) and path.endswith(DELTA_SUFFIX)
+        ]
+        return sorted(paths, key=lambda path: path.rsplit("/", 1)[-1])
+
+    def _storage_version(self, *paths: str) -> Optional[str]:
+        """Combined storage version of ``paths``; ``None`` if any is unknown."""
+        versions = []
+        for path in paths:
+            version = self.storage.get_file_version(path)
+            if not isinstance(version, str):
+                return None
+            versions.append(version)
+        return ":".join(versions)
 
     # -- Internals -------------------------------------------------------
 
+    def _own_state(self) -> None:
+        """Detach from the cache's shared objects before mutating them."""
+        if not self._shared:
+            return
+        faiss = _dependable_faiss_import()
+        self.index = faiss.clone_index(self.index)
+        # BinaryDocstore.copy shares the mapped buffer and copies only its overlay.
+        self.documents = self.documents.copy()
+        self.index_to_docstore_id = dict(self.index_to_docstore_id)
+        if self.keyword_index is not None:
+            self.keyword_index = self.keyword_index.copy()
+        self._cached = None
+        self._shared = False
+
+    def _ensure_keyword_index(self) -> BM25Index:
+        """Return the BM25 index, reading ``index.bm25`` or building it if absent.
+
+        One loaded or built while sharing a cached entry is stored on that
+        entry, so a source pays for it once per process rather than per request.
+        """
+        if self.keyword_index is None:
+            if self._keyword_path is not None:
+                data = self.storage.get_file(self._keyword_path).read()
+                self.keyword_index = BM25Index.from_bytes(data)
+            else:
+                self.keyword_index = BM25Index.from_documents(self.documents)
+            if self._shared and self._cached is not None:
+                self._cached.keyword_index = self.keyword_index
+        return self.keyword_index
+
+    def _sync_keyword_index(self) -> None:
+        """Read a pending ``index.bm25`` before the state it mirrors changes.
+
+        Left unread it would miss the change; with keyword search off it is
+        simply forgotten and rebuilt from the docstore if ever needed.
+        """
+        if self.keyword_index is not None or self._keyword_path is None:
+            return
+        if settings.FAISS_KEYWORD_INDEX:
+            self._ensure_keyword_index()
+        self._keyword_path = None
+
     def _append(self, texts, metadatas, vectors, ids=None) -> List[str]:
         """Add embedded rows to the index and docstore, returning their ids."""
         ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+        self._sync_keyword_index()
+        # Rows deleted from an ANN index stay in it until compaction, so new
+        # rows start at ntotal, not at the number of mapped rows.
+        start = self.index.ntotal
         self.index.add(np.array(vectors, dtype=np.float32))
-        start = len(self.index_to_docstore_id)
         for offset, (text, metadata, doc_id) in enumerate(zip(texts, metadatas, ids)):
             self.documents[doc_id] = {
                 "page_content": text,
                 "metadata": dict(metadata or {}),
             }
             self.index_to_docstore_id[start + offset] = doc_id
+            if self.keyword_index is not None:
+                self.keyword_index.add(doc_id, text)
         return ids
 
+    def _apply_delta(self, data: bytes, doomed: Dict[str, None]) -> None:
+        """Replay one delta segment onto the freshly loaded state.
+
+        Deleted ids are collected in ``doomed`` so the caller removes them
+        in one pass after the last segment; an add of a doomed id applies
+        the pending deletes first. Replays are idempotent: an add whose id
+        is already present, or a delete whose id is already gone, is skipped.
+        """
+        op, ids, documents, vectors = load_delta_segment(data)
+        if op == DELTA_DELETE:
+            for doc_id in ids:
+                if doc_id in self.documents:
+                    doomed[doc_id] = None
+            return
+        if any(doc_id in doomed for doc_id in ids):
+            self.delete_index(list(doomed))
+            doomed.clear()
+        keep = [i for i, doc_id in enumerate(ids) if doc_id not in self.documents]
+        if not keep:
+            return
+        if self.index is None:
+            faiss = _dependable_faiss_import()
+            self.index = faiss.IndexFlatL2(vectors.shape[1])
+        self._append(
+            [documents[i].get("page_content", "") for i in keep],
+            [documents[i].get("metadata") or {} for i in keep],
+            vectors[keep],
+            [ids[i] for i in keep],
+        )
+
     def _to_document(self, doc_id: str) -> Optional[Document]:
         stored = self.documents.get(doc_id)
         if stored is None:
@@ -196,7 +456,10 @@ class FaissStore(BaseVectorStore):
         if query_vector is None:
             query_vector = self.embeddings.embed_query(question)
         vector = np.array([query_vector], dtype=np.float32)
-        distances, rows = self.index.search(vector, min(k, self.index.ntotal))
+        # Over-fetch by the deleted rows still in the index so they can't
+        # crowd live chunks out of the top k.
+        fetch = min(k + self._deleted_rows(), self.index.ntotal)
+        distances, rows = self.index.search(vector, fetch)
 
         results = []
         for distance, row in zip(distances[0], rows[0]):
@@ -206,6 +469,21 @@ class FaissStore(BaseVectorStore):
             document = self._to_document(doc_id) if doc_id else None
             if document is not None:
                 results.append((document, float(distance)))
+        return results[:k]
+
+    def keyword_search(self, question: str, k: int = 10) -> List[Document]:
+        """Return up to ``k`` chunks ranked by BM25 against ``question``.
+
+        The lexical half of :class:`HybridRetriever`, matching what
+        ``PGVectorStore.keyword_search`` provides from Postgres full-text.
+        """
+        if not settings.FAISS_KEYWORD_INDEX or not self.documents:
+            return []
+        results = []
+        for doc_id, _ in self._ensure_keyword_index().search(question, k):
+            document = self._to_document(doc_id)
+            if document is not None:
+                results.append(document)
         return results
 
     # -- Mutation --------------------------------------------------------
@@ -216,14 +494,22 @@ class FaissStore(BaseVectorStore):
         metadatas: Optional[List[dict]] = None,
         *args,
         ids: Optional[List[str]] = None,
+        vectors: Optional[List[List[float]]] = None,
         **kwargs,
     ) -> List[str]:
-        """Embed and append ``texts`` to the index."""
+        """Embed and append ``texts`` to the index.
+
+        Args:
+            vectors: Precomputed embeddings of ``texts``, row-aligned; when
+                given the store skips embedding them itself.
+        """
         texts = list(texts)
         if not texts:
             return []
         metadatas = list(metadatas or [{} for _ in texts])
-        vectors = self.embeddings.embed_documents(texts)
+        if vectors is None:
+            vectors = self.embeddings.embed_documents(texts)
+        self._own_state()
         if self.index is None:
             faiss = _dependable_faiss_import()
             self.index = faiss.IndexFlatL2(len(vectors[0]))
@@ -231,67 +517,167 @@ class FaissStore(BaseVectorStore):
 
     def delete_index(self, ids: Optional[List[str]] = None, *args, **kwargs):
         """Delete the given chunk ids, or the whole index when ids are omitted."""
+        if ids is not None:
+            self._sync_keyword_index()
+        self._own_state()
         if ids is None:
             faiss = _dependable_faiss_import()
             dimension = self.index.d if self.index is not None else None
             self.index = faiss.IndexFlatL2(dimension) if dimension else None
             self.documents = {}
             self.index_to_docstore_id = {}
+            self.keyword_index = BM25Index()
+            self._keyword_path = None
             return True
 
-        missing = set(ids) - set(self.documents)
+        missing = {doc_id for doc_id in ids if doc_id not in self.documents}
         if missing:
             raise ValueError(f"Chunk ids not found in index: {sorted(missing)}")
 
         rows_by_id = {doc_id: row for row, doc_id in self.index_to_docstore_id.items()}
         rows_to_drop = {rows_by_id[doc_id] for doc_id in ids}
-        self.index.remove_ids(np.array(sorted(rows_to_drop), dtype=np.int64))
         for doc_id in ids:
             self.documents.pop(doc_id, None)
-
-        # remove_ids compacts the index, so the mapping has to be renumbered.
-        remaining = [
-            doc_id
-            for row, doc_id in sorted(self.index_to_docstore_id.items())
-            if row not in rows_to_drop
-        ]
-        self.index_to_docstore_id = dict(enumerate(remaining))
+        if self.keyword_index is not None:
+            self.keyword_index.remove(ids)
+
+        if index_kind(self.index) == FLAT and not self._deleted_rows():
+            # remove_ids compacts the index, so the mapping has to be renumbered.
+            self.index = remove_rows(self.index, rows_to_drop)
+            remaining = [
+                doc_id
+                for row, doc_id in sorted(self.index_to_docstore_id.items())
+                if row not in rows_to_drop
+            ]
+            self.index_to_docstore_id = dict(enumerate(remaining))
+        else:
+            # ANN indexes can't drop rows in place and rebuilding one per
+            # delete is a full retrain or graph build. Unmap the rows so
+            # search skips them; the next full save compacts them away.
+            for row in rows_to_drop:
+                del self.index_to_docstore_id[row]
         return True
 
+    def _deleted_rows(self) -> int:
+        """Rows still in the index whose chunk has been deleted."""
+        if self.index is None:
+            return 0
+        return self.index.ntotal - len(self.index_to_docstore_id)
+
+    def _compact(self) -> None:
+        """Drop deleted rows from the index and renumber the mapping densely."""
+        if self._deleted_rows() <= 0:
+            return
+        self._own_state()
+        live = set(self.index_to_docstore_id)
+        dead = [row for row in range(self.index.ntotal) if row not in live]
+        self.index = remove_rows(self.index, dead)
+        self.index_to_docstore_id = dict(
+            enumerate(doc_id for _, doc_id in sorted(self.index_to_docstore_id.items()))
+        )
+
     def add_chunk(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> str:
-        """Add a new chunk and save to storage."""
-        ids = self.add_texts([text], [metadata or {}])
-        self._save_to_storage()
+        """Add a new chunk and persist it as a delta segment."""
+        metadata = dict(metadata or {})
+        vectors = self.embeddings.embed_documents([text])
+        ids = self.add_texts([text], [metadata], vectors=vectors)
+        self._persist_delta(
+            dump_delta_segment(
+                DELTA_ADD, ids, [{"page_content": text, "metadata": metadata}], vectors
+            )
+        )
         return ids[0]
 
     def delete_chunk(self, chunk_id: str) -> bool:
-        """Delete a chunk and save to storage."""
+        """Delete a chunk and persist the removal as a delta segment."""
         self.delete_index([chunk_id])
-        self._save_to_storage()
+        self._persist_delta(dump_delta_segment(DELTA_DELETE, [chunk_id]))
         return True
 
     # -- Persistence -----------------------------------------------------
 
     def _write_index_files(self, directory: str) -> None:
-        """Write index.faiss plus both sidecars into ``directory``."""
+        """Write index.faiss, index.docs and index.bm25 into ``directory``.
+
+        ``index.pkl`` is added only when ``FAISS_WRITE_PICKLE_SIDECAR`` is on.
+
+        An index whose type no longer matches its size (a flat index that
+        outgrew ``FAISS_ANN_MIN_VECTORS``, or one built before an ANN type
+        was configured) is migrated here, so existing sources convert on
+        their next save. Rows deleted from an ANN index since the last full
+        save are compacted out first.
+        """
         faiss = _dependable_faiss_import()
         os.makedirs(directory, exist_ok=True)
+        self._compact()
+        migrated = migrate_if_needed(self.index)
+        if migrated is not self.index:
+            # A fresh object, so a shared cached index is left untouched.
+            self.index = migrated
+            self._shared = False
         faiss.write_index(self.index, os.path.join(directory, FAISS_INDEX))
-        with open(os.path.join(directory, JSON_SIDECAR), "wb") as f:
-            f.write(dump_json_sidecar(self.documents, self.index_to_docstore_id))
-        with open(os.path.join(directory, PICKLE_SIDECAR), "wb") as f:
-            f.write(dump_pickle_sidecar(self.documents, self.index_to_docstore_id))
+        with open(os.path.join(directory, BINARY_SIDECAR), "wb") as f:
+            f.write(dump_binary_sidecar(self.documents, self.index_to_docstore_id))
+        if settings.FAISS_WRITE_PICKLE_SIDECAR is True:
+            with open(os.path.join(directory, PICKLE_SIDECAR), "wb") as f:
+                f.write(dump_pickle_sidecar(self.documents, self.index_to_docstore_id))
+        if settings.FAISS_KEYWORD_INDEX:
+            with open(os.path.join(directory, KEYWORD_INDEX), "wb") as f:
+                f.write(self._ensure_keyword_index().to_bytes())
 
     def _save_to_storage(self) -> bool:
-        """Persist the index through the configured storage backend."""
+        """Persist the whole index, folding in and clearing the delta log.
+
+        Sidecars this save did not write are removed, so a reader never
+        prefers a stale ``index.json`` or ``index.pkl`` over the new state.
+        """
+        storage_path = get_vectorstore(self.source_id)
         with tempfile.TemporaryDirectory() as temp_dir:
             self._write_index_files(temp_dir)
-            storage_path = get_vectorstore(self.source_id)
-            for name in (FAISS_INDEX, JSON_SIDECAR, PICKLE_SIDECAR):
-                with open(os.path.join(temp_dir, name), "rb") as f:
-                    self.storage.save_file(io.BytesIO(f.read()), f"{storage_path}/{name}")
+            for name in (FAISS_INDEX, BINARY_SIDECAR, JSON_SIDECAR, PICKLE_SIDECAR, KEYWORD_INDEX):
+                target = f"{storage_path}/{name}"
+                local = os.path.join(temp_dir, name)
+                if not os.path.exists(local):
+                    if name in (JSON_SIDECAR, PICKLE_SIDECAR) and self.storage.file_exists(target):
+                        self.storage.delete_file(target)
+                    continue
+                if name == BINARY_SIDECAR:
+                    # Unlink first so a process still mapping the old file
+                    # keeps reading it instead of a truncated one.
+                    self.storage.delete_file(target)
+                with open(local, "rb") as f:
+                    self.storage.save_file(io.BytesIO(f.read()), target)
+        for segment in self._list_delta_segments():
+            self.storage.delete_file(segment)
+        self._delta_segments = []
+        self._persisted = True
+        self._invalidate_cache(storage_path)
         return True
 
+    def _persist_delta(self, segment: bytes) -> None:
+        """Append ``segment`` to the delta log, or save in full when due.
+
+        A full save happens when no base exists in storage yet, when the log
+        is disabled, or when the log has reached ``FAISS_DELTA_MAX_SEGMENTS``.
+        """
+        if not self._persisted or len(self._delta_segments) >= _delta_max_segments():
+            self._save_to_storage()
+            return
+        storage_path = get_vectorstore(self.source_id)
+        name = f"{len(self._delta_segments) + 1:010d}-{uuid.uuid4().hex[:8]}{DELTA_SUFFIX}"
+        path = f"{storage_path}/{DELTA_DIR}/{name}"
+        self.storage.save_file(io.BytesIO(segment), path)
+        self._delta_segments.append(path)
+        self._invalidate_cache(storage_path)
+
+    @staticmethod
+    def _invalidate_cache(storage_path: str) -> None:
+        # Other processes notice the new storage version on their next load;
+        # drop this process's entry now so it never serves the old copy.
+        cache = get_index_cache()
+        if cache is not None:
+            cache.invalidate(storage_path)
+
     def save_local(self, path: Optional[str] = None) -> bool:
         if path:
             self._write_index_files(path)
@@ -330,3 +716,28 @@ class FaissStore(BaseVectorStore):
             }
             for doc_id, stored in self.documents.items()
         ]
+
+    def get_chunks_page(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        path_suffix: Optional[str] = None,
+        search: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """One page straight off the docstore, without copying it to a list.
+
+        Unfiltered, the total is the docstore size and the page an
+        ``islice`` of it; filtered, a single pass keeps only the page.
+        """
+        chunks = (
+            {
+                "doc_id": doc_id,
+                "text": stored.get("page_content", ""),
+                "metadata": stored.get("metadata") or {},
+            }
+            for doc_id, stored in self.documents.items()
+        )
+        if not path_suffix and not search:
+            return list(islice(chunks, offset, offset + limit)), len(self.documents)
+        return page_of_chunks(chunks, offset, limit, path_suffix, search)
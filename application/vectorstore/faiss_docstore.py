@@ -11,18 +11,31 @@ legacy sidecar is read forever, via a :class:`CompatUnpickler` that resolves
 langchain's symbols onto local stand-ins and refuses everything else — the
 previous ``pickle.load`` would execute arbitrary code from an uploaded file.
 
-``index.json`` is the format written going forward. ``index.pkl`` is written
-alongside it, byte-compatible with langchain's layout, so an older DocsGPT can
-still read an index this version has re-saved.
+``index.docs`` is the format written going forward: a columnar binary file
+(row numbers, offset arrays, then one blob each for ids, text and metadata)
+that :func:`load_binary_sidecar` reads straight out of a buffer or ``mmap``.
+Only the ids are decoded up front; a chunk's text and metadata are sliced out
+of the buffer when that chunk is read, so loading a large source costs a
+fraction of a JSON or pickle parse. ``index.json`` (the previous format) is
+still read. ``index.pkl`` is written only on request, byte-compatible with
+langchain's layout, for an older DocsGPT that must read a re-saved index.
+
+Single-chunk edits append a delta segment (:func:`dump_delta_segment`) rather
+than rewriting the sidecar; the store replays segments on load and folds them
+into a full save once enough accumulate.
 """
 
 import io
 import json
 import pickle
+import struct
 import sys
 import types
+from collections.abc import MutableMapping
 from contextlib import contextmanager
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 # Module paths the legacy pickle references, mapped onto the stand-ins below.
 _LEGACY_DOCUMENT_PATHS = (
@@ -228,3 +241,248 @@ def dump_json_sidecar(
         },
     }
     return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+# ``index.docs`` header: magic, format version, flags (unused), row count.
+_BINARY_MAGIC = b"DGFD"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sHHQ")
+
+
+def _offsets(chunks: Sequence[bytes]) -> np.ndarray:
+    """``len(chunks) + 1`` byte offsets delimiting ``chunks`` in their blob."""
+    offsets = np.zeros(len(chunks) + 1, dtype="<u8")
+    if chunks:
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    return offsets
+
+
+def _encode_metadata(metadata: Optional[Dict[str, Any]]) -> bytes:
+    # Empty metadata, the common case for plain uploads, takes no bytes.
+    if not metadata:
+        return b""
+    return json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class BinaryDocstore(MutableMapping):
+    """Docstore view over an ``index.docs`` buffer, decoded per chunk.
+
+    Reads slice the shared buffer; writes and deletes land in a small
+    overlay, so the buffer (which may be an ``mmap`` shared with the index
+    cache) is never modified. :meth:`copy` is cheap for the same reason.
+    """
+
+    def __init__(self, view: memoryview, positions: Dict[str, int],
+                 text_offsets: np.ndarray, text_start: int,
+                 meta_offsets: np.ndarray, meta_start: int) -> None:
+        self._view = view
+        self._positions = positions
+        self._text_offsets = text_offsets
+        self._text_start = text_start
+        self._meta_offsets = meta_offsets
+        self._meta_start = meta_start
+        self._overlay: Dict[str, Dict[str, Any]] = {}
+        # Buffer ids that were deleted or overwritten through the overlay.
+        self._shadowed: set = set()
+
+    @property
+    def nbytes(self) -> int:
+        return self._view.nbytes
+
+    def _decode(self, position: int) -> Dict[str, Any]:
+        start = self._text_start + int(self._text_offsets[position])
+        end = self._text_start + int(self._text_offsets[position + 1])
+        text = str(self._view[start:end], "utf-8")
+        start = self._meta_start + int(self._meta_offsets[position])
+        end = self._meta_start + int(self._meta_offsets[position + 1])
+        metadata = json.loads(str(self._view[start:end], "utf-8")) if end > start else {}
+        return {"page_content": text, "metadata": metadata}
+
+    def __getitem__(self, doc_id: str) -> Dict[str, Any]:
+        stored = self._overlay.get(doc_id)
+        if stored is not None:
+            return stored
+        if doc_id in self._shadowed:
+            raise KeyError(doc_id)
+        return self._decode(self._positions[doc_id])
+
+    def __setitem__(self, doc_id: str, value: Dict[str, Any]) -> None:
+        self._overlay[doc_id] = value
+        if doc_id in self._positions:
+            self._shadowed.add(doc_id)
+
+    def __delitem__(self, doc_id: str) -> None:
+        found = self._overlay.pop(doc_id, None) is not None
+        if doc_id in self._positions and doc_id not in self._shadowed:
+            self._shadowed.add(doc_id)
+            found = True
+        if not found:
+            raise KeyError(doc_id)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._overlay or (
+            doc_id in self._positions and doc_id not in self._shadowed
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for doc_id in self._positions:
+            if doc_id not in self._shadowed:
+                yield doc_id
+        yield from self._overlay
+
+    def __len__(self) -> int:
+        return len(self._positions) - len(self._shadowed) + len(self._overlay)
+
+    def copy(self) -> "BinaryDocstore":
+        clone = BinaryDocstore(
+            self._view, self._positions, self._text_offsets, self._text_start,
+            self._meta_offsets, self._meta_start,
+        )
+        clone._overlay = dict(self._overlay)
+        clone._shadowed = set(self._shadowed)
+        return clone
+
+
+def dump_binary_sidecar(
+    documents: "MutableMapping[str, Dict[str, Any]]", index_to_docstore_id: Dict[int, str]
+) -> bytes:
+    """Serialize to the columnar ``index.docs`` layout.
+
+    Chunks are laid out in FAISS row order, followed by any chunk without a
+    row, so row ``i`` of a freshly saved index is position ``i`` on disk.
+    """
+    ordered: List[str] = []
+    rows: List[int] = []
+    for row, doc_id in sorted(index_to_docstore_id.items()):
+        if doc_id in documents:
+            ordered.append(doc_id)
+            rows.append(int(row))
+    mapped = set(ordered)
+    for doc_id in documents:
+        if doc_id not in mapped:
+            ordered.append(doc_id)
+            rows.append(-1)
+
+    ids, texts, metas = [], [], []
+    for doc_id in ordered:
+        doc = documents[doc_id]
+        ids.append(str(doc_id).encode("utf-8"))
+        texts.append((doc.get("page_content", "") or "").encode("utf-8"))
+        metas.append(_encode_metadata(doc.get("metadata")))
+
+    return b"".join(
+        [
+            _BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION, 0, len(ordered)),
+            np.asarray(rows, dtype="<i8").tobytes(),
+            _offsets(ids).tobytes(),
+            _offsets(texts).tobytes(),
+            _offsets(metas).tobytes(),
+            *ids,
+            *texts,
+            *metas,
+        ]
+    )
+
+
+def load_binary_sidecar(data: Any) -> Tuple[BinaryDocstore, Dict[int, str]]:
+    """Read an ``index.docs`` sidecar without copying its text.
+
+    Args:
+        data: Any buffer holding the file — ``bytes`` or an ``mmap``. It is
+            referenced, not copied, for as long as the docstore lives.
+
+    Raises:
+        ValueError: If ``data`` is not an ``index.docs`` file this version
+            understands.
+    """
+    view = memoryview(data).cast("B")
+    if view.nbytes < _BINARY_HEADER.size:
+        raise ValueError("Truncated FAISS docstore sidecar")
+    magic, version, _flags, count = _BINARY_HEADER.unpack_from(view)
+    if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+        raise ValueError("Unrecognised FAISS docstore sidecar")
+
+    position = _BINARY_HEADER.size
+    rows = np.frombuffer(view, dtype="<i8", count=count, offset=position)
+    position += rows.nbytes
+    columns = []
+    for _ in range(3):
+        columns.append(np.frombuffer(view, dtype="<u8", count=count + 1, offset=position))
+        position += columns[-1].nbytes
+    id_offsets, text_offsets, meta_offsets = columns
+
+    id_start = position
+    text_start = id_start + int(id_offsets[-1])
+    meta_start = text_start + int(text_offsets[-1])
+    if meta_start + int(meta_offsets[-1]) > view.nbytes:
+        raise ValueError("Truncated FAISS docstore sidecar")
+
+    id_blob = bytes(view[id_start:text_start])
+    bounds = id_offsets.tolist()
+    positions: Dict[str, int] = {}
+    mapping: Dict[int, str] = {}
+    for index, row in enumerate(rows.tolist()):
+        doc_id = id_blob[bounds[index]:bounds[index + 1]].decode("utf-8")
+        positions[doc_id] = index
+        if row >= 0:
+            mapping[row] = doc_id
+
+    documents = BinaryDocstore(
+        view, positions, text_offsets, text_start, meta_offsets, meta_start
+    )
+    return documents, mapping
+
+
+# Delta segments: magic, format version, operation, padding, vector width,
+# then the JSON body length. Added rows' float32 vectors follow the body.
+_DELTA_MAGIC = b"DGFL"
+_DELTA_VERSION = 1
+_DELTA_HEADER = struct.Struct("<4sHBxIQ")
+DELTA_ADD = 1
+DELTA_DELETE = 2
+
+
+def dump_delta_segment(
+    op: int,
+    ids: Sequence[str],
+    documents: Optional[Sequence[Dict[str, Any]]] = None,
+    vectors: Optional[Any] = None,
+) -> bytes:
+    """Encode one docstore edit for the append-only delta log.
+
+    Args:
+        op: :data:`DELTA_ADD` or :data:`DELTA_DELETE`.
+        ids: Chunk ids the edit applies to.
+        documents: For an add, ``{"page_content", "metadata"}`` per id.
+        vectors: For an add, the embedding of each id, row-aligned.
+    """
+    body: Dict[str, Any] = {"ids": list(ids)}
+    matrix = np.zeros((0, 0), dtype="<f4")
+    if op == DELTA_ADD:
+        body["documents"] = [
+            {"page_content": doc.get("page_content", ""), "metadata": doc.get("metadata") or {}}
+            for doc in documents or []
+        ]
+        matrix = np.asarray(vectors, dtype="<f4").reshape(len(body["ids"]), -1)
+    encoded = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    header = _DELTA_HEADER.pack(_DELTA_MAGIC, _DELTA_VERSION, op, matrix.shape[1], len(encoded))
+    return header + encoded + matrix.tobytes()
+
+
+def load_delta_segment(data: bytes) -> Tuple[int, List[str], List[Dict[str, Any]], np.ndarray]:
+    """Decode a segment into ``(op, ids, documents, vectors)``."""
+    if len(data) < _DELTA_HEADER.size:
+        raise ValueError("Truncated FAISS delta segment")
+    magic, version, op, width, length = _DELTA_HEADER.unpack_from(data)
+    if magic != _DELTA_MAGIC or version != _DELTA_VERSION or op not in (DELTA_ADD, DELTA_DELETE):
+        raise ValueError("Unrecognised FAISS delta segment")
+    start = _DELTA_HEADER.size
+    body = json.loads(bytes(data[start:start + length]).decode("utf-8"))
+    ids = list(body.get("ids") or [])
+    documents = list(body.get("documents") or [])
+    vectors = np.zeros((0, width), dtype=np.float32)
+    if op == DELTA_ADD and width:
+        vectors = np.frombuffer(
+            data, dtype="<f4", count=len(ids) * width, offset=start + length
+        ).reshape(len(ids), width).astype(np.float32)
+    return op, ids, documents, vectors
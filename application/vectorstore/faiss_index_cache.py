@@ -0,0 +1,172 @@
+"""Process-wide LRU cache of loaded FAISS indexes.
+
+Building a :class:`~application.vectorstore.faiss.FaissStore` from storage
+downloads ``index.faiss``, runs ``faiss.read_index`` and decodes the sidecar —
+on every request that touches the source. This cache keeps the decoded index
+and docstore per source so repeat turns on the same source skip all of it.
+
+An entry is keyed by source id and tagged with the storage *version* of the
+files it was loaded from (local mtime/size, S3 ETag). A reader checks the
+current version first — one ``stat``/``HEAD`` instead of a full download — so
+a write from another process or worker is picked up on the next load. Writes
+made through a ``FaissStore`` in this process also invalidate the entry
+directly, so the writer's own process never serves the stale copy.
+
+Cached objects are shared by every store built from them. Search on a FAISS
+index is read-only and safe to run concurrently from the WSGI threadpool; a
+store that is about to mutate detaches first (see ``FaissStore._own_state``),
+so shared entries are never modified in place.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from application.vectorstore.faiss_keyword_index import BM25Index
+
+# Default byte budget when the setting is missing or unusable.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass
+class CachedIndex:
+    """A decoded FAISS index plus its docstore, as loaded from storage.
+
+    ``keyword_index`` is ``None`` until the first keyword search reads
+    ``index.bm25``, or builds it for sources saved before that file existed
+    (see ``FaissStore._ensure_keyword_index``).
+    """
+
+    version: str
+    index: Any
+    documents: Dict[str, Dict[str, Any]]
+    index_to_docstore_id: Dict[int, str]
+    nbytes: int
+    keyword_index: Optional["BM25Index"] = None
+
+
+class FaissIndexCache:
+    """Thread-safe LRU of :class:`CachedIndex` entries bounded by total bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedIndex]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, source_id: str, version: str) -> Optional[CachedIndex]:
+        """Return the entry for ``source_id`` if it was loaded at ``version``.
+
+        An entry at any other version is stale and dropped on the spot.
+        """
+        with self._lock:
+            entry = self._entries.get(source_id)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(source_id)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                self._drop(source_id)
+            self.misses += 1
+            return None
+
+    def put(self, source_id: str, entry: CachedIndex) -> None:
+        """Insert ``entry``, evicting least-recently-used entries over budget.
+
+        An entry larger than the whole budget is not cached at all.
+        """
+        if entry.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if source_id in self._entries:
+                self._drop(source_id)
+            self._entries[source_id] = entry
+            self._bytes += entry.nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, source_id: str) -> None:
+        """Forget ``source_id``; the next load reads storage again."""
+        with self._lock:
+            if source_id in self._entries:
+                self._drop(source_id)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _drop(self, source_id: str) -> None:
+        """Remove an entry; caller holds the lock."""
+        entry = self._entries.pop(source_id)
+        self._bytes -= entry.nbytes
+
+
+_CACHE: Optional[FaissIndexCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def resolve_max_bytes() -> int:
+    """Byte budget from settings, defensively — 0 disables the cache.
+
+    Returns:
+        int: ``FAISS_INDEX_CACHE_MAX_BYTES`` when it is a non-negative,
+        non-bool int, else :data:`DEFAULT_MAX_BYTES`. The unit suite replaces
+        ``settings`` with a MagicMock, whose attributes must never become a
+        budget.
+    """
+    from application.core.settings import settings
+
+    value = getattr(settings, "FAISS_INDEX_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return DEFAULT_MAX_BYTES
+
+
+def get_index_cache() -> Optional[FaissIndexCache]:
+    """Return this process's index cache, or ``None`` when it is disabled."""
+    global _CACHE
+    if _CACHE is not None:
+        return _CACHE
+    max_bytes = resolve_max_bytes()
+    if max_bytes <= 0:
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = FaissIndexCache(max_bytes)
+    return _CACHE
+
+
+def cache_stats() -> Dict[str, int]:
+    """Counters for the process cache; all zeros when it is disabled."""
+    cache = get_index_cache()
+    if cache is None:
+        return {
+            "hits": 0, "misses": 0, "evictions": 0, "invalidations": 0,
+            "entries": 0, "bytes": 0, "max_bytes": 0,
+        }
+    return cache.stats()
@@ -0,0 +1,221 @@
+"""Index-type selection and (re)building for :class:`FaissStore`.
+
+A flat L2 index is exact but scans every vector per query — fine for a few
+thousand chunks, unusable at millions. ``FAISS_INDEX_TYPE`` chooses what a
+source is built as:
+
+* ``flat`` — always ``IndexFlatL2`` (the historical behaviour).
+* ``ivf_flat`` / ``ivf_pq`` / ``hnsw`` — always that approximate index.
+* ``auto`` — flat below ``FAISS_ANN_MIN_VECTORS``, ``FAISS_ANN_INDEX`` above.
+
+Every kind is still one ``index.faiss`` written by faiss itself, next to the
+unchanged sidecar, so the on-disk layout does not move. Search parameters
+(``nprobe`` for IVF, ``efSearch`` for HNSW) are set at build time and are
+serialized inside ``index.faiss``, which is what makes them per-source: each
+index carries the values chosen for its own size.
+
+Approximate indexes cannot renumber rows on removal the way a flat index
+does. The store deletes from them logically and compacts on its next full
+save with :func:`remove_rows`, which re-adds the surviving reconstructed
+vectors: IVF kinds keep their trained quantizer for that, HNSW rebuilds its
+graph. Reconstruction is exact for flat, HNSW and IVF-Flat storage and
+approximate for IVF-PQ.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FLAT = "flat"
+IVF_FLAT = "ivf_flat"
+IVF_PQ = "ivf_pq"
+HNSW = "hnsw"
+ANN_KINDS = (IVF_FLAT, IVF_PQ, HNSW)
+
+# faiss warns below ~39 training points per centroid; PQ codebooks need 256.
+_MIN_POINTS_PER_CENTROID = 39
+_PQ_CENTROIDS = 256
+
+
+def _setting(name: str, default: Any) -> Any:
+    """Read a typed setting, falling back when the suite mocks ``settings``."""
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(default, bool) or not isinstance(value, type(default)):
+        return default
+    return value
+
+
+def _optional_int_setting(name: str) -> Optional[int]:
+    from application.core.settings import settings
+
+    value = getattr(settings, name, None)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return None
+
+
+def index_kind(index: Any) -> str:
+    """Classify an index object as one of the supported kinds."""
+    import faiss
+
+    if isinstance(index, faiss.IndexHNSW):
+        return HNSW
+    if isinstance(index, faiss.IndexIVFPQ):
+        return IVF_PQ
+    if isinstance(index, faiss.IndexIVF):
+        return IVF_FLAT
+    return FLAT
+
+
+def desired_kind(ntotal: int) -> str:
+    """Kind a source with ``ntotal`` vectors should be stored as.
+
+    Falls back to flat when there are too few vectors to train the chosen
+    IVF variant; such an index is migrated on a later save once it grows.
+    """
+    configured = str(_setting("FAISS_INDEX_TYPE", "auto")).lower()
+    if configured == "auto":
+        if ntotal < _setting("FAISS_ANN_MIN_VECTORS", 100_000):
+            return FLAT
+        configured = str(_setting("FAISS_ANN_INDEX", HNSW)).lower()
+    if configured not in ANN_KINDS:
+        return FLAT
+    if configured in (IVF_FLAT, IVF_PQ) and ntotal < _min_train_points(configured):
+        return FLAT
+    return configured
+
+
+def _nlist(ntotal: int) -> int:
+    """IVF list count: ~4·sqrt(n), capped so each list gets enough training points."""
+    return max(1, min(int(4 * math.sqrt(ntotal)), ntotal // _MIN_POINTS_PER_CENTROID))
+
+
+def _min_train_points(kind: str) -> int:
+    return _PQ_CENTROIDS * _MIN_POINTS_PER_CENTROID if kind == IVF_PQ else _MIN_POINTS_PER_CENTROID
+
+
+def _pq_subquantizers(dimension: int) -> int:
+    """Largest conventional PQ ``m`` that divides ``dimension``."""
+    for m in (64, 48, 32, 24, 16, 12, 8, 4, 2):
+        if m <= dimension and dimension % m == 0:
+            return m
+    return 1
+
+
+def _factory_string(kind: str, dimension: int, ntotal: int) -> str:
+    if kind == HNSW:
+        return f"HNSW{_setting('FAISS_HNSW_M', 32)}"
+    if kind == IVF_FLAT:
+        return f"IVF{_nlist(ntotal)},Flat"
+    if kind == IVF_PQ:
+        return f"IVF{_nlist(ntotal)},PQ{_pq_subquantizers(dimension)}"
+    return "Flat"
+
+
+def apply_search_params(index: Any) -> None:
+    """Set the build-time search parameters for ``index``'s kind.
+
+    ``nprobe`` defaults to sqrt(nlist) unless ``FAISS_IVF_NPROBE`` pins it;
+    ``efSearch`` comes from ``FAISS_HNSW_EF_SEARCH``. Both are written into
+    ``index.faiss`` with the index.
+    """
+    import faiss
+
+    kind = index_kind(index)
+    if kind in (IVF_FLAT, IVF_PQ):
+        ivf = faiss.extract_index_ivf(index)
+        pinned = _optional_int_setting("FAISS_IVF_NPROBE")
+        ivf.nprobe = min(ivf.nlist, pinned or max(1, int(math.sqrt(ivf.nlist))))
+    elif kind == HNSW:
+        index.hnsw.efSearch = _setting("FAISS_HNSW_EF_SEARCH", 64)
+
+
+def build_index(kind: str, vectors: np.ndarray, dimension: Optional[int] = None) -> Any:
+    """Build and populate an index of ``kind`` over ``vectors``.
+
+    IVF kinds are trained on a random sample of at most
+    ``FAISS_TRAIN_SAMPLE_SIZE`` vectors before the full set is added.
+
+    Args:
+        kind: One of :data:`FLAT` or :data:`ANN_KINDS`.
+        vectors: ``(n, d)`` float32 array; may be empty for a flat index.
+        dimension: Index width when ``vectors`` is empty.
+    """
+    import faiss
+
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    dimension = vectors.shape[1] if vectors.ndim == 2 and len(vectors) else dimension
+    index = faiss.index_factory(dimension, _factory_string(kind, dimension, len(vectors)))
+    if not index.is_trained:
+        sample_size = _setting("FAISS_TRAIN_SAMPLE_SIZE", 100_000)
+        sample = vectors
+        if len(vectors) > sample_size:
+            rows = np.random.default_rng(0).choice(len(vectors), sample_size, replace=False)
+            sample = vectors[np.sort(rows)]
+        index.train(sample)
+    apply_search_params(index)
+    if len(vectors):
+        index.add(vectors)
+    return index
+
+
+def reconstruct_all(index: Any) -> np.ndarray:
+    """Every vector held by ``index``, in row order.
+
+    Exact for flat, HNSW and IVF-Flat storage; IVF-PQ returns its decoded
+    approximations.
+    """
+    import faiss
+
+    if index.ntotal == 0:
+        return np.zeros((0, index.d), dtype=np.float32)
+    if index_kind(index) in (IVF_FLAT, IVF_PQ):
+        faiss.extract_index_ivf(index).make_direct_map()
+    return index.reconstruct_n(0, index.ntotal)
+
+
+def remove_rows(index: Any, rows) -> Any:
+    """Return ``index`` without ``rows``, renumbered so row ids stay dense.
+
+    Flat indexes compact in place. An IVF index whose kind still fits the
+    smaller size is reset and refilled on its existing training; anything
+    else is rebuilt as :func:`desired_kind`.
+    """
+    import faiss
+
+    rows = np.array(sorted(rows), dtype=np.int64)
+    kind = index_kind(index)
+    if kind == FLAT:
+        index.remove_ids(rows)
+        return index
+    keep = np.setdiff1d(np.arange(index.ntotal, dtype=np.int64), rows)
+    vectors = reconstruct_all(index)[keep]
+    target = desired_kind(len(keep))
+    if target == kind and kind in (IVF_FLAT, IVF_PQ):
+        refilled = faiss.clone_index(index)
+        refilled.reset()
+        if len(vectors):
+            refilled.add(vectors)
+        return refilled
+    return build_index(target, vectors, index.d)
+
+
+def migrate_if_needed(index: Any) -> Any:
+    """Return ``index`` rebuilt as :func:`desired_kind`, or unchanged."""
+    if index is None:
+        return index
+    current, target = index_kind(index), desired_kind(index.ntotal)
+    if current == target:
+        return index
+    logger.info(
+        "Migrating FAISS index from %s to %s (%d vectors)", current, target, index.ntotal
+    )
+    return build_index(target, reconstruct_all(index), index.d)
@@ -0,0 +1,228 @@
+"""In-process BM25 keyword index for :class:`FaissStore`.
+
+FAISS has no lexical search, so ``BaseVectorStore.keyword_search`` returned
+``[]`` for it and :class:`~application.retriever.hybrid_rag.HybridRetriever`
+silently fell back to vector-only. This module keeps a compact inverted index
+next to the FAISS one: each term maps to a postings pair of parallel arrays
+(document slots, term frequencies), and scoring a query is a handful of
+vectorized NumPy operations over the postings of its terms.
+
+Documents occupy dense integer *slots*. Adding appends to the affected
+postings lists; removing tombstones the slot, and :meth:`BM25Index.compact`
+drops tombstones and renumbers (serialization writes a compacted copy). The file
+(``index.bm25``) is plain JSON, like ``index.json`` — nothing here is
+unpickled from storage.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Okapi BM25 defaults.
+K1 = 1.2
+B = 0.75
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Short function words that would otherwise match nearly every chunk.
+_STOPWORDS = frozenset(
+    """a an and are as at be but by for from has have he her his i if in into
+    is it its me my no not of on or our she so that the their them then there
+    these they this to was we were what when where which who will with you
+    your""".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens of ``text`` with stopwords removed."""
+    return [
+        token
+        for token in _TOKEN_RE.findall((text or "").lower())
+        if token not in _STOPWORDS
+    ]
+
+
+class BM25Index:
+    """Incrementally updatable BM25 index over chunk ids."""
+
+    def __init__(self) -> None:
+        self._doc_ids: List[Optional[str]] = []
+        self._slot_of: Dict[str, int] = {}
+        self._doc_len: List[int] = []
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._total_len = 0
+        # Lazily built NumPy views; invalidated per term / wholesale on change.
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._doc_len_array: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    # -- Mutation --------------------------------------------------------
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index ``text`` under ``doc_id``, replacing any previous entry."""
+        if doc_id in self._slot_of:
+            self.remove([doc_id])
+        slot = len(self._doc_ids)
+        tokens = tokenize(text)
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for term, tf in counts.items():
+            slots, tfs = self._postings.setdefault(term, ([], []))
+            slots.append(slot)
+            tfs.append(tf)
+            self._arrays.pop(term, None)
+        self._doc_ids.append(doc_id)
+        self._slot_of[doc_id] = slot
+        self._doc_len.append(len(tokens))
+        self._total_len += len(tokens)
+        self._doc_len_array = None
+
+    def add_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        for doc_id, text in items:
+            self.add(doc_id, text)
+
+    def remove(self, doc_ids: Iterable[str]) -> None:
+        """Tombstone ``doc_ids``; unknown ids are ignored."""
+        for doc_id in doc_ids:
+            slot = self._slot_of.pop(doc_id, None)
+            if slot is None:
+                continue
+            self._doc_ids[slot] = None
+            self._total_len -= self._doc_len[slot]
+            self._doc_len[slot] = 0
+        self._doc_len_array = None
+
+    def compact(self) -> None:
+        """Drop tombstoned slots and renumber the survivors densely."""
+        if len(self._slot_of) == len(self._doc_ids):
+            return
+        remap = {}
+        doc_ids, doc_len = [], []
+        for old, doc_id in enumerate(self._doc_ids):
+            if doc_id is None:
+                continue
+            remap[old] = len(doc_ids)
+            doc_ids.append(doc_id)
+            doc_len.append(self._doc_len[old])
+        postings = {}
+        for term, (slots, tfs) in self._postings.items():
+            kept = [(remap[s], tf) for s, tf in zip(slots, tfs) if s in remap]
+            if kept:
+                postings[term] = ([s for s, _ in kept], [tf for _, tf in kept])
+        self._doc_ids, self._doc_len, self._postings = doc_ids, doc_len, postings
+        self._slot_of = {doc_id: slot for slot, doc_id in enumerate(doc_ids)}
+        self._arrays = {}
+        self._doc_len_array = None
+
+    def copy(self) -> "BM25Index":
+        """Independent copy, for a store detaching from a shared cached index."""
+        clone = BM25Index()
+        clone._doc_ids = list(self._doc_ids)
+        clone._slot_of = dict(self._slot_of)
+        clone._doc_len = list(self._doc_len)
+        clone._postings = {
+            term: (list(slots), list(tfs)) for term, (slots, tfs) in self._postings.items()
+        }
+        clone._total_len = self._total_len
+        return clone
+
+    # -- Search ----------------------------------------------------------
+
+    def _term_arrays(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        cached = self._arrays.get(term)
+        if cached is not None:
+            return cached
+        postings = self._postings.get(term)
+        if postings is None:
+            return None
+        arrays = (
+            np.asarray(postings[0], dtype=np.int64),
+            np.asarray(postings[1], dtype=np.float32),
+        )
+        self._arrays[term] = arrays
+        return arrays
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(doc_id, bm25_score)`` pairs, best first."""
+        n_docs = len(self._slot_of)
+        if n_docs == 0 or k <= 0:
+            return []
+        if self._doc_len_array is None:
+            self._doc_len_array = np.asarray(self._doc_len, dtype=np.float32)
+        doc_len = self._doc_len_array
+        avg_len = max(self._total_len / n_docs, 1.0)
+        scores = np.zeros(len(self._doc_ids), dtype=np.float32)
+
+        for term in set(tokenize(query)):
+            arrays = self._term_arrays(term)
+            if arrays is None:
+                continue
+            slots, tfs = arrays
+            # Tombstoned slots have length 0 and no doc id; drop them here.
+            alive = doc_len[slots] > 0
+            slots, tfs = slots[alive], tfs[alive]
+            if not len(slots):
+                continue
+            df = len(slots)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            norm = K1 * (1.0 - B + B * doc_len[slots] / avg_len)
+            scores[slots] += idf * tfs * (K1 + 1.0) / (tfs + norm)
+
+        matched = np.flatnonzero(scores)
+        if not len(matched):
+            return []
+        if len(matched) > k:
+            matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        ranked = matched[np.argsort(-scores[matched], kind="stable")]
+        return [(self._doc_ids[slot], float(scores[slot])) for slot in ranked]
+
+    # -- Persistence -----------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the ``index.bm25`` JSON payload, without tombstones.
+
+        Tombstones are compacted out of a copy: this index may be the one a
+        cached :class:`FaissStore` entry shares with concurrent readers.
+        """
+        source = self
+        if len(self._slot_of) != len(self._doc_ids):
+            source = self.copy()
+            source.compact()
+        payload = {
+            "version": 1,
+            "doc_ids": source._doc_ids,
+            "doc_len": source._doc_len,
+            "postings": {term: [slots, tfs] for term, (slots, tfs) in source._postings.items()},
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BM25Index":
+        payload = json.loads(data.decode("utf-8"))
+        index = cls()
+        index._doc_ids = list(payload.get("doc_ids") or [])
+        index._doc_len = [int(n) for n in payload.get("doc_len") or []]
+        index._slot_of = {doc_id: slot for slot, doc_id in enumerate(index._doc_ids)}
+        index._postings = {
+            term: (list(pair[0]), list(pair[1]))
+            for term, pair in (payload.get("postings") or {}).items()
+        }
+        index._total_len = sum(index._doc_len)
+        return index
+
+    @classmethod
+    def from_documents(cls, documents: Dict[str, Dict]) -> "BM25Index":
+        """Build from a FaissStore docstore (``doc_id -> {page_content, ...}``)."""
+        index = cls()
+        index.add_many(
+            (doc_id, stored.get("page_content", "")) for doc_id, stored in documents.items()
+        )
+        return index
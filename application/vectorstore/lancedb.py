@@ -64,9 +64,16 @@ class LanceDBVectorStore(BaseVectorStore):
             ])
             self.docsearch = self.lance_db.create_table(self.table_name, schema=schema)
 
-    def add_texts(self, texts: List[str], metadatas: Optional[List[dict]] = None, source_id: str = None):
-        """Add texts with metadata and their embeddings to the LanceDB table."""
-        embeddings = self._get_embeddings(settings.EMBEDDINGS_NAME, self.embeddings_key).embed_documents(texts)
+    def add_texts(self, texts: List[str], metadatas: Optional[List[dict]] = None, source_id: str = None,
+                  vectors: Optional[List[List[float]]] = None):
+        """Add texts with metadata and their embeddings to the LanceDB table.
+
+        ``vectors`` are precomputed embeddings of ``texts``; when given the
+        store skips embedding them itself.
+        """
+        embeddings = vectors
+        if embeddings is None:
+            embeddings = self._get_embeddings(settings.EMBEDDINGS_NAME, self.embeddings_key).embed_documents(texts)
         vectors = []
         for embedding, text, metadata in zip(embeddings, texts, metadatas or [{}] * len(texts)):
             if source_id:
@@ -2,10 +2,11 @@ import logging
 import os
 import uuid
 from contextlib import contextmanager
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 
 from application.core.settings import settings
-from application.vectorstore.base import BaseVectorStore
+from application.vectorstore.base import BaseVectorStore, page_of_chunks
 from application.vectorstore.document_class import Document
 
 
@@ -27,6 +28,10 @@ def _without_milvus_uri_env():
         if previous is not sentinel:
             os.environ["MILVUS_URI"] = previous
 
+_ITERATOR_BATCH = 1000
+# Characters a path suffix cannot carry into a ``like`` pattern verbatim.
+_LIKE_UNSAFE = frozenset('%_"\\')
+
 
 class MilvusStore(BaseVectorStore):
     """Vector store backed by Milvus through the native ``pymilvus`` client.
@@ -142,14 +147,21 @@ class MilvusStore(BaseVectorStore):
         texts: List[str],
         metadatas: Optional[List[dict]] = None,
         *args,
+        vectors: Optional[List[List[float]]] = None,
         **kwargs,
     ) -> List[str]:
-        """Embed and insert ``texts``, stamping each with the source id."""
+        """Embed and insert ``texts``, stamping each with the source id.
+
+        Args:
+            vectors: Precomputed embeddings of ``texts``, row-aligned; when
+                given the store skips embedding them itself.
+        """
         texts = list(texts)
         if not texts:
             return []
         metadatas = list(metadatas or [{} for _ in texts])
-        vectors = self._embeddings.embed_documents(texts)
+        if vectors is None:
+            vectors = self._embeddings.embed_documents(texts)
 
         rows, ids = [], []
         for text, metadata, vector in zip(texts, metadatas, vectors):
@@ -203,6 +215,82 @@ class MilvusStore(BaseVectorStore):
             logging.error("Error getting chunks: %s", e, exc_info=True)
             return []
 
+    @staticmethod
+    def _to_chunk(row: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "doc_id": row.get("id"),
+            "text": row.get("text"),
+            "metadata": row.get("metadata") or {},
+        }
+
+    def _iter_rows(self, expr: str, fields=("id", "text", "metadata"), limit: int = -1):
+        """Stream rows matching ``expr`` in primary-key order, a batch at a time."""
+        iterator = self._client.query_iterator(
+            collection_name=self._collection,
+            batch_size=_ITERATOR_BATCH,
+            limit=limit,
+            filter=expr,
+            output_fields=list(fields),
+        )
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    return
+                yield from batch
+        finally:
+            iterator.close()
+
+    def get_chunks_page(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        path_suffix: Optional[str] = None,
+        search: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of this source's chunks, filtered and counted by Milvus.
+
+        A path suffix becomes a ``like`` on the metadata JSON when it has no
+        wildcard or quote characters. Pages follow primary-key order: the
+        skipped rows are walked as bare ids and the page resumes after the
+        last one, since a plain ``query`` neither orders its rows nor accepts
+        an ``offset + limit`` past 16384. Milvus ``like`` is case-sensitive,
+        so a search term (and an unsafe suffix) is applied while streaming the
+        rows instead, keeping only the page in memory.
+        """
+        expr = self._filter
+        if path_suffix and not _LIKE_UNSAFE.intersection(path_suffix):
+            expr = (
+                f'{expr} and (metadata["source"] like "%{path_suffix}" '
+                f'or metadata["file_path"] like "%{path_suffix}")'
+            )
+            path_suffix = None
+        try:
+            if path_suffix or search:
+                chunks = (self._to_chunk(row) for row in self._iter_rows(expr))
+                return page_of_chunks(chunks, offset, limit, path_suffix, search)
+            total = self._client.query(
+                collection_name=self._collection,
+                filter=expr,
+                output_fields=["count(*)"],
+            )[0]["count(*)"]
+            if offset >= total or limit <= 0:
+                return [], total
+            page_expr = expr
+            if offset:
+                skipped = islice(self._iter_rows(expr, ("id",), offset), offset - 1, None)
+                last = next(skipped, None)
+                if last is None:
+                    return [], total
+                escaped = str(last["id"]).replace('"', '\\"')
+                page_expr = f'{expr} and id > "{escaped}"'
+            rows = self._iter_rows(page_expr, limit=limit)
+            return [self._to_chunk(row) for row in rows], total
+        except Exception as e:
+            logging.error("Error getting chunks page: %s", e, exc_info=True)
+            return [], 0
+
     def add_chunk(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Add one chunk and return its id."""
         ids = self.add_texts([text], [metadata or {}])
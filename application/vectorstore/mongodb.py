@@ -1,4 +1,5 @@
 import logging
+import re
 from functools import cached_property
 
 from application.core.settings import settings
@@ -122,10 +123,10 @@ class MongoDBVectorStore(BaseVectorStore):
             )
         return results
 
-    def _insert_texts(self, texts, metadatas):
+    def _insert_texts(self, texts, metadatas, vectors=None):
         if not texts:
             return []
-        embeddings = self._embedding.embed_documents(texts)
+        embeddings = vectors if vectors is not None else self._embedding.embed_documents(texts)
 
         to_insert = [
             {self._text_key: t, self._embedding_key: embedding, **m}
@@ -166,20 +167,37 @@ class MongoDBVectorStore(BaseVectorStore):
         #         }
         #         self._collection.create_index(self._index_name, index_mongo)
 
+        # Precomputed embeddings of ``texts``, row-aligned; when given the
+        # store skips embedding them itself.
+        vectors = kwargs.pop("vectors", None)
         batch_size = 100
         _metadatas = metadatas or ({} for _ in texts)
         texts_batch = []
         metadatas_batch = []
         result_ids = []
+        batch_start = 0
         for i, (text, metadata) in enumerate(zip(texts, _metadatas)):
             texts_batch.append(text)
             metadatas_batch.append(metadata)
             if (i + 1) % batch_size == 0:
-                result_ids.extend(self._insert_texts(texts_batch, metadatas_batch))
+                result_ids.extend(
+                    self._insert_texts(
+                        texts_batch,
+                        metadatas_batch,
+                        vectors[batch_start:i + 1] if vectors is not None else None,
+                    )
+                )
                 texts_batch = []
                 metadatas_batch = []
+                batch_start = i + 1
         if texts_batch:
-            result_ids.extend(self._insert_texts(texts_batch, metadatas_batch))
+            result_ids.extend(
+                self._insert_texts(
+                    texts_batch,
+                    metadatas_batch,
+                    vectors[batch_start:] if vectors is not None else None,
+                )
+            )
         return result_ids
 
     def delete_index(self, *args, **kwargs):
@@ -209,6 +227,54 @@ class MongoDBVectorStore(BaseVectorStore):
             logging.error(f"Error getting chunks: {e}", exc_info=True)
             return []
 
+    def get_chunks_page(
+        self, offset=0, limit=10, path_suffix=None, search=None, after=None
+    ):
+        """One page of this source's chunks, filtered, sorted and counted by Mongo.
+
+        Metadata lives at the top level of each document, so the path and
+        search filters are anchored / case-insensitive regexes over
+        ``source``, ``file_path``, the text and ``title``.
+        """
+        query = {"source_id": self._source_id, self._text_key: {"$nin": [None, ""]}}
+        clauses = []
+        if path_suffix:
+            suffix = {"$regex": f"{re.escape(path_suffix)}$"}
+            clauses.append({"$or": [{"source": suffix}, {"file_path": suffix}]})
+        if search:
+            needle = {"$regex": re.escape(search), "$options": "i"}
+            clauses.append({"$or": [{self._text_key: needle}, {"title": needle}]})
+        if clauses:
+            query["$and"] = clauses
+        try:
+            total = self._collection.count_documents(query)
+            if offset >= total or limit <= 0:
+                return [], total
+            cursor = (
+                self._collection.find(query, {self._embedding_key: 0})
+                .sort("_id", 1)
+                .skip(offset)
+                .limit(limit)
+            )
+            chunks = []
+            for doc in cursor:
+                metadata = {
+                    k: v
+                    for k, v in doc.items()
+                    if k not in ["_id", self._text_key, self._embedding_key, "source_id"]
+                }
+                chunks.append(
+                    {
+                        "doc_id": str(doc.get("_id")),
+                        "text": doc.get(self._text_key),
+                        "metadata": metadata,
+                    }
+                )
+            return chunks, total
+        except Exception as e:
+            logging.error(f"Error getting chunks page: {e}", exc_info=True)
+            return [], 0
+
     def add_chunk(self, text, metadata=None):
         metadata = metadata or {}
         embeddings = self._embedding.embed_documents([text])
@@ -1,7 +1,7 @@
 import logging
 import math
 import re
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Tuple
 
 from psycopg.types.json import Jsonb
 
@@ -16,6 +16,15 @@ _IVFFLAT_LISTS_CACHE: Dict[str, Optional[int]] = {}
 DEFAULT_EMBEDDING_DIM = 768
 # Advisory-lock key shared with the boot hook so concurrent workers serialize DDL.
 SCHEMA_LOCK_KEY = "docsgpt:vectors:ddl"
+# Session advisory lock held by the (single) tsvector backfill.
+TSV_BACKFILL_LOCK_KEY = "docsgpt:vectors:tsv-backfill"
+
+# ``keyword_search`` matches against ``<text_column>_tsv``, a precomputed
+# ``tsvector`` column with a GIN index, instead of parsing every row's text.
+TSV_COLUMN_SUFFIX = "_tsv"
+DEFAULT_TSV_BACKFILL_BATCH = 5000
+# table name -> True once its tsvector column is populated and indexed
+_TSV_READY_CACHE: Dict[str, bool] = {}
 
 # The connection pools moved to ``application.vectorstore.pgconn`` so the graph
 # store can share them without importing this module. Only the names something
@@ -229,7 +238,10 @@ class PGVectorStore(BaseVectorStore):
                 {vector_column} vector({dimension}),
                 {metadata_column} JSONB,
                 source_id TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                {text_column}{TSV_COLUMN_SUFFIX} tsvector GENERATED ALWAYS AS (
+                    to_tsvector('english', {text_column})
+                ) STORED
             );
             """
             cursor.execute(create_table_query)
@@ -256,12 +268,193 @@ class PGVectorStore(BaseVectorStore):
             """
             cursor.execute(source_index_query)
 
-            # Functional GIN index backing keyword_search full-text queries.
-            fts_index_query = f"""
-            CREATE INDEX IF NOT EXISTS {table_name}_text_fts_idx
-            ON {table_name} USING gin(to_tsvector('english', {text_column}));
+            # Tables created before the tsvector column existed get a plain,
+            # nullable one: adding it is a catalog-only change, where adding a
+            # STORED generated column would rewrite the whole table under an
+            # exclusive lock at boot. A trigger keeps new writes current and
+            # ``backfill_tsvector`` fills old rows and builds the index
+            # concurrently, off the boot path. Until it finishes,
+            # ``keyword_search`` keeps using the old expression index.
+            tsv_column = f"{text_column}{TSV_COLUMN_SUFFIX}"
+            cursor.execute(
+                f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {tsv_column} tsvector;"
+            )
+            generated = PGVectorStore._tsv_generated(cursor, table_name, tsv_column)
+            if generated:
+                # Fresh table: the index build is instant (and a no-op later).
+                PGVectorStore._create_tsv_index(conn, cursor, table_name, tsv_column)
+            elif generated is False:
+                PGVectorStore._create_tsv_trigger(
+                    cursor, table_name, text_column, tsv_column
+                )
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _tsv_generated(cursor, table_name: str, tsv_column: str) -> Optional[bool]:
+        """Whether ``tsv_column`` is a generated column; ``None`` if it is absent."""
+        cursor.execute(
+            "SELECT a.attgenerated FROM pg_attribute a "
+            "WHERE a.attrelid = %s::regclass AND a.attname = %s "
+            "AND NOT a.attisdropped",
+            (table_name, tsv_column),
+        )
+        row = cursor.fetchone()
+        if not row or not isinstance(row[0], str):
+            return None
+        return row[0] == "s"
+
+    @staticmethod
+    def _tsv_index_valid(cursor, table_name: str) -> Optional[bool]:
+        """``True``/``False`` for a valid/invalid tsvector index, ``None`` if absent.
+
+        ``CREATE INDEX CONCURRENTLY`` leaves an invalid index behind when it
+        fails, and ``IF NOT EXISTS`` would then skip rebuilding it.
+        """
+        cursor.execute(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = %s",
+            (f"{table_name}{TSV_COLUMN_SUFFIX}_idx",),
+        )
+        row = cursor.fetchone()
+        if not row or not isinstance(row[0], bool):
+            return None
+        return row[0]
+
+    @staticmethod
+    def _create_tsv_index(
+        conn, cursor, table_name: str, tsv_column: str, concurrently: bool = False
+    ) -> None:
+        """GIN index over the tsvector column, composite with ``source_id`` if possible.
+
+        Every keyword query filters on one source. With ``btree_gin`` (a
+        trusted contrib extension) the scalar ``source_id`` joins the GIN
+        index, so the source filter and the text match are a single index
+        scan; without it the planner combines this index with
+        ``source_id_idx`` in a bitmap AND.
+        """
+        try:
+            with conn.transaction():
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS btree_gin;")
+            columns = f"source_id, {tsv_column}"
+        except Exception as e:
+            logging.info(
+                "btree_gin unavailable (%s); indexing %s without source_id", e, tsv_column
+            )
+            columns = tsv_column
+        cursor.execute(
+            f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+            f"{table_name}{TSV_COLUMN_SUFFIX}_idx ON {table_name} USING gin({columns});"
+        )
+
+    @staticmethod
+    def _create_tsv_trigger(
+        cursor, table_name: str, text_column: str, tsv_column: str
+    ) -> None:
+        """Keep a legacy (non-generated) tsvector column current on writes."""
+        trigger = f"{table_name}{TSV_COLUMN_SUFFIX}_refresh"
+        cursor.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION {trigger}() RETURNS trigger AS $$
+            BEGIN
+                NEW.{tsv_column} := to_tsvector('english', NEW.{text_column});
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
             """
-            cursor.execute(fts_index_query)
+        )
+        cursor.execute(
+            "SELECT 1 FROM pg_trigger WHERE tgrelid = %s::regclass AND tgname = %s",
+            (table_name, trigger),
+        )
+        if cursor.fetchone() is None:
+            cursor.execute(
+                f"CREATE TRIGGER {trigger} BEFORE INSERT OR UPDATE OF {text_column} "
+                f"ON {table_name} FOR EACH ROW EXECUTE FUNCTION {trigger}();"
+            )
+
+    @staticmethod
+    def tsvector_backfill_pending(
+        conn, table_name: str = "documents", text_column: str = "text"
+    ) -> bool:
+        """Whether a legacy table still needs :meth:`backfill_tsvector`."""
+        cursor = conn.cursor()
+        try:
+            generated = PGVectorStore._tsv_generated(
+                cursor, table_name, f"{text_column}{TSV_COLUMN_SUFFIX}"
+            )
+            if generated is not False:
+                return False
+            return PGVectorStore._tsv_index_valid(cursor, table_name) is not True
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def backfill_tsvector(
+        conn,
+        *,
+        table_name: str = "documents",
+        text_column: str = "text",
+        batch_size: int = DEFAULT_TSV_BACKFILL_BATCH,
+    ) -> Optional[int]:
+        """Populate a legacy table's tsvector column, then index it concurrently.
+
+        Walks the primary key in ``batch_size`` windows so each ``UPDATE`` is a
+        short transaction, builds the GIN index with ``CREATE INDEX
+        CONCURRENTLY`` and drops the superseded expression index. Rows written
+        meanwhile are covered by the trigger. Safe to re-run: filled rows are
+        skipped. Only one backfill runs at a time.
+
+        Args:
+            conn: Open psycopg connection in autocommit mode (``CONCURRENTLY``
+                cannot run inside a transaction block).
+            table_name: Documents table to backfill.
+            text_column: Chunk-text column name.
+            batch_size: Primary-key window per ``UPDATE``.
+
+        Returns:
+            The number of rows filled, or ``None`` when another backfill holds
+            the lock or the table has no tsvector column yet.
+        """
+        tsv_column = f"{text_column}{TSV_COLUMN_SUFFIX}"
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT pg_try_advisory_lock(hashtext(%s));", (TSV_BACKFILL_LOCK_KEY,)
+            )
+            if not cursor.fetchone()[0]:
+                return None
+            try:
+                generated = PGVectorStore._tsv_generated(cursor, table_name, tsv_column)
+                if generated is None:
+                    return None
+                filled = 0
+                if not generated:
+                    cursor.execute(f"SELECT coalesce(max(id), 0) FROM {table_name};")
+                    max_id = cursor.fetchone()[0]
+                    for low in range(0, max_id, batch_size):
+                        cursor.execute(
+                            f"UPDATE {table_name} "
+                            f"SET {tsv_column} = to_tsvector('english', {text_column}) "
+                            f"WHERE id > %s AND id <= %s AND {tsv_column} IS NULL;",
+                            (low, low + batch_size),
+                        )
+                        filled += max(cursor.rowcount, 0)
+                if PGVectorStore._tsv_index_valid(cursor, table_name) is False:
+                    cursor.execute(
+                        f"DROP INDEX CONCURRENTLY IF EXISTS {table_name}{TSV_COLUMN_SUFFIX}_idx;"
+                    )
+                PGVectorStore._create_tsv_index(
+                    conn, cursor, table_name, tsv_column, concurrently=True
+                )
+                cursor.execute(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {table_name}_text_fts_idx;"
+                )
+                return filled
+            finally:
+                cursor.execute(
+                    "SELECT pg_advisory_unlock(hashtext(%s));", (TSV_BACKFILL_LOCK_KEY,)
+                )
         finally:
             cursor.close()
 
@@ -334,6 +527,28 @@ class PGVectorStore(BaseVectorStore):
         self._ensure_table_exists()
         self._schema_ensured = True
 
+    def _tsv_ready(self, conn) -> bool:
+        """Whether this table's tsvector column is populated and indexed.
+
+        Cached per table once true; until then (a legacy table mid-backfill)
+        each keyword search re-checks the catalog.
+        """
+        if _TSV_READY_CACHE.get(self._table_name):
+            return True
+        try:
+            with conn.cursor() as cursor:
+                ready = self._tsv_index_valid(cursor, self._table_name) is True
+        except Exception as e:  # catalog lookup must never break search
+            logging.debug("Could not check tsvector index for %s: %s", self._table_name, e)
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return False
+        if ready:
+            _TSV_READY_CACHE[self._table_name] = True
+        return ready
+
     score_kind = "cosine_similarity"
 
     def search(
@@ -522,19 +737,21 @@ class PGVectorStore(BaseVectorStore):
         bound as a query parameter (never interpolated) to prevent injection.
         """
         conn = self._get_connection()
+        if self._tsv_ready(conn):
+            document = f"{self._text_column}{TSV_COLUMN_SUFFIX}"
+        else:
+            # Legacy table not yet backfilled: its expression index still
+            # serves this form.
+            document = f"to_tsvector('english', {self._text_column})"
         cursor = conn.cursor()
 
         try:
             keyword_query = f"""
             SELECT {self._text_column}, {self._metadata_column},
-                   ts_rank(
-                       to_tsvector('english', {self._text_column}),
-                       websearch_to_tsquery('english', %s)
-                   ) AS rank
+                   ts_rank({document}, websearch_to_tsquery('english', %s)) AS rank
             FROM {self._table_name}
             WHERE source_id = %s
-              AND to_tsvector('english', {self._text_column})
-                  @@ websearch_to_tsquery('english', %s)
+              AND {document} @@ websearch_to_tsquery('english', %s)
             ORDER BY rank DESC
             LIMIT %s;
             """
@@ -568,13 +785,19 @@ class PGVectorStore(BaseVectorStore):
         texts: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         *args,
+        vectors: Optional[List[List[float]]] = None,
         **kwargs,
     ) -> List[str]:
-        """Add texts with their embeddings to the vector store"""
+        """Add texts with their embeddings to the vector store.
+
+        Args:
+            vectors: Precomputed embeddings of ``texts``, row-aligned; when
+                given the store skips embedding them itself.
+        """
         if not texts:
             return []
 
-        embeddings = self._embedding.embed_documents(texts)
+        embeddings = vectors if vectors is not None else self._embedding.embed_documents(texts)
         metadatas = metadatas or [{}] * len(texts)
 
         self._ensure_schema_once()
@@ -664,6 +887,78 @@ class PGVectorStore(BaseVectorStore):
         finally:
             cursor.close()
 
+    def get_chunks_page(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        path_suffix: Optional[str] = None,
+        search: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of this source's chunks, filtered, ordered and counted in SQL.
+
+        The page and the total are separate statements so ``LIMIT`` can stop
+        the page scan early. Given ``after`` (the previous page's last id)
+        the page seeks past it on the primary key instead of skipping
+        ``offset`` rows.
+        """
+        where = ["source_id = %s"]
+        params: List[Any] = [self._source_id]
+        if path_suffix:
+            where.append(
+                f"(right({self._metadata_column}->>'source', %s) = %s "
+                f"OR right({self._metadata_column}->>'file_path', %s) = %s)"
+            )
+            params += [len(path_suffix), path_suffix] * 2
+        if search:
+            where.append(
+                f"(strpos(lower({self._text_column}), %s) > 0 "
+                f"OR strpos(lower(coalesce({self._metadata_column}->>'title', '')), %s) > 0)"
+            )
+            params += [search.lower()] * 2
+        where_sql = " AND ".join(where)
+
+        if after is not None and str(after).isdigit():
+            page_sql = f"{where_sql} AND id > %s ORDER BY id LIMIT %s"
+            page_params = (*params, int(after), limit)
+        else:
+            page_sql = f"{where_sql} ORDER BY id LIMIT %s OFFSET %s"
+            page_params = (*params, limit, offset)
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                f"""
+                SELECT id, {self._text_column}, {self._metadata_column}
+                FROM {self._table_name}
+                WHERE {page_sql};
+                """,
+                page_params,
+            )
+            rows = cursor.fetchall()
+            cursor.execute(
+                f"SELECT count(*) FROM {self._table_name} WHERE {where_sql};",
+                tuple(params),
+            )
+            total = cursor.fetchone()[0]
+            conn.commit()
+            chunks = [
+                {"doc_id": str(doc_id), "text": text, "metadata": metadata or {}}
+                for doc_id, text, metadata in rows
+            ]
+            return chunks, total
+        except Exception as e:
+            logging.error(f"Error getting chunks page: {e}", exc_info=True)
+            try:
+                conn.rollback()
+            except Exception:
+                # Connection already gone; nothing left to roll back.
+                pass
+            return [], 0
+        finally:
+            cursor.close()
+
     def add_chunk(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Add a single chunk to the vector store"""
         metadata = metadata or {}
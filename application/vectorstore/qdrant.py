@@ -3,9 +3,14 @@ import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
 from application.core.settings import settings
-from application.vectorstore.base import BaseVectorStore
+from application.vectorstore.base import BaseVectorStore, page_of_chunks
 from application.vectorstore.document_class import Document
 
+# Points per ``scroll`` request when walking a source; skipping to a page
+# fetches ids only, so it can take bigger steps.
+_SCROLL_BATCH = 256
+_SKIP_BATCH = 2048
+
 
 class QdrantStore(BaseVectorStore):
     """Vector store backed by Qdrant through the native ``qdrant-client``.
@@ -135,14 +140,21 @@ class QdrantStore(BaseVectorStore):
         texts: List[str],
         metadatas: Optional[List[dict]] = None,
         *args,
+        vectors: Optional[List[List[float]]] = None,
         **kwargs,
     ) -> List[str]:
-        """Embed and upsert ``texts``, stamping each with the source id."""
+        """Embed and upsert ``texts``, stamping each with the source id.
+
+        Args:
+            vectors: Precomputed embeddings of ``texts``, row-aligned; when
+                given the store skips embedding them itself.
+        """
         texts = list(texts)
         if not texts:
             return []
         metadatas = list(metadatas or [{} for _ in texts])
-        vectors = self._embeddings.embed_documents(texts)
+        if vectors is None:
+            vectors = self._embeddings.embed_documents(texts)
 
         points, ids = [], []
         for text, metadata, vector in zip(texts, metadatas, vectors):
@@ -171,35 +183,84 @@ class QdrantStore(BaseVectorStore):
             points_selector=self._models.FilterSelector(filter=self._filter),
         )
 
+    @staticmethod
+    def _to_chunk(record) -> Dict[str, Any]:
+        payload = record.payload or {}
+        return {
+            "doc_id": str(record.id),
+            "text": payload.get("page_content"),
+            "metadata": payload.get("metadata") or {},
+        }
+
+    def _scroll(self, offset=None, limit: Optional[int] = None, with_payload=True):
+        """Yield this source's points in id order, ``_SCROLL_BATCH`` per request."""
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch = _SCROLL_BATCH if remaining is None else min(remaining, _SCROLL_BATCH)
+            records, offset = self._client.scroll(
+                collection_name=self._collection,
+                scroll_filter=self._filter,
+                limit=batch,
+                with_payload=with_payload,
+                with_vectors=False,
+                offset=offset,
+            )
+            yield from records
+            if remaining is not None:
+                remaining -= len(records)
+            if offset is None:
+                return
+
     def get_chunks(self) -> List[Dict[str, Any]]:
         """Return every chunk stored for this source."""
-        chunks: List[Dict[str, Any]] = []
-        offset = None
         try:
-            while True:
-                records, offset = self._client.scroll(
+            return [self._to_chunk(record) for record in self._scroll()]
+        except Exception as e:
+            logging.error("Error getting chunks: %s", e, exc_info=True)
+            return []
+
+    def get_chunks_page(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        path_suffix: Optional[str] = None,
+        search: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of this source's chunks, counted server-side when unfiltered.
+
+        Qdrant pages by point id rather than position, so the skipped points
+        are scrolled without payloads and the page alone is fetched with
+        them. Suffix and substring filters have no payload-index equivalent;
+        those pages stream the source and keep only the page in memory.
+        """
+        try:
+            if path_suffix or search:
+                chunks = (self._to_chunk(record) for record in self._scroll())
+                return page_of_chunks(chunks, offset, limit, path_suffix, search)
+            total = self._client.count(
+                collection_name=self._collection, count_filter=self._filter, exact=True
+            ).count
+            if offset >= total or limit <= 0:
+                return [], total
+            next_id, remaining = None, offset
+            while remaining > 0:
+                records, next_id = self._client.scroll(
                     collection_name=self._collection,
                     scroll_filter=self._filter,
-                    limit=100,
-                    with_payload=True,
+                    limit=min(remaining, _SKIP_BATCH),
+                    with_payload=False,
                     with_vectors=False,
-                    offset=offset,
+                    offset=next_id,
                 )
-                for record in records:
-                    payload = record.payload or {}
-                    chunks.append(
-                        {
-                            "doc_id": str(record.id),
-                            "text": payload.get("page_content"),
-                            "metadata": payload.get("metadata") or {},
-                        }
-                    )
-                if offset is None:
-                    break
-            return chunks
+                remaining -= len(records)
+                if next_id is None:
+                    return [], total
+            page = [self._to_chunk(r) for r in self._scroll(offset=next_id, limit=limit)]
+            return page, total
         except Exception as e:
-            logging.error("Error getting chunks: %s", e, exc_info=True)
-            return []
+            logging.error("Error getting chunks page: %s", e, exc_info=True)
+            return [], 0
 
     def add_chunk(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Add one chunk and return its id."""
@@ -0,0 +1,244 @@
+"""Two-tier cache for ``embed_query`` results.
+
+``embed_questions`` already embeds each distinct question once per retrieval,
+but the same questions recur across requests — FAQ traffic, widget suggested
+prompts, retries, API-key searches — and each one paid for a fresh embedding
+call. This cache sits under every ``embed_query`` of the shared embeddings
+instances:
+
+* tier 1 — an in-process LRU of float32 vectors, bounded by
+  ``QUERY_EMBEDDING_CACHE_SIZE`` entries, each expiring after
+  ``QUERY_EMBEDDING_CACHE_TTL`` seconds;
+* tier 2 — optionally (``QUERY_EMBEDDING_CACHE_REDIS``) the shared Redis,
+  holding the same vectors as compact float32 bytes with the same TTL, so
+  one process's embedding serves every worker.
+
+Keys combine the embeddings model with the normalized query text (NFC,
+whitespace collapsed and stripped). It is installed by
+:class:`~application.vectorstore.base.EmbeddingsSingleton` on the instances
+it creates (see :func:`install`), so stores, GraphRAG and the semantic
+chunker benefit without changes — and the instance keeps its identity and
+type. Redis errors are logged and degrade to the local tier.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "query_emb:"
+DEFAULT_SIZE = 2048
+DEFAULT_TTL = 24 * 60 * 60
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    text = unicodedata.normalize("NFC", text or "")
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def cache_key(model: str, text: str) -> str:
+    digest = hashlib.sha256(f"{model}\x00{normalize_query(text)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU of query vectors with TTL, plus an optional Redis tier."""
+
+    def __init__(self, max_entries: int, ttl: int, use_redis: bool = False) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self._entries: "OrderedDict[str, Tuple[float, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.redis_errors = 0
+
+    def get_or_compute(
+        self, model: str, text: str, compute: Callable[[str], List[float]]
+    ) -> List[float]:
+        """Return the cached vector for ``text``, computing and storing it on a miss."""
+        key = cache_key(model, text)
+        vector = self._get_local(key)
+        if vector is not None:
+            return vector.tolist()
+
+        vector = self._get_redis(key)
+        if vector is not None:
+            self._put_local(key, vector)
+            return vector.tolist()
+
+        result = compute(text)
+        vector = np.asarray(result, dtype=np.float32)
+        with self._lock:
+            self.misses += 1
+        self._put_local(key, vector)
+        self._put_redis(key, vector)
+        return result
+
+    def _get_local(self, key: str) -> Optional[np.ndarray]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, vector = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            self.local_hits += 1
+            return vector
+
+    def _put_local(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _get_redis(self, key: str) -> Optional[np.ndarray]:
+        redis_client = self._redis()
+        if redis_client is None:
+            return None
+        try:
+            data = redis_client.get(f"{REDIS_KEY_PREFIX}{key}")
+        except Exception as e:
+            self._redis_failed("get", e)
+            return None
+        if not data:
+            return None
+        with self._lock:
+            self.redis_hits += 1
+        return np.frombuffer(data, dtype="<f4").astype(np.float32)
+
+    def _put_redis(self, key: str, vector: np.ndarray) -> None:
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+        try:
+            redis_client.set(
+                f"{REDIS_KEY_PREFIX}{key}", vector.astype("<f4").tobytes(), ex=self.ttl
+            )
+        except Exception as e:
+            self._redis_failed("set", e)
+
+    def _redis(self) -> Any:
+        if not self.use_redis:
+            return None
+        from application.cache import get_redis_instance
+
+        return get_redis_instance()
+
+    def _redis_failed(self, op: str, error: Exception) -> None:
+        with self._lock:
+            self.redis_errors += 1
+        logger.warning(f"Query embedding cache Redis {op} failed: {error}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the counters and current occupancy."""
+        with self._lock:
+            lookups = self.local_hits + self.redis_hits + self.misses
+            return {
+                "local_hits": self.local_hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_rate": (
+                    round((self.local_hits + self.redis_hits) / lookups, 4)
+                    if lookups else 0.0
+                ),
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "redis_errors": self.redis_errors,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+_CACHE: Optional[QueryEmbeddingCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def _int_setting(name: str, default: int) -> int:
+    """Non-negative int setting, defensively: the suite mocks ``settings``."""
+    from application.core.settings import settings
+
+    value = getattr(settings, name, default)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def get_query_cache() -> Optional[QueryEmbeddingCache]:
+    """Return this process's query cache, or ``None`` when it is disabled."""
+    global _CACHE
+    if _CACHE is not None:
+        return _CACHE
+    max_entries = _int_setting("QUERY_EMBEDDING_CACHE_SIZE", DEFAULT_SIZE)
+    if max_entries <= 0:
+        return None
+    from application.core.settings import settings
+
+    use_redis = getattr(settings, "QUERY_EMBEDDING_CACHE_REDIS", False) is True
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = QueryEmbeddingCache(
+                max_entries,
+                _int_setting("QUERY_EMBEDDING_CACHE_TTL", DEFAULT_TTL),
+                use_redis=use_redis,
+            )
+    return _CACHE
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Counters for the process cache; empty when it is disabled."""
+    cache = get_query_cache()
+    return cache.stats() if cache is not None else {}
+
+
+def install(embeddings: Any, model: str) -> Any:
+    """Route ``embeddings.embed_query`` through the query cache, in place.
+
+    The instance itself is returned unchanged in identity and type; only its
+    ``embed_query`` attribute is replaced. Idempotent, and a no-op when the
+    cache is disabled or the object has no ``embed_query``.
+    """
+    cache = get_query_cache()
+    original = getattr(embeddings, "embed_query", None)
+    if cache is None or not callable(original) or getattr(original, "_query_cached", False) is True:
+        return embeddings
+
+    @functools.wraps(original)
+    def embed_query(text):
+        if not isinstance(text, str):
+            return original(text)
+        return cache.get_or_compute(model, text, original)
+
+    embed_query._query_cached = True
+    try:
+        embeddings.embed_query = embed_query
+    except AttributeError:
+        logger.debug("Cannot install query embedding cache on %r", type(embeddings))
+    return embeddings
@@ -22,6 +22,8 @@ from application.parser.connectors.connector_creator import ConnectorCreator
 from application.parser.embedding_pipeline import (
     assert_index_complete,
     embed_and_store_documents,
+    embed_and_store_stream,
+    pipeline_stage,
 )
 from application.parser.file.bulk import SimpleDirectoryReader, get_default_file_extractor
 from application.parser.file.constants import SUPPORTED_SOURCE_EXTENSIONS
@@ -153,6 +155,28 @@ def _maybe_enqueue_graph_extraction(cfg, source_id, user):
             exc_info=True,
         )
 
+
+def _invalidate_semantic_cache_for_source(source_id) -> None:
+    """Drop cached answers of every agent that retrieves from ``source_id``.
+
+    Re-ingested text changes the retrieved-document fingerprint anyway, but
+    answers built from the old chunks would otherwise linger until they
+    expire. Never raises: a Redis or DB hiccup must not fail the ingest.
+    """
+    from application.semantic_cache import get_semantic_cache, invalidate_agents
+
+    if get_semantic_cache() is None:
+        return
+    try:
+        with db_readonly() as conn:
+            agent_ids = AgentsRepository(conn).list_ids_for_source(str(source_id))
+        invalidate_agents(agent_ids)
+    except Exception as e:
+        logging.warning(
+            f"Failed to invalidate semantic cache for {source_id}: {e}",
+            exc_info=True,
+        )
+
 # Re-exported here for backward-compatible imports
 # (``from application.worker import _derive_source_id`` /
 # ``DOCSGPT_INGEST_NAMESPACE``) from tests and any other in-tree callers.
@@ -198,14 +222,21 @@ def _stop_ingest_heartbeat(thread, stop_event):
         thread.join(timeout=5)
 
 
-def _make_parse_progress_callback(task, user, source_id, start_pct, end_pct):
+def _make_parse_progress_callback(
+    task, user, source_id, start_pct, end_pct, task_id=None,
+):
     """Build a ``load_data`` callback mapping parse progress to
     ``[start_pct, end_pct]`` via ``update_state`` + a throttled
     ``stage='parsing'`` SSE event.
+
+    Pass ``task_id`` when the callback runs off the task's own thread:
+    ``update_state`` otherwise reads the id from Celery's thread-local
+    request, which is empty there.
     """
     span = end_pct - start_pct
     source_id_str = str(source_id)
     state = {"last_pct": -1}
+    state_kwargs = {"task_id": task_id} if task_id else {}
 
     def _callback(files_done, total_files):
         if not total_files:
@@ -214,6 +245,7 @@ def _make_parse_progress_callback(task, user, source_id, start_pct, end_pct):
         task.update_state(
             state="PROGRESS",
             meta={"current": pct, "status": "Parsing files"},
+            **state_kwargs,
         )
         if user and pct > state["last_pct"]:
             publish_user_event(
@@ -274,6 +306,106 @@ def _apply_display_names_to_structure(structure, file_name_map, prefix=""):
     return structure
 
 
+def _apply_display_names_to_docs(docs, file_name_map):
+    """Label each parsed document with its file's original (display) name."""
+    for doc in docs:
+        extra_info = getattr(doc, "extra_info", None)
+        if not isinstance(extra_info, dict):
+            continue
+        rel_path = extra_info.get("source") or extra_info.get("file_path")
+        display_name = _get_display_name(file_name_map, rel_path)
+        if display_name:
+            display_name = str(display_name)
+            extra_info["filename"] = display_name
+            extra_info["file_name"] = display_name
+            extra_info["title"] = display_name
+
+
+def _stream_upload(
+    task, reader, chunker, file_name_map, source_id, user, vector_store_path,
+    sample=False,
+):
+    """Parse, chunk, embed and store an upload as one streaming pipeline.
+
+    Each stage runs on its own thread with a bounded queue to the next
+    (``INGEST_STREAM_QUEUE_FILES`` files), so chunks of the first files are
+    being embedded while later files still parse and only a few files'
+    documents are in memory at once. The first file is parsed on the
+    calling thread before any stage starts: that is where the reader forks
+    its ``INGEST_PARSE_PROCESSES`` workers, which it refuses to do off the
+    main thread. Parsing keeps the 1-50% band and embedding the 50-100%
+    band. With ``sample`` the first five chunks are logged as they pass.
+
+    Returns:
+        ``(embedding_cache_stats, tokens)``.
+    """
+    queue_files = settings.INGEST_STREAM_QUEUE_FILES
+    if not isinstance(queue_files, int) or isinstance(queue_files, bool) or queue_files < 1:
+        queue_files = 1
+    tokens = 0
+    # Captured here: the parse stage reports progress from its own thread.
+    task_id = getattr(task.request, "id", None)
+
+    files = reader.iter_data(
+        progress_callback=_make_parse_progress_callback(
+            task, user, source_id, start_pct=1, end_pct=50,
+            task_id=task_id,
+        )
+    )
+    try:
+        first_file = next(files, None)
+    except BaseException:
+        files.close()
+        raise
+
+    def _parsed_files():
+        try:
+            if first_file is not None:
+                yield first_file
+                yield from files
+        finally:
+            files.close()
+
+    parsed = pipeline_stage(_parsed_files(), queue_files, name="ingest-parse")
+
+    def _chunk_files():
+        nonlocal tokens
+        try:
+            for file_docs in parsed:
+                if file_name_map:
+                    _apply_display_names_to_docs(file_docs, file_name_map)
+                chunks = [
+                    Document.to_vector_format(doc)
+                    for doc in chunker.chunk(documents=file_docs)
+                ]
+                tokens += count_tokens_docs(chunks)
+                yield chunks
+        finally:
+            parsed.close()
+
+    chunked = pipeline_stage(_chunk_files(), queue_files, name="ingest-chunk")
+
+    def _chunks():
+        sampled = 0
+        try:
+            for file_chunks in chunked:
+                for chunk in file_chunks:
+                    if sample and sampled < 5:
+                        logging.info(f"Sample document {sampled}: {chunk}")
+                        sampled += 1
+                    yield chunk
+        finally:
+            chunked.close()
+
+    embedding_cache_stats = embed_and_store_stream(
+        _chunks(), vector_store_path, source_id, task,
+        attempt_id=task_id,
+        user_id=user,
+        progress_start=50, progress_end=100,
+    )
+    return embedding_cache_stats, tokens
+
+
 def _download_source_files_to_dir(storage, source_file_path, temp_dir):
     """Mirror a source's stored files into ``temp_dir``, preserving structure."""
     if not storage.is_directory(source_file_path):
@@ -446,19 +578,26 @@ def upload_index(full_path, file_data):
 
         if settings.VECTOR_STORE == "faiss":
             faiss_path = full_path + "/index.faiss"
+            docs_path = full_path + "/index.docs"
             pkl_path = full_path + "/index.pkl"
 
             if not os.path.exists(faiss_path):
                 logging.error(f"FAISS index file not found: {faiss_path}")
                 raise FileNotFoundError(f"FAISS index file not found: {faiss_path}")
 
-            if not os.path.exists(pkl_path):
-                logging.error(f"FAISS pickle file not found: {pkl_path}")
-                raise FileNotFoundError(f"FAISS pickle file not found: {pkl_path}")
+            # index.docs is the current sidecar; index.pkl is only written
+            # when FAISS_WRITE_PICKLE_SIDECAR is on.
+            if os.path.exists(docs_path):
+                sidecar_field, sidecar_path = "file_docs", docs_path
+            elif os.path.exists(pkl_path):
+                sidecar_field, sidecar_path = "file_pkl", pkl_path
+            else:
+                logging.error(f"FAISS docstore file not found: {docs_path}")
+                raise FileNotFoundError(f"FAISS docstore file not found: {docs_path}")
 
             files = {
                 "file_faiss": open(faiss_path, "rb"),
-                "file_pkl": open(pkl_path, "rb"),
+                sidecar_field: open(sidecar_path, "rb"),
             }
             response = requests.post(
                 urljoin(settings.API_URL, "/api/upload_index"),
@@ -630,32 +769,7 @@ def ingest_worker(
                 exclude_hidden=exclude,
                 file_metadata=metadata_from_filename,
             )
-            # Parsing/OCR owns 1-50% of the bar; embedding takes 50-100%.
-            raw_docs = reader.load_data(
-                progress_callback=_make_parse_progress_callback(
-                    self, user, source_uuid, start_pct=1, end_pct=50,
-                )
-            )
-
-            directory_structure = getattr(reader, "directory_structure", {})
-            logging.info(f"Directory structure from reader: {directory_structure}")
             file_name_map = _normalize_file_name_map(file_name_map)
-            if file_name_map:
-                for doc in raw_docs:
-                    extra_info = getattr(doc, "extra_info", None)
-                    if not isinstance(extra_info, dict):
-                        continue
-                    rel_path = extra_info.get("source") or extra_info.get("file_path")
-                    display_name = _get_display_name(file_name_map, rel_path)
-                    if display_name:
-                        display_name = str(display_name)
-                        extra_info["filename"] = display_name
-                        extra_info["file_name"] = display_name
-                        extra_info["title"] = display_name
-                directory_structure = _apply_display_names_to_structure(
-                    directory_structure, file_name_map
-                )
-
             cfg = SourceConfig.parse(config)
             chunker = ChunkerCreator.create_chunker(
                 cfg.chunking.strategy,
@@ -664,35 +778,60 @@ def ingest_worker(
                 min_tokens=cfg.chunking.min_tokens,
                 duplicate_headers=cfg.chunking.duplicate_headers,
             )
-            raw_docs = chunker.chunk(documents=raw_docs)
-
-            docs = [Document.to_vector_format(raw_doc) for raw_doc in raw_docs]
-
             vector_store_path = os.path.join(temp_dir, "vector_store")
             os.makedirs(vector_store_path, exist_ok=True)
 
-            heartbeat_thread, heartbeat_stop = _start_ingest_heartbeat(source_uuid)
-            try:
-                embed_and_store_documents(
-                    docs, vector_store_path, source_uuid, self,
-                    attempt_id=getattr(self.request, "id", None),
-                    user_id=user,
-                    progress_start=50, progress_end=100,
+            if settings.INGEST_STREAMING:
+                heartbeat_thread, heartbeat_stop = _start_ingest_heartbeat(source_uuid)
+                try:
+                    embedding_cache_stats, tokens = _stream_upload(
+                        self, reader, chunker, file_name_map, source_uuid, user,
+                        vector_store_path, sample=sample,
+                    )
+                finally:
+                    _stop_ingest_heartbeat(heartbeat_thread, heartbeat_stop)
+            else:
+                # Parsing/OCR owns 1-50% of the bar; embedding takes 50-100%.
+                raw_docs = reader.load_data(
+                    progress_callback=_make_parse_progress_callback(
+                        self, user, source_uuid, start_pct=1, end_pct=50,
+                    )
                 )
-            finally:
-                _stop_ingest_heartbeat(heartbeat_thread, heartbeat_stop)
+                if file_name_map:
+                    _apply_display_names_to_docs(raw_docs, file_name_map)
+
+                raw_docs = chunker.chunk(documents=raw_docs)
+                if sample:
+                    for i in range(min(5, len(raw_docs))):
+                        logging.info(f"Sample document {i}: {raw_docs[i]}")
+
+                docs = [Document.to_vector_format(raw_doc) for raw_doc in raw_docs]
+
+                heartbeat_thread, heartbeat_stop = _start_ingest_heartbeat(source_uuid)
+                try:
+                    embedding_cache_stats = embed_and_store_documents(
+                        docs, vector_store_path, source_uuid, self,
+                        attempt_id=getattr(self.request, "id", None),
+                        user_id=user,
+                        progress_start=50, progress_end=100,
+                    )
+                finally:
+                    _stop_ingest_heartbeat(heartbeat_thread, heartbeat_stop)
+                tokens = count_tokens_docs(docs)
             # Defense-in-depth: chunk-progress is the authoritative
             # record of how many chunks landed; mismatch raises so the
             # task fails loud rather than caching a partial index.
             assert_index_complete(source_uuid)
 
-            tokens = count_tokens_docs(docs)
+            directory_structure = getattr(reader, "directory_structure", {})
+            logging.info(f"Directory structure from reader: {directory_structure}")
+            if file_name_map:
+                directory_structure = _apply_display_names_to_structure(
+                    directory_structure, file_name_map
+                )
 
             self.update_state(state="PROGRESS", meta={"current": 100})
 
-            if sample:
-                for i in range(min(5, len(raw_docs))):
-                    logging.info(f"Sample document {i}: {raw_docs[i]}")
             file_data = {
                 "name": job_name,
                 "file": filename,
@@ -710,23 +849,27 @@ def ingest_worker(
                 file_data["config"] = json.dumps(config)
 
             upload_index(vector_store_path, file_data)
+            completed_payload = {
+                "source_id": source_id_for_events,
+                "filename": filename,
+                "tokens": tokens,
+                "operation": "upload",
+                # Forward-looking contract: ``limited`` is always
+                # ``False`` today but is carried on the wire so a
+                # future token-cap detection path can flip it and
+                # the frontend slice / UploadToast already react.
+                "limited": False,
+            }
+            if embedding_cache_stats:
+                completed_payload["embedding_cache"] = embedding_cache_stats
             publish_user_event(
                 user,
                 "source.ingest.completed",
-                {
-                    "source_id": source_id_for_events,
-                    "filename": filename,
-                    "tokens": tokens,
-                    "operation": "upload",
-                    # Forward-looking contract: ``limited`` is always
-                    # ``False`` today but is carried on the wire so a
-                    # future token-cap detection path can flip it and
-                    # the frontend slice / UploadToast already react.
-                    "limited": False,
-                },
+                completed_payload,
                 scope={"kind": "source", "id": source_id_for_events},
             )
             _maybe_enqueue_graph_extraction(cfg, source_id_for_events, user)
+            _invalidate_semantic_cache_for_source(source_id_for_events)
     except Exception as e:
         logging.error(f"Error in ingest_worker: {e}", exc_info=True)
         publish_user_event(
@@ -1107,6 +1250,7 @@ def reingest_source_worker(self, source_id, user):
                     scope={"kind": "source", "id": source_id},
                 )
                 _maybe_enqueue_graph_extraction(cfg, source_id, user)
+                _invalidate_semantic_cache_for_source(source_id)
 
                 return {
                     "source_id": source_id,
@@ -1285,8 +1429,9 @@ def remote_worker(
             f"{list(directory_structure.keys())}"
         )
 
+        embedding_cache_stats = None
         if operation_mode == "upload":
-            embed_and_store_documents(
+            embedding_cache_stats = embed_and_store_documents(
                 docs, full_path, source_uuid, self,
                 attempt_id=getattr(self.request, "id", None),
                 user_id=user,
@@ -1296,7 +1441,7 @@ def remote_worker(
             if not doc_id:
                 logging.error("Invalid doc_id provided for sync operation: %s", doc_id)
                 raise ValueError("doc_id must be provided for sync operation.")
-            embed_and_store_documents(
+            embedding_cache_stats = embed_and_store_documents(
                 docs, full_path, source_uuid, self,
                 attempt_id=getattr(self.request, "id", None),
                 user_id=user,
@@ -1337,21 +1482,25 @@ def remote_worker(
                     f"Failed to update last_sync for source {source_id_for_events}: {upd_err}"
                 )
         upload_index(full_path, file_data)
+        completed_payload = {
+            "source_id": source_id_for_events,
+            "job_name": name_job,
+            "loader": loader,
+            "operation": operation_mode,
+            "tokens": tokens,
+            # Forward-looking contract: see ingest_worker.
+            "limited": False,
+        }
+        if embedding_cache_stats:
+            completed_payload["embedding_cache"] = embedding_cache_stats
         publish_user_event(
             user,
             "source.ingest.completed",
-            {
-                "source_id": source_id_for_events,
-                "job_name": name_job,
-                "loader": loader,
-                "operation": operation_mode,
-                "tokens": tokens,
-                # Forward-looking contract: see ingest_worker.
-                "limited": False,
-            },
+            completed_payload,
             scope={"kind": "source", "id": source_id_for_events},
         )
         _maybe_enqueue_graph_extraction(cfg, source_id_for_events, user)
+        _invalidate_semantic_cache_for_source(source_id_for_events)
     except Exception as e:
         logging.error("Error in remote_worker task: %s", str(e), exc_info=True)
         publish_user_event(
@@ -2192,7 +2341,7 @@ def ingest_connector(
             self.update_state(
                 state="PROGRESS", meta={"current": 60, "status": "Storing documents"}
             )
-            embed_and_store_documents(
+            embedding_cache_stats = embed_and_store_documents(
                 docs, vector_store_path, source_uuid, self,
                 attempt_id=getattr(self.request, "id", None),
                 user_id=user,
@@ -2247,19 +2396,23 @@ def ingest_connector(
 
             logging.info(f"Remote ingestion completed: {job_name}")
 
+            completed_payload = {
+                "source_id": source_id_for_events,
+                "job_name": job_name,
+                "loader": source_type,
+                "operation": operation_mode,
+                "tokens": tokens,
+            }
+            if embedding_cache_stats:
+                completed_payload["embedding_cache"] = embedding_cache_stats
             publish_user_event(
                 user,
                 "source.ingest.completed",
-                {
-                    "source_id": source_id_for_events,
-                    "job_name": job_name,
-                    "loader": source_type,
-                    "operation": operation_mode,
-                    "tokens": tokens,
-                },
+                completed_payload,
                 scope={"kind": "source", "id": source_id_for_events},
             )
             _maybe_enqueue_graph_extraction(cfg, source_id_for_events, user)
+            _invalidate_semantic_cache_for_source(source_id_for_events)
 
             return {
                 "user": user,
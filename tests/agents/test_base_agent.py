@@ -835,10 +835,28 @@ class TestCalculateContextTokens:
         with patch(
             "application.api.answer.services.compression.token_counter.TokenCounter"
         ) as MockTC:
-            MockTC.count_message_tokens.return_value = 42
+            MockTC.count_contents.return_value = [42]
             result = agent._calculate_current_context_tokens(messages)
             assert result == 42
-            MockTC.count_message_tokens.assert_called_once_with(messages)
+            MockTC.count_contents.assert_called_once_with(["hello"])
+
+    def test_recounts_only_changed_messages(
+        self, agent_base_params, mock_llm_creator, mock_llm_handler_creator
+    ):
+        agent = ClassicAgent(**agent_base_params)
+        messages = [{"role": "user", "content": "hello"}]
+
+        with patch(
+            "application.api.answer.services.compression.token_counter.TokenCounter"
+        ) as MockTC:
+            MockTC.count_contents.side_effect = lambda contents: [5] * len(contents)
+            assert agent._calculate_current_context_tokens(messages) == 5
+            messages = messages + [{"role": "tool", "content": "result"}]
+            assert agent._calculate_current_context_tokens(messages) == 10
+            messages[0] = {"role": "user", "content": "replaced"}
+            assert agent._calculate_current_context_tokens(messages) == 10
+            counted = [c.args[0] for c in MockTC.count_contents.call_args_list]
+            assert counted == [["hello"], ["result"], ["replaced"]]
 
 
 # ---------------------------------------------------------------------------
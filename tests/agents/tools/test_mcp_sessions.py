@@ -0,0 +1,267 @@
+"""Tests for the process-wide MCP session pool."""
+
+import asyncio
+import concurrent.futures
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastmcp.exceptions import ToolError
+
+from application.agents.tools import mcp_sessions
+from application.agents.tools.mcp_sessions import MCPSessionManager
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeClient:
+    """Stands in for a FastMCP ``Client``: counts handshakes."""
+
+    def __init__(self):
+        self.handshakes = 0
+        self.connected = False
+        self.ping_error = None
+        self.threads = set()
+
+    async def __aenter__(self):
+        self.handshakes += 1
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def ping(self):
+        if self.ping_error:
+            raise self.ping_error
+        return True
+
+    async def call_tool(self, name, arguments):
+        assert self.connected, "operation ran without an open session"
+        self.threads.add(threading.current_thread().name)
+        return {"name": name, "arguments": arguments}
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def manager(clock):
+    manager = MCPSessionManager(
+        max_sessions=2, idle_seconds=300, healthcheck_seconds=60, clock=clock
+    )
+    yield manager
+    manager.close()
+
+
+def _call(manager, client, key="k", retry=False, timeout=5):
+    return manager.run(
+        key, client, lambda: client.call_tool("t", {}), timeout=timeout, retry=retry
+    )
+
+
+@pytest.mark.unit
+class TestSessionReuse:
+    def test_one_handshake_for_many_calls(self, manager):
+        client = _FakeClient()
+        for _ in range(10):
+            _call(manager, client)
+        assert client.handshakes == 1
+        assert manager.stats()["reuses"] == 9
+        assert client.threads == {"mcp-sessions"}
+
+    def test_concurrent_callers_share_the_session(self, manager):
+        client = _FakeClient()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: _call(manager, client), range(8)))
+        assert client.handshakes == 1
+
+    def test_rebuilt_client_replaces_session(self, manager):
+        old, new = _FakeClient(), _FakeClient()
+        _call(manager, old)
+        _call(manager, new)
+        assert not old.connected
+        assert new.handshakes == 1
+
+    def test_bound_closes_least_recently_used(self, manager):
+        clients = [_FakeClient() for _ in range(3)]
+        for i, client in enumerate(clients):
+            _call(manager, client, key=f"k{i}")
+        assert not clients[0].connected
+        assert clients[1].connected and clients[2].connected
+
+
+@pytest.mark.unit
+class TestHealthAndReconnect:
+    def test_stale_session_failing_ping_reconnects(self, manager, clock):
+        client = _FakeClient()
+        _call(manager, client)
+        client.ping_error = ConnectionError("gone")
+        clock.now += 61
+        _call(manager, client)
+        assert client.handshakes == 2
+        assert manager.stats()["reconnects"] == 1
+
+    def test_fresh_session_skips_ping(self, manager, clock):
+        client = _FakeClient()
+        _call(manager, client)
+        client.ping_error = ConnectionError("would fail")
+        clock.now += 10
+        _call(manager, client)
+        assert client.handshakes == 1
+
+    def test_read_only_operation_retries_on_a_new_session(self, manager):
+        client = _FakeClient()
+        attempts = []
+
+        async def flaky():
+            attempts.append(client.handshakes)
+            if len(attempts) == 1:
+                raise ConnectionResetError("reset")
+            return "tools"
+
+        assert manager.run("k", client, flaky, timeout=5, retry=True) == "tools"
+        assert attempts == [1, 2]
+
+    def test_call_tool_is_not_retried_but_session_is_dropped(self, manager):
+        client = _FakeClient()
+
+        async def broken():
+            raise ConnectionResetError("reset")
+
+        with pytest.raises(ConnectionResetError):
+            manager.run("k", client, broken, timeout=5)
+        assert not client.connected
+        _call(manager, client)
+        assert client.handshakes == 2
+
+    def test_tool_error_keeps_the_session(self, manager):
+        client = _FakeClient()
+
+        async def tool_failed():
+            raise ToolError("bad arguments")
+
+        with pytest.raises(ToolError):
+            manager.run("k", client, tool_failed, timeout=5, retry=True)
+        _call(manager, client)
+        assert client.handshakes == 1
+
+    def test_timeout(self, manager):
+        client = _FakeClient()
+
+        async def slow():
+            await asyncio.sleep(5)
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            manager.run("k", client, slow, timeout=0.05)
+
+
+@pytest.mark.unit
+class TestIdleEviction:
+    def test_idle_session_is_closed(self, manager, clock):
+        client = _FakeClient()
+        _call(manager, client)
+        clock.now += 301
+        manager.sweep()
+        assert not client.connected
+        assert manager.stats()["sessions"] == 0
+
+    def test_recent_session_survives(self, manager, clock):
+        client = _FakeClient()
+        _call(manager, client)
+        clock.now += 100
+        manager.sweep()
+        assert client.connected
+
+
+@pytest.mark.unit
+class TestMCPToolUsesPool:
+    @pytest.fixture
+    def tool(self, monkeypatch, manager):
+        import application.agents.tools.mcp_tool as mcp_mod
+
+        monkeypatch.setattr(mcp_mod, "validate_url", lambda u, **kw: u)
+        monkeypatch.setattr(mcp_mod, "get_session_manager", lambda: manager)
+        with patch.object(mcp_mod.MCPTool, "_setup_client"):
+            tool = mcp_mod.MCPTool(
+                {"server_url": "https://mcp.example.com/api", "transport_type": "http"}
+            )
+        tool._client = _FakeClient()
+        return tool
+
+    def test_repeated_actions_share_one_handshake(self, tool):
+        for _ in range(3):
+            assert tool.execute_action("search", q="x") == {
+                "name": "search",
+                "arguments": {"q": "x"},
+            }
+        assert tool._client.handshakes == 1
+
+    def test_parallel_actions_multiplex_on_the_pool_loop(self, tool):
+        started = threading.Barrier(5, timeout=5)
+
+        async def call_tool(name, arguments):
+            # Every call must be in flight at once for the barrier to open.
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            return {"name": name, "arguments": arguments}
+
+        tool._client.call_tool = call_tool
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(
+                pool.map(lambda n: tool.execute_action("search", q=n), range(5))
+            )
+        assert [r["arguments"]["q"] for r in results] == list(range(5))
+        assert tool._client.handshakes == 1
+        assert tool.uses_session_pool({}) is True
+
+    def test_interactive_oauth_connects_per_operation(self, tool):
+        tool.auth_type = "oauth"
+        tool.query_mode = False
+        assert tool._session_manager() is None
+        tool.query_mode = True
+        assert tool._session_manager() is not None
+        assert tool.uses_session_pool({"auth_type": "oauth"}) is False
+
+    def test_cache_key_never_shares_a_token_prefix(self):
+        from application.agents.tools.mcp_tool import MCPTool
+
+        keys = set()
+        for token in ("sk-proj-abcdef-1", "sk-proj-abcdef-2"):
+            with patch.object(MCPTool, "_setup_client"), patch(
+                "application.agents.tools.mcp_tool.validate_url", lambda u, **kw: u
+            ):
+                tool = MCPTool({
+                    "server_url": "https://mcp.example.com/api",
+                    "auth_type": "bearer",
+                    "auth_credentials": {"bearer_token": token},
+                })
+            assert token not in tool._cache_key
+            keys.add(tool._cache_key)
+        assert len(keys) == 2
+
+
+@pytest.mark.unit
+class TestProcessManager:
+    def test_disabled_by_suite_fixture(self):
+        assert mcp_sessions.get_session_manager() is None
+        assert mcp_sessions.session_stats()["sessions"] == 0
+
+    def test_built_from_settings(self, monkeypatch):
+        monkeypatch.setattr(mcp_sessions, "resolve_max_sessions", lambda: 8)
+        monkeypatch.setattr(mcp_sessions, "_MANAGER", None)
+        manager = mcp_sessions.get_session_manager()
+        assert isinstance(manager, MCPSessionManager)
+        assert manager.max_sessions == 8
+        assert mcp_sessions.get_session_manager() is manager
+        manager.close()
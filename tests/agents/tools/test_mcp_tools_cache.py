@@ -0,0 +1,151 @@
+"""Tests for the Redis-backed MCP tool listing cache."""
+
+import asyncio
+import types
+from unittest.mock import patch
+
+import mcp.types as mcp_types
+import pytest
+
+from application.agents.tools import mcp_tools_cache
+from application.agents.tools.mcp_tools_cache import ToolListChangedHandler
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.kv = {}
+
+    def get(self, key):
+        return self.kv.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.kv:
+            return None
+        self.kv[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.kv.pop(key, None) is not None)
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = _FakeRedis()
+    monkeypatch.setattr(mcp_tools_cache, "resolve_ttl", lambda: 300)
+    monkeypatch.setattr(mcp_tools_cache, "get_redis_instance", lambda: client)
+    return client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        mcp_tools_cache, "time", types.SimpleNamespace(time=lambda: clock.now)
+    )
+    return clock
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    import application.agents.tools.mcp_tool as mcp_mod
+
+    monkeypatch.setattr(mcp_mod, "validate_url", lambda u, **kw: u)
+    with patch.object(mcp_mod.MCPTool, "_setup_client"):
+        tool = mcp_mod.MCPTool(
+            {"server_url": "https://mcp.example.com/api", "transport_type": "http"}
+        )
+    tool._client = object()
+    listings = []
+
+    def _run(operation, *args, **kwargs):
+        assert operation == "list_tools"
+        listings.append(operation)
+        return [{"name": f"search_v{len(listings)}", "description": ""}]
+
+    tool._run_async_operation = _run
+    tool.listings = listings
+    return tool
+
+
+def _names(tools):
+    return [t["name"] for t in tools]
+
+
+@pytest.mark.unit
+class TestDiscoveryCache:
+    def test_second_discovery_is_served_from_redis(self, tool, redis_client, clock):
+        assert _names(tool.discover_tools()) == ["search_v1"]
+        assert _names(tool.discover_tools()) == ["search_v1"]
+        assert len(tool.listings) == 1
+        assert tool.get_actions_metadata()[0]["name"] == "search_v1"
+
+    def test_entries_are_keyed_by_server_config(self, tool, redis_client, clock):
+        tool.discover_tools()
+        (key,) = redis_client.kv
+        assert key == mcp_tools_cache.tools_cache_key(tool._cache_key)
+        assert "mcp.example.com" not in key
+
+    def test_stale_entry_is_served_and_relisted_once(self, tool, redis_client, clock):
+        tool.discover_tools()
+        clock.now += 301
+        futures = []
+        refresh = mcp_tools_cache.refresh_in_background
+        with patch.object(
+            mcp_tools_cache, "refresh_in_background",
+            lambda *a: futures.append(refresh(*a)),
+        ):
+            assert _names(tool.discover_tools()) == ["search_v1"]
+            futures[0].result(timeout=5)
+            assert _names(tool.discover_tools()) == ["search_v2"]
+        assert len(tool.listings) == 2
+        assert futures[1:] == []
+
+    def test_refresh_lock_keeps_other_processes_out(self, tool, redis_client, clock):
+        tool.discover_tools()
+        lock_key = mcp_tools_cache.tools_cache_key(tool._cache_key) + ":refresh"
+        redis_client.set(lock_key, "1", nx=True)
+        clock.now += 301
+        assert mcp_tools_cache.refresh_in_background(tool._cache_key, tool._list_tools) is None
+        assert _names(tool.discover_tools()) == ["search_v1"]
+        assert len(tool.listings) == 1
+
+    def test_force_refresh_lists_live_and_rewrites(self, tool, redis_client, clock):
+        tool.discover_tools()
+        assert _names(tool.discover_tools(force_refresh=True)) == ["search_v2"]
+        assert _names(tool.discover_tools()) == ["search_v2"]
+        assert len(tool.listings) == 2
+
+    def test_tool_list_changed_drops_the_entry(self, tool, redis_client, clock):
+        tool.discover_tools()
+        handler = ToolListChangedHandler(tool._cache_key)
+        asyncio.run(handler(mcp_types.ToolListChangedNotification()))
+        assert redis_client.kv == {}
+        assert _names(tool.discover_tools()) == ["search_v2"]
+
+    def test_connection_test_always_lists_live(self, tool, redis_client, clock):
+        tool.discover_tools()
+        tool._run_async_operation = lambda op, *a, **kw: (
+            tool.listings.append(op) or [{"name": "fresh", "description": ""}]
+        )
+        result = tool._test_regular_connection()
+        assert result["tools"][0]["name"] == "fresh"
+
+
+@pytest.mark.unit
+class TestCacheDisabled:
+    def test_zero_ttl_lists_every_time(self, tool):
+        tool.discover_tools()
+        tool.discover_tools()
+        assert len(tool.listings) == 2
+
+    def test_redis_errors_fall_back_to_live(self, tool, monkeypatch):
+        class _Down:
+            def get(self, key):
+                raise ConnectionError("down")
+
+            set = delete = get
+
+        monkeypatch.setattr(mcp_tools_cache, "resolve_ttl", lambda: 300)
+        monkeypatch.setattr(mcp_tools_cache, "get_redis_instance", lambda: _Down())
+        assert _names(tool.discover_tools()) == ["search_v1"]
+        assert _names(tool.discover_tools()) == ["search_v2"]
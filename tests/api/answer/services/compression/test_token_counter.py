@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pytest
+
+from application.api.answer.services.compression import token_counter
+from application.api.answer.services.compression.token_counter import (
+    MessageTokenTally,
+    TokenCounter,
+)
+
+
+def _word_counts(texts):
+    return [len(t.split()) if isinstance(t, str) else 0 for t in texts]
+
+
+@pytest.fixture
+def encoder():
+    with patch.object(
+        token_counter, "num_tokens_from_strings", side_effect=_word_counts
+    ) as mock_encode:
+        yield mock_encode
+
+
+@pytest.mark.unit
+class TestTokenCache:
+    def test_repeat_texts_are_not_re_encoded(self, encoder):
+        assert TokenCounter.count_texts(["a b", "c d e"]) == [2, 3]
+        assert TokenCounter.count_texts(["c d e", "a b", "f"]) == [3, 2, 1]
+        assert [c.args[0] for c in encoder.call_args_list] == [["a b", "c d e"], ["f"]]
+        stats = token_counter.token_cache_stats()
+        assert stats["hits"] == 2 and stats["misses"] == 3
+
+    def test_misses_are_encoded_as_one_batch(self, encoder):
+        messages = [{"content": "one two"}, {"content": [{"text": "x"}]}, {"content": "three"}]
+        TokenCounter.count_message_tokens(messages)
+        encoder.assert_called_once()
+        assert len(encoder.call_args.args[0]) == 3
+
+    def test_cache_is_bounded(self, encoder, monkeypatch):
+        monkeypatch.setattr(
+            "application.core.settings.settings.TOKEN_COUNT_CACHE_SIZE", 2, raising=False
+        )
+        TokenCounter.count_texts(["a", "b c", "d e f"])
+        assert token_counter.token_cache_stats()["entries"] == 2
+        TokenCounter.count_texts(["a"])
+        assert encoder.call_count == 2
+
+    def test_zero_size_disables_cache(self, encoder, monkeypatch):
+        monkeypatch.setattr(
+            "application.core.settings.settings.TOKEN_COUNT_CACHE_SIZE", 0, raising=False
+        )
+        TokenCounter.count_texts(["a b"])
+        TokenCounter.count_texts(["a b"])
+        assert encoder.call_count == 2
+        assert token_counter.token_cache_stats()["entries"] == 0
+
+    def test_image_parts_keep_flat_estimate(self, encoder):
+        content = [{"type": "image_url", "image_url": {"url": "data:..."}}, {"type": "text", "text": "hi"}]
+        tokens = TokenCounter.count_message_tokens([{"content": content}])
+        assert tokens > TokenCounter._IMAGE_PART_TOKEN_ESTIMATE
+
+
+@pytest.mark.unit
+class TestMessageTokenTally:
+    def test_matches_full_count(self, encoder):
+        messages = [{"content": "a b c"}, {"content": [{"text": "d"}]}, {"content": None}]
+        assert MessageTokenTally().count(messages) == TokenCounter.count_message_tokens(messages)
+
+    def test_counts_appended_and_replaced_messages_only(self, encoder):
+        tally = MessageTokenTally()
+        messages = [{"content": "a b"}, {"content": "c"}]
+        assert tally.count(messages) == 3
+        with patch.object(
+            TokenCounter, "count_contents", wraps=TokenCounter.count_contents
+        ) as counted:
+            messages.append({"content": "d e f"})
+            assert tally.count(messages) == 6
+            messages[0]["content"] = "a"
+            assert tally.count(messages) == 5
+            assert tally.count(messages[:1]) == 1
+        assert [c.args[0] for c in counted.call_args_list] == [["d e f"], ["a"]]
+
+    def test_structured_content_is_recounted(self, encoder):
+        tally = MessageTokenTally()
+        parts = [{"text": "a"}]
+        messages = [{"content": parts}]
+        first = tally.count(messages)
+        parts.append({"text": "b c d e f g"})
+        assert tally.count(messages) > first
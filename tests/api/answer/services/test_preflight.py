@@ -0,0 +1,149 @@
+"""Tests for the dependency-aware pre-flight runner."""
+
+import logging
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from application.api.answer.services.preflight import Preflight
+from application.core import log_context
+
+
+def _meet(barrier):
+    """A step that only finishes once every party of ``barrier`` is running."""
+    return lambda: barrier.wait(timeout=2) is not None
+
+
+@pytest.mark.unit
+class TestPreflight:
+    def test_independent_steps_overlap(self):
+        barrier = threading.Barrier(3)
+        preflight = Preflight()
+        for name in ("history", "attachments", "tools"):
+            preflight.add(name, _meet(barrier))
+        assert preflight.run(concurrency=4) == {
+            "history": True, "attachments": True, "tools": True,
+        }
+
+    def test_dependents_wait_for_their_steps(self):
+        seen = []
+        preflight = Preflight()
+        preflight.add("model", lambda: seen.append("model") or "gpt")
+        preflight.add("history", lambda: seen.append("history"), after=("model",))
+        preflight.add("attachments", lambda: seen.append("attachments"))
+        results = preflight.run(concurrency=4)
+        assert results["model"] == "gpt"
+        assert seen.index("model") < seen.index("history")
+
+    def test_concurrency_of_one_runs_inline_in_order(self):
+        seen = []
+        preflight = Preflight()
+        for name in ("agent", "model", "history"):
+            preflight.add(
+                name, lambda name=name: seen.append((name, threading.current_thread()))
+            )
+        preflight.run(concurrency=1)
+        assert [name for name, _ in seen] == ["agent", "model", "history"]
+        assert {thread for _, thread in seen} == {threading.current_thread()}
+
+    def test_failure_is_raised_and_dependents_never_start(self):
+        dependent = MagicMock()
+        preflight = Preflight()
+        preflight.add("agent", MagicMock(side_effect=ValueError("no access")))
+        preflight.add("attachments", lambda: "loaded")
+        preflight.add("model", dependent, after=("agent",))
+        with pytest.raises(ValueError, match="no access"):
+            preflight.run(concurrency=4)
+        dependent.assert_not_called()
+        assert preflight.results == {"attachments": "loaded"}
+
+    def test_steps_keep_the_callers_log_context(self):
+        token = log_context.bind(activity_id="act-1")
+        try:
+            preflight = Preflight()
+            preflight.add("a", lambda: dict(log_context.snapshot()))
+            preflight.add("b", lambda: dict(log_context.snapshot()))
+            results = preflight.run(concurrency=2)
+        finally:
+            log_context.reset(token)
+        assert results["a"]["activity_id"] == results["b"]["activity_id"] == "act-1"
+
+    def test_later_run_executes_only_new_steps(self):
+        agent = MagicMock(return_value="cfg")
+        preflight = Preflight()
+        preflight.add("agent", agent)
+        preflight.run(concurrency=4)
+        preflight.add("docs", lambda: "docs", after=("agent",))
+        assert preflight.run(concurrency=4) == {"agent": "cfg", "docs": "docs"}
+        agent.assert_called_once()
+        assert set(preflight.timings_ms) == {"agent", "docs", "total"}
+
+    def test_unknown_dependency_is_rejected(self):
+        preflight = Preflight()
+        with pytest.raises(ValueError):
+            preflight.add("docs", lambda: None, after=("history",))
+
+
+@pytest.mark.unit
+class TestBuildAgentPreflight:
+    def test_retrieval_and_tool_prefetch_overlap(self, monkeypatch, caplog):
+        from application.api.answer.services import preflight as preflight_mod
+        from application.api.answer.services.stream_processor import StreamProcessor
+
+        monkeypatch.setattr(preflight_mod, "resolve_concurrency", lambda: 4)
+        barrier = threading.Barrier(2)
+        sp = StreamProcessor.__new__(StreamProcessor)
+        sp.all_sources = []
+        sp.agent_config = {"agent_type": "classic"}
+        sp.initialize = MagicMock()
+
+        def docs(question):
+            barrier.wait(timeout=2)
+            return "text", ["doc"]
+
+        def tools():
+            barrier.wait(timeout=2)
+            return {"t": {}}
+
+        sp.pre_fetch_docs = MagicMock(side_effect=docs)
+        sp.pre_fetch_tools = MagicMock(side_effect=tools)
+        sp.create_agent = MagicMock(return_value="AGENT")
+
+        with caplog.at_level(logging.INFO, logger=preflight_mod.__name__):
+            assert sp.build_agent("q") == "AGENT"
+        sp.create_agent.assert_called_once_with(
+            docs_together="text", docs=["doc"], tools_data={"t": {}}
+        )
+        (record,) = [r for r in caplog.records if hasattr(r, "preflight_ms")]
+        assert {"docs", "tools", "total"} <= set(record.preflight_ms)
+
+    def test_api_key_attachments_load_as_the_key_owner(self, monkeypatch):
+        from application.api.answer.services import preflight as preflight_mod
+        from application.api.answer.services.stream_processor import StreamProcessor
+
+        monkeypatch.setattr(preflight_mod, "resolve_concurrency", lambda: 4)
+        sp = StreamProcessor.__new__(StreamProcessor)
+        sp.data = {"api_key": "key", "attachments": ["att-1"]}
+        sp.initial_user_id = None
+        agent_resolved = threading.Event()
+
+        def configure_agent():
+            # Give an unordered attachments step every chance to run first.
+            agent_resolved.wait(timeout=0.2)
+            sp.initial_user_id = "key-owner"
+
+        sp._configure_agent = configure_agent
+        for step in (
+            "_validate_and_set_model",
+            "_configure_source",
+            "_configure_retriever",
+            "_load_conversation_history",
+        ):
+            setattr(sp, step, MagicMock())
+        sp._get_attachments_content = MagicMock(return_value=[{"id": "att-1"}])
+
+        sp.initialize()
+
+        sp._get_attachments_content.assert_called_once_with(["att-1"], "key-owner")
+        assert sp.attachments == [{"id": "att-1"}]
@@ -318,3 +318,53 @@ class TestUploadIndex:
         assert r.status_code == 200
         assert r.json == {"status": "ok"}
         assert fake_storage.save_file.call_count == 2
+
+    def test_faiss_accepts_binary_sidecar(self, pg_conn):
+        app = _make_app()
+        fake_storage = MagicMock()
+        fake_storage.list_files.return_value = [
+            "indexes/legacy-src-8/index.delta/0001.seg"
+        ]
+        data = {
+            **self._base_form(source_id="legacy-src-8"),
+            "file_faiss": (io.BytesIO(b"faiss-data"), "index.faiss"),
+            "file_docs": (io.BytesIO(b"docs-data"), "index.docs"),
+        }
+        with patch(
+            "application.api.internal.routes.settings.INTERNAL_KEY", _TEST_KEY
+        ), patch(
+            "application.api.internal.routes.settings.VECTOR_STORE", "faiss"
+        ), patch(
+            "application.api.internal.routes.settings.EMBEDDINGS_NAME", "emb"
+        ), patch(
+            "application.api.internal.routes.StorageCreator.get_storage",
+            return_value=fake_storage,
+        ), _patch_db(pg_conn):
+            with app.test_client() as c:
+                r = c.post(
+                    "/api/upload_index",
+                    headers=_AUTH,
+                    data=data,
+                    content_type="multipart/form-data",
+                )
+        assert r.status_code == 200
+        saved = [call.args[1] for call in fake_storage.save_file.call_args_list]
+        assert saved == ["indexes/legacy-src-8/index.faiss", "indexes/legacy-src-8/index.docs"]
+        # Leftovers of the previous index go first; then each file is
+        # unlinked before it is written, so a worker mapping the old
+        # sidecar never sees it truncated.
+        writes = [
+            (name, args[-1])
+            for name, args, _ in fake_storage.method_calls
+            if name in ("delete_file", "save_file")
+        ]
+        assert writes == [
+            ("delete_file", "indexes/legacy-src-8/index.json"),
+            ("delete_file", "indexes/legacy-src-8/index.pkl"),
+            ("delete_file", "indexes/legacy-src-8/index.bm25"),
+            ("delete_file", "indexes/legacy-src-8/index.delta/0001.seg"),
+            ("delete_file", "indexes/legacy-src-8/index.faiss"),
+            ("save_file", "indexes/legacy-src-8/index.faiss"),
+            ("delete_file", "indexes/legacy-src-8/index.docs"),
+            ("save_file", "indexes/legacy-src-8/index.docs"),
+        ]
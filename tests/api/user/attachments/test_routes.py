@@ -319,7 +319,7 @@ class TestLiveSpeechToTextEndpoint:
             session_id = _get_response_json(start_response)["session_id"]
 
         mock_stt = MagicMock()
-        mock_stt.transcribe.side_effect = [
+        mock_stt.transcribe_chunk.side_effect = [
             {
                 "text": "hello this is a longer test phrase for transcript stabilization today now",
                 "language": "ru",
@@ -465,7 +465,7 @@ class TestLiveSpeechToTextEndpoint:
             session_id = _get_response_json(start_response)["session_id"]
 
         mock_stt = MagicMock()
-        mock_stt.transcribe.return_value = {
+        mock_stt.transcribe_chunk.return_value = {
             "text": "hello there",
             "language": "ru",
             "duration_s": 1.0,
@@ -1280,7 +1280,7 @@ class TestLiveSpeechToTextAdditional:
             session_id = _get_response_json(start_response)["session_id"]
 
         mock_stt = MagicMock()
-        mock_stt.transcribe.side_effect = Exception("transcription error")
+        mock_stt.transcribe_chunk.side_effect = Exception("transcription error")
         mock_create_stt.return_value = mock_stt
 
         chunk_resource = LiveSpeechToTextChunk()
@@ -1335,7 +1335,7 @@ class TestLiveSpeechToTextAdditional:
             session_id = _get_response_json(start_response)["session_id"]
 
         mock_stt = MagicMock()
-        mock_stt.transcribe.return_value = {
+        mock_stt.transcribe_chunk.return_value = {
             "text": "hola mundo esto es una prueba larga para pasar las validaciones de texto",
             "language": "es",
         }
@@ -1504,7 +1504,7 @@ class TestLiveSpeechToTextAdditional:
             session_id = _get_response_json(start_response)["session_id"]
 
         mock_stt = MagicMock()
-        mock_stt.transcribe.return_value = {
+        mock_stt.transcribe_chunk.return_value = {
             "text": "hello this is a longer test phrase for transcript stabilization today now",
             "language": "en",
             "duration_s": 1.0,
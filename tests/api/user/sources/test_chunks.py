@@ -24,6 +24,18 @@ def _patch_db(conn):
         yield
 
 
+def _fake_store(chunks):
+    """A store mock whose ``get_chunks_page`` is the real base default."""
+    from application.vectorstore.base import BaseVectorStore
+
+    store = MagicMock()
+    store.get_chunks.return_value = chunks
+    store.get_chunks_page.side_effect = (
+        lambda **kwargs: BaseVectorStore.get_chunks_page(store, **kwargs)
+    )
+    return store
+
+
 def _seed_source(pg_conn, user="u", name="src"):
     from application.storage.db.repositories.sources import SourcesRepository
     return SourcesRepository(pg_conn).create(name, user_id=user)
@@ -102,11 +114,10 @@ class TestGetChunks:
         user = "u-chunks"
         src = _seed_source(pg_conn, user=user)
 
-        fake_store = MagicMock()
-        fake_store.get_chunks.return_value = [
+        fake_store = _fake_store([
             {"text": f"chunk {i}", "metadata": {"title": f"T{i}"}}
             for i in range(5)
-        ]
+        ])
 
         with _patch_db(pg_conn), patch(
             "application.api.user.sources.chunks.get_vector_store",
@@ -128,11 +139,10 @@ class TestGetChunks:
         user = "u-path"
         src = _seed_source(pg_conn, user=user)
 
-        fake_store = MagicMock()
-        fake_store.get_chunks.return_value = [
+        fake_store = _fake_store([
             {"text": "a", "metadata": {"source": "/a/b/file.txt"}},
             {"text": "b", "metadata": {"source": "/other.txt"}},
-        ]
+        ])
 
         with _patch_db(pg_conn), patch(
             "application.api.user.sources.chunks.get_vector_store",
@@ -152,11 +162,10 @@ class TestGetChunks:
         user = "u-srch"
         src = _seed_source(pg_conn, user=user)
 
-        fake_store = MagicMock()
-        fake_store.get_chunks.return_value = [
+        fake_store = _fake_store([
             {"text": "the cat", "metadata": {"title": ""}},
             {"text": "a dog", "metadata": {"title": ""}},
-        ]
+        ])
 
         with _patch_db(pg_conn), patch(
             "application.api.user.sources.chunks.get_vector_store",
@@ -170,6 +179,54 @@ class TestGetChunks:
         assert response.status_code == 200
         assert response.json["total"] == 1
 
+    def test_pages_in_the_store_not_the_handler(self, app, pg_conn):
+        from application.api.user.sources.chunks import GetChunks
+
+        user = "u-page"
+        src = _seed_source(pg_conn, user=user)
+
+        fake_store = MagicMock()
+        fake_store.get_chunks_page.return_value = ([{"text": "c"}], 41)
+
+        with _patch_db(pg_conn), patch(
+            "application.api.user.sources.chunks.get_vector_store",
+            return_value=fake_store,
+        ), app.test_request_context(
+            f"/api/get_chunks?id={src['id']}&page=3&per_page=20&path=a.md&search=Cat"
+        ):
+            from flask import request
+            request.decoded_token = {"sub": user}
+            response = GetChunks().get()
+        assert response.status_code == 200
+        assert response.json["total"] == 41
+        fake_store.get_chunks_page.assert_called_once_with(
+            offset=40, limit=20, path_suffix="a.md", search="cat", after=None
+        )
+        fake_store.get_chunks.assert_not_called()
+
+    def test_after_cursor_is_forwarded_and_returned(self, app, pg_conn):
+        from application.api.user.sources.chunks import GetChunks
+
+        user = "u-after"
+        src = _seed_source(pg_conn, user=user)
+
+        fake_store = MagicMock()
+        fake_store.get_chunks_page.return_value = (
+            [{"doc_id": "11", "text": "a"}, {"doc_id": "12", "text": "b"}], 30
+        )
+
+        with _patch_db(pg_conn), patch(
+            "application.api.user.sources.chunks.get_vector_store",
+            return_value=fake_store,
+        ), app.test_request_context(
+            f"/api/get_chunks?id={src['id']}&page=2&per_page=2&after=10"
+        ):
+            from flask import request
+            request.decoded_token = {"sub": user}
+            response = GetChunks().get()
+        assert response.json["next_after"] == "12"
+        assert fake_store.get_chunks_page.call_args.kwargs["after"] == "10"
+
     def test_returns_500_on_vector_store_error(self, app, pg_conn):
         from application.api.user.sources.chunks import GetChunks
 
@@ -286,7 +286,7 @@ class TestSetupPeriodicTasks:
 
         setup_periodic_tasks(sender)
 
-        assert sender.add_periodic_task.call_count == 14
+        assert sender.add_periodic_task.call_count == 15
 
         calls = sender.add_periodic_task.call_args_list
 
@@ -327,6 +327,9 @@ class TestSetupPeriodicTasks:
         # stale workflow-run reaper (5m)
         assert calls[13][0][0] == timedelta(seconds=300)
         assert calls[13][1].get("name") == "reap-stale-workflow-runs"
+        # embedding_cache retention sweep (24h)
+        assert calls[14][0][0] == timedelta(hours=24)
+        assert calls[14][1].get("name") == "cleanup-embedding-cache"
 
 
 class TestMcpOauthTask:
@@ -577,6 +580,43 @@ class TestCleanupPendingToolState:
         }
 
 
+class TestCleanupEmbeddingCacheTask:
+    @pytest.mark.unit
+    def test_skips_when_postgres_uri_missing(self, monkeypatch):
+        from application.api.user.tasks import cleanup_embedding_cache
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "POSTGRES_URI", None, raising=False)
+
+        result = cleanup_embedding_cache.run()
+        assert result == {"deleted": 0, "skipped": "POSTGRES_URI not set"}
+
+    @pytest.mark.unit
+    def test_skips_when_backend_is_not_postgres(self, monkeypatch):
+        from application.api.user.tasks import cleanup_embedding_cache
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "POSTGRES_URI", "postgresql://x", raising=False)
+        monkeypatch.setattr(settings, "EMBEDDING_CACHE_BACKEND", "sqlite")
+
+        result = cleanup_embedding_cache.run()
+        assert result["deleted"] == 0
+        assert "not postgres" in result["skipped"]
+
+
+class TestBackfillPgvectorTsvectorTask:
+    @pytest.mark.unit
+    def test_delegates_to_the_bootstrap_backfill(self):
+        from application.api.user.tasks import backfill_pgvector_tsvector
+
+        with patch(
+            "application.storage.db.bootstrap.backfill_vector_tsvector",
+            return_value={"filled": 3},
+        ) as backfill:
+            assert backfill_pgvector_tsvector.run() == {"filled": 3}
+        backfill.assert_called_once()
+
+
 class TestCleanupMessageEventsTask:
     """Retention janitor delegates to MessageEventsRepository.cleanup_older_than."""
 
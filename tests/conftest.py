@@ -162,6 +162,78 @@ def _no_real_redis(monkeypatch):
     monkeypatch.setattr("application.cache._pubsub_redis_creation_failed", True)
 
 
+@pytest.fixture(autouse=True)
+def _no_llm_client_pool(monkeypatch):
+    """Build provider SDK clients per LLM, as before the client pool.
+
+    The pool is process-wide, so a client built against one test's patched
+    ``OpenAI``/``Anthropic`` would otherwise be handed to the next test.
+    Tests of the pool itself install their own ``LLMClientPool``.
+    """
+    monkeypatch.setattr("application.llm.client_pool._POOL", None)
+    monkeypatch.setattr("application.llm.client_pool.resolve_max_clients", lambda: 0)
+
+
+@pytest.fixture(autouse=True)
+def _no_mcp_session_pool(monkeypatch):
+    """Connect MCP clients per operation, as before the session pool.
+
+    Pooled sessions outlive a test and would hand one test's mocked client
+    to the next. Tests of the pool itself build their own manager.
+    """
+    monkeypatch.setattr("application.agents.tools.mcp_sessions._MANAGER", None)
+    monkeypatch.setattr(
+        "application.agents.tools.mcp_sessions.resolve_max_sessions", lambda: 0
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_mcp_tools_cache(monkeypatch):
+    """List MCP tools live: a developer's Redis must not answer discovery."""
+    monkeypatch.setattr(
+        "application.agents.tools.mcp_tools_cache.resolve_ttl", lambda: 0
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_semantic_cache(monkeypatch):
+    """Keep agents off the semantic answer cache and a developer's Redis."""
+    monkeypatch.setattr("application.semantic_cache._CACHE", None)
+    monkeypatch.setattr("application.semantic_cache.resolve_ttl", lambda: 0)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_graph_adjacency_cache():
+    """Start every test without cached GraphRAG adjacency."""
+    from application.graphrag.ppr import clear_adjacency_cache
+
+    clear_adjacency_cache()
+    yield
+    clear_adjacency_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stt_model_pool(monkeypatch):
+    """Give every test its own faster-whisper model pool."""
+    monkeypatch.setattr("application.stt.model_pool._POOL", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_token_cache():
+    """Start every test with an empty token-count cache.
+
+    Counts are memoized process-wide by text digest, so one test's patched
+    tokenizer would otherwise leak its counts into the next.
+    """
+    from application.api.answer.services.compression.token_counter import (
+        clear_token_cache,
+    )
+
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
 @pytest.fixture
 def mock_llm():
     llm = Mock()
@@ -298,6 +298,10 @@ class TestExtractionLive:
                 good,
             ])
             _install_stub_llm(monkeypatch, llm)
+            # Responses are handed out in call order; keep calls in chunk order.
+            monkeypatch.setattr(
+                extraction_module.settings, "GRAPHRAG_EXTRACTION_CONCURRENCY", 1
+            )
 
             summary = extract_graph_for_source(
                 source_id,
@@ -344,6 +348,215 @@ class TestExtractionLive:
             store.delete_by_source(source_id)
 
 
+class _TextLLM:
+    """Thread-safe stub LLM answering by chunk text (``text -> response``)."""
+
+    def __init__(self, responses, barrier=None):
+        self.responses = responses
+        self.barrier = barrier
+        self.model_id = "stub-model"
+        self.gen_calls = []
+
+    def gen(self, model=None, messages=None, **kwargs):
+        text = messages[-1]["content"].split("\n")[1]
+        self.gen_calls.append(text)
+        if self.barrier is not None:
+            self.barrier.wait(timeout=2)
+        response = self.responses[text]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _fake_store(chunk_ids=None):
+    from unittest.mock import MagicMock
+
+    store = MagicMock()
+    store.pending_chunks.side_effect = lambda source_id, ids: list(ids)
+    store.apply_chunks.side_effect = lambda source_id, items, emb: [
+        (len(entities), len(relationships)) for _, entities, relationships in items
+    ]
+    store.apply_chunk.side_effect = lambda source_id, cid, entities, rels, emb: (
+        len(entities), len(rels),
+    )
+    return store
+
+
+def _entity(name):
+    return _extraction_json(
+        entities=[{"name": name, "type": "t", "description": "d"}],
+        relationships=[],
+    )
+
+
+@pytest.mark.unit
+class TestConcurrentExtraction:
+    @pytest.fixture
+    def store(self, monkeypatch):
+        store = _fake_store()
+        monkeypatch.setattr(
+            "application.graphrag.store.GraphStore", lambda *a, **k: store
+        )
+        return store
+
+    @pytest.fixture
+    def embedding(self, monkeypatch):
+        embedding = _StubEmbedding()
+        embedding.calls = []
+        original = embedding.embed_documents
+
+        def _embed(documents):
+            embedding.calls.append(list(documents))
+            return original(documents)
+
+        embedding.embed_documents = _embed
+        monkeypatch.setattr(extraction_module, "get_embeddings", lambda: embedding)
+        return embedding
+
+    def _run(self, chunks, **kwargs):
+        return extract_graph_for_source(
+            "sid", user="owner-1", chunks=chunks, config=SourceConfig(),
+            request_id="req-1", **kwargs,
+        )
+
+    def test_extraction_calls_overlap(self, monkeypatch, store, embedding):
+        import threading
+
+        monkeypatch.setattr(
+            extraction_module.settings, "GRAPHRAG_EXTRACTION_CONCURRENCY", 3
+        )
+        llm = _TextLLM(
+            {f"text {i}": _entity(f"E{i}") for i in range(3)},
+            barrier=threading.Barrier(3),
+        )
+        _install_stub_llm(monkeypatch, llm)
+
+        summary = self._run([_chunk(f"c{i}", f"text {i}") for i in range(3)])
+
+        assert summary["chunks_processed"] == 3
+        assert summary["nodes"] == 3
+
+    def test_in_flight_calls_use_their_own_llm(self, monkeypatch, store, embedding):
+        import threading
+
+        monkeypatch.setattr(
+            extraction_module.settings, "GRAPHRAG_EXTRACTION_CONCURRENCY", 2
+        )
+        barrier = threading.Barrier(2)
+        built = []
+
+        def _create(*args, **kwargs):
+            llm = _TextLLM({f"text {i}": _entity("E") for i in range(4)}, barrier)
+            built.append(llm)
+            return llm
+
+        monkeypatch.setattr(
+            extraction_module.LLMCreator, "create_llm", staticmethod(_create)
+        )
+
+        self._run([_chunk(f"c{i}", f"text {i}") for i in range(4)])
+
+        assert len(built) == 2
+        assert all(len(llm.gen_calls) == 2 for llm in built)
+
+    def test_finished_chunks_are_written_as_one_group(
+        self, monkeypatch, store, embedding
+    ):
+        monkeypatch.setattr(
+            extraction_module.settings, "GRAPHRAG_EXTRACTION_CONCURRENCY", 1
+        )
+        llm = _TextLLM({f"text {i}": _entity(f"E{i}") for i in range(4)})
+        _install_stub_llm(monkeypatch, llm)
+        progress = []
+
+        summary = self._run(
+            [_chunk(f"c{i}", f"text {i}") for i in range(4)] + [_chunk("c4", "")],
+            progress_cb=progress.append,
+        )
+
+        assert summary["chunks_processed"] == 5
+        store.apply_chunks.assert_called_once()
+        assert [item[0] for item in store.apply_chunks.call_args[0][1]] == [
+            "c0", "c1", "c2", "c3", "c4",
+        ]
+        store.mark_chunks.assert_called_once_with(
+            "sid", [(f"c{i}", "done") for i in range(5)]
+        )
+        assert embedding.calls == [["E0", "E1", "E2", "E3"]]
+        assert [p["current"] for p in progress] == [1, 2, 3, 4, 5]
+
+    def test_write_batch_bounds_the_group(self, monkeypatch, store, embedding):
+        monkeypatch.setattr(
+            extraction_module.settings, "GRAPHRAG_EXTRACTION_CONCURRENCY", 1
+        )
+        monkeypatch.setattr(
+            extraction_module.settings, "GRAPHRAG_EXTRACTION_WRITE_BATCH", 2
+        )
+        _install_stub_llm(
+            monkeypatch, _TextLLM({f"text {i}": _entity("E") for i in range(5)})
+        )
+
+        self._run([_chunk(f"c{i}", f"text {i}") for i in range(5)])
+
+        assert [len(c[0][1]) for c in store.apply_chunks.call_args_list] == [2, 2, 1]
+
+    def test_failed_group_write_retries_chunk_by_chunk(
+        self, monkeypatch, store, embedding
+    ):
+        monkeypatch.setattr(
+            extraction_module.settings, "GRAPHRAG_EXTRACTION_CONCURRENCY", 1
+        )
+        store.apply_chunks.side_effect = RuntimeError("deadlock")
+
+        def _apply(source_id, chunk_id, entities, rels, emb):
+            if chunk_id == "c1":
+                raise RuntimeError("bad row")
+            return len(entities), len(rels)
+
+        store.apply_chunk.side_effect = _apply
+        _install_stub_llm(
+            monkeypatch,
+            _TextLLM({
+                "text 0": _entity("A"),
+                "text 1": _entity("B"),
+                "text 2": RuntimeError("model exploded"),
+            }),
+        )
+
+        summary = self._run([_chunk(f"c{i}", f"text {i}") for i in range(3)])
+
+        assert summary["chunks_processed"] == 1
+        assert summary["failed_chunks"] == 2
+        store.mark_chunks.assert_called_once_with(
+            "sid", [("c0", "done"), ("c1", "failed"), ("c2", "failed")]
+        )
+
+
+@pytest.mark.unit
+class TestRateLimiting:
+    def test_bucket_spaces_calls_after_the_burst(self):
+        import time
+
+        bucket = extraction_module._TokenBucket(rate=50.0, capacity=1)
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        assert time.monotonic() - started >= 0.05
+
+    def test_limiter_is_shared_per_provider(self, monkeypatch):
+        monkeypatch.setattr(extraction_module, "_RATE_LIMITERS", {})
+        monkeypatch.setattr(
+            extraction_module.settings, "GRAPHRAG_EXTRACTION_REQUESTS_PER_MINUTE", 600
+        )
+        openai = extraction_module._rate_limiter("openai")
+        assert openai is extraction_module._rate_limiter("openai")
+        assert openai is not extraction_module._rate_limiter("anthropic")
+        assert openai.rate == 10.0
+
+    def test_unlimited_by_default(self):
+        assert extraction_module._rate_limiter("openai") is None
+
+
 @pytest.mark.unit
 class TestExtractionTokenUsage:
     def test_llm_tagged_for_token_usage(self, monkeypatch):
@@ -0,0 +1,174 @@
+"""Tests for the sparse PPR engine and its per-source adjacency cache."""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import MagicMock
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from application.graphrag import ppr
+
+
+def _graph(node_count=30, edge_count=60, seed=7):
+    rng = random.Random(seed)
+    nodes = [{"id": f"n{i}", "doc_freq": rng.randint(0, 5)} for i in range(node_count)]
+    # The last node stays isolated (dangling); one self-loop is included.
+    edges = [{"src_node_id": "n0", "dst_node_id": "n0", "weight": 2.0}]
+    for _ in range(edge_count):
+        a, b = rng.sample(range(node_count - 1), 2)
+        edges.append(
+            {"src_node_id": f"n{a}", "dst_node_id": f"n{b}", "weight": rng.uniform(0.5, 3)}
+        )
+    return nodes, edges
+
+
+def _networkx_ppr(nodes, edges, seeds):
+    graph = nx.Graph()
+    for node in nodes:
+        graph.add_node(node["id"])
+    for edge in edges:
+        src, dst = edge["src_node_id"], edge["dst_node_id"]
+        weight = float(edge["weight"])
+        if graph.has_edge(src, dst):
+            weight = max(weight, graph[src][dst]["weight"])
+        graph.add_edge(src, dst, weight=weight)
+    personalization = {n: seeds.get(n, 0.0) for n in graph.nodes}
+    return nx.pagerank(graph, personalization=personalization, weight="weight")
+
+
+def _store(nodes, edges):
+    store = MagicMock()
+    store.get_source_graph.return_value = {"nodes": nodes, "edges": edges}
+    return store
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value).encode()
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+@pytest.mark.unit
+class TestPersonalizedPageRank:
+    def test_matches_networkx(self):
+        nodes, edges = _graph()
+        seeds = {"n1": 0.9, "n4": 0.4}
+        adjacency = ppr.build_adjacency(nodes, edges)
+
+        (ranks,) = ppr.pagerank_across_sources([(adjacency, seeds)])
+
+        expected = _networkx_ppr(nodes, edges, seeds)
+        for node_id, rank in expected.items():
+            assert ranks[adjacency.index[node_id]] == pytest.approx(rank, abs=1e-5)
+
+    def test_seed_columns_solve_together(self):
+        nodes, edges = _graph()
+        adjacency = ppr.build_adjacency(nodes, edges)
+        seed_sets = [{"n1": 1.0}, {"n2": 0.5, "n9": 0.5}, {}]
+        personalization = np.column_stack(
+            [adjacency.personalization(seeds) for seeds in seed_sets]
+        )
+
+        ranks = ppr.personalized_pagerank(
+            adjacency.transition_t, adjacency.dangling, personalization
+        )
+
+        for column, seeds in enumerate(seed_sets):
+            (single,) = ppr.pagerank_across_sources([(adjacency, seeds)])
+            np.testing.assert_allclose(ranks[:, column], single, atol=1e-4)
+        assert np.allclose(ranks.sum(axis=0), 1.0)
+
+    def test_sources_stay_separate_in_one_pass(self):
+        first = ppr.build_adjacency(*_graph(seed=1))
+        second = ppr.build_adjacency(*_graph(node_count=12, edge_count=20, seed=2))
+        empty = ppr.build_adjacency([], [])
+
+        together = ppr.pagerank_across_sources(
+            [(first, {"n3": 1.0}), (empty, {}), (second, {"n5": 1.0})]
+        )
+
+        (alone,) = ppr.pagerank_across_sources([(second, {"n5": 1.0})])
+        np.testing.assert_allclose(together[2], alone, atol=1e-4)
+        assert together[0].sum() == pytest.approx(1.0)
+        assert len(together[1]) == 0
+
+    def test_heaviest_duplicate_edge_wins_and_unknown_endpoints_are_dropped(self):
+        adjacency = ppr.build_adjacency(
+            [{"id": "a"}, {"id": "b"}, {"id": "c"}],
+            [
+                {"src_node_id": "a", "dst_node_id": "b", "weight": 1.0},
+                {"src_node_id": "b", "dst_node_id": "a", "weight": 4.0},
+                {"src_node_id": "a", "dst_node_id": "c", "weight": 2.0},
+                {"src_node_id": "a", "dst_node_id": "ghost", "weight": 9.0},
+            ],
+        )
+        # Column ``a`` of the transposed transition matrix: a's out-weights.
+        column = adjacency.transition_t[:, adjacency.index["a"]].toarray().ravel()
+        assert column[adjacency.index["b"]] == pytest.approx(4 / 6)
+        assert column[adjacency.index["c"]] == pytest.approx(2 / 6)
+
+    def test_scores_apply_idf_and_limit(self):
+        adjacency = ppr.build_adjacency(
+            [{"id": "hub", "doc_freq": 1000}, {"id": "leaf", "doc_freq": 1}, {"id": "x"}],
+            [],
+        )
+        scores = adjacency.scores(np.array([0.5, 0.5, 0.0]), limit=1)
+        assert list(scores) == ["leaf"]
+
+
+@pytest.mark.unit
+class TestAdjacencyCache:
+    def test_cached_until_invalidated(self):
+        store = _store(*_graph())
+        first = ppr.get_adjacency(store, "src")
+        assert ppr.get_adjacency(store, "src") is first
+        ppr.invalidate_adjacency("src")
+        assert ppr.get_adjacency(store, "src") is not first
+        assert store.get_source_graph.call_count == 2
+
+    def test_other_processes_writes_are_seen_through_redis(self, monkeypatch):
+        redis = _FakeRedis()
+        monkeypatch.setattr(ppr, "get_redis_instance", lambda: redis)
+        store = _store(*_graph())
+        first = ppr.get_adjacency(store, "src")
+        assert ppr.get_adjacency(store, "src") is first
+
+        # Another process bumps the version without touching our cache.
+        redis.incr(ppr._version_key("src"))
+
+        assert ppr.get_adjacency(store, "src") is not first
+
+    def test_entries_expire_without_redis(self, monkeypatch):
+        monkeypatch.setattr(
+            "application.core.settings.settings.GRAPHRAG_ADJACENCY_CACHE_TTL", 0
+        )
+        store = _store(*_graph())
+        ppr.get_adjacency(store, "src")
+        ppr.get_adjacency(store, "src")
+        assert store.get_source_graph.call_count == 2
+
+    def test_least_recently_used_source_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(
+            "application.core.settings.settings.GRAPHRAG_ADJACENCY_CACHE_SOURCES", 2
+        )
+        store = _store(*_graph())
+        for source_id in ("a", "b", "a", "c"):
+            ppr.get_adjacency(store, source_id)
+        assert list(ppr._CACHE) == ["a", "c"]
+
+    def test_failed_fetch_is_not_cached(self):
+        store = MagicMock()
+        store.get_source_graph.side_effect = RuntimeError("db down")
+        with pytest.raises(RuntimeError):
+            ppr.get_adjacency(store, "src")
+        assert "src" not in ppr._CACHE
@@ -233,6 +233,26 @@ class TestGraphStoreLive:
         finally:
             store.delete_by_source(source_id)
 
+    def test_search_nodes_by_embedding_many_keeps_k_per_source(self, store):
+        a, b, c = (str(uuid.uuid4()) for _ in range(3))
+        try:
+            near_a = store.upsert_node(a, "Near", "near", "thing", "d", _embedding(1.0))
+            store.upsert_node(a, "Far", "far", "thing", "d", _embedding(-1.0))
+            near_b = store.upsert_node(b, "Near", "near", "thing", "d", _embedding(0.9))
+
+            results = store.search_nodes_by_embedding_many(
+                [a, b, c], _embedding(1.0), k=1
+            )
+
+            assert [row["id"] for row in results[a]] == [near_a]
+            assert [row["id"] for row in results[b]] == [near_b]
+            assert results[c] == []
+            # Agrees with the per-source query it replaces.
+            assert results[a] == store.search_nodes_by_embedding(a, _embedding(1.0), k=1)
+        finally:
+            store.delete_by_source(a)
+            store.delete_by_source(b)
+
     def test_get_subgraph_bounded(self, store, source_id):
         try:
             a = store.upsert_node(source_id, "A", "a")
@@ -593,8 +613,10 @@ class TestGraphSchemaIsBootOwned:
             lambda s: s.add_edge("sid", "a", "b"),
             lambda s: s.link_node_chunk("sid", "n", "c1"),
             lambda s: s.apply_chunk("sid", "c1", [], [], {}),
+            lambda s: s.apply_chunks("sid", [("c1", [], [])], {}),
             lambda s: s.set_node_degrees("sid"),
             lambda s: s.mark_chunk("sid", "c1", "done"),
+            lambda s: s.mark_chunks("sid", [("c1", "done")]),
             lambda s: s.delete_by_source("sid"),
         ],
         ids=[
@@ -602,8 +624,10 @@ class TestGraphSchemaIsBootOwned:
             "add_edge",
             "link_node_chunk",
             "apply_chunk",
+            "apply_chunks",
             "set_node_degrees",
             "mark_chunk",
+            "mark_chunks",
             "delete_by_source",
         ],
     )
@@ -616,6 +640,62 @@ class TestGraphSchemaIsBootOwned:
 
         assert store._ensure_tables.call_count == 1
 
+    def test_apply_chunks_commits_once_for_the_group(self):
+        store, cursor = self._mock_store()
+        entity = {"name": "Ada", "normalized_name": "ada"}
+
+        counts = store.apply_chunks(
+            "sid",
+            [("c1", [entity], []), ("c2", [entity], [{"source": "Ada", "target": "X"}])],
+            {},
+        )
+
+        assert counts == [(1, 0), (1, 1)]
+        store._connection.commit.assert_called_once()
+
+    def test_apply_chunks_rolls_back_the_whole_group(self):
+        store, cursor = self._mock_store()
+        cursor.execute.side_effect = [None, None, RuntimeError("boom")]
+        entity = {"name": "Ada", "normalized_name": "ada"}
+
+        with pytest.raises(RuntimeError):
+            store.apply_chunks("sid", [("c1", [entity], []), ("c2", [entity], [])], {})
+
+        store._connection.commit.assert_not_called()
+        store._connection.rollback.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda s: s.apply_chunks("sid", [("c1", [], [])], {}),
+            lambda s: s.set_node_degrees("sid"),
+            lambda s: s.delete_by_source("sid"),
+        ],
+        ids=["apply_chunks", "set_node_degrees", "delete_by_source"],
+    )
+    def test_graph_writes_invalidate_cached_adjacency(self, call, monkeypatch):
+        invalidate = MagicMock()
+        monkeypatch.setattr(
+            "application.graphrag.store.invalidate_adjacency", invalidate
+        )
+        store, _ = self._mock_store()
+
+        call(store)
+
+        invalidate.assert_called_once_with("sid")
+
+    def test_mark_chunks_writes_all_statuses_in_one_statement(self):
+        store, cursor = self._mock_store()
+
+        store.mark_chunks("sid", [("c1", "done"), ("c2", "failed")])
+        store.mark_chunks("sid", [])
+
+        cursor.executemany.assert_called_once()
+        assert cursor.executemany.call_args[0][1] == [
+            ("sid", "c1", "done"), ("sid", "c2", "failed"),
+        ]
+        store._connection.commit.assert_called_once()
+
     @pytest.mark.parametrize(
         "call",
         [
@@ -623,6 +703,7 @@ class TestGraphSchemaIsBootOwned:
             lambda s: s.count_nodes_many(["sid"]),
             lambda s: s.get_node_by_normalized("sid", "n"),
             lambda s: s.search_nodes_by_embedding("sid", _embedding(1.0)),
+            lambda s: s.search_nodes_by_embedding_many(["sid"], _embedding(1.0)),
             lambda s: s.get_subgraph("sid", ["n"]),
             lambda s: s.get_graph_overview("sid"),
             lambda s: s.get_chunk_ids_for_nodes("sid", ["n"]),
@@ -634,6 +715,7 @@ class TestGraphSchemaIsBootOwned:
             "count_nodes_many",
             "get_node_by_normalized",
             "search_nodes_by_embedding",
+            "search_nodes_by_embedding_many",
             "get_subgraph",
             "get_graph_overview",
             "get_chunk_ids_for_nodes",
@@ -869,3 +951,62 @@ class TestCountNodesMany:
         store, _, _ = self._store_with_mock_conn([(source_id.lower(), 3)])
 
         assert store.count_nodes_many([source_id]) == {source_id: 3}
+
+
+@pytest.mark.unit
+class TestSearchNodesByEmbeddingMany:
+    """One ``LATERAL`` query replaces the retriever's per-source seed search."""
+
+    def _store_with_mock_conn(self, rows):
+        store = GraphStore.__new__(GraphStore)
+        cursor = MagicMock()
+        cursor.fetchall.return_value = rows
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        store._connection = conn
+        store._get_connection = lambda: conn
+        store._tables_ensured = True
+        return store, cursor, conn
+
+    def test_groups_rows_by_source_in_one_query(self):
+        source_a = str(uuid.uuid4())
+        source_b = str(uuid.uuid4()).upper()
+        store, cursor, _ = self._store_with_mock_conn(
+            [
+                (source_a, "n1", "N1", "d1", 0.1),
+                (source_a, "n2", "N2", "d2", 0.4),
+                (source_b.lower(), "n3", "N3", "d3", 0.2),
+            ]
+        )
+
+        results = store.search_nodes_by_embedding_many(
+            [source_a, source_b, "c"], [0.1, 0.2], k=2
+        )
+
+        assert [row["id"] for row in results[source_a]] == ["n1", "n2"]
+        # Postgres returns canonical lowercase UUID text; keys keep the
+        # caller's spelling.
+        assert results[source_b] == [
+            {"id": "n3", "name": "N3", "description": "d3", "distance": 0.2}
+        ]
+        assert results["c"] == []
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args.args
+        assert "CROSS JOIN LATERAL" in sql
+        assert params == ([source_a, source_b, "c"], [0.1, 0.2], [0.1, 0.2], 2)
+
+    def test_empty_input_short_circuits(self):
+        store, cursor, _ = self._store_with_mock_conn([])
+
+        assert store.search_nodes_by_embedding_many([None, ""], [0.1]) == {}
+        cursor.execute.assert_not_called()
+
+    def test_a_failed_query_reports_no_seeds(self):
+        store, cursor, conn = self._store_with_mock_conn([])
+        cursor.execute.side_effect = RuntimeError("no such table")
+
+        assert store.search_nodes_by_embedding_many(["a", "b"], [0.1]) == {
+            "a": [],
+            "b": [],
+        }
+        conn.rollback.assert_called_once()
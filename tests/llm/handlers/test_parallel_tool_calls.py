@@ -0,0 +1,304 @@
+"""Tests for concurrent execution of parallel-safe tool calls in one batch."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from application.agents.tool_executor import ToolExecutor
+from application.llm.handlers.base import LLMHandler, ToolCall
+
+
+class _Handler(LLMHandler):
+    def parse_response(self, response):
+        return response
+
+    def create_tool_message(self, tool_call, result):
+        return {"role": "tool", "tool_call_id": tool_call.id, "content": str(result)}
+
+    def _iterate_stream(self, response):
+        yield from response
+
+
+class _Executor:
+    """Just enough of ToolExecutor for handle_tool_calls."""
+
+    def __init__(self, safe, pauses=()):
+        self.safe = set(safe)
+        self.pauses = set(pauses)
+        self.tool_calls = []
+        self._name_to_tool = {}
+        self.pause_checks = []
+
+    def is_parallel_safe(self, tools_dict, call, llm_class_name):
+        return call.name in self.safe
+
+    def check_pause(self, tools_dict, call, llm_class_name):
+        self.pause_checks.append(call.id)
+        if call.name in self.pauses:
+            return {
+                "call_id": call.id,
+                "name": call.name,
+                "tool_name": call.name,
+                "action_name": call.name,
+                "llm_name": call.name,
+                "arguments": {},
+                "pause_type": "awaiting_approval",
+            }
+        return None
+
+
+def _agent(executor, run):
+    agent = Mock()
+    agent.llm = Mock()
+    agent.tool_executor = executor
+    agent._check_context_limit = Mock(return_value=False)
+
+    def _execute(tools_dict, call):
+        yield {"type": "tool_call", "data": {"call_id": call.id, "status": "pending"}}
+        result = run(call)
+        executor.tool_calls.append({"call_id": call.id, "result": result})
+        return result, call.id
+
+    agent._execute_tool_action = _execute
+    return agent
+
+
+def _drain(gen):
+    events = []
+    while True:
+        try:
+            events.append(next(gen))
+        except StopIteration as e:
+            return events, e.value
+
+
+@pytest.fixture(autouse=True)
+def _unbounded_results(monkeypatch):
+    # Keep _bound_tool_response_for_llm from loading a tokenizer.
+    monkeypatch.setattr(
+        "application.core.settings.settings.TOOL_RESULT_MAX_TOKENS", 0, raising=False
+    )
+
+
+@pytest.fixture
+def concurrency(monkeypatch):
+    monkeypatch.setattr(
+        "application.core.settings.settings.TOOL_CALL_CONCURRENCY", 4
+    )
+
+
+@pytest.mark.unit
+class TestParallelToolCalls:
+    def test_safe_calls_run_at_once_and_report_in_order(self, concurrency):
+        barrier = threading.Barrier(3, timeout=5)
+        executor = _Executor(safe={"search"})
+
+        def run(call):
+            barrier.wait()  # only returns once all three are running
+            return f"result-{call.id}"
+
+        calls = [ToolCall(id=f"c{n}", name="search", arguments={}) for n in range(3)]
+        events, (messages, pending) = _drain(
+            _Handler().handle_tool_calls(_agent(executor, run), calls, {}, [])
+        )
+        assert pending is None
+        assert [e["data"]["call_id"] for e in events] == ["c0", "c1", "c2"]
+        assert messages[0]["role"] == "assistant"
+        assert [c["id"] for c in messages[0]["tool_calls"]] == ["c0", "c1", "c2"]
+        assert [m["content"] for m in messages[1:]] == [
+            "result-c0", "result-c1", "result-c2",
+        ]
+        assert [row["call_id"] for row in executor.tool_calls] == ["c0", "c1", "c2"]
+
+    def test_unsafe_call_splits_the_batch(self, concurrency):
+        running = []
+        lock = threading.Lock()
+        overlaps = []
+        executor = _Executor(safe={"search"})
+
+        def run(call):
+            with lock:
+                running.append(call.id)
+                if call.name == "write" and len(running) > 1:
+                    overlaps.append(call.id)
+            threading.Event().wait(0.05)
+            with lock:
+                running.remove(call.id)
+            return call.id
+
+        calls = [
+            ToolCall(id="a", name="search", arguments={}),
+            ToolCall(id="b", name="search", arguments={}),
+            ToolCall(id="w", name="write", arguments={}),
+            ToolCall(id="c", name="search", arguments={}),
+        ]
+        _, (messages, _) = _drain(
+            _Handler().handle_tool_calls(_agent(executor, run), calls, {}, [])
+        )
+        assert overlaps == []
+        assert [m["tool_call_id"] for m in messages[1:]] == ["a", "b", "w", "c"]
+
+    def test_paused_call_stays_pending_and_is_checked_once(self, concurrency):
+        executor = _Executor(safe={"search"}, pauses={"search_gated"})
+        executor.safe.add("search_gated")
+        calls = [
+            ToolCall(id="a", name="search", arguments={}),
+            ToolCall(id="b", name="search", arguments={}),
+            ToolCall(id="p", name="search_gated", arguments={}),
+        ]
+        _, (messages, pending) = _drain(
+            _Handler().handle_tool_calls(_agent(executor, lambda c: c.id), calls, {}, [])
+        )
+        assert [p["call_id"] for p in pending] == ["p"]
+        assert [m["tool_call_id"] for m in messages[1:]] == ["a", "b"]
+        assert sorted(executor.pause_checks) == ["a", "b", "p"]
+
+    def test_worker_error_becomes_error_message(self, concurrency):
+        executor = _Executor(safe={"search"})
+
+        def run(call):
+            if call.id == "bad":
+                raise RuntimeError("boom")
+            return "ok"
+
+        calls = [
+            ToolCall(id="ok", name="search", arguments={}),
+            ToolCall(id="bad", name="search", arguments={}),
+        ]
+        events, (messages, _) = _drain(
+            _Handler().handle_tool_calls(_agent(executor, run), calls, {}, [])
+        )
+        assert messages[-1]["tool_call_id"] == "bad"
+        assert "boom" in messages[-1]["content"]
+        assert events[-1]["data"]["status"] == "error"
+
+    def test_context_limit_is_checked_before_each_wave_result(
+        self, concurrency, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "application.core.settings.settings.ENABLE_CONVERSATION_COMPRESSION",
+            False,
+        )
+        executor = _Executor(safe={"search"})
+        agent = _agent(executor, lambda c: c.id)
+        # Over the limit once the first wave result is in the messages.
+        agent._check_context_limit = Mock(
+            side_effect=lambda messages: any(m.get("role") == "tool" for m in messages)
+        )
+
+        calls = [ToolCall(id=f"c{n}", name="search", arguments={}) for n in range(3)]
+        events, (messages, _) = _drain(
+            _Handler().handle_tool_calls(agent, calls, {}, [])
+        )
+        assert agent._check_context_limit.call_count == 2
+        assert [m["tool_call_id"] for m in messages[1:]] == ["c0"]
+        assert [
+            e["data"]["call_id"] for e in events if e["data"].get("status") == "skipped"
+        ] == ["c1", "c2"]
+        assert agent.context_limit_reached is True
+
+    def test_wave_is_cut_to_the_context_headroom(self, concurrency, monkeypatch):
+        settings_path = "application.core.settings.settings"
+        monkeypatch.setattr(f"{settings_path}.TOOL_RESULT_MAX_TOKENS", 100)
+        monkeypatch.setattr(f"{settings_path}.ENABLE_CONVERSATION_COMPRESSION", False)
+        monkeypatch.setattr("application.utils.num_tokens_from_string", len)
+        both_running = threading.Barrier(2, timeout=5)
+        ran = []
+        executor = _Executor(safe={"search"})
+
+        def run(call):
+            ran.append(call.id)
+            if call.id in ("c0", "c1"):
+                both_running.wait()  # c0 and c1 share a wave
+            return call.id
+
+        agent = _agent(executor, run)
+        # Room for two worst-case results; the limit trips once both are in.
+        agent._context_headroom = Mock(return_value=250)
+        agent._check_context_limit = Mock(
+            side_effect=lambda messages: sum(m.get("role") == "tool" for m in messages) >= 2
+        )
+
+        calls = [ToolCall(id=f"c{n}", name="search", arguments={}) for n in range(3)]
+        events, (messages, _) = _drain(
+            _Handler().handle_tool_calls(agent, calls, {}, [])
+        )
+        assert sorted(ran) == ["c0", "c1"]
+        assert [row["call_id"] for row in executor.tool_calls] == ["c0", "c1"]
+        assert [m["tool_call_id"] for m in messages[1:]] == ["c0", "c1"]
+        assert [
+            e["data"]["call_id"] for e in events if e["data"].get("status") == "skipped"
+        ] == ["c2"]
+
+    def test_unbounded_results_run_one_at_a_time(self, concurrency):
+        executor = _Executor(safe={"search"})
+        agent = _agent(executor, lambda c: c.id)
+        agent._context_headroom = Mock(return_value=10**9)
+        assert _Handler()._wave_budget(agent, [], 3) == 1
+        agent._context_headroom = Mock(return_value=None)
+        assert _Handler()._wave_budget(agent, [], 3) == 3
+
+    def test_concurrency_of_one_runs_serially(self, monkeypatch):
+        monkeypatch.setattr(
+            "application.core.settings.settings.TOOL_CALL_CONCURRENCY", 1
+        )
+        running = []
+        overlaps = []
+        executor = _Executor(safe={"search"})
+
+        def run(call):
+            running.append(call.id)
+            overlaps.append(len(running))
+            threading.Event().wait(0.01)
+            running.remove(call.id)
+            return call.id
+
+        calls = [ToolCall(id=f"c{n}", name="search", arguments={}) for n in range(3)]
+        _drain(_Handler().handle_tool_calls(_agent(executor, run), calls, {}, []))
+        assert overlaps == [1, 1, 1]
+
+
+@pytest.mark.unit
+class TestIsParallelSafe:
+    def _executor(self):
+        executor = ToolExecutor(user="u")
+        executor._name_to_tool = {
+            "search": ("t1", "search"),
+            "note": ("t2", "view"),
+            "call_api": ("t3", "call_api"),
+        }
+        return executor
+
+    def _tools(self):
+        return {
+            "t1": {"name": "duckduckgo", "actions": []},
+            "t2": {"name": "notes", "actions": []},
+            "t3": {"name": "api_tool", "config": {}},
+        }
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [("search", True), ("note", False), ("call_api", False), ("missing", False)],
+    )
+    def test_flag_comes_from_the_tool_class(self, name, expected):
+        call = ToolCall(id="x", name=name, arguments={})
+        assert self._executor().is_parallel_safe(self._tools(), call, "OpenAILLM") is expected
+
+    def test_client_side_tool_is_never_parallel(self):
+        tools = {"t1": {"name": "duckduckgo", "client_side": True, "actions": []}}
+        call = ToolCall(id="x", name="search", arguments={})
+        assert self._executor().is_parallel_safe(tools, call, "OpenAILLM") is False
+
+    def test_mcp_tool_is_parallel_only_on_the_session_pool(self, monkeypatch):
+        import application.agents.tools.mcp_tool as mcp_mod
+
+        executor = ToolExecutor(user="u")
+        executor._name_to_tool = {"lookup": ("t1", "lookup")}
+        tools = {"t1": {"name": "mcp_tool", "config": {"auth_type": "oauth"}}}
+        call = ToolCall(id="x", name="lookup", arguments={})
+
+        monkeypatch.setattr(mcp_mod, "get_session_manager", lambda: None)
+        assert executor.is_parallel_safe(tools, call, "OpenAILLM") is False
+        monkeypatch.setattr(mcp_mod, "get_session_manager", lambda: object())
+        assert executor.is_parallel_safe(tools, call, "OpenAILLM") is True
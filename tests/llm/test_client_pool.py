@@ -0,0 +1,200 @@
+"""Tests for the process-wide LLM client pool."""
+
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from application.llm import client_pool
+from application.llm.client_pool import LLMClientPool, credential_fingerprint
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def pool(clock):
+    pool = LLMClientPool(max_clients=4, idle_seconds=60, clock=clock)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def installed_pool(monkeypatch, pool):
+    """Make ``get_client_pool()`` hand out ``pool``."""
+    monkeypatch.setattr(client_pool, "_POOL", pool)
+    return pool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+class TestSdkClients:
+    def test_same_endpoint_and_key_reuses_client(self, pool):
+        factory = MagicMock(side_effect=lambda http: object())
+        first = pool.sdk_client("openai", "https://api/v1", "k", factory)
+        second = pool.sdk_client("openai", "https://api/v1", "k", factory)
+        assert first is second
+        factory.assert_called_once()
+        assert pool.stats()["hits"] == 1 and pool.stats()["misses"] == 1
+
+    def test_credentials_get_own_client_on_shared_connections(self, pool):
+        seen = []
+        pool.sdk_client("openai", "https://api/v1", "k1", lambda http: seen.append(http))
+        pool.sdk_client("openai", "https://api/v1", "k2", lambda http: seen.append(http))
+        assert len(seen) == 2
+        assert seen[0] is seen[1]
+        assert isinstance(seen[0], httpx.Client)
+
+    def test_endpoints_get_own_connections(self, pool):
+        seen = []
+        pool.sdk_client("openai", "https://a/v1", "k", lambda http: seen.append(http))
+        pool.sdk_client("groq", "https://b/v1", "k", lambda http: seen.append(http))
+        assert seen[0] is not seen[1]
+
+    def test_fingerprint_hides_the_key(self):
+        assert "secret" not in credential_fingerprint("secret")
+        assert credential_fingerprint("a") != credential_fingerprint("b")
+        assert credential_fingerprint(None) == ""
+
+
+@pytest.mark.unit
+class TestEviction:
+    def test_idle_http_client_is_closed(self, pool, clock):
+        client = pool.http_client("openai", "https://api/v1")
+        clock.now += 61
+        replacement = pool.http_client("openai", "https://api/v1")
+        assert replacement is not client
+        assert client.is_closed
+        assert pool.stats()["evictions"] == 1
+
+    def test_sdk_use_keeps_its_http_client_fresh(self, pool, clock):
+        factory = lambda http: types.SimpleNamespace(http=http)  # noqa: E731
+        sdk = pool.sdk_client("openai", "https://api/v1", "k", factory)
+        for _ in range(3):
+            clock.now += 40
+            assert pool.sdk_client("openai", "https://api/v1", "k", factory) is sdk
+        assert not sdk.http.is_closed
+
+    def test_lru_bound_drops_without_closing(self, pool):
+        clients = [pool.http_client("openai", f"https://h{i}/v1") for i in range(5)]
+        assert pool.stats()["http_clients"] == 4
+        assert not clients[0].is_closed
+        assert pool.http_client("openai", "https://h0/v1") is not clients[0]
+
+
+@pytest.mark.unit
+class TestPinnedClients:
+    def test_pinned_clients_are_keyed_apart_and_bounded(self, pool):
+        built = httpx.Client()
+        with mock.patch(
+            "application.security.safe_url.pinned_httpx_client", return_value=built
+        ) as pinned:
+            first = pool.http_client("openai_compatible", "https://byom/v1", pinned=True)
+            second = pool.http_client("openai_compatible", "https://byom/v1", pinned=True)
+        assert first is second is built
+        pinned.assert_called_once()
+        assert isinstance(pinned.call_args.kwargs["limits"], httpx.Limits)
+        assert pool.http_client("openai_compatible", "https://byom/v1") is not built
+
+    def test_sdk_client_on_pinned_client_keeps_it_fresh(self, pool, clock):
+        with mock.patch(
+            "application.security.safe_url.pinned_httpx_client",
+            return_value=httpx.Client(),
+        ):
+            pinned = pool.http_client("openai_compatible", "https://byom/v1", pinned=True)
+        factory = lambda http: types.SimpleNamespace(http=http)  # noqa: E731
+        for _ in range(3):
+            pool.sdk_client("openai_compatible", "https://byom/v1", "k", factory, http_client=pinned)
+            clock.now += 40
+        assert not pinned.is_closed
+
+
+@pytest.mark.unit
+class TestConnectionReuse:
+    def test_counts_reused_connections(self, pool, local_server):
+        client = pool.http_client("openai", local_server)
+        for _ in range(3):
+            assert client.get(f"{local_server}/ping").status_code == 200
+        stats = pool.stats()
+        assert stats["requests"] == 3
+        assert stats["connections"] == 1
+        assert stats["reused_connections"] == 2
+
+    def test_limits_come_from_settings(self, pool, monkeypatch):
+        monkeypatch.setattr(
+            "application.core.settings.settings.LLM_HTTP_MAX_KEEPALIVE", 3
+        )
+        limits = pool._limits()
+        assert limits.max_keepalive_connections == 3
+
+
+@pytest.mark.unit
+class TestProcessPool:
+    def test_disabled_pool_is_none(self):
+        # The suite-wide fixture disables pooling.
+        assert client_pool.get_client_pool() is None
+        assert client_pool.pool_stats()["hits"] == 0
+
+    def test_openai_llm_shares_sdk_client(self, installed_pool, monkeypatch):
+        from application.llm.openai import OpenAILLM
+
+        monkeypatch.setattr(
+            "application.llm.openai.StorageCreator",
+            types.SimpleNamespace(get_storage=lambda: None),
+        )
+        mock_openai = MagicMock(side_effect=lambda **kwargs: object())
+        monkeypatch.setattr("application.llm.openai.OpenAI", mock_openai)
+        first = OpenAILLM(api_key="k", base_url="https://custom.api/v1")
+        second = OpenAILLM(api_key="k", base_url="https://custom.api/v1")
+        assert first.client is second.client
+        mock_openai.assert_called_once()
+        assert isinstance(mock_openai.call_args.kwargs["http_client"], httpx.Client)
+
+    def test_anthropic_llm_shares_sdk_client(self, installed_pool, monkeypatch):
+        from application.llm.anthropic import AnthropicLLM
+
+        monkeypatch.setattr(
+            "application.llm.anthropic.StorageCreator",
+            types.SimpleNamespace(get_storage=lambda: None),
+        )
+        mock_anthropic = MagicMock(side_effect=lambda **kwargs: object())
+        monkeypatch.setattr("application.llm.anthropic.Anthropic", mock_anthropic)
+        assert AnthropicLLM(api_key="k").anthropic is AnthropicLLM(api_key="k").anthropic
+        mock_anthropic.assert_called_once()
+
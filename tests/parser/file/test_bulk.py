@@ -4,6 +4,8 @@ Covers: SimpleDirectoryReader (init, file discovery, load_data, directory
 structure building), get_default_file_extractor.
 """
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -405,6 +407,128 @@ class TestSimpleDirectoryReaderLoadData:
         assert len(reader.file_token_counts) >= 1
 
 
+# =====================================================================
+# SimpleDirectoryReader - parallel parsing
+# =====================================================================
+
+
+class _SlowFirstParser:
+    """Parser whose earlier files take longest, so workers finish out of order."""
+
+    parser_config_set = True
+
+    def parse_file(self, path, errors="ignore"):
+        from application.parser.file.base_parser import DocumentParseError
+
+        if path.name.startswith("bad"):
+            raise DocumentParseError(f"cannot read {path.name}")
+        time.sleep(0.05 * (5 - int(path.stem[-1])))
+        return f"parsed {path.name} in {os.getpid()}"
+
+    def get_file_metadata(self, path):
+        return {"parser": "slow"}
+
+
+@pytest.fixture
+def parallel_parsing(monkeypatch):
+    from application.parser.file import parse_pool
+
+    if parse_pool.fork_context() is None:
+        pytest.skip("needs the fork start method")
+    monkeypatch.setattr(
+        "application.core.settings.settings.INGEST_PARSE_PROCESSES", 3
+    )
+    monkeypatch.setattr(
+        "application.parser.file.bulk.num_tokens_from_string", len
+    )
+
+
+@pytest.mark.unit
+class TestParallelLoadData:
+
+    def _write(self, tmp_path, names):
+        for name in names:
+            (tmp_path / name).write_text(name)
+
+    def test_documents_keep_input_order_across_workers(
+        self, tmp_path, parallel_parsing
+    ):
+        from application.parser.file.bulk import SimpleDirectoryReader
+
+        self._write(tmp_path, [f"f{i}.md" for i in range(5)])
+        reader = SimpleDirectoryReader(
+            input_dir=str(tmp_path),
+            file_extractor={".md": _SlowFirstParser()},
+            file_metadata=lambda name: {"file": name},
+        )
+        calls = []
+        docs = reader.load_data(
+            progress_callback=lambda done, total: calls.append((done, total))
+        )
+
+        assert [d.extra_info["file"] for d in docs] == [f"f{i}.md" for i in range(5)]
+        assert all(d.extra_info["parser"] == "slow" for d in docs)
+        # Parsed (and token-counted) off the calling process.
+        assert all(str(os.getpid()) not in d.text for d in docs)
+        assert len(reader.file_token_counts) == 5
+        assert docs[0].extra_info["token_count"] == len(docs[0].text)
+        assert calls == [(n, 5) for n in range(1, 6)]
+
+    def test_unreadable_files_are_recorded_in_order(
+        self, tmp_path, parallel_parsing
+    ):
+        from application.parser.file.bulk import SimpleDirectoryReader
+
+        self._write(tmp_path, ["bad1.md", "f2.md", "bad3.md", "f4.md"])
+        reader = SimpleDirectoryReader(
+            input_dir=str(tmp_path),
+            file_extractor={".md": _SlowFirstParser()},
+        )
+        docs = reader.load_data()
+
+        assert len(docs) == 2
+        assert [p.name for p, _ in reader.failed_files] == ["bad1.md", "bad3.md"]
+        assert reader.failed_files[0][1] == "cannot read bad1.md"
+
+    def test_a_single_file_is_parsed_in_process(self, tmp_path, parallel_parsing):
+        from application.parser.file.base_parser import DocumentParseError
+        from application.parser.file.bulk import SimpleDirectoryReader
+
+        self._write(tmp_path, ["bad1.md"])
+        reader = SimpleDirectoryReader(
+            input_files=[str(tmp_path / "bad1.md")],
+            file_extractor={".md": _SlowFirstParser()},
+        )
+        with patch(
+            "application.parser.file.bulk.parse_in_processes"
+        ) as pool, pytest.raises(DocumentParseError, match="cannot read bad1.md"):
+            reader.load_data()
+        pool.assert_not_called()
+
+    def test_a_pipeline_thread_parses_in_process(self, tmp_path, parallel_parsing):
+        """The streaming ingest drives the reader from its parse stage thread;
+        forking there would copy locks held by the embed/heartbeat threads."""
+        import threading
+
+        from application.parser.file.bulk import SimpleDirectoryReader
+
+        self._write(tmp_path, [f"f{i}.md" for i in range(3)])
+        reader = SimpleDirectoryReader(
+            input_dir=str(tmp_path),
+            file_extractor={".md": _SlowFirstParser()},
+        )
+        files = []
+        with patch("application.parser.file.bulk.parse_in_processes") as pool:
+            thread = threading.Thread(target=lambda: files.extend(reader.iter_data()))
+            thread.start()
+            thread.join()
+
+        pool.assert_not_called()
+        assert [d.text for docs in files for d in docs] == [
+            f"parsed f{i}.md in {os.getpid()}" for i in range(3)
+        ]
+
+
 # =====================================================================
 # Directory Structure Building
 # =====================================================================
@@ -485,6 +609,93 @@ class TestBuildDirectoryStructure:
         assert reader.directory_structure == {}
 
 
+# =====================================================================
+# SimpleDirectoryReader - iter_data
+# =====================================================================
+
+
+@pytest.mark.unit
+class TestIterData:
+
+    @pytest.fixture(autouse=True)
+    def _count_tokens_offline(self, monkeypatch):
+        monkeypatch.setattr(
+            "application.parser.file.bulk.num_tokens_from_string", len
+        )
+
+    def test_yields_each_file_as_it_is_parsed(self, tmp_path):
+        from application.parser.file.base_parser import DocumentParseError
+        from application.parser.file.bulk import SimpleDirectoryReader
+
+        for name in ("a.md", "bad.md", "b.md"):
+            (tmp_path / name).write_text(name)
+        parsed = []
+
+        def _parse(path, **kwargs):
+            parsed.append(path.name)
+            if path.name == "bad.md":
+                raise DocumentParseError("boom")
+            return [f"{path.name} one", f"{path.name} two"]
+
+        mock_parser = MagicMock()
+        mock_parser.parser_config_set = True
+        mock_parser.parse_file.side_effect = _parse
+        mock_parser.get_file_metadata.return_value = {}
+
+        reader = SimpleDirectoryReader(
+            input_dir=str(tmp_path),
+            file_extractor={".md": mock_parser},
+            file_metadata=lambda name: {"title": name},
+        )
+        files = reader.iter_data()
+
+        first = next(files)
+        # Nothing past the first file is parsed until it is asked for.
+        assert parsed == ["a.md"]
+        assert [d.text for d in first] == ["a.md one", "a.md two"]
+        assert {d.extra_info["source"] for d in first} == {"a.md"}
+
+        rest = list(files)
+        assert [[d.text for d in docs] for docs in rest] == [["b.md one", "b.md two"]]
+        assert [Path(p).name for p, _ in reader.failed_files] == ["bad.md"]
+        assert set(reader.directory_structure) == {"a.md", "b.md", "bad.md"}
+
+    def test_raises_after_the_last_file_when_none_parsed(self, tmp_path):
+        from application.parser.file.base_parser import DocumentParseError
+        from application.parser.file.bulk import SimpleDirectoryReader
+
+        (tmp_path / "a.md").write_text("x")
+        (tmp_path / "b.md").write_text("y")
+
+        mock_parser = MagicMock()
+        mock_parser.parser_config_set = True
+        mock_parser.parse_file.side_effect = DocumentParseError("nope")
+
+        reader = SimpleDirectoryReader(
+            input_dir=str(tmp_path), file_extractor={".md": mock_parser}
+        )
+        with pytest.raises(DocumentParseError, match="None of the 2 files"):
+            list(reader.iter_data())
+
+    def test_load_data_concatenates_streamed_files(self, tmp_path):
+        from application.parser.file.bulk import SimpleDirectoryReader
+
+        (tmp_path / "a.md").write_text("x")
+        (tmp_path / "b.md").write_text("y")
+
+        mock_parser = MagicMock()
+        mock_parser.parser_config_set = True
+        mock_parser.parse_file.side_effect = lambda path, **kw: path.name
+        mock_parser.get_file_metadata.return_value = {}
+
+        reader = SimpleDirectoryReader(
+            input_dir=str(tmp_path), file_extractor={".md": mock_parser}
+        )
+        docs = reader.load_data(concatenate=True)
+
+        assert [d.text for d in docs] == ["a.md\nb.md"]
+
+
 # =====================================================================
 # get_default_file_extractor
 # =====================================================================
@@ -291,3 +291,351 @@ def test_embed_and_store_documents_save_fails_raises_oserror(
     with pytest.raises(OSError, match="Unable to save vector store"):
         embed_and_store_documents(docs, str(folder_name), source_id, task_status)
 
+
+
+# ── batched embedding ──────────────────────────────────────────────────────
+
+
+def _docs(*texts):
+    return [MagicMock(page_content=t, metadata={}) for t in texts]
+
+
+def test_plan_batches_bounds_by_count():
+    from application.parser.embedding_pipeline import _plan_batches
+
+    docs = _docs(*[f"d{i}" for i in range(7)])
+    assert _plan_batches(docs, 0, 3, 0) == [(0, 3), (3, 6), (6, 7)]
+    # Resume: planning starts at the checkpoint, not at chunk 0.
+    assert _plan_batches(docs, 5, 3, 0) == [(5, 7)]
+
+
+def test_plan_batches_bounds_by_tokens():
+    from application.parser.embedding_pipeline import _plan_batches
+
+    docs = _docs("a", "b", "c", "d")
+    with patch(
+        "application.parser.embedding_pipeline.num_tokens_from_string",
+        side_effect=lambda text: {"a": 4, "b": 4, "c": 9, "d": 1}[text],
+    ):
+        # "c" alone exceeds the cap and still gets its own batch.
+        assert _plan_batches(docs, 0, 100, 8) == [(0, 2), (2, 3), (3, 4)]
+
+
+@pytest.fixture
+def batched_settings(mock_settings, monkeypatch):
+    mock_settings.VECTOR_STORE = "pgvector"
+    mock_settings.INGEST_EMBED_BATCH_SIZE = 2
+    mock_settings.INGEST_EMBED_BATCH_MAX_TOKENS = 0
+    mock_settings.INGEST_EMBED_PREFETCH = 1
+    embeddings = MagicMock()
+    embeddings.embed_documents.side_effect = lambda texts: [
+        [float(len(t))] for t in texts
+    ]
+    monkeypatch.setattr(
+        "application.parser.embedding_pipeline.get_embeddings",
+        lambda *a, **kw: embeddings,
+    )
+    recorded = []
+    monkeypatch.setattr(
+        "application.parser.embedding_pipeline._record_progress",
+        lambda sid, last_index, embedded_chunks: recorded.append(
+            (last_index, embedded_chunks)
+        ),
+    )
+    return embeddings, recorded
+
+
+def test_embed_and_store_documents_batched(
+    tmp_path, batched_settings, mock_vector_creator
+):
+    embeddings, recorded = batched_settings
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+
+    docs = _docs("a\x00", "bb", "ccc", "dddd", "e")
+    embed_and_store_documents(docs, str(tmp_path / "b"), "sid", MagicMock())
+
+    assert embeddings.embed_documents.call_count == 3
+    written = [c.args[0] for c in store.add_texts.call_args_list]
+    assert written == [["a", "bb"], ["ccc", "dddd"], ["e"]]
+    assert store.add_texts.call_args_list[0].kwargs["vectors"] == [[1.0], [2.0]]
+    assert all(
+        m["source_id"] == "sid"
+        for c in store.add_texts.call_args_list
+        for m in c.kwargs["metadatas"]
+    )
+    # One checkpoint per batch, at the batch's last index.
+    assert recorded == [(1, 2), (3, 4), (4, 5)]
+
+
+@patch("application.parser.embedding_pipeline.add_batch_to_store_with_retry")
+def test_embed_and_store_documents_batched_failure_raises(
+    mock_add_batch, tmp_path, batched_settings, mock_vector_creator, caplog
+):
+    _, recorded = batched_settings
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+
+    def side_effect(store, docs, vectors):
+        if docs[0].page_content == "c":
+            raise RuntimeError("store down")
+    mock_add_batch.side_effect = side_effect
+
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(EmbeddingPipelineError, match="chunk 2/5"):
+            embed_and_store_documents(
+                _docs("a", "b", "c", "d", "e"), str(tmp_path / "f"), "sid", MagicMock(),
+            )
+
+    # Only the batch before the failure is checkpointed, so a retry
+    # resumes at the failed batch.
+    assert recorded == [(1, 2)]
+    assert "Error embedding documents 2-3" in caplog.text
+    store.save_local.assert_called()
+
+
+def test_embed_and_store_documents_reuses_cached_embeddings(
+    tmp_path, batched_settings, mock_vector_creator, monkeypatch
+):
+    from application.parser.embedding_cache import SQLiteEmbeddingCache
+
+    embeddings, _ = batched_settings
+    cache = SQLiteEmbeddingCache(str(tmp_path / "cache.sqlite3"), max_entries=100)
+    monkeypatch.setattr(
+        "application.parser.embedding_pipeline.get_embedding_cache", lambda: cache
+    )
+    mock_vector_creator.create_vectorstore.return_value = MagicMock()
+
+    first = embed_and_store_documents(
+        _docs("a", "bb", "ccc"), str(tmp_path / "c1"), "sid", MagicMock()
+    )
+    assert first == {"hits": 0, "misses": 3, "hit_rate": 0.0}
+
+    embeddings.embed_documents.reset_mock()
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+    second = embed_and_store_documents(
+        _docs("a", "bb", "dddd"), str(tmp_path / "c2"), "sid", MagicMock()
+    )
+    # Only the changed chunk reaches the embedder; the rest come from cache.
+    embeddings.embed_documents.assert_called_once_with(["dddd"])
+    assert second == {"hits": 2, "misses": 1, "hit_rate": 0.6667}
+    assert store.add_texts.call_args_list[0].kwargs["vectors"] == [[1.0], [2.0]]
+
+
+def test_embed_and_store_documents_without_cache_returns_none(
+    tmp_path, batched_settings, mock_vector_creator, monkeypatch
+):
+    monkeypatch.setattr(
+        "application.parser.embedding_pipeline.get_embedding_cache", lambda: None
+    )
+    mock_vector_creator.create_vectorstore.return_value = MagicMock()
+    assert embed_and_store_documents(
+        _docs("a"), str(tmp_path / "n"), "sid", MagicMock()
+    ) is None
+
+
+# ── streaming ──────────────────────────────────────────────────────────────
+
+
+def test_pipeline_stage_hands_items_over_in_order():
+    from application.parser.embedding_pipeline import pipeline_stage
+
+    assert list(pipeline_stage(iter(range(10)), 2, name="t")) == list(range(10))
+
+
+def test_pipeline_stage_reraises_after_earlier_items():
+    from application.parser.embedding_pipeline import pipeline_stage
+
+    def _items():
+        yield 1
+        yield 2
+        raise ValueError("parser bug")
+
+    got = []
+    with pytest.raises(ValueError, match="parser bug"):
+        for item in pipeline_stage(_items(), 4, name="t"):
+            got.append(item)
+    assert got == [1, 2]
+
+
+def test_pipeline_stage_bounds_lookahead_and_closes_upstream_on_stop():
+    import threading
+
+    from application.parser.embedding_pipeline import pipeline_stage
+
+    produced = []
+    closed = threading.Event()
+
+    def _items():
+        try:
+            for i in range(100):
+                produced.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    stage = pipeline_stage(_items(), 2, name="t")
+    assert next(stage) == 0
+    stage.close()
+
+    assert closed.is_set()
+    # One item handed over, two queued, one blocked on the full queue.
+    assert len(produced) <= 4
+
+
+def _chunks(*texts):
+    from application.vectorstore.document_class import Document
+
+    return [Document(page_content=t, metadata={}) for t in texts]
+
+
+@pytest.fixture
+def stream_settings(batched_settings, monkeypatch):
+    embeddings, _ = batched_settings
+    recorded = []
+    monkeypatch.setattr(
+        "application.parser.embedding_pipeline._record_progress",
+        lambda sid, last_index, embedded_chunks, total_chunks=None: recorded.append(
+            (last_index, embedded_chunks, total_chunks)
+        ),
+    )
+    resume = {"index": 0}
+    monkeypatch.setattr(
+        "application.parser.embedding_pipeline._init_progress_and_resume_index",
+        lambda sid, total, attempt_id: resume["index"],
+    )
+    return embeddings, recorded, resume
+
+
+def test_embed_and_store_stream_batches_a_stream(
+    tmp_path, stream_settings, mock_vector_creator
+):
+    from application.parser.embedding_pipeline import embed_and_store_stream
+
+    embeddings, recorded, _ = stream_settings
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+    task_status = MagicMock()
+
+    chunks = iter(_chunks("a\x00", " ", "bb", "ccc", "dddd", "e"))
+    embed_and_store_stream(
+        chunks, str(tmp_path / "s"), "sid", task_status,
+        progress_start=50, progress_end=100,
+    )
+
+    written = [c.args[0] for c in store.add_texts.call_args_list]
+    assert written == [["a", "bb"], ["ccc", "dddd"], ["e"]]
+    assert store.add_texts.call_args_list[0].kwargs["vectors"] == [[1.0], [2.0]]
+    store.delete_index.assert_called_once()
+    # While chunks are still arriving the row's total stays one ahead of
+    # what was seen; the final checkpoint carries the real total.
+    assert recorded[0][:2] == (1, 2)
+    assert all(embedded < total for _, embedded, total in recorded[:2])
+    assert recorded[-1] == (4, 5, 5)
+    currents = [
+        c.kwargs["meta"]["current"] for c in task_status.update_state.call_args_list
+    ]
+    assert currents and all(50 <= c <= 100 for c in currents)
+    assert currents[-1] == 100
+
+
+def test_embed_and_store_stream_resume_skips_embedded_chunks(
+    tmp_path, stream_settings, mock_vector_creator
+):
+    from application.parser.embedding_pipeline import embed_and_store_stream
+
+    _, recorded, resume = stream_settings
+    resume["index"] = 3
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+
+    embed_and_store_stream(
+        iter(_chunks("a", "b", "c", "d", "e")), str(tmp_path / "r"), "sid", MagicMock(),
+    )
+
+    written = [c.args[0] for c in store.add_texts.call_args_list]
+    assert written == [["d", "e"]]
+    store.delete_index.assert_not_called()
+    assert recorded[-1] == (4, 5, 5)
+
+
+def test_embed_and_store_stream_seeds_faiss_with_first_chunk(
+    tmp_path, stream_settings, mock_vector_creator
+):
+    from application.parser.embedding_pipeline import embed_and_store_stream
+
+    _, recorded, _ = stream_settings
+    from application.parser import embedding_pipeline
+
+    embedding_pipeline.settings.VECTOR_STORE = "faiss"
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+
+    embed_and_store_stream(
+        iter(_chunks("a", "b", "c")), str(tmp_path / "f"), "sid", MagicMock(),
+    )
+
+    seed = mock_vector_creator.create_vectorstore.call_args.kwargs["docs_init"]
+    assert [d.page_content for d in seed] == ["a"]
+    assert [c.args[0] for c in store.add_texts.call_args_list] == [["b", "c"]]
+    assert recorded[0] == (0, 1, 2)
+    assert recorded[-1] == (2, 3, 3)
+    store.save_local.assert_called_with(str(tmp_path / "f"))
+
+
+def test_embed_and_store_stream_blank_stream_is_a_parse_error(
+    tmp_path, stream_settings, mock_vector_creator
+):
+    from application.parser.embedding_pipeline import embed_and_store_stream
+    from application.parser.file.base_parser import DocumentParseError
+
+    with pytest.raises(DocumentParseError):
+        embed_and_store_stream(
+            iter(_chunks(" ", "")), str(tmp_path / "e"), "sid", MagicMock(),
+        )
+    mock_vector_creator.create_vectorstore.assert_not_called()
+
+
+def test_embed_and_store_stream_passes_upstream_errors_through(
+    tmp_path, stream_settings, mock_vector_creator
+):
+    from application.parser.embedding_pipeline import embed_and_store_stream
+
+    _, recorded, _ = stream_settings
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+
+    def _failing():
+        yield from _chunks("a", "b", "c")
+        raise RuntimeError("chunker bug")
+
+    with pytest.raises(RuntimeError, match="chunker bug"):
+        embed_and_store_stream(_failing(), str(tmp_path / "u"), "sid", MagicMock())
+
+    # The full batch before the failure landed and was checkpointed with
+    # the total still open.
+    assert recorded == [(1, 2, 4)]
+
+
+@patch("application.parser.embedding_pipeline.add_batch_to_store_with_retry")
+def test_embed_and_store_stream_store_failure_raises(
+    mock_add_batch, tmp_path, stream_settings, mock_vector_creator
+):
+    from application.parser.embedding_pipeline import embed_and_store_stream
+
+    _, recorded, _ = stream_settings
+    store = MagicMock()
+    mock_vector_creator.create_vectorstore.return_value = store
+
+    def side_effect(store, docs, vectors):
+        if docs[0].page_content == "c":
+            raise RuntimeError("store down")
+    mock_add_batch.side_effect = side_effect
+
+    with pytest.raises(EmbeddingPipelineError, match="chunk 2/"):
+        embed_and_store_stream(
+            iter(_chunks("a", "b", "c", "d", "e")), str(tmp_path / "x"), "sid", MagicMock(),
+        )
+    assert [r[:2] for r in recorded] == [(1, 2)]
+    store.save_local.assert_called()
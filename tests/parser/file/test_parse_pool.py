@@ -0,0 +1,162 @@
+"""Tests for application/parser/file/parse_pool.py
+
+The workers are real forked processes; the parse callables are plain
+functions so nothing but their results crosses the pipe.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from application.parser.file import parse_pool
+from application.parser.file.base_parser import DocumentParseError
+
+pytestmark = pytest.mark.skipif(
+    parse_pool.fork_context() is None, reason="needs the fork start method"
+)
+
+
+def _upper(item):
+    # Later items finish first, so completion order is the reverse of input.
+    time.sleep(0.05 * (3 - int(item[-1])))
+    return item.upper()
+
+
+def _parse_with_failures(item):
+    if item == "unreadable":
+        raise DocumentParseError("cannot read")
+    if item == "bug":
+        raise ValueError("parser bug")
+    if item == "slow":
+        time.sleep(60)
+    if item == "crash":
+        os._exit(3)
+    if item == "greedy":
+        bytearray(512 * 1024 * 1024)
+    return item
+
+
+@pytest.mark.unit
+class TestParseInProcesses:
+    def test_outcomes_come_back_in_input_order(self):
+        done = []
+
+        results = list(
+            parse_pool.parse_in_processes(
+                _upper, ["f0", "f1", "f2"], 3, on_done=done.append
+            )
+        )
+
+        assert results == [("f0", "F0"), ("f1", "F1"), ("f2", "F2")]
+        assert done == [1, 2, 3]
+
+    def test_parser_exceptions_are_yielded_not_raised(self):
+        results = dict(
+            parse_pool.parse_in_processes(
+                _parse_with_failures, ["ok", "unreadable", "bug"], 2
+            )
+        )
+
+        assert results["ok"] == "ok"
+        assert isinstance(results["unreadable"], DocumentParseError)
+        assert isinstance(results["bug"], ValueError)
+
+    def test_a_slow_file_times_out_without_stalling_the_batch(self):
+        started = time.monotonic()
+
+        results = dict(
+            parse_pool.parse_in_processes(
+                _parse_with_failures, ["slow", "a", "b", "c"], 2, timeout=1
+            )
+        )
+
+        assert time.monotonic() - started < 30
+        assert isinstance(results["slow"], DocumentParseError)
+        assert "timed out" in str(results["slow"])
+        assert [results[k] for k in "abc"] == ["a", "b", "c"]
+
+    def test_a_crashed_worker_fails_only_its_file(self):
+        results = dict(
+            parse_pool.parse_in_processes(
+                _parse_with_failures, ["crash", "a", "b"], 2, label=str
+            )
+        )
+
+        assert isinstance(results["crash"], DocumentParseError)
+        assert "exit code 3" in str(results["crash"])
+        assert results["a"] == "a"
+        assert results["b"] == "b"
+
+    @pytest.mark.skipif(
+        not Path("/proc/self/statm").exists(), reason="needs /proc"
+    )
+    def test_memory_headroom_stops_a_runaway_parse(self):
+        results = dict(
+            parse_pool.parse_in_processes(
+                _parse_with_failures,
+                ["greedy", "a"],
+                1,
+                memory_headroom_mb=64,
+            )
+        )
+
+        assert isinstance(results["greedy"], DocumentParseError)
+        assert "memory limit" in str(results["greedy"])
+        # The worker was replaced, so the next file still parses.
+        assert results["a"] == "a"
+
+
+@pytest.mark.unit
+class TestSettings:
+    @pytest.mark.parametrize(
+        "value, n_files, expected",
+        [(0, 10, 0), (4, 10, 4), (4, 2, 2), (True, 10, 0), ("8", 10, 0), (-1, 10, 0)],
+    )
+    def test_process_count_is_resolved_defensively(
+        self, monkeypatch, value, n_files, expected
+    ):
+        monkeypatch.setattr(
+            "application.core.settings.settings.INGEST_PARSE_PROCESSES", value
+        )
+        assert parse_pool.resolve_parse_processes(n_files) == expected
+
+    def test_timeout_and_headroom_defaults(self):
+        assert parse_pool.resolve_file_timeout() == parse_pool.DEFAULT_FILE_TIMEOUT
+        assert (
+            parse_pool.resolve_memory_headroom_mb()
+            == parse_pool.DEFAULT_MEMORY_HEADROOM_MB
+        )
+
+
+def _parse_in_pool_worker(_):
+    # Runs inside a billiard pool worker, as a Celery prefork task does.
+    return dict(parse_pool.parse_in_processes(_upper, ["f0", "f1"], 2))
+
+
+@pytest.mark.unit
+class TestCeleryPrefork:
+    def test_workers_start_from_a_daemonic_pool_process(self):
+        billiard = pytest.importorskip("billiard")
+
+        with billiard.get_context("fork").Pool(1) as pool:
+            (results,) = pool.map(_parse_in_pool_worker, [0])
+
+        assert results == {"f0": "F0", "f1": "F1"}
+
+    def test_no_workers_off_the_main_thread(self, monkeypatch):
+        import threading
+
+        monkeypatch.setattr(
+            "application.core.settings.settings.INGEST_PARSE_PROCESSES", 4
+        )
+        resolved = []
+        thread = threading.Thread(
+            target=lambda: resolved.append(parse_pool.resolve_parse_processes(10))
+        )
+        thread.start()
+        thread.join()
+
+        assert resolved == [0]
+        assert parse_pool.resolve_parse_processes(10) == 4
@@ -0,0 +1,164 @@
+"""Tests for the content-addressed ingest embedding cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from application.parser.embedding_cache import (
+    CachingEmbeddings,
+    EmbeddingCacheStats,
+    SQLiteEmbeddingCache,
+    content_hash,
+    decode_vector,
+    encode_vector,
+    get_embedding_cache,
+    model_key,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SQLiteEmbeddingCache(str(tmp_path / "cache.sqlite3"), max_entries=3)
+
+
+def _embedder():
+    embedder = MagicMock()
+    embedder.embed_documents.side_effect = lambda texts: [
+        [float(len(t)), 0.5] for t in texts
+    ]
+    return embedder
+
+
+@pytest.mark.unit
+class TestKeys:
+    def test_hash_ignores_whitespace_noise(self):
+        assert content_hash("Hello  world\n") == content_hash(" Hello world")
+
+    def test_hash_distinguishes_content(self):
+        assert content_hash("Hello world") != content_hash("Hello world!")
+
+    def test_vector_roundtrip_is_float32(self):
+        assert decode_vector(encode_vector([0.25, -1.5])) == [0.25, -1.5]
+
+    def test_model_key_includes_endpoint(self, monkeypatch):
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "EMBEDDINGS_NAME", "m")
+        monkeypatch.setattr(settings, "EMBEDDINGS_BASE_URL", "http://e")
+        monkeypatch.setattr(settings, "EMBEDDINGS_MAX_INPUT_TOKENS", None)
+        assert model_key() == "m|embeddings_base_url=http://e"
+
+
+@pytest.mark.unit
+class TestSQLiteEmbeddingCache:
+    def test_put_then_get(self, cache):
+        cache.put_many("m", {"h1": [1.0, 2.0]})
+        assert cache.get_many("m", ["h1", "h2"]) == {"h1": [1.0, 2.0]}
+
+    def test_models_are_isolated(self, cache):
+        cache.put_many("m1", {"h": [1.0]})
+        assert cache.get_many("m2", ["h"]) == {}
+
+    def test_evicts_least_recently_used(self, cache, monkeypatch):
+        clock = iter(range(100))
+        monkeypatch.setattr("application.parser.embedding_cache.time.time", lambda: next(clock))
+        cache.put_many("m", {"a": [1.0], "b": [2.0], "c": [3.0]})
+        cache.get_many("m", ["a"])  # refresh "a"; "b" and "c" are older
+        cache.put_many("m", {"d": [4.0]})
+        assert len(cache) == 3
+        assert set(cache.get_many("m", ["a", "b", "c", "d"])) == {"a", "c", "d"}
+
+    def test_recounts_only_past_the_cap(self, tmp_path):
+        cache = SQLiteEmbeddingCache(str(tmp_path / "cache.sqlite3"), max_entries=20)
+        counts = []
+        cache._conn.set_trace_callback(
+            lambda sql: counts.append(sql) if "count(*)" in sql else None
+        )
+        for n in range(20):
+            cache.put_many("m", {f"h{n}": [float(n)]})
+        assert counts == []
+        cache.put_many("m", {"h20": [20.0]})
+        assert len(counts) == 1
+        # Trimmed a tenth below the cap, so the next puts don't recount.
+        assert cache._rows == 18
+        cache.put_many("m", {"h21": [21.0], "h22": [22.0]})
+        assert len(counts) == 1
+        cache._conn.set_trace_callback(None)
+        assert len(cache) == 20
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "shared.sqlite3")
+        SQLiteEmbeddingCache(path, 10).put_many("m", {"h": [1.0]})
+        assert SQLiteEmbeddingCache(path, 10).get_many("m", ["h"]) == {"h": [1.0]}
+
+
+@pytest.mark.unit
+class TestCachingEmbeddings:
+    def test_only_misses_reach_the_embedder(self, cache):
+        embedder = _embedder()
+        cached = CachingEmbeddings(embedder, cache, "m")
+        cached.embed_documents(["one", "two"])
+        embedder.embed_documents.reset_mock()
+
+        vectors = cached.embed_documents(["one", "three", "two"])
+
+        embedder.embed_documents.assert_called_once_with(["three"])
+        assert vectors == [[3.0, 0.5], [5.0, 0.5], [3.0, 0.5]]
+        assert cached.stats.as_dict() == {"hits": 2, "misses": 3, "hit_rate": 0.4}
+
+    def test_duplicates_in_one_call_are_embedded_once(self, cache):
+        embedder = _embedder()
+        cached = CachingEmbeddings(embedder, cache, "m")
+        assert cached.embed_documents(["x", "x"]) == [[1.0, 0.5], [1.0, 0.5]]
+        embedder.embed_documents.assert_called_once_with(["x"])
+
+    def test_cache_errors_fall_back_to_embedding(self):
+        broken = MagicMock()
+        broken.get_many.side_effect = RuntimeError("db down")
+        broken.put_many.side_effect = RuntimeError("db down")
+        cached = CachingEmbeddings(_embedder(), broken, "m")
+        assert cached.embed_documents(["ab"]) == [[2.0, 0.5]]
+        assert cached.stats.misses == 1
+
+    def test_failed_embed_is_not_counted(self, cache):
+        embedder = MagicMock()
+        embedder.embed_documents.side_effect = RuntimeError("rate limited")
+        cached = CachingEmbeddings(embedder, cache, "m")
+        with pytest.raises(RuntimeError):
+            cached.embed_documents(["a"])
+        assert cached.stats == EmbeddingCacheStats()
+
+    def test_other_attributes_pass_through(self, cache):
+        embedder = _embedder()
+        embedder.dimension = 2
+        assert CachingEmbeddings(embedder, cache, "m").dimension == 2
+
+
+@pytest.mark.unit
+class TestGetEmbeddingCache:
+    @pytest.fixture(autouse=True)
+    def reset(self, monkeypatch):
+        from application.parser import embedding_cache
+
+        monkeypatch.setattr(embedding_cache, "_CACHE", None)
+
+    def test_disabled_by_default(self, monkeypatch):
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "EMBEDDING_CACHE_BACKEND", None)
+        assert get_embedding_cache() is None
+
+    def test_sqlite_backend(self, monkeypatch, tmp_path):
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "EMBEDDING_CACHE_BACKEND", "sqlite")
+        monkeypatch.setattr(settings, "EMBEDDING_CACHE_PATH", str(tmp_path / "c.db"))
+        cache = get_embedding_cache()
+        assert isinstance(cache, SQLiteEmbeddingCache)
+        assert get_embedding_cache() is cache
+
+    def test_unknown_backend_disables(self, monkeypatch):
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "EMBEDDING_CACHE_BACKEND", "lmdb")
+        assert get_embedding_cache() is None
@@ -1,14 +1,17 @@
 """Tests for the GraphRAG local PPR retriever.
 
-The GraphStore and embeddings are mocked (no DB, no model load); ``networkx``
-runs for real on small crafted graphs. The composed ClassicRAG is mocked when
+The GraphStore and embeddings are mocked (no DB, no model load); the sparse
+PPR engine runs for real on small crafted graphs. The composed ClassicRAG is mocked when
 exercising the fallback path.
 """
 
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from application.retriever import graph_rag
 from application.retriever.graph_rag import GraphRAGRetriever
 from application.retriever.retriever_creator import RetrieverCreator
 
@@ -67,7 +70,7 @@ class TestGraphRAGFallback:
 
         assert docs == classic_docs
         store.search_nodes_by_embedding.assert_not_called()
-        store.get_subgraph.assert_not_called()
+        store.get_source_graph.assert_not_called()
         # Released early (before the classic fallback checks out of the same
         # pool) and again in _get_data's finally; close() is idempotent.
         assert store.close.called
@@ -108,7 +111,10 @@ def _store_with_graph(
         source_id: len(nodes) for source_id in ids
     }
     store.search_nodes_by_embedding.return_value = seed_rows
-    store.get_subgraph.return_value = {"nodes": nodes, "edges": edges}
+    store.search_nodes_by_embedding_many.side_effect = lambda ids, embedding, k=10: {
+        source_id: list(seed_rows) for source_id in ids
+    }
+    store.get_source_graph.return_value = {"nodes": nodes, "edges": edges}
     store.get_chunk_ids_for_nodes.return_value = node_chunks
     store.get_chunk_texts.return_value = _as_chunk_data(chunk_texts, metadata_by_chunk)
     return store
@@ -157,7 +163,7 @@ class TestGraphRAGPoolDiscipline:
         mock_store_cls.return_value = store
 
         rag = _make_retriever()
-        with patch.object(rag, "_graph_docs_for_source", return_value=[]):
+        with patch.object(rag, "_graph_docs_for_sources", return_value=[[]]):
             with patch.object(rag, "_classic_for_sources") as classic:
                 rag._get_data()
 
@@ -208,8 +214,8 @@ class TestGraphRAGHappyPath:
     ):
         # One seed at cosine distance > 1 (negative similarity) => raw weight
         # 1 - 1.5 < 0. Paired with a positive seed the personalization sums to
-        # ~0, which makes networkx pagerank raise ZeroDivisionError. Clamping
-        # each weight to >= 0 keeps the personalization a valid distribution.
+        # ~0, which is no distribution to normalize. Clamping each weight to
+        # >= 0 keeps the personalization valid.
         nodes = [{"id": "n1", "doc_freq": 1}, {"id": "n2", "doc_freq": 1}]
         edges = [{"src_node_id": "n1", "dst_node_id": "n2", "weight": 1.0}]
         node_chunks = {"n1": ["c1"], "n2": ["c2"]}
@@ -380,7 +386,7 @@ class TestGraphRAGIdf:
 
     @pytest.mark.unit
     def test_idf_helper_monotonic(self):
-        from application.retriever.graph_rag import _idf
+        from application.graphrag.ppr import _idf
 
         assert _idf(1) > _idf(10) > _idf(1000)
 
@@ -663,10 +669,11 @@ class TestGraphRAGBatching:
         docs = rag._get_data()
 
         assert rag._embed_query.call_count == 1
-        assert store.search_nodes_by_embedding.call_count == 2
-        # The one vector is what every source searches with.
-        for call in store.search_nodes_by_embedding.call_args_list:
-            assert call.args[1] == [0.1, 0.2, 0.3]
+        # One seed query covers both sources, with the one shared vector.
+        store.search_nodes_by_embedding_many.assert_called_once_with(
+            ["a", "b"], [0.1, 0.2, 0.3], k=10
+        )
+        store.search_nodes_by_embedding.assert_not_called()
         assert [doc["text"] for doc in docs] == ["graph text", "graph text"]
 
     @patch("application.retriever.graph_rag.num_tokens_from_string", return_value=10)
@@ -677,12 +684,12 @@ class TestGraphRAGBatching:
     ):
         store = _single_node_store({"a": 3, "b": 3, "c": 3})
 
-        def _seed(source_id, embedding, k=10):
+        def _graph(source_id):
             if source_id in ("b", "c"):
                 raise RuntimeError("graph exploded")
-            return [{"id": "n1", "distance": 0.0}]
+            return {"nodes": [{"id": "n1", "doc_freq": 1}], "edges": []}
 
-        store.search_nodes_by_embedding.side_effect = _seed
+        store.get_source_graph.side_effect = _graph
         mock_store_cls.return_value = store
 
         rag = _multi_source_retriever(["a", "b", "c"], chunks=6)
@@ -800,3 +807,99 @@ class TestGraphRAGBatching:
         assert rag._get_data() == []
         mock_store_cls.assert_not_called()
         rag._classic._get_data.assert_not_called()
+
+
+@pytest.mark.unit
+class TestGraphRAGParallelSources:
+    """Graph sources fan out instead of running back to back."""
+
+    @patch("application.retriever.graph_rag.num_tokens_from_string", return_value=10)
+    @patch("application.retriever.graph_rag.GraphStore")
+    @patch("application.retriever.graph_rag.graphrag_available", return_value=True)
+    def test_sources_run_concurrently_on_their_own_stores(
+        self, _avail, mock_store_cls, _tok, _patch_llm_creator, _patch_embed
+    ):
+        store = _single_node_store({"a": 3, "b": 3, "c": 3})
+        # Every source's text fetch waits for the other two: a serial loop
+        # would break the barrier instead of passing it.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _texts(source_id, chunk_ids):
+            barrier.wait()
+            return _as_chunk_data({"c1": f"text {source_id}"})
+
+        store.get_chunk_texts.side_effect = _texts
+        mock_store_cls.return_value = store
+
+        rag = _multi_source_retriever(["a", "b", "c"], chunks=3)
+        docs = rag._get_data()
+
+        assert [doc["text"] for doc in docs] == ["text a", "text b", "text c"]
+        # The shared store plus one per source for each of the two fan-outs,
+        # every one of them handed back.
+        assert mock_store_cls.call_count == 7
+        assert store.close.call_count == 7
+
+    @patch("application.retriever.graph_rag.num_tokens_from_string", return_value=10)
+    @patch("application.retriever.graph_rag.GraphStore")
+    @patch("application.retriever.graph_rag.graphrag_available", return_value=True)
+    def test_merge_keeps_source_order_whatever_finishes_first(
+        self, _avail, mock_store_cls, _tok, _patch_llm_creator, _patch_embed
+    ):
+        store = _single_node_store({"a": 3, "b": 0, "c": 3, "d": 3})
+        delays = {"a": 0.2, "c": 0.1, "d": 0.0}
+
+        def _texts(source_id, chunk_ids):
+            time.sleep(delays[source_id])
+            return _as_chunk_data({"c1": f"text {source_id}"})
+
+        store.get_chunk_texts.side_effect = _texts
+        mock_store_cls.return_value = store
+
+        rag = _multi_source_retriever(["a", "b", "c", "d"], chunks=4)
+        _recording_classic(rag, [_CLASSIC_DOC])
+        docs = rag._get_data()
+
+        assert [doc["text"] for doc in docs] == [
+            "text a", "classic", "text c", "text d",
+        ]
+
+    @patch("application.retriever.graph_rag.num_tokens_from_string", return_value=10)
+    @patch("application.retriever.graph_rag.GraphStore")
+    @patch("application.retriever.graph_rag.graphrag_available", return_value=True)
+    def test_fan_out_leaves_a_pool_slot_for_the_shared_store(
+        self, _avail, mock_store_cls, _tok, _patch_llm_creator, _patch_embed,
+        monkeypatch,
+    ):
+        # A two-connection pool: the shared store holds one, so the graph
+        # sources run serially on it rather than queueing for the other.
+        monkeypatch.setattr(
+            "application.core.settings.settings.PGVECTOR_POOL_MAX_SIZE", 2
+        )
+        store = _single_node_store({"a": 3, "b": 3})
+        mock_store_cls.return_value = store
+
+        rag = _multi_source_retriever(["a", "b"], chunks=4)
+        docs = rag._get_data()
+
+        assert [doc["text"] for doc in docs] == ["graph text", "graph text"]
+        assert mock_store_cls.call_count == 1
+
+    @patch("application.retriever.graph_rag.num_tokens_from_string", return_value=10)
+    @patch("application.retriever.graph_rag.GraphStore")
+    @patch("application.retriever.graph_rag.graphrag_available", return_value=True)
+    def test_walks_share_one_ppr_pass(
+        self, _avail, mock_store_cls, _tok, _patch_llm_creator, _patch_embed
+    ):
+        store = _single_node_store({"a": 3, "b": 3})
+        mock_store_cls.return_value = store
+
+        rag = _multi_source_retriever(["a", "b"], chunks=4)
+        with patch(
+            "application.retriever.graph_rag.pagerank_across_sources",
+            wraps=graph_rag.pagerank_across_sources,
+        ) as ppr:
+            rag._get_data()
+
+        ppr.assert_called_once()
+        assert len(ppr.call_args.args[0]) == 2
@@ -0,0 +1,56 @@
+"""Tests for EmbeddingCacheRepository against ephemeral Postgres."""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from application.storage.db.repositories.embedding_cache import (
+    EmbeddingCacheRepository,
+)
+
+
+class TestEmbeddingCacheRepository:
+    def test_put_then_get(self, pg_conn):
+        repo = EmbeddingCacheRepository(pg_conn)
+        repo.put_many("m", [("h1", b"\x00\x00\x80?"), ("h2", b"\x00\x00\x00@")])
+        assert repo.get_many("m", ["h1", "missing"]) == {"h1": b"\x00\x00\x80?"}
+
+    def test_upsert_replaces_vector(self, pg_conn):
+        repo = EmbeddingCacheRepository(pg_conn)
+        repo.put_many("m", [("h", b"old")])
+        repo.put_many("m", [("h", b"new")])
+        assert repo.get_many("m", ["h"]) == {"h": b"new"}
+
+    def test_models_are_isolated(self, pg_conn):
+        repo = EmbeddingCacheRepository(pg_conn)
+        repo.put_many("m1", [("h", b"v")])
+        assert repo.get_many("m2", ["h"]) == {}
+
+    def test_cleanup_drops_only_stale_rows(self, pg_conn):
+        repo = EmbeddingCacheRepository(pg_conn)
+        repo.put_many("m", [("fresh", b"a"), ("stale", b"b")])
+        pg_conn.execute(
+            text(
+                "UPDATE embedding_cache SET last_used = now() - interval '100 days' "
+                "WHERE text_hash = 'stale'"
+            )
+        )
+        assert repo.cleanup_unused_since(90) == 1
+        assert set(repo.get_many("m", ["fresh", "stale"])) == {"fresh"}
+
+    def test_get_touches_only_day_old_hits(self, pg_conn):
+        repo = EmbeddingCacheRepository(pg_conn)
+        repo.put_many("m", [("recent", b"a"), ("old", b"b")])
+        pg_conn.execute(
+            text(
+                "UPDATE embedding_cache SET last_used = now() - CASE text_hash "
+                "WHEN 'recent' THEN interval '2 hours' ELSE interval '3 days' END"
+            )
+        )
+        assert set(repo.get_many("m", ["recent", "old"])) == {"recent", "old"}
+        touched = dict(
+            pg_conn.execute(
+                text("SELECT text_hash, last_used = now() FROM embedding_cache")
+            ).fetchall()
+        )
+        assert touched == {"recent": False, "old": True}
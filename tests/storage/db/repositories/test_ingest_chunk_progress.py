@@ -60,6 +60,30 @@ class TestInitProgressStatus:
         assert _status(pg_conn, sid) == "active"
 
 
+class TestRecordChunk:
+    def test_keeps_total_by_default(self, pg_conn):
+        sid = "3c000000-0000-0000-0000-0000000000e1"
+        repo = IngestChunkProgressRepository(pg_conn)
+        repo.init_progress(sid, 10, "att-1")
+
+        repo.record_chunk(sid, last_index=3, embedded_chunks=4)
+
+        progress = repo.get_progress(sid)
+        assert progress["embedded_chunks"] == 4
+        assert progress["total_chunks"] == 10
+
+    def test_moves_total_when_given(self, pg_conn):
+        sid = "3c000000-0000-0000-0000-0000000000e2"
+        repo = IngestChunkProgressRepository(pg_conn)
+        repo.init_progress(sid, 1, "att-1")
+
+        repo.record_chunk(sid, last_index=3, embedded_chunks=4, total_chunks=7)
+
+        progress = repo.get_progress(sid)
+        assert progress["last_index"] == 3
+        assert progress["total_chunks"] == 7
+
+
 class TestDelete:
     def test_delete_removes_row(self, pg_conn):
         sid = "3c000000-0000-0000-0000-0000000000d1"
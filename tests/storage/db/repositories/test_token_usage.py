@@ -290,3 +290,32 @@ class TestBucketedTotals:
         )
         assert len(rows) == 1
         assert rows[0]["prompt_tokens"] == 10
+
+
+class TestUsageByBucket:
+    def test_buckets_add_up_to_range_aggregates(self, pg_conn):
+        repo = _repo(pg_conn)
+        base = datetime(2026, 4, 10, 12, 0, tzinfo=timezone.utc)
+        # One request whose calls straddle a bucket boundary.
+        repo.insert(api_key="k-b", prompt_tokens=10, generated_tokens=0,
+                    request_id="r1", timestamp=base + timedelta(seconds=290))
+        repo.insert(api_key="k-b", prompt_tokens=5, generated_tokens=0,
+                    request_id="r1", timestamp=base + timedelta(seconds=310))
+        repo.insert(api_key="k-b", prompt_tokens=1, generated_tokens=1,
+                    timestamp=base + timedelta(seconds=320))
+        repo.insert(api_key="k-b", prompt_tokens=7, generated_tokens=0,
+                    source="title", timestamp=base + timedelta(seconds=330))
+        repo.insert(api_key="k-other", prompt_tokens=99, generated_tokens=0,
+                    timestamp=base + timedelta(seconds=10))
+        start, end = base, base + timedelta(hours=1)
+        buckets = repo.usage_by_bucket(
+            start=start, end=end, api_key="k-b", bucket_seconds=300,
+        )
+        first = int(base.timestamp()) // 300
+        assert buckets == {first: (10, 1), first + 1: (14, 1)}
+        assert sum(t for t, _ in buckets.values()) == repo.sum_tokens_in_range(
+            start=start, end=end, api_key="k-b",
+        )
+        assert sum(r for _, r in buckets.values()) == repo.count_in_range(
+            start=start, end=end, api_key="k-b",
+        )
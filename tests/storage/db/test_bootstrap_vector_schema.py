@@ -178,6 +178,69 @@ class TestEnsureVectorSchemaDimensionCheck:
         assert vector_schema.call_args.kwargs["dimension"] == 768
 
 
+@pytest.mark.unit
+class TestTsvectorBackfill:
+    def _run(self, pending):
+        conn = MagicMock()
+        with patch("psycopg.connect", return_value=conn), patch(
+            "application.vectorstore.base.get_embeddings",
+            return_value=_embeddings(768),
+        ), patch("application.vectorstore.pgvector.PGVectorStore.create_schema"), patch(
+            "application.vectorstore.pgvector.PGVectorStore.table_dimension",
+            return_value=768,
+        ), patch(
+            "application.vectorstore.pgvector.PGVectorStore.tsvector_backfill_pending",
+            return_value=pending,
+        ), patch("application.celery_init.celery.send_task") as send_task:
+            ensure_vector_schema()
+        return conn, send_task
+
+    def test_boot_queues_the_backfill_when_pending(self, vector_settings):
+        conn, send_task = self._run(pending=True)
+
+        send_task.assert_called_once_with(
+            "application.api.user.tasks.backfill_pgvector_tsvector"
+        )
+        conn.commit.assert_called_once()
+
+    def test_boot_queues_nothing_otherwise(self, vector_settings):
+        _, send_task = self._run(pending=False)
+
+        send_task.assert_not_called()
+
+    def test_a_broker_outage_does_not_fail_boot(self, vector_settings):
+        with patch(
+            "application.celery_init.celery.send_task",
+            side_effect=ConnectionError("broker down"),
+        ):
+            from application.storage.db.bootstrap import _enqueue_tsvector_backfill
+
+            _enqueue_tsvector_backfill(MagicMock())  # must not raise
+
+    def test_backfill_uses_an_autocommit_connection(self, vector_settings):
+        from application.storage.db.bootstrap import backfill_vector_tsvector
+
+        conn = MagicMock()
+        with patch("psycopg.connect", return_value=conn) as connect, patch(
+            "application.vectorstore.pgvector.PGVectorStore.backfill_tsvector",
+            return_value=42,
+        ) as backfill:
+            result = backfill_vector_tsvector()
+
+        assert result == {"filled": 42}
+        assert connect.call_args.kwargs["autocommit"] is True
+        assert backfill.call_args.kwargs["batch_size"] == 5000
+        conn.close.assert_called_once()
+
+    def test_backfill_skips_other_stores(self, vector_settings, monkeypatch):
+        from application.storage.db.bootstrap import backfill_vector_tsvector
+
+        monkeypatch.setattr(vector_settings, "VECTOR_STORE", "faiss", raising=False)
+        with patch("psycopg.connect") as connect:
+            assert "skipped" in backfill_vector_tsvector()
+        connect.assert_not_called()
+
+
 @pytest.mark.unit
 class TestBootGating:
     """The boot hook must stay behind AUTO_VECTOR_SCHEMA.
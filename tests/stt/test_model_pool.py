@@ -0,0 +1,173 @@
+"""Tests for application/stt/model_pool.py"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from application.stt import model_pool
+from application.stt.faster_whisper_stt import FasterWhisperSTT
+from application.stt.model_pool import WhisperModelPool
+
+KEY = ("base", "auto", "int8")
+
+
+def _whisper_module():
+    module = MagicMock()
+    info = MagicMock(language="en", duration=2.0)
+    module.WhisperModel.return_value.transcribe.side_effect = lambda *a, **kw: (
+        iter([MagicMock(text=" hi ", start=0.0, end=1.0)]),
+        info,
+    )
+    return module
+
+
+@pytest.mark.unit
+class TestSharedModels:
+    def test_instances_share_one_load(self):
+        module = _whisper_module()
+        with patch.dict("sys.modules", {"faster_whisper": module}):
+            for _ in range(3):
+                assert FasterWhisperSTT().transcribe(Path("a.wav"))["text"] == "hi"
+        assert module.WhisperModel.call_count == 1
+        assert model_pool.get_model_pool().stats()["loads"] == 1
+
+    def test_models_are_keyed_by_size_device_and_compute_type(self):
+        module = _whisper_module()
+        with patch.dict("sys.modules", {"faster_whisper": module}):
+            FasterWhisperSTT()._get_model()
+            FasterWhisperSTT(compute_type="float16")._get_model()
+        assert module.WhisperModel.call_count == 2
+
+    def test_concurrent_first_use_loads_once(self):
+        loads = []
+
+        def slow_loader():
+            loads.append(1)
+            time.sleep(0.05)
+            return object()
+
+        pool = WhisperModelPool()
+        threads = [
+            threading.Thread(target=pool.get, args=(KEY, slow_loader)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(loads) == 1
+
+
+@pytest.mark.unit
+class TestSlots:
+    def test_inferences_per_model_are_bounded(self):
+        pool = WhisperModelPool(max_concurrency=2)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def infer():
+            with pool.slot(KEY):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=infer) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert peak[0] == 2
+
+
+@pytest.mark.unit
+class TestChunkBatcher:
+    def test_concurrent_chunks_run_as_one_group(self):
+        pool = WhisperModelPool(batch_window_ms=200, batch_size=8)
+        batcher = pool.batcher(KEY)
+        threads_seen, results = set(), []
+
+        def chunk(n):
+            threads_seen.add(threading.current_thread().name)
+            return n * 10
+
+        callers = [
+            threading.Thread(target=lambda n=n: results.append(batcher.run(lambda: chunk(n))))
+            for n in range(3)
+        ]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+        assert sorted(results) == [0, 10, 20]
+        assert batcher.batches == 1
+        assert threads_seen == {"stt-chunk-batcher"}
+
+    def test_groups_use_every_slot(self):
+        pool = WhisperModelPool(max_concurrency=2, batch_window_ms=1, batch_size=1)
+        batcher = pool.batcher(KEY)
+        both_running = threading.Barrier(2, timeout=5)
+
+        def chunk():
+            both_running.wait()  # only returns once two groups run at once
+            return "ok"
+
+        results = []
+        callers = [
+            threading.Thread(target=lambda: results.append(batcher.run(chunk)))
+            for _ in range(2)
+        ]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+        assert results == ["ok", "ok"]
+        assert batcher.batches == 2
+
+    def test_errors_reach_their_caller_only(self):
+        batcher = WhisperModelPool(batch_window_ms=1).batcher(KEY)
+        with pytest.raises(RuntimeError, match="bad chunk"):
+            batcher.run(MagicMock(side_effect=RuntimeError("bad chunk")))
+        assert batcher.run(lambda: "next") == "next"
+
+    def test_live_chunks_go_through_the_batcher(self, monkeypatch):
+        pool = WhisperModelPool(batch_window_ms=1)
+        monkeypatch.setattr(model_pool, "_POOL", pool)
+        monkeypatch.setattr(model_pool, "_POOL_PID", model_pool.os.getpid())
+        with patch.dict("sys.modules", {"faster_whisper": _whisper_module()}):
+            result = FasterWhisperSTT().transcribe_chunk(Path("c.wav"), language="en")
+        assert result["text"] == "hi"
+        assert pool.stats()["chunk_batches"] == 1
+
+    def test_batching_is_off_by_default(self):
+        assert WhisperModelPool().batcher(KEY) is None
+
+    def test_zero_window_transcribes_directly(self, monkeypatch):
+        pool = WhisperModelPool(batch_window_ms=0)
+        monkeypatch.setattr(model_pool, "_POOL", pool)
+        monkeypatch.setattr(model_pool, "_POOL_PID", model_pool.os.getpid())
+        assert pool.batcher(KEY) is None
+        with patch.dict("sys.modules", {"faster_whisper": _whisper_module()}):
+            assert FasterWhisperSTT().transcribe_chunk(Path("c.wav"))["text"] == "hi"
+
+
+@pytest.mark.unit
+class TestPreload:
+    def test_preload_loads_the_configured_model(self, monkeypatch):
+        module = _whisper_module()
+        monkeypatch.setattr("application.core.settings.settings.STT_PRELOAD_MODEL", True)
+        monkeypatch.setattr("application.core.settings.settings.STT_PROVIDER", "faster_whisper")
+        with patch.dict("sys.modules", {"faster_whisper": module}):
+            model_pool.preload_default_model()
+            FasterWhisperSTT().transcribe(Path("a.wav"))
+        assert module.WhisperModel.call_count == 1
+
+    def test_preload_is_off_by_default(self):
+        module = _whisper_module()
+        with patch.dict("sys.modules", {"faster_whisper": module}):
+            model_pool.preload_default_model()
+        module.WhisperModel.assert_not_called()
@@ -1,7 +1,9 @@
 import json
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+import application.cache as cache_module
 from application.cache import (
     gen_cache,
     gen_cache_key,
@@ -97,7 +99,8 @@ def test_stream_cache_hit(mock_make_redis):
 
     result = list(mock_function(None, model, messages, stream=True, tools=None))
 
-    assert result == ["chunk1", "chunk2"]
+    # Pre-v1 entries still replay, coalesced into one frame.
+    assert result == ["chunk1chunk2"]
     mock_redis_instance.get.assert_called_once()
     mock_redis_instance.set.assert_not_called()
 
@@ -947,7 +950,7 @@ def test_gen_and_stream_caches_do_not_share_a_key_space(mock_make_redis):
 
     replayed = list(streamer_again(None, "m", messages, stream=True, tools=None))
 
-    assert replayed == ["alpha", "beta"]
+    assert replayed == ["alphabeta"]
     assert not upstream_calls
 
 
@@ -975,3 +978,74 @@ def test_a_json_array_answer_is_never_replayed_as_stream_chunks(mock_make_redis)
         yield "fresh"
 
     assert list(streamer(None, "m", messages, stream=True, tools=None)) == ["fresh"]
+
+
+# ── stream_cache replay frames and compression ─────────────────────────────
+
+
+@pytest.mark.unit
+class TestStreamCacheEntries:
+    @pytest.fixture
+    def fake(self):
+        fake = _FakeRedis()
+        with patch("application.cache.get_redis_instance", return_value=fake):
+            yield fake
+
+    @staticmethod
+    def _stream(chunks, upstream_calls=None):
+        @stream_cache
+        def streamer(self, model, messages, stream, tools, **kwargs):
+            if upstream_calls is not None:
+                upstream_calls.append(1)
+            yield from chunks
+
+        messages = [{"role": "user", "content": "replay"}]
+        return list(streamer(None, "m", messages, stream=True, tools=None))
+
+    def test_hit_replays_coalesced_frames_without_sleeping(self, fake):
+        thought = {"type": "thought", "thought": "hmm"}
+        chunks = ["a"] * 600 + [thought] + ["b"] * 3
+        assert self._stream(chunks) == chunks
+
+        calls = []
+        with patch("time.sleep", side_effect=AssertionError("slept")):
+            replayed = self._stream(["unused"], calls)
+        assert replayed == ["a" * 600, thought, "bbb"]
+        assert not calls
+
+    def test_entries_are_compressed(self, fake):
+        self._stream(["word "] * 2000)
+        (entry,) = fake.store.values()
+        assert entry.startswith(cache_module._STREAM_ENTRY_MAGIC)
+        assert len(entry) < len(json.dumps(["word "] * 2000)) // 20
+
+    def test_frames_are_bounded_by_setting(self, fake):
+        with patch.object(cache_module.settings, "STREAM_CACHE_FRAME_CHARS", 4):
+            self._stream(["ab"] * 5)
+            assert self._stream([]) == ["abab", "abab", "ab"]
+
+    def test_oversized_stream_is_not_cached(self, fake):
+        with patch.object(cache_module.settings, "STREAM_CACHE_MAX_BYTES", 64):
+            result = self._stream([os.urandom(8).hex() for _ in range(50)])
+        assert len(result) == 50
+        assert fake.store == {}
+
+    def test_version_1_entries_still_replay(self, fake):
+        messages = [{"role": "user", "content": "replay"}]
+        key = "stream:" + cache_module.gen_cache_key(messages, "m")
+        fake.store[key] = json.dumps(
+            {"version": 1, "chunks": ["x", "y", {"type": "thought", "thought": "t"}]}
+        ).encode()
+        assert self._stream(["unused"]) == ["xy", {"type": "thought", "thought": "t"}]
+
+    def test_gen_cache_ignores_compressed_stream_entries(self, fake):
+        self._stream(["alpha"])
+        (key,) = fake.store
+        fake.store[key.replace("stream:", "gen:", 1)] = fake.store[key]
+
+        @gen_cache
+        def generator(self, model, messages, stream, tools, **kwargs):
+            return "fresh"
+
+        messages = [{"role": "user", "content": "replay"}]
+        assert generator(None, "m", messages, stream=False, tools=None) == "fresh"
@@ -2061,14 +2061,14 @@ class TestFaissStore:
             ms.EMBEDDINGS_NAME = "test"
             return FaissStore(source_id, "key", docs_init=docs_init)
 
-    def test_faiss_save_to_storage_writes_all_three_files(self, tmp_path):
+    def test_faiss_save_to_storage_writes_index_and_sidecar(self, tmp_path):
         from application.storage.local import LocalStorage
 
         storage = LocalStorage(base_dir=str(tmp_path))
         store = self._make(storage, docs_init=[self._Doc("hello", {"source": "a"})])
 
         assert store._save_to_storage() is True
-        for name in ("index.faiss", "index.json", "index.pkl"):
+        for name in ("index.faiss", "index.docs"):
             assert storage.file_exists(f"indexes/test/{name}"), name
 
     def test_faiss_init_load_from_storage(self, tmp_path):
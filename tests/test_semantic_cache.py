@@ -0,0 +1,223 @@
+"""Tests for the per-agent semantic answer cache."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from application import semantic_cache
+from application.guardrails.config import AgentConfig
+from application.semantic_cache import SemanticCache, context_fingerprint
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.kv = {}
+        self.hashes = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.kv.get(key)
+
+    def incr(self, key):
+        self.kv[key] = str(int(self.kv.get(key, 0)) + 1).encode()
+        return int(self.kv[key])
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value.encode()
+
+    def hvals(self, key):
+        return list(self.hashes.get(key, {}).values())
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+# Questions about refunds point one way, everything else another.
+def _embed(text):
+    return [1.0, 0.05 * len(text) % 0.2] if "refund" in text.lower() else [0.0, 1.0]
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    return SemanticCache(_FakeRedis(), max_entries=3, clock=clock)
+
+
+def _lookup(cache, question, context="ctx", threshold=0.95, ttl=60, embed=_embed):
+    return cache.lookup("agent", context, question, embed, threshold, ttl)
+
+
+@pytest.mark.unit
+class TestSemanticCache:
+    def test_paraphrase_is_answered_from_the_cache(self, cache):
+        cache.store("agent", "ctx", "How do I get a refund?", "Email us.", _embed, 60)
+        hit = _lookup(cache, "how can I request a refund")
+        assert hit.answer == "Email us."
+        assert hit.score >= 0.95
+        assert cache.stats()["hits"] == 1
+
+    def test_unrelated_question_misses(self, cache):
+        cache.store("agent", "ctx", "How do I get a refund?", "Email us.", _embed, 60)
+        assert _lookup(cache, "What are your opening hours?") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_identical_question_skips_embedding(self, cache):
+        cache.store("agent", "ctx", "How do I get a refund?", "Email us.", _embed, 60)
+        embed = Mock(side_effect=AssertionError("embedded an exact repeat"))
+        hit = _lookup(cache, "  How do I\tget a refund? ", embed=embed)
+        assert hit.answer == "Email us." and hit.score == 1.0
+        assert cache.stats()["exact_hits"] == 1
+
+    def test_other_context_misses(self, cache):
+        cache.store("agent", "ctx", "How do I get a refund?", "Email us.", _embed, 60)
+        assert _lookup(cache, "How do I get a refund?", context="other") is None
+
+    def test_entries_expire(self, cache, clock):
+        cache.store("agent", "ctx", "How do I get a refund?", "Email us.", _embed, 60)
+        clock.now += 61
+        assert _lookup(cache, "How do I get a refund?") is None
+
+    def test_invalidate_hides_earlier_answers(self, cache):
+        cache.store("agent", "ctx", "How do I get a refund?", "Email us.", _embed, 60)
+        cache.invalidate("agent")
+        assert _lookup(cache, "How do I get a refund?") is None
+        cache.store("agent", "ctx", "How do I get a refund?", "Use the form.", _embed, 60)
+        assert _lookup(cache, "How do I get a refund?").answer == "Use the form."
+
+    def test_bucket_keeps_newest_entries(self, cache, clock):
+        for n in range(5):
+            clock.now += 1
+            cache.store("agent", "ctx", f"question {n}", f"answer {n}", _embed, 60)
+        (bucket,) = cache.redis.hashes.values()
+        assert len(bucket) == 3
+        assert _lookup(cache, "question 4").answer == "answer 4"
+        assert _lookup(cache, "question 0", threshold=1.01) is None
+
+    def test_redis_errors_read_as_misses(self, clock):
+        broken = Mock()
+        broken.get.side_effect = ConnectionError("down")
+        cache = SemanticCache(broken, clock=clock)
+        assert _lookup(cache, "How do I get a refund?") is None
+        cache.store("agent", "ctx", "How do I get a refund?", "Email us.", _embed, 60)
+        assert cache.stats()["errors"] == 2
+
+
+@pytest.mark.unit
+class TestContextFingerprint:
+    def test_doc_order_does_not_matter(self):
+        docs = [{"title": "a", "text": "one"}, {"title": "b", "text": "two"}]
+        assert context_fingerprint("m", "p", docs) == context_fingerprint("m", "p", docs[::-1])
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("m2", "p", [{"title": "a", "text": "one"}], None),
+            ("m", "p2", [{"title": "a", "text": "one"}], None),
+            ("m", "p", [{"title": "a", "text": "one, re-ingested"}], None),
+            ("m", "p", [{"title": "a", "text": "one"}], {"temperature": 1}),
+        ],
+    )
+    def test_answer_inputs_change_it(self, changed):
+        base = context_fingerprint("m", "p", [{"title": "a", "text": "one"}])
+        assert context_fingerprint(*changed) != base
+
+
+@pytest.mark.unit
+class TestAgentConfig:
+    def test_disabled_by_default(self):
+        assert AgentConfig.parse({}).semantic_cache.enabled is False
+
+    def test_out_of_range_threshold_is_rejected_on_write(self):
+        with pytest.raises(Exception):
+            AgentConfig.model_validate({"semantic_cache": {"threshold": 0.1}})
+
+    def test_bad_section_does_not_cost_the_guardrails(self):
+        parsed = AgentConfig.parse(
+            {"guardrails": {"enabled": True}, "semantic_cache": {"threshold": 7}}
+        )
+        assert parsed.guardrails.enabled is True
+        assert parsed.semantic_cache.enabled is False
+
+
+@pytest.mark.unit
+class TestAgentReplay:
+    @pytest.fixture
+    def installed(self, monkeypatch, clock):
+        cache = SemanticCache(_FakeRedis(), clock=clock)
+        monkeypatch.setattr(semantic_cache, "_CACHE", cache)
+        monkeypatch.setattr(semantic_cache, "resolve_ttl", lambda: 60)
+        monkeypatch.setattr(
+            "application.vectorstore.base.get_embeddings",
+            lambda: Mock(embed_query=_embed),
+        )
+        return cache
+
+    @pytest.fixture
+    def agent(self, agent_base_params, mock_llm_creator, mock_llm_handler_creator):
+        from application.agents.classic_agent import ClassicAgent
+
+        return ClassicAgent(
+            **agent_base_params,
+            agent_id="agent-1",
+            retrieved_docs=[{"title": "FAQ", "text": "Refunds via email."}],
+            agent_config={"semantic_cache": {"enabled": True}},
+        )
+
+    def _run(self, agent, question, answer="Email us."):
+        with patch.object(
+            agent, "_gen_inner", return_value=iter([{"answer": answer}])
+        ) as inner:
+            events = list(agent.gen(question))
+        return events, inner
+
+    def test_similar_question_is_replayed(self, installed, agent):
+        _, inner = self._run(agent, "How do I get a refund?")
+        inner.assert_called_once()
+        events, inner = self._run(agent, "how can I request a refund", answer="new")
+        inner.assert_not_called()
+        assert events[0] == {"answer": "Email us."}
+        assert {"sources": agent.retrieved_docs} in events
+        assert installed.stats()["hits"] == 1
+
+    def test_follow_up_turns_are_not_cached(self, installed, agent):
+        agent.chat_history = [{"prompt": "hi", "response": "hello"}]
+        self._run(agent, "How do I get a refund?")
+        _, inner = self._run(agent, "How do I get a refund?")
+        inner.assert_called_once()
+        assert installed.stats()["stores"] == 0
+
+    def test_answers_using_tools_are_not_stored(self, installed, agent):
+        agent.tool_executor.tool_calls = [{"tool_name": "search"}]
+        self._run(agent, "How do I get a refund?")
+        assert installed.stats()["stores"] == 0
+
+    def test_agents_without_opt_in_skip_the_cache(self, installed, agent):
+        agent.semantic_cache_config = AgentConfig.parse({}).semantic_cache
+        self._run(agent, "How do I get a refund?")
+        _, inner = self._run(agent, "How do I get a refund?")
+        inner.assert_called_once()
@@ -0,0 +1,185 @@
+"""Tests for application/usage_quota.py"""
+
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from application import usage_quota
+from application.usage import _persist_call_usage
+
+REPO = "application.storage.db.repositories.token_usage.TokenUsageRepository"
+
+
+class _FakeRedis:
+    """In-memory Redis whose ``eval`` re-implements the three quota scripts."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.strings = set()
+        self.fail = False
+
+    def eval(self, script, numkeys, *args):
+        if self.fail:
+            raise ConnectionError("redis down")
+        keys, argv = args[:numkeys], [str(a) for a in args[numkeys:]]
+        if script == usage_quota._RECORD_LUA:
+            counters, seeded, request_key = keys
+            if seeded not in self.strings:
+                return 0
+            fields = self.hashes.setdefault(counters, {})
+            if int(argv[1]) > 0:
+                field = f"t:{argv[0]}"
+                fields[field] = fields.get(field, 0) + int(argv[1])
+            if argv[2] == "1" or (argv[2] == "2" and request_key not in self.strings):
+                self.strings.add(request_key)
+                field = f"r:{argv[0]}"
+                fields[field] = fields.get(field, 0) + 1
+            return 1
+        if script == usage_quota._READ_LUA:
+            counters, seeded = keys
+            if seeded not in self.strings:
+                return None
+            fields = self.hashes.get(counters, {})
+            oldest = int(argv[0])
+            tokens = requests = 0
+            for field, value in list(fields.items()):
+                if int(field[2:]) < oldest:
+                    del fields[field]
+                elif field.startswith("t"):
+                    tokens += value
+                else:
+                    requests += value
+            return [tokens, requests]
+        if script == usage_quota._SEED_LUA:
+            counters, seeded = keys
+            pairs = argv[2:]
+            self.hashes[counters] = {
+                pairs[i]: int(pairs[i + 1]) for i in range(0, len(pairs), 2)
+            }
+            self.strings.add(seeded)
+            return 1
+        raise AssertionError("unexpected script")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(usage_quota, "get_redis_instance", lambda: fake)
+    return fake
+
+
+def _bucket(offset=0):
+    return int(time.time()) // usage_quota.resolve_bucket_seconds() + offset
+
+
+def _repo(buckets=None, tokens=0, requests=0):
+    repo = MagicMock()
+    repo.usage_by_bucket.return_value = buckets or {}
+    repo.sum_tokens_in_range.return_value = tokens
+    repo.count_in_range.return_value = requests
+    return repo
+
+
+@pytest.mark.unit
+class TestRollingUsage:
+    def test_without_redis_uses_sql_aggregates(self):
+        repo = _repo(tokens=120, requests=3)
+        with patch(REPO, return_value=repo):
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (120, 3)
+        repo.usage_by_bucket.assert_not_called()
+
+    def test_without_redis_skips_unrequested_aggregate(self):
+        repo = _repo(tokens=120)
+        with patch(REPO, return_value=repo):
+            assert usage_quota.rolling_usage(MagicMock(), "key", requests=False) == (120, 0)
+        repo.count_in_range.assert_not_called()
+
+    def test_first_check_seeds_then_redis_answers(self, fake_redis):
+        repo = _repo(buckets={_bucket(-2): (40, 1), _bucket(): (60, 2)})
+        with patch(REPO, return_value=repo):
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (100, 3)
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (100, 3)
+        repo.usage_by_bucket.assert_called_once()
+        repo.sum_tokens_in_range.assert_not_called()
+
+    def test_expired_buckets_are_dropped(self, fake_redis):
+        stale = _bucket() - usage_quota.WINDOW_SECONDS // usage_quota.resolve_bucket_seconds() - 1
+        repo = _repo(buckets={stale: (500, 5), _bucket(): (7, 1)})
+        with patch(REPO, return_value=repo):
+            usage_quota.rolling_usage(MagicMock(), "key")
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (7, 1)
+        (fields,) = fake_redis.hashes.values()
+        assert set(fields) == {f"t:{_bucket()}", f"r:{_bucket()}"}
+
+    def test_redis_errors_fall_back_to_sql(self, fake_redis):
+        fake_redis.fail = True
+        repo = _repo(tokens=9, requests=1)
+        with patch(REPO, return_value=repo):
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (9, 1)
+
+    def test_zero_reconcile_interval_disables_counters(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(
+            "application.core.settings.settings.USAGE_QUOTA_RECONCILE_SECONDS", 0
+        )
+        repo = _repo(tokens=9, requests=1)
+        with patch(REPO, return_value=repo):
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (9, 1)
+        assert fake_redis.hashes == {}
+
+
+@pytest.mark.unit
+class TestRecordUsage:
+    def _seed(self, fake_redis):
+        with patch(REPO, return_value=_repo()):
+            usage_quota.rolling_usage(MagicMock(), "key")
+
+    def test_unseeded_counters_are_left_to_the_rebuild(self, fake_redis):
+        usage_quota.record_usage("key", 50, "agent_stream", "req-1")
+        assert fake_redis.hashes == {}
+
+    def test_request_counted_once_per_request_id(self, fake_redis):
+        self._seed(fake_redis)
+        for _ in range(3):
+            usage_quota.record_usage("key", 10, "agent_stream", "req-1")
+        usage_quota.record_usage("key", 5, "agent_stream", None)
+        usage_quota.record_usage("key", 5, "agent_stream", None)
+        with patch(REPO) as repo_cls:
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (40, 3)
+        repo_cls.return_value.usage_by_bucket.assert_not_called()
+
+    def test_side_channel_calls_add_tokens_only(self, fake_redis):
+        self._seed(fake_redis)
+        usage_quota.record_usage("key", 8, "title", "req-1")
+        with patch(REPO):
+            assert usage_quota.rolling_usage(MagicMock(), "key") == (8, 0)
+
+    def test_persisted_api_key_calls_are_recorded(self):
+        llm = MagicMock(decoded_token=None, user_api_key="key", agent_id=None)
+        llm._token_usage_source = None
+        llm._request_id = "req-9"
+
+        @contextmanager
+        def session():
+            yield MagicMock()
+
+        with patch("application.usage.db_session", session), patch(
+            "application.usage.TokenUsageRepository"
+        ), patch("application.usage.record_usage") as record:
+            _persist_call_usage(llm, {"prompt_tokens": 3, "generated_tokens": 4})
+        record.assert_called_once_with("key", 7, "agent_stream", "req-9")
+
+    def test_failed_inserts_are_not_recorded(self):
+        llm = MagicMock(decoded_token=None, user_api_key="key", agent_id=None)
+
+        @contextmanager
+        def session():
+            raise RuntimeError("db down")
+            yield
+
+        with patch("application.usage.db_session", session), patch(
+            "application.usage.record_usage"
+        ) as record:
+            _persist_call_usage(llm, {"prompt_tokens": 3, "generated_tokens": 4})
+        record.assert_not_called()
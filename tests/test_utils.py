@@ -20,6 +20,7 @@ from application.utils import (
     limit_chat_history,
     num_tokens_from_object_or_list,
     num_tokens_from_string,
+    num_tokens_from_strings,
     safe_filename,
     truncate_to_line_boundary,
     validate_function_name,
@@ -127,6 +128,11 @@ class TestNumTokens:
         assert count > 100000
         assert elapsed < 10, f"pathological encode took {elapsed:.1f}s — tiktoken downgraded?"
 
+    @pytest.mark.unit
+    def test_batch_counts_match_single_counts(self):
+        texts = ["hello world", "", 42, "<|endoftext|> marker text"]
+        assert num_tokens_from_strings(texts) == [num_tokens_from_string(t) for t in texts]
+
 
 class TestNumTokensFromObjectOrList:
 
@@ -311,3 +311,25 @@ class TestUploadIndex:
         mock_post.assert_called_once()
         files = mock_post.call_args.kwargs["files"]
         assert "file_faiss" in files and "file_pkl" in files
+
+    def test_faiss_prefers_binary_sidecar(self, tmp_path):
+        from application.worker import upload_index
+
+        (tmp_path / "index.faiss").write_bytes(b"faiss-bytes")
+        (tmp_path / "index.docs").write_bytes(b"docs-bytes")
+        (tmp_path / "index.pkl").write_bytes(b"pkl-bytes")
+        mock_response = MagicMock()
+
+        with patch(
+            "application.worker.settings.VECTOR_STORE", "faiss"
+        ), patch(
+            "application.worker.settings.API_URL", "http://api/"
+        ), patch(
+            "application.worker.settings.INTERNAL_KEY", ""
+        ), patch(
+            "application.worker.requests.post", return_value=mock_response,
+        ) as mock_post:
+            upload_index(str(tmp_path), {"source_id": "1"})
+
+        files = mock_post.call_args.kwargs["files"]
+        assert set(files) == {"file_faiss", "file_docs"}
@@ -30,7 +30,7 @@ class TestRemoteEmbeddings:
         emb = RemoteEmbeddings(api_url="http://host", model_name="m")
         assert "Authorization" not in emb.headers
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_sends_correct_payload(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {
@@ -48,7 +48,7 @@ class TestRemoteEmbeddings:
         assert call_kwargs[1]["json"]["model"] == "model-v1"
         assert result == [[0.1, 0.2]]
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_sorts_by_index(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {
@@ -64,7 +64,7 @@ class TestRemoteEmbeddings:
         result = emb._embed(["a", "b"])
         assert result == [[0.1, 0.2], [0.3, 0.4]]
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_raises_on_error_response(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {"error": "rate limit exceeded"}
@@ -75,7 +75,7 @@ class TestRemoteEmbeddings:
         with pytest.raises(ValueError, match="rate limit exceeded"):
             emb._embed("test")
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_raises_on_unexpected_format(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {"unexpected": True}
@@ -86,7 +86,7 @@ class TestRemoteEmbeddings:
         with pytest.raises(ValueError, match="Unexpected response format"):
             emb._embed("test")
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_raises_on_non_dict_response(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = [1, 2, 3]
@@ -97,7 +97,7 @@ class TestRemoteEmbeddings:
         with pytest.raises(ValueError, match="Unexpected response format"):
             emb._embed("test")
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_query(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {
@@ -112,7 +112,7 @@ class TestRemoteEmbeddings:
         assert result == [0.1, 0.2, 0.3]
         assert emb.dimension == 3
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_query_raises_on_bad_structure(self, mock_post):
         mock_resp = Mock()
         # Return multiple embeddings for a single query
@@ -129,7 +129,7 @@ class TestRemoteEmbeddings:
         with pytest.raises(ValueError, match="Unexpected result structure"):
             emb.embed_query("hello")
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_embed_documents(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {
@@ -151,7 +151,7 @@ class TestRemoteEmbeddings:
         emb = RemoteEmbeddings("http://host", "m")
         assert emb.embed_documents([]) == []
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_call_with_string(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {
@@ -164,7 +164,7 @@ class TestRemoteEmbeddings:
         result = emb("hello")
         assert result == [0.5]
 
-    @patch("application.vectorstore.base.requests.post")
+    @patch("application.vectorstore.base.requests.Session.post")
     def test_call_with_list(self, mock_post):
         mock_resp = Mock()
         mock_resp.json.return_value = {
@@ -461,6 +461,52 @@ class TestSearchWithScoresDefault:
         assert _Store().search_with_scores("q") == []
 
 
+@pytest.mark.unit
+class TestGetChunksPageDefault:
+    def _store(self, chunks):
+        from application.vectorstore.base import BaseVectorStore
+
+        class _Store(BaseVectorStore):
+            def search(self, *args, **kwargs):
+                return []
+
+            def add_texts(self, texts, metadatas=None, *args, **kwargs):
+                return []
+
+            def get_chunks(self):
+                return chunks
+
+        return _Store()
+
+    def test_pages_and_counts(self):
+        chunks = [{"text": f"c{i}", "metadata": {}} for i in range(5)]
+
+        assert self._store(chunks).get_chunks_page(offset=3, limit=10) == (chunks[3:], 5)
+
+    def test_path_suffix_matches_source_or_file_path(self):
+        chunks = [
+            {"text": "a", "metadata": {"source": "/x/a.md"}},
+            {"text": "b", "metadata": {"file_path": "y/a.md"}},
+            {"text": "c", "metadata": {"source": "/x/c.md", "title": None}},
+        ]
+
+        page, total = self._store(chunks).get_chunks_page(path_suffix="a.md")
+        assert total == 2 and [c["text"] for c in page] == ["a", "b"]
+
+    def test_search_is_case_insensitive_over_text_and_title(self):
+        chunks = [
+            {"text": "The Cat", "metadata": {}},
+            {"text": "dog", "metadata": {"title": "CATalog"}},
+            {"text": "bird", "metadata": {"title": None}},
+        ]
+
+        _, total = self._store(chunks).get_chunks_page(search="cat")
+        assert total == 2
+
+    def test_store_without_chunks_is_empty(self):
+        assert self._store(None).get_chunks_page() == ([], 0)
+
+
 # --- get_embeddings (the single resolver) ---
 
 
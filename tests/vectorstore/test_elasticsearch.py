@@ -290,3 +290,49 @@ class TestElasticsearchStoreConnectToElasticsearch:
                 api_key="my-api-key",
             )
             assert result is mock_es
+
+
+@pytest.mark.unit
+class TestElasticsearchStoreGetChunksPage:
+    def test_builds_a_filtered_counted_page_query(self):
+        store, mock_es, _ = _make_es_store(source_id="src")
+        mock_es.search.return_value = {
+            "hits": {
+                "total": {"value": 42},
+                "hits": [{"_id": "c1", "_source": {"text": "hello", "metadata": {"a": 1}}}],
+            }
+        }
+
+        chunks, total = store.get_chunks_page(
+            offset=20, limit=10, path_suffix="dir/a*.md", search="hello"
+        )
+
+        kwargs = mock_es.search.call_args.kwargs
+        assert kwargs["from_"] == 20 and kwargs["size"] == 10
+        assert kwargs["track_total_hits"] is True
+        filters = kwargs["query"]["bool"]["filter"]
+        assert filters[0] == {"match": {"metadata.source_id.keyword": "src"}}
+        path_clause = filters[1]["bool"]["should"][0]["wildcard"]
+        assert path_clause["metadata.source.keyword"]["value"] == "*dir/a\\*.md"
+        assert filters[2]["bool"]["should"][0] == {
+            "wildcard": {"text": {"value": "*hello*", "case_insensitive": True}}
+        }
+        assert total == 42
+        assert chunks == [{"doc_id": "c1", "text": "hello", "metadata": {"a": 1}}]
+
+    def test_search_with_spaces_is_a_phrase_match(self):
+        store, mock_es, _ = _make_es_store(source_id="src")
+        mock_es.search.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
+
+        store.get_chunks_page(search="hello world")
+
+        filters = mock_es.search.call_args.kwargs["query"]["bool"]["filter"]
+        text_clause, title_clause = filters[1]["bool"]["should"]
+        assert text_clause == {"match_phrase": {"text": "hello world"}}
+        assert title_clause["wildcard"]["metadata.title.keyword"]["value"] == "*hello world*"
+
+    def test_returns_empty_on_error(self):
+        store, mock_es, _ = _make_es_store()
+        mock_es.search.side_effect = Exception("down")
+
+        assert store.get_chunks_page() == ([], 0)
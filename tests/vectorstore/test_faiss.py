@@ -4,7 +4,7 @@ The store no longer wraps langchain, so these drive the actual index rather
 than asserting that calls were forwarded to a mock.
 """
 
-import json
+import io
 from unittest.mock import Mock, patch
 
 import pytest
@@ -43,6 +43,16 @@ class _SeedDoc:
         self.metadata = metadata
 
 
+@pytest.fixture(autouse=True)
+def index_cache(monkeypatch):
+    """Give every test its own process index cache."""
+    from application.vectorstore import faiss_index_cache
+
+    fresh = faiss_index_cache.FaissIndexCache(max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(faiss_index_cache, "_CACHE", fresh)
+    return fresh
+
+
 @pytest.fixture
 def storage(tmp_path):
     return LocalStorage(base_dir=str(tmp_path))
@@ -112,6 +122,13 @@ class TestFaissStore:
         assert populated.index.ntotal == 4
         assert len(populated.get_chunks()) == 4
 
+    def test_add_texts_uses_precomputed_vectors(self, populated):
+        populated.embeddings = Mock(wraps=populated.embeddings)
+        populated.add_texts(["unrelated text"], [{}], vectors=[[1.0, 0.0, 0.0]])
+        populated.embeddings.embed_documents.assert_not_called()
+        hits = {d.page_content for d in populated.search("paris", k=2)}
+        assert "unrelated text" in hits
+
     def test_add_texts_empty_is_noop(self, populated):
         assert populated.add_texts([], []) == []
         assert populated.index.ntotal == 3
@@ -141,22 +158,94 @@ class TestFaissStore:
 
 @pytest.mark.unit
 class TestFaissPersistence:
-    def test_save_writes_both_sidecars(self, populated, storage, tmp_path):
-        for name in ("index.faiss", "index.json", "index.pkl"):
+    def test_save_writes_binary_sidecar(self, populated, storage, tmp_path):
+        for name in ("index.faiss", "index.docs", "index.bm25"):
             assert storage.file_exists(f"indexes/src/{name}"), name
+        # The pickle is opt-in legacy output; JSON is read but no longer written.
+        assert not storage.file_exists("indexes/src/index.pkl")
+        assert not storage.file_exists("indexes/src/index.json")
 
-    def test_reload_prefers_json_sidecar(self, populated, make_store, storage):
+    def test_reload_reads_binary_sidecar(self, populated, make_store, storage):
         reloaded = make_store()
         assert len(reloaded.get_chunks()) == 3
         assert reloaded.index.ntotal == 3
         assert "Paris" in str(reloaded.search("Paris", k=1)[0])
+        assert reloaded.search("Paris", k=1)[0].metadata == {"source": "geo.txt"}
 
-    def test_reload_falls_back_to_legacy_pickle(self, populated, make_store, storage, tmp_path):
-        (tmp_path / "indexes" / "src" / "index.json").unlink()
+    def test_reload_falls_back_to_json_sidecar(self, populated, make_store, tmp_path):
+        from application.vectorstore.faiss_docstore import dump_json_sidecar
+
+        directory = tmp_path / "indexes" / "src"
+        (directory / "index.json").write_bytes(
+            dump_json_sidecar(dict(populated.documents), populated.index_to_docstore_id)
+        )
+        (directory / "index.docs").unlink()
         reloaded = make_store()
         assert len(reloaded.get_chunks()) == 3
         assert "Paris" in str(reloaded.search("Paris", k=1)[0])
 
+    def test_reload_falls_back_to_legacy_pickle(self, populated, make_store, tmp_path):
+        from application.vectorstore.faiss_docstore import dump_pickle_sidecar
+
+        directory = tmp_path / "indexes" / "src"
+        (directory / "index.pkl").write_bytes(
+            dump_pickle_sidecar(dict(populated.documents), populated.index_to_docstore_id)
+        )
+        (directory / "index.docs").unlink()
+        reloaded = make_store()
+        assert len(reloaded.get_chunks()) == 3
+        assert "Paris" in str(reloaded.search("Paris", k=1)[0])
+
+    def test_uploaded_index_replaces_segments_and_stale_sidecars(
+        self, populated, make_store, storage, tmp_path
+    ):
+        from application.vectorstore.faiss import replace_index_files
+        from application.vectorstore.faiss_docstore import dump_pickle_sidecar
+
+        populated.add_chunk("Redis caches things.", {})
+        other = make_store(
+            source_id="other",
+            docs_init=[_SeedDoc("Kafka streams events.", {"source": "mq.txt"})],
+        )
+        other.save_local()
+        src = tmp_path / "indexes" / "src"
+        assert (src / "index.delta").exists() and (src / "index.bm25").exists()
+
+        replace_index_files(
+            storage,
+            "indexes/src",
+            {
+                "index.faiss": io.BytesIO(
+                    (tmp_path / "indexes" / "other" / "index.faiss").read_bytes()
+                ),
+                "index.pkl": io.BytesIO(
+                    dump_pickle_sidecar(dict(other.documents), other.index_to_docstore_id)
+                ),
+            },
+        )
+
+        assert sorted(p.name for p in src.iterdir() if p.is_file()) == [
+            "index.faiss", "index.pkl",
+        ]
+        assert list((src / "index.delta").iterdir()) == []
+        reloaded = make_store()
+        assert set(reloaded.documents) == set(other.documents)
+        assert "Kafka" in reloaded.keyword_search("kafka")[0].page_content
+
+    def test_pickle_sidecar_is_opt_in(self, populated, storage):
+        with patch("application.vectorstore.faiss.settings") as mock_settings:
+            mock_settings.FAISS_WRITE_PICKLE_SIDECAR = True
+            populated.save_local()
+        assert storage.file_exists("indexes/src/index.pkl")
+
+    def test_full_save_removes_stale_sidecars(self, populated, storage, tmp_path):
+        directory = tmp_path / "indexes" / "src"
+        (directory / "index.json").write_text("{}")
+        (directory / "index.pkl").write_bytes(b"stale")
+        populated.save_local()
+        assert not storage.file_exists("indexes/src/index.json")
+        assert not storage.file_exists("indexes/src/index.pkl")
+
     def test_missing_index_raises(self, make_store):
         with pytest.raises(Exception, match="Error loading FAISS index"):
             make_store(source_id="never-written")
@@ -165,14 +254,253 @@ class TestFaissPersistence:
         target = tmp_path / "exported"
         populated.save_local(str(target))
         assert {p.name for p in target.iterdir()} == {
-            "index.faiss", "index.json", "index.pkl"
+            "index.faiss", "index.docs", "index.bm25"
         }
 
-    def test_json_sidecar_is_readable_json(self, populated, tmp_path):
-        payload = json.loads((tmp_path / "indexes" / "src" / "index.json").read_text())
-        assert payload["version"] == 1
-        assert len(payload["documents"]) == 3
-        assert len(payload["index_to_docstore_id"]) == 3
+
+@pytest.mark.unit
+class TestFaissDeltaLog:
+    @staticmethod
+    def _segments(tmp_path):
+        directory = tmp_path / "indexes" / "src" / "index.delta"
+        return sorted(p.name for p in directory.iterdir()) if directory.exists() else []
+
+    def test_add_chunk_writes_segment_not_base(self, populated, tmp_path):
+        sidecar = tmp_path / "indexes" / "src" / "index.docs"
+        before = sidecar.read_bytes()
+        populated.add_chunk("Redis caches things.", {"source": "cache.txt"})
+        assert sidecar.read_bytes() == before
+        assert len(self._segments(tmp_path)) == 1
+
+    def test_reload_replays_segments(self, populated, make_store):
+        chunk_id = populated.add_chunk("Redis caches things.", {"source": "cache.txt"})
+        populated.delete_chunk(populated.get_chunks()[0]["doc_id"])
+        reloaded = make_store()
+        assert reloaded.index.ntotal == 3
+        assert {c["doc_id"] for c in reloaded.get_chunks()} == set(populated.documents)
+        assert reloaded.documents[chunk_id]["metadata"] == {"source": "cache.txt"}
+        assert reloaded.keyword_search("redis")[0].metadata["source"] == "cache.txt"
+        # The vector came from the segment, not a fresh embedding.
+        reloaded.embeddings = Mock(wraps=reloaded.embeddings)
+        assert reloaded.search("redis", k=1)
+        reloaded.embeddings.embed_documents.assert_not_called()
+
+    def test_reload_applies_deletes_in_one_pass(self, populated, make_store):
+        from application.vectorstore.faiss import FaissStore
+
+        first, second = [c["doc_id"] for c in populated.get_chunks()[:2]]
+        populated.delete_chunk(first)
+        populated.add_chunk("Redis caches things.", {})
+        populated.delete_chunk(second)
+        with patch.object(
+            FaissStore, "delete_index", autospec=True, side_effect=FaissStore.delete_index
+        ) as delete_index:
+            reloaded = make_store()
+        delete_index.assert_called_once()
+        assert sorted(delete_index.call_args.args[1]) == sorted([first, second])
+        assert set(reloaded.documents) == set(populated.documents)
+        assert reloaded.index.ntotal == 2
+        assert "Redis" in reloaded.search("redis", k=1)[0].page_content
+
+    def test_full_save_compacts_segments(self, populated, make_store, tmp_path):
+        populated.add_chunk("Redis caches things.", {})
+        populated.save_local()
+        assert self._segments(tmp_path) == []
+        assert make_store().index.ntotal == 4
+
+    def test_segment_limit_triggers_compaction(self, populated, make_store, tmp_path):
+        with patch("application.vectorstore.faiss.settings") as mock_settings:
+            mock_settings.FAISS_DELTA_MAX_SEGMENTS = 2
+            for n in range(3):
+                populated.add_chunk(f"Redis note {n}", {})
+            assert self._segments(tmp_path) == []
+            populated.add_chunk("Redis note 3", {})
+        assert len(self._segments(tmp_path)) == 1
+        assert make_store().index.ntotal == 7
+
+    def test_zero_limit_saves_in_full(self, populated, tmp_path):
+        with patch("application.vectorstore.faiss.settings") as mock_settings:
+            mock_settings.FAISS_DELTA_MAX_SEGMENTS = 0
+            populated.add_chunk("Redis caches things.", {})
+        assert self._segments(tmp_path) == []
+
+    def test_unsaved_store_saves_in_full(self, make_store, storage, tmp_path):
+        store = make_store(docs_init=[_SeedDoc("only doc", {})])
+        store.add_chunk("Redis caches things.", {})
+        assert storage.file_exists("indexes/src/index.docs")
+        assert self._segments(tmp_path) == []
+
+    def test_segment_versions_key_the_cache(self, populated, make_store, index_cache):
+        reader = make_store()
+        make_store().add_chunk("Redis caches things.", {})
+        assert make_store().index is not reader.index
+        assert make_store().index.ntotal == 4
+
+
+@pytest.mark.unit
+class TestFaissIndexCaching:
+    def test_second_load_is_served_from_cache(self, populated, make_store, index_cache):
+        first = make_store()
+        second = make_store()
+        assert second.index is first.index
+        assert index_cache.stats()["hits"] == 1
+        assert "Paris" in str(second.search("Paris", k=1)[0])
+
+    def test_write_invalidates_and_reload_sees_it(self, populated, make_store, index_cache):
+        writer = make_store()
+        writer.add_chunk("Redis caches things.", {})
+        assert index_cache.stats()["invalidations"] == 1
+        assert make_store().index.ntotal == 4
+
+    def test_mutation_does_not_leak_into_shared_entry(self, populated, make_store):
+        reader = make_store()
+        writer = make_store()
+        writer.add_texts(["Redis caches things."], [{}])
+        writer.delete_index([writer.get_chunks()[0]["doc_id"]])
+        assert writer.index is not reader.index
+        assert reader.index.ntotal == 3
+        assert len(reader.get_chunks()) == 3
+
+    def test_disabled_cache_always_loads(self, populated, make_store, monkeypatch):
+        from application.vectorstore import faiss_index_cache
+
+        monkeypatch.setattr(faiss_index_cache, "_CACHE", None)
+        monkeypatch.setattr(faiss_index_cache, "resolve_max_bytes", lambda: 0)
+        assert make_store().index is not make_store().index
+
+
+@pytest.mark.unit
+class TestFaissKeywordSearch:
+    def test_keyword_search_ranks_by_terms(self, populated):
+        hits = populated.keyword_search("relational database", k=2)
+        assert hits[0].metadata["source"] == "db.txt"
+
+    def test_keyword_search_no_match(self, populated):
+        assert populated.keyword_search("kubernetes") == []
+
+    def test_added_and_deleted_chunks_are_reflected(self, populated):
+        chunk_id = populated.add_chunk("Redis caches things.", {"source": "cache.txt"})
+        assert populated.keyword_search("redis")[0].metadata["source"] == "cache.txt"
+        populated.delete_chunk(chunk_id)
+        assert populated.keyword_search("redis") == []
+
+    def test_reload_reads_persisted_index_on_first_search(
+        self, populated, make_store, storage
+    ):
+        with patch.object(storage, "get_file", wraps=storage.get_file) as get_file:
+            reloaded = make_store()
+            assert reloaded.keyword_index is None
+            assert not any(
+                call.args[0].endswith("index.bm25") for call in get_file.call_args_list
+            )
+            hits = reloaded.keyword_search("background tasks")
+        assert "Celery" in hits[0].page_content
+        assert get_file.call_args_list[-1].args[0] == "indexes/src/index.bm25"
+        # Read once per process: the cache entry now carries it.
+        assert make_store().keyword_index is reloaded.keyword_index
+
+    def test_stored_index_picks_up_delta_segments(self, populated, make_store):
+        chunk_id = populated.add_chunk("Redis caches things.", {"source": "cache.txt"})
+        reloaded = make_store()
+        assert reloaded.keyword_search("redis")[0].metadata["source"] == "cache.txt"
+        populated.delete_chunk(chunk_id)
+        assert make_store().keyword_search("redis") == []
+
+    def test_legacy_index_without_bm25_builds_once(self, populated, make_store, tmp_path):
+        (tmp_path / "indexes" / "src" / "index.bm25").unlink()
+        first = make_store()
+        assert first.keyword_index is None
+        assert "Paris" in first.keyword_search("france")[0].page_content
+        # The lazily built index lands on the shared cache entry.
+        assert make_store().keyword_index is first.keyword_index
+
+    def test_mutation_does_not_leak_into_shared_keyword_index(self, populated, make_store):
+        reader = make_store()
+        writer = make_store()
+        writer.add_texts(["Redis caches things."], [{}])
+        assert reader.keyword_search("redis") == []
+        assert writer.keyword_search("redis")
+
+    def test_hybrid_retriever_gets_keyword_hits(self, populated):
+        from application.retriever.hybrid_rag import HybridRetriever
+
+        retriever = HybridRetriever.__new__(HybridRetriever)
+        retriever.include_scores = True
+        fused = retriever._fetch_candidates(populated, "relational database", 2, None)
+        # Ranked first by both halves, so its RRF score sums two terms.
+        top, score = fused[0]
+        assert "relational database" in top.page_content
+        assert score > 1.0 / 60
+
+
+@pytest.mark.unit
+class TestFaissChunksPage:
+    def test_unfiltered_page_slices_the_docstore(self, populated):
+        everything = populated.get_chunks()
+
+        page, total = populated.get_chunks_page(offset=1, limit=1)
+
+        assert total == 3
+        assert page == everything[1:2]
+
+    def test_filters_count_only_matches(self, populated):
+        page, total = populated.get_chunks_page(path_suffix="db.txt")
+        assert total == 1 and page[0]["metadata"]["source"] == "db.txt"
+
+        page, total = populated.get_chunks_page(search="CELERY")
+        assert total == 1 and "Celery" in page[0]["text"]
+
+
+@pytest.mark.unit
+class TestFaissAnnIndexes:
+    @pytest.fixture(autouse=True)
+    def hnsw(self, monkeypatch):
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "hnsw")
+
+    def test_existing_flat_index_migrates_on_save(self, populated, make_store):
+        from application.vectorstore.faiss_index_factory import HNSW, index_kind
+
+        # ``populated`` was built flat-sized and saved, so it is HNSW now.
+        assert index_kind(populated.index) == HNSW
+        reloaded = make_store()
+        assert index_kind(reloaded.index) == HNSW
+        assert "Paris" in str(reloaded.search("Paris", k=1)[0])
+
+    def test_delete_on_ann_index_keeps_rows_aligned(self, populated):
+        paris = next(
+            c["doc_id"] for c in populated.get_chunks() if "Paris" in c["text"]
+        )
+        populated.delete_chunk(paris)
+        hit = populated.search("database", k=1)[0]
+        assert "relational database" in hit.page_content
+        assert "Celery" in populated.search("celery", k=1)[0].page_content
+        assert all("Paris" not in d.page_content for d in populated.search("Paris", k=3))
+
+    def test_ann_delete_is_logical_until_a_full_save(self, populated, make_store):
+        from application.vectorstore import faiss_index_factory
+
+        paris = next(
+            c["doc_id"] for c in populated.get_chunks() if "Paris" in c["text"]
+        )
+        with patch.object(
+            faiss_index_factory, "build_index", side_effect=AssertionError("rebuilt")
+        ):
+            populated.delete_chunk(paris)
+            reloaded = make_store()
+        assert populated.index.ntotal == 3
+        assert [d.page_content for d in reloaded.search("Paris", k=1)] != [
+            "The capital of France is Paris."
+        ]
+        added = populated.add_chunk("Redis caches things.", {})
+        assert populated.search("redis", k=1)[0].page_content == "Redis caches things."
+
+        populated.save_local()
+        assert populated.index.ntotal == 3
+        assert sorted(populated.index_to_docstore_id) == [0, 1, 2]
+        assert added in populated.index_to_docstore_id.values()
+        assert len(make_store().search("Paris", k=3)) == 3
 
 
 @pytest.mark.unit
@@ -9,17 +9,25 @@ Two properties matter here and neither can regress quietly:
 """
 
 import io
+import mmap
 import pickle
 import pickletools
 
+import numpy as np
 import pytest
 
 from application.vectorstore.faiss_docstore import (
+    DELTA_ADD,
+    DELTA_DELETE,
     CompatUnpickler,
     LegacyDocstore,
     LegacyDocument,
+    dump_binary_sidecar,
+    dump_delta_segment,
     dump_json_sidecar,
     dump_pickle_sidecar,
+    load_binary_sidecar,
+    load_delta_segment,
     load_json_sidecar,
     load_pickle_sidecar,
 )
@@ -169,6 +177,82 @@ class TestJsonSidecar:
         assert documents == {} and mapping == {}
 
 
+@pytest.mark.unit
+class TestBinarySidecar:
+    def test_round_trip(self):
+        documents, mapping = load_binary_sidecar(dump_binary_sidecar(DOCUMENTS, MAPPING))
+        assert dict(documents) == DOCUMENTS
+        assert mapping == MAPPING
+
+    def test_reads_from_mmap(self, tmp_path):
+        path = tmp_path / "index.docs"
+        path.write_bytes(dump_binary_sidecar(DOCUMENTS, MAPPING))
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        documents, _ = load_binary_sidecar(mapped)
+        assert documents["id-2"]["page_content"] == "Postgres is a database."
+
+    def test_unmapped_documents_are_kept(self):
+        documents, mapping = load_binary_sidecar(dump_binary_sidecar(DOCUMENTS, {0: "id-2"}))
+        assert set(documents) == {"id-1", "id-2"}
+        assert mapping == {0: "id-2"}
+
+    def test_unicode_and_empty_metadata(self):
+        source = {"id": {"page_content": "café — naïve 日本語", "metadata": {}}}
+        documents, _ = load_binary_sidecar(dump_binary_sidecar(source, {0: "id"}))
+        assert documents["id"] == source["id"]
+
+    def test_empty_index(self):
+        documents, mapping = load_binary_sidecar(dump_binary_sidecar({}, {}))
+        assert len(documents) == 0 and mapping == {}
+
+    def test_rejects_other_formats(self):
+        with pytest.raises(ValueError):
+            load_binary_sidecar(dump_json_sidecar(DOCUMENTS, MAPPING))
+
+    def test_rejects_truncated_file(self):
+        data = dump_binary_sidecar(DOCUMENTS, MAPPING)
+        with pytest.raises(ValueError):
+            load_binary_sidecar(data[:-5])
+
+    def test_writes_go_to_overlay_and_copy_is_independent(self):
+        documents, _ = load_binary_sidecar(dump_binary_sidecar(DOCUMENTS, MAPPING))
+        clone = documents.copy()
+        clone["id-3"] = {"page_content": "new", "metadata": {}}
+        del clone["id-1"]
+        assert set(clone) == {"id-2", "id-3"} and len(clone) == 2
+        assert set(documents) == {"id-1", "id-2"} and len(documents) == 2
+        with pytest.raises(KeyError):
+            del clone["id-1"]
+
+    def test_overwritten_chunk_is_not_listed_twice(self):
+        documents, _ = load_binary_sidecar(dump_binary_sidecar(DOCUMENTS, MAPPING))
+        documents["id-1"] = {"page_content": "edited", "metadata": {}}
+        assert sorted(documents) == ["id-1", "id-2"]
+        assert documents["id-1"]["page_content"] == "edited"
+
+
+@pytest.mark.unit
+class TestDeltaSegment:
+    def test_add_round_trip(self):
+        data = dump_delta_segment(
+            DELTA_ADD, ["id-3"], [{"page_content": "Redis", "metadata": {"a": 1}}], [[0.5, 1.0]]
+        )
+        op, ids, documents, vectors = load_delta_segment(data)
+        assert op == DELTA_ADD and ids == ["id-3"]
+        assert documents == [{"page_content": "Redis", "metadata": {"a": 1}}]
+        np.testing.assert_array_equal(vectors, np.array([[0.5, 1.0]], dtype=np.float32))
+
+    def test_delete_round_trip(self):
+        op, ids, documents, vectors = load_delta_segment(dump_delta_segment(DELTA_DELETE, ["id-1"]))
+        assert op == DELTA_DELETE and ids == ["id-1"]
+        assert documents == [] and len(vectors) == 0
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            load_delta_segment(b"not a segment at all")
+
+
 @pytest.mark.unit
 class TestRealLegacyFixture:
     """The index.pkl checked into the repo was written by langchain in 2025."""
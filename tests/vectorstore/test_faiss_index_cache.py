@@ -0,0 +1,61 @@
+"""Tests for the process-wide FAISS index cache (LRU, versions, counters)."""
+
+from unittest.mock import patch
+
+import pytest
+
+from application.vectorstore import faiss_index_cache
+from application.vectorstore.faiss_index_cache import CachedIndex, FaissIndexCache
+
+
+def _entry(version="v1", nbytes=10):
+    return CachedIndex(
+        version=version, index=object(), documents={}, index_to_docstore_id={},
+        nbytes=nbytes,
+    )
+
+
+@pytest.mark.unit
+class TestFaissIndexCache:
+    def test_hit_and_miss_counters(self):
+        cache = FaissIndexCache(max_bytes=100)
+        assert cache.get("a", "v1") is None
+        entry = _entry()
+        cache.put("a", entry)
+        assert cache.get("a", "v1") is entry
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_version_mismatch_drops_entry(self):
+        cache = FaissIndexCache(max_bytes=100)
+        cache.put("a", _entry("v1"))
+        assert cache.get("a", "v2") is None
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["bytes"] == 0
+
+    def test_lru_eviction_by_bytes(self):
+        cache = FaissIndexCache(max_bytes=25)
+        cache.put("a", _entry(nbytes=10))
+        cache.put("b", _entry(nbytes=10))
+        cache.get("a", "v1")  # "b" is now least recently used
+        cache.put("c", _entry(nbytes=10))
+        assert cache.get("b", "v1") is None
+        assert cache.get("a", "v1") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_entry_is_not_cached(self):
+        cache = FaissIndexCache(max_bytes=5)
+        cache.put("a", _entry(nbytes=10))
+        assert cache.stats()["entries"] == 0
+
+    def test_invalidate(self):
+        cache = FaissIndexCache(max_bytes=100)
+        cache.put("a", _entry())
+        cache.invalidate("a")
+        assert cache.get("a", "v1") is None
+        assert cache.stats()["invalidations"] == 1
+
+    def test_resolve_max_bytes_ignores_non_int(self):
+        with patch("application.core.settings.settings") as mock_settings:
+            mock_settings.FAISS_INDEX_CACHE_MAX_BYTES = "lots"
+            assert faiss_index_cache.resolve_max_bytes() == faiss_index_cache.DEFAULT_MAX_BYTES
@@ -0,0 +1,107 @@
+"""Tests for FAISS index-type selection, training and migration."""
+
+import numpy as np
+import pytest
+
+from application.core.settings import settings
+from application.vectorstore import faiss_index_factory as factory
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(1).random((2000, 8), dtype=np.float32)
+
+
+@pytest.mark.unit
+class TestDesiredKind:
+    def test_auto_stays_flat_below_threshold(self, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "auto")
+        monkeypatch.setattr(settings, "FAISS_ANN_MIN_VECTORS", 1000)
+        monkeypatch.setattr(settings, "FAISS_ANN_INDEX", "hnsw")
+        assert factory.desired_kind(999) == factory.FLAT
+        assert factory.desired_kind(1000) == factory.HNSW
+
+    def test_ivf_falls_back_to_flat_without_enough_training_points(self, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "ivf_pq")
+        assert factory.desired_kind(100) == factory.FLAT
+        assert factory.desired_kind(256 * 39) == factory.IVF_PQ
+
+    def test_unknown_type_is_flat(self, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "annoy")
+        assert factory.desired_kind(10_000_000) == factory.FLAT
+
+
+@pytest.mark.unit
+class TestBuildIndex:
+    @pytest.mark.parametrize("kind", [factory.FLAT, factory.IVF_FLAT, factory.HNSW])
+    def test_build_and_search(self, kind, vectors):
+        index = factory.build_index(kind, vectors)
+        assert factory.index_kind(index) == kind
+        assert index.ntotal == len(vectors)
+        _, rows = index.search(vectors[:1], 1)
+        assert rows[0][0] == 0
+
+    def test_search_params_are_set_and_pinnable(self, vectors, monkeypatch):
+        import faiss
+
+        index = factory.build_index(factory.IVF_FLAT, vectors)
+        ivf = faiss.extract_index_ivf(index)
+        assert ivf.nprobe == max(1, int(ivf.nlist ** 0.5))
+
+        monkeypatch.setattr(settings, "FAISS_IVF_NPROBE", 3)
+        factory.apply_search_params(index)
+        assert ivf.nprobe == 3
+
+        monkeypatch.setattr(settings, "FAISS_HNSW_EF_SEARCH", 99)
+        assert factory.build_index(factory.HNSW, vectors).hnsw.efSearch == 99
+
+    def test_training_uses_a_bounded_sample(self, vectors, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_TRAIN_SAMPLE_SIZE", 500)
+        index = factory.build_index(factory.IVF_FLAT, vectors)
+        assert index.is_trained
+        assert index.ntotal == len(vectors)
+
+    def test_migrate_flat_to_hnsw_preserves_vectors(self, vectors, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "hnsw")
+        flat = factory.build_index(factory.FLAT, vectors)
+        migrated = factory.migrate_if_needed(flat)
+        assert factory.index_kind(migrated) == factory.HNSW
+        np.testing.assert_allclose(factory.reconstruct_all(migrated), vectors)
+
+    def test_migrate_is_noop_when_kind_matches(self, vectors, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "flat")
+        flat = factory.build_index(factory.FLAT, vectors)
+        assert factory.migrate_if_needed(flat) is flat
+
+
+@pytest.mark.unit
+class TestRemoveRows:
+    def test_flat_compacts_in_place(self, vectors):
+        flat = factory.build_index(factory.FLAT, vectors)
+        assert factory.remove_rows(flat, {0, 5}) is flat
+        np.testing.assert_allclose(
+            factory.reconstruct_all(flat), np.delete(vectors, [0, 5], axis=0)
+        )
+
+    def test_ivf_keeps_its_training(self, vectors, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "ivf_flat")
+        index = factory.build_index(factory.IVF_FLAT, vectors)
+        monkeypatch.setattr(
+            factory, "build_index", lambda *a, **k: pytest.fail("retrained")
+        )
+        smaller = factory.remove_rows(index, {3})
+        assert factory.index_kind(smaller) == factory.IVF_FLAT
+        assert smaller.ntotal == len(vectors) - 1
+        np.testing.assert_allclose(
+            factory.reconstruct_all(smaller), np.delete(vectors, 3, axis=0)
+        )
+        _, rows = smaller.search(vectors[4:5], 1)
+        assert rows[0][0] == 3
+
+    def test_hnsw_is_rebuilt_with_dense_rows(self, vectors, monkeypatch):
+        monkeypatch.setattr(settings, "FAISS_INDEX_TYPE", "hnsw")
+        index = factory.build_index(factory.HNSW, vectors)
+        smaller = factory.remove_rows(index, {0})
+        assert factory.index_kind(smaller) == factory.HNSW
+        _, rows = smaller.search(vectors[1:2], 1)
+        assert rows[0][0] == 0
@@ -0,0 +1,103 @@
+"""Tests for the in-process BM25 index behind FaissStore.keyword_search."""
+
+import json
+
+import pytest
+
+from application.vectorstore.faiss_keyword_index import BM25Index, tokenize
+
+
+@pytest.fixture
+def index():
+    idx = BM25Index()
+    idx.add("geo", "The capital of France is Paris.")
+    idx.add("db", "Postgres is a relational database; the database stores rows.")
+    idx.add("queue", "Celery runs background tasks from a queue.")
+    return idx
+
+
+@pytest.mark.unit
+class TestTokenize:
+    def test_lowercases_and_drops_stopwords(self):
+        assert tokenize("The Capital of FRANCE") == ["capital", "france"]
+
+    def test_empty_text(self):
+        assert tokenize("") == []
+        assert tokenize(None) == []
+
+
+@pytest.mark.unit
+class TestBM25Index:
+    def test_search_ranks_matching_doc_first(self, index):
+        assert index.search("which database?", k=3)[0][0] == "db"
+
+    def test_unmatched_query_returns_empty(self, index):
+        assert index.search("kubernetes", k=3) == []
+
+    def test_stopword_only_query_returns_empty(self, index):
+        assert index.search("the of is", k=3) == []
+
+    def test_k_limits_results_and_orders_by_score(self, index):
+        index.add("db2", "database")
+        hits = index.search("database paris", k=2)
+        assert len(hits) == 2
+        assert hits[0][1] >= hits[1][1]
+
+    def test_higher_term_frequency_scores_higher(self):
+        idx = BM25Index()
+        idx.add("once", "redis cache layer for sessions")
+        idx.add("twice", "redis cache backed by redis cluster")
+        assert idx.search("redis", k=2)[0][0] == "twice"
+
+    def test_remove_hides_document(self, index):
+        index.remove(["db"])
+        assert len(index) == 2
+        assert index.search("database", k=3) == []
+
+    def test_remove_unknown_id_is_ignored(self, index):
+        index.remove(["missing"])
+        assert len(index) == 3
+
+    def test_re_adding_replaces_previous_text(self, index):
+        index.add("geo", "Berlin is in Germany.")
+        assert index.search("paris", k=3) == []
+        assert index.search("berlin", k=3)[0][0] == "geo"
+
+    def test_compact_renumbers_and_keeps_results(self, index):
+        index.remove(["geo"])
+        index.compact()
+        assert len(index._doc_ids) == 2
+        assert index.search("celery", k=1)[0][0] == "queue"
+
+    def test_roundtrip_through_bytes(self, index):
+        index.remove(["queue"])
+        restored = BM25Index.from_bytes(index.to_bytes())
+        assert len(restored) == 2
+        assert restored.search("database", k=3) == index.search("database", k=3)
+        assert restored.search("celery", k=3) == []
+
+    def test_serializing_leaves_tombstones_in_place(self, index):
+        index.remove(["geo"])
+        slots = list(index._doc_ids)
+        restored = BM25Index.from_bytes(index.to_bytes())
+        assert index._doc_ids == slots
+        assert len(restored._doc_ids) == 2
+
+    def test_serialized_form_is_json(self, index):
+        payload = json.loads(index.to_bytes())
+        assert payload["version"] == 1
+        assert payload["doc_ids"] == ["geo", "db", "queue"]
+
+    def test_copy_is_independent(self, index):
+        clone = index.copy()
+        clone.add("cache", "Redis caches things.")
+        clone.remove(["geo"])
+        assert index.search("redis", k=3) == []
+        assert index.search("paris", k=1)[0][0] == "geo"
+
+    def test_from_documents_uses_page_content(self):
+        idx = BM25Index.from_documents(
+            {"a": {"page_content": "alpha beta", "metadata": {}}, "b": {"metadata": {}}}
+        )
+        assert len(idx) == 2
+        assert idx.search("alpha", k=2) == [("a", pytest.approx(idx.search("alpha")[0][1]))]
@@ -171,3 +171,33 @@ class TestMilvusUriEnvGuard:
             with _without_milvus_uri_env():
                 assert "MILVUS_URI" not in os.environ
             assert "MILVUS_URI" not in os.environ
+
+
+@pytest.mark.unit
+class TestMilvusChunksPage:
+    @pytest.fixture
+    def many(self, store):
+        store.add_texts(
+            [f"chunk {i}" for i in range(7)],
+            [{"source": f"dir/{'a' if i % 2 else 'b'}.txt", "title": f"T{i}"} for i in range(7)],
+        )
+        return store
+
+    def test_pages_partition_the_source_in_id_order(self, many):
+        ids = sorted(c["doc_id"] for c in many.get_chunks())
+        pages = [many.get_chunks_page(offset=o, limit=3) for o in (0, 3, 6, 9)]
+
+        assert [total for _, total in pages] == [7, 7, 7, 7]
+        assert [c["doc_id"] for page, _ in pages for c in page] == ids
+
+    def test_path_suffix_is_filtered_by_milvus(self, many):
+        page, total = many.get_chunks_page(limit=2, path_suffix="a.txt")
+        assert total == 3 and len(page) == 2
+        assert all(c["metadata"]["source"] == "dir/a.txt" for c in page)
+
+    def test_search_and_unsafe_suffix_are_streamed(self, many):
+        page, total = many.get_chunks_page(search="T4")
+        assert total == 1 and page[0]["text"] == "chunk 4"
+
+        _, total = many.get_chunks_page(path_suffix="%.txt")
+        assert total == 0
@@ -324,3 +324,41 @@ class TestMongoDBSearchWithScores:
         pipeline = mock_collection.aggregate.call_args[0][0]
         assert any("$addFields" in stage for stage in pipeline)
         assert not any("$match" in stage for stage in pipeline)
+
+
+@pytest.mark.unit
+class TestMongoDBVectorStoreGetChunksPage:
+    def test_filters_sorts_and_pages_in_mongo(self):
+        store, mock_collection, _ = _make_mongodb_store(source_id="src")
+        mock_collection.count_documents.return_value = 12
+        cursor = mock_collection.find.return_value.sort.return_value
+        cursor.skip.return_value.limit.return_value = iter(
+            [{"_id": "id3", "text": "t", "embedding": [0.1], "source_id": "src", "title": "x"}]
+        )
+
+        chunks, total = store.get_chunks_page(
+            offset=10, limit=5, path_suffix="a.md", search="Cat."
+        )
+
+        query = mock_collection.count_documents.call_args[0][0]
+        assert query["source_id"] == "src"
+        path, search = query["$and"]
+        assert path["$or"][0] == {"source": {"$regex": r"a\.md$"}}
+        assert search["$or"][0] == {"text": {"$regex": r"Cat\.", "$options": "i"}}
+        cursor.skip.assert_called_once_with(10)
+        cursor.skip.return_value.limit.assert_called_once_with(5)
+        assert total == 12
+        assert chunks == [{"doc_id": "id3", "text": "t", "metadata": {"title": "x"}}]
+
+    def test_page_past_the_end_skips_the_find(self):
+        store, mock_collection, _ = _make_mongodb_store()
+        mock_collection.count_documents.return_value = 3
+
+        assert store.get_chunks_page(offset=3) == ([], 3)
+        mock_collection.find.assert_not_called()
+
+    def test_returns_empty_on_error(self):
+        store, mock_collection, _ = _make_mongodb_store()
+        mock_collection.count_documents.side_effect = Exception("down")
+
+        assert store.get_chunks_page() == ([], 0)
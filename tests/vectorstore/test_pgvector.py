@@ -181,13 +181,65 @@ class TestPGVectorStoreKeywordSearch:
 
     def test_ensure_table_exists_creates_fts_index(self):
         store, mock_conn, mock_cursor, _ = _make_store()
+        mock_cursor.fetchone.return_value = ("s",)
         store._ensure_table_exists()
 
         executed = " ".join(
             str(call.args[0]) for call in mock_cursor.execute.call_args_list
         )
-        assert "documents_text_fts_idx" in executed
-        assert "gin(to_tsvector('english'" in executed
+        assert "text_tsv tsvector GENERATED ALWAYS AS" in executed
+        assert "documents_tsv_idx" in executed
+        assert "USING gin(source_id, text_tsv)" in executed
+
+
+@pytest.mark.unit
+class TestPGVectorStoreGetChunksPage:
+    def test_filters_orders_and_pages_in_sql(self):
+        store, mock_conn, mock_cursor, _ = _make_store(source_id="src1")
+        mock_cursor.fetchall.return_value = [(7, "Hello", {"source": "a.md"})]
+        mock_cursor.fetchone.return_value = (31,)
+
+        chunks, total = store.get_chunks_page(
+            offset=20, limit=10, path_suffix="a.md", search="HeLLo"
+        )
+
+        (page_call, count_call) = mock_cursor.execute.call_args_list
+        sql, params = page_call.args
+        assert "ORDER BY id LIMIT %s OFFSET %s" in sql
+        assert "OVER ()" not in sql
+        assert params == ("src1", 4, "a.md", 4, "a.md", "hello", "hello", 10, 20)
+        count_sql, count_params = count_call.args
+        assert count_sql.startswith("SELECT count(*)")
+        assert count_params == ("src1", 4, "a.md", 4, "a.md", "hello", "hello")
+        assert total == 31
+        assert chunks == [{"doc_id": "7", "text": "Hello", "metadata": {"source": "a.md"}}]
+        mock_conn.commit.assert_called_once()
+
+    def test_after_seeks_on_the_primary_key(self):
+        store, _, mock_cursor, _ = _make_store(source_id="src1")
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = (5,)
+
+        store.get_chunks_page(offset=20, limit=10, after="42")
+
+        sql, params = mock_cursor.execute.call_args_list[0].args
+        assert "id > %s ORDER BY id LIMIT %s" in sql
+        assert "OFFSET" not in sql
+        assert params == ("src1", 42, 10)
+
+    def test_page_past_the_end_still_has_a_total(self):
+        store, _, mock_cursor, _ = _make_store(source_id="src1")
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = (5,)
+
+        assert store.get_chunks_page(offset=50) == ([], 5)
+
+    def test_returns_empty_on_error(self):
+        store, mock_conn, mock_cursor, _ = _make_store()
+        mock_cursor.execute.side_effect = Exception("down")
+
+        assert store.get_chunks_page() == ([], 0)
+        mock_conn.rollback.assert_called_once()
 
 
 @pytest.mark.unit
@@ -131,7 +131,7 @@ class TestBootHookCreatesTheSchema:
             )
             indexes = {row[0] for row in cursor.fetchall()}
         assert "documents_source_id_idx" in indexes
-        assert "documents_text_fts_idx" in indexes
+        assert "documents_tsv_idx" in indexes
         assert PGVectorStore.table_dimension(postgresql) == STUB_DIM
 
     def test_mismatched_model_width_fails_loudly(self, live_dsn, stub_embeddings):
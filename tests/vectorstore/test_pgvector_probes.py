@@ -116,7 +116,7 @@ class TestNoVectorIndexOnEmptyTable:
         assert "USING ivfflat" not in source
         assert "USING hnsw" not in source
         # the non-vector indexes are still expected
-        assert "source_id_idx" in source and "text_fts_idx" in source
+        assert "source_id_idx" in source and "_create_tsv_index" in source
 
 
 @pytest.mark.unit
@@ -180,6 +180,7 @@ class TestCreateSchema:
 
         conn, cursor = MagicMock(), MagicMock()
         conn.cursor.return_value = cursor
+        cursor.fetchone.return_value = ("s",)  # fresh table: generated column
 
         PGVectorStore.create_schema(conn, dimension=8)
 
@@ -188,8 +189,9 @@ class TestCreateSchema:
         assert "CREATE TABLE IF NOT EXISTS documents" in statements
         assert "vector(8)" in statements
         assert "documents_source_id_idx" in statements
-        assert "documents_text_fts_idx" in statements
-        assert cursor.execute.call_count == 4
+        assert "documents_tsv_idx" in statements
+        assert "CREATE TRIGGER" not in statements
+        assert cursor.execute.call_count == 7
         conn.commit.assert_not_called()
 
     def test_ensure_table_exists_locks_then_commits(self):
@@ -0,0 +1,174 @@
+"""Keyword search reads a precomputed, GIN-indexed ``tsvector`` column.
+
+Computing ``to_tsvector`` per row in both the WHERE clause and ``ts_rank``
+made every hybrid query parse the full text of its source. New tables get a
+generated column; tables created before it get a plain column, a trigger and
+a batched background backfill.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from application.vectorstore import pgvector as pgvector_module
+from application.vectorstore.pgvector import PGVectorStore
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    pgvector_module._TSV_READY_CACHE.clear()
+    yield
+    pgvector_module._TSV_READY_CACHE.clear()
+
+
+def _store(conn) -> PGVectorStore:
+    store = PGVectorStore.__new__(PGVectorStore)
+    store._table_name = "documents"
+    store._source_id = "s1"
+    store._text_column = "text"
+    store._metadata_column = "metadata"
+    store._connection = conn
+    store._get_connection = lambda: conn
+    return store
+
+
+def _search_conn(index_valid):
+    """A connection whose catalog probe reports the tsvector index state."""
+    conn, probe, query = MagicMock(), MagicMock(), MagicMock()
+    conn.cursor.return_value = query
+    conn.cursor.return_value.__enter__.return_value = probe
+    probe.fetchone.return_value = (index_valid,) if index_valid is not None else None
+    query.fetchall.return_value = [("hello", {"k": 1}, 0.5)]
+    return conn, probe, query
+
+
+def _statements(cursor):
+    return " ".join(str(c) for c in cursor.execute.call_args_list)
+
+
+@pytest.mark.unit
+class TestKeywordSearchColumn:
+    def test_uses_the_tsvector_column_once_indexed(self):
+        conn, _, query = _search_conn(True)
+
+        docs = _store(conn).keyword_search("hello", k=3)
+
+        sql, params = query.execute.call_args[0]
+        assert "ts_rank(text_tsv," in sql
+        assert "AND text_tsv @@ websearch_to_tsquery" in sql
+        assert "to_tsvector('english', text)" not in sql
+        assert params == ("hello", "s1", "hello", 3)
+        assert [d.page_content for d in docs] == ["hello"]
+
+    def test_falls_back_to_the_expression_until_backfilled(self):
+        for state in (False, None):
+            conn, _, query = _search_conn(state)
+
+            _store(conn).keyword_search("hello")
+
+            sql, _ = query.execute.call_args[0]
+            assert "to_tsvector('english', text) @@" in sql
+
+    def test_readiness_is_cached_once_true(self):
+        conn, probe, _ = _search_conn(True)
+        store = _store(conn)
+
+        store.keyword_search("a")
+        store.keyword_search("b")
+
+        assert probe.execute.call_count == 1
+
+    def test_not_ready_is_rechecked(self):
+        conn, probe, _ = _search_conn(False)
+        store = _store(conn)
+
+        store.keyword_search("a")
+        store.keyword_search("b")
+
+        assert probe.execute.call_count == 2
+
+    def test_probe_failure_rolls_back_and_still_searches(self):
+        conn, probe, query = _search_conn(True)
+        probe.execute.side_effect = RuntimeError("catalog")
+
+        docs = _store(conn).keyword_search("hello")
+
+        conn.rollback.assert_called_once()
+        assert "to_tsvector('english', text)" in query.execute.call_args[0][0]
+        assert len(docs) == 1
+
+
+@pytest.mark.unit
+class TestCreateSchemaOnLegacyTable:
+    def _run(self, trigger_exists):
+        conn, cursor = MagicMock(), MagicMock()
+        conn.cursor.return_value = cursor
+        # attgenerated '' = plain column; then the trigger lookup.
+        cursor.fetchone.side_effect = [("",), (1,) if trigger_exists else None]
+        PGVectorStore.create_schema(conn, dimension=8)
+        return _statements(cursor)
+
+    def test_adds_a_plain_column_and_a_trigger_but_no_index(self):
+        statements = self._run(trigger_exists=False)
+
+        assert "ADD COLUMN IF NOT EXISTS text_tsv tsvector" in statements
+        assert "CREATE OR REPLACE FUNCTION documents_tsv_refresh()" in statements
+        assert "BEFORE INSERT OR UPDATE OF text" in statements
+        # Building the index on a populated table is the backfill's job.
+        assert "documents_tsv_idx" not in statements
+
+    def test_existing_trigger_is_not_recreated(self):
+        assert "CREATE TRIGGER" not in self._run(trigger_exists=True)
+
+
+@pytest.mark.unit
+class TestBackfill:
+    def _conn(self, rows, rowcount=10):
+        conn, cursor = MagicMock(), MagicMock()
+        conn.cursor.return_value = cursor
+        cursor.fetchone.side_effect = rows
+        cursor.rowcount = rowcount
+        return conn, cursor
+
+    def test_fills_in_primary_key_windows_then_indexes_concurrently(self):
+        # lock acquired, plain column, max(id)=25, index absent
+        conn, cursor = self._conn([(True,), ("",), (25,), None])
+
+        filled = PGVectorStore.backfill_tsvector(conn, batch_size=10)
+
+        updates = [
+            c.args[1] for c in cursor.execute.call_args_list if "UPDATE" in c.args[0]
+        ]
+        assert updates == [(0, 10), (10, 20), (20, 30)]
+        assert filled == 30
+        statements = _statements(cursor)
+        assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS documents_tsv_idx" in statements
+        assert "DROP INDEX CONCURRENTLY IF EXISTS documents_text_fts_idx" in statements
+        assert "pg_advisory_unlock" in statements
+
+    def test_invalid_index_from_a_failed_build_is_rebuilt(self):
+        conn, cursor = self._conn([(True,), ("",), (0,), (False,)])
+
+        PGVectorStore.backfill_tsvector(conn)
+
+        statements = _statements(cursor)
+        assert "DROP INDEX CONCURRENTLY IF EXISTS documents_tsv_idx" in statements
+        assert "CREATE INDEX CONCURRENTLY" in statements
+
+    def test_defers_to_a_running_backfill(self):
+        conn, cursor = self._conn([(False,)])
+
+        assert PGVectorStore.backfill_tsvector(conn) is None
+        assert "UPDATE" not in _statements(cursor)
+
+    def test_pending_only_for_a_plain_unindexed_column(self):
+        conn, _ = self._conn([("",), None])
+        assert PGVectorStore.tsvector_backfill_pending(conn) is True
+
+        conn, _ = self._conn([("",), (True,)])
+        assert PGVectorStore.tsvector_backfill_pending(conn) is False
+
+        conn, _ = self._conn([("s",)])
+        assert PGVectorStore.tsvector_backfill_pending(conn) is False
@@ -181,3 +181,32 @@ class TestQdrantClientKwargs:
         assert kwargs["url"] == "http://qdrant:6333"
         assert kwargs["api_key"] == "secret"
         assert "location" not in kwargs
+
+
+@pytest.mark.unit
+class TestQdrantChunksPage:
+    @pytest.fixture
+    def many(self, store):
+        store.add_texts(
+            [f"chunk {i}" for i in range(7)],
+            [{"source": f"dir/{'a' if i % 2 else 'b'}.txt", "title": f"T{i}"} for i in range(7)],
+        )
+        return store
+
+    def test_pages_partition_the_source_in_id_order(self, many):
+        ids = sorted(c["doc_id"] for c in many.get_chunks())
+        pages = [many.get_chunks_page(offset=o, limit=3) for o in (0, 3, 6, 9)]
+
+        assert [total for _, total in pages] == [7, 7, 7, 7]
+        assert [c["doc_id"] for page, _ in pages for c in page] == ids
+
+    def test_path_and_search_filters(self, many):
+        page, total = many.get_chunks_page(limit=2, path_suffix="a.txt")
+        assert total == 3 and len(page) == 2
+
+        page, total = many.get_chunks_page(search="t4")
+        assert total == 1 and page[0]["text"] == "chunk 4"
+
+    def test_returns_empty_when_client_raises(self, many):
+        with patch.object(many._client, "count", side_effect=RuntimeError("down")):
+            assert many.get_chunks_page() == ([], 0)
@@ -0,0 +1,142 @@
+"""Tests for the two-tier query-embedding cache."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from application.vectorstore import query_embedding_cache
+from application.vectorstore.query_embedding_cache import (
+    QueryEmbeddingCache,
+    cache_key,
+    install,
+)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+def _compute():
+    return Mock(side_effect=lambda text: [float(len(text)), 0.5])
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(query_embedding_cache, "_CACHE", None)
+
+
+@pytest.mark.unit
+class TestCacheKey:
+    def test_normalizes_whitespace(self):
+        assert cache_key("m", "  what is docsgpt?\n") == cache_key("m", "what is  docsgpt?")
+
+    def test_scoped_by_model(self):
+        assert cache_key("a", "q") != cache_key("b", "q")
+
+
+@pytest.mark.unit
+class TestQueryEmbeddingCache:
+    def test_second_lookup_is_a_local_hit(self):
+        cache = QueryEmbeddingCache(max_entries=4, ttl=60)
+        compute = _compute()
+        assert cache.get_or_compute("m", "hello", compute) == [5.0, 0.5]
+        assert cache.get_or_compute("m", "hello ", compute) == [5.0, 0.5]
+        compute.assert_called_once()
+        stats = cache.stats()
+        assert (stats["local_hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_lru_eviction(self):
+        cache = QueryEmbeddingCache(max_entries=2, ttl=60)
+        compute = _compute()
+        for text in ("a", "b", "a", "c"):
+            cache.get_or_compute("m", text, compute)
+        cache.get_or_compute("m", "b", compute)  # evicted, recomputed
+        assert compute.call_count == 4
+        assert cache.stats()["evictions"] == 2
+
+    def test_ttl_expiry(self):
+        cache = QueryEmbeddingCache(max_entries=4, ttl=10)
+        compute = _compute()
+        with patch.object(query_embedding_cache.time, "monotonic", return_value=0.0):
+            cache.get_or_compute("m", "q", compute)
+        with patch.object(query_embedding_cache.time, "monotonic", return_value=11.0):
+            cache.get_or_compute("m", "q", compute)
+        assert compute.call_count == 2
+        assert cache.stats()["expirations"] == 1
+
+    def test_redis_tier_shares_across_processes(self):
+        redis = _FakeRedis()
+        with patch("application.cache.get_redis_instance", return_value=redis):
+            first = QueryEmbeddingCache(max_entries=4, ttl=60, use_redis=True)
+            first.get_or_compute("m", "q", _compute())
+            # A second process has an empty LRU but shares Redis.
+            second = QueryEmbeddingCache(max_entries=4, ttl=60, use_redis=True)
+            compute = _compute()
+            assert second.get_or_compute("m", "q", compute) == [1.0, 0.5]
+        compute.assert_not_called()
+        assert second.stats()["redis_hits"] == 1
+        (value,) = redis.store.values()
+        assert len(value) == 8  # two float32s
+
+    def test_redis_errors_degrade_to_local(self):
+        broken = MagicMock()
+        broken.get.side_effect = ConnectionError("down")
+        broken.set.side_effect = ConnectionError("down")
+        with patch("application.cache.get_redis_instance", return_value=broken):
+            cache = QueryEmbeddingCache(max_entries=4, ttl=60, use_redis=True)
+            assert cache.get_or_compute("m", "q", _compute()) == [1.0, 0.5]
+            assert cache.get_or_compute("m", "q", _compute()) == [1.0, 0.5]
+        assert cache.stats()["redis_errors"] == 2
+        assert cache.stats()["local_hits"] == 1
+
+
+@pytest.mark.unit
+class TestInstall:
+    def test_wraps_embed_query_in_place(self):
+        embeddings = Mock()
+        embeddings.embed_query.side_effect = lambda text: [1.0]
+        inner = embeddings.embed_query
+
+        assert install(embeddings, "m") is embeddings
+        embeddings.embed_query("q")
+        embeddings.embed_query("q")
+        assert inner.call_count == 1
+
+    def test_is_idempotent(self):
+        embeddings = Mock()
+        install(embeddings, "m")
+        wrapped = embeddings.embed_query
+        install(embeddings, "m")
+        assert embeddings.embed_query is wrapped
+
+    def test_disabled_when_size_is_zero(self, monkeypatch):
+        from application.core.settings import settings
+
+        monkeypatch.setattr(settings, "QUERY_EMBEDDING_CACHE_SIZE", 0)
+        embeddings = Mock()
+        inner = embeddings.embed_query
+        install(embeddings, "m")
+        assert embeddings.embed_query is inner
+
+    def test_singleton_instances_get_the_cache(self):
+        from application.vectorstore.base import EmbeddingsSingleton, RemoteEmbeddings
+
+        EmbeddingsSingleton._instances = {}
+        with patch("application.vectorstore.base.settings") as mock_settings, patch.object(
+            RemoteEmbeddings, "_embed", return_value=[[0.1, 0.2]]
+        ) as remote_call:
+            mock_settings.EMBEDDINGS_BASE_URL = "http://remote:8080"
+            mock_settings.EMBEDDINGS_KEY = None
+            instance = EmbeddingsSingleton.get_instance("gemma")
+            assert isinstance(instance, RemoteEmbeddings)
+            instance.embed_query("same question")
+            instance.embed_query("same question")
+        EmbeddingsSingleton._instances = {}
+        remote_call.assert_called_once()
@@ -0,0 +1,173 @@
+"""Tests for the pooled, batching and coalescing ``RemoteEmbeddings`` client."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from application.core.settings import settings
+from application.vectorstore import base
+from application.vectorstore.base import RemoteEmbeddings
+
+
+class _FakeServer:
+    """Stand-in for ``Session.post`` embedding each input as ``[float(text)]``."""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.requests = []
+        self.sessions = set()
+        self.inflight = 0
+        self.max_inflight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, session, url, headers=None, json=None, timeout=None):
+        with self._lock:
+            self.requests.append(json["input"])
+            self.sessions.add(id(session))
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.inflight -= 1
+        resp = MagicMock()
+        resp.raise_for_status.return_value = None
+        if self.fail:
+            resp.json.return_value = {"error": "overloaded"}
+            return resp
+        inputs = json["input"] if isinstance(json["input"], list) else [json["input"]]
+        resp.json.return_value = {
+            "data": [
+                {"index": i, "embedding": [float(text)]}
+                for i, text in reversed(list(enumerate(inputs)))
+            ]
+        }
+        return resp
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDINGS_MAX_INPUT_TOKENS", None)
+    monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_MAX_TOKENS", None)
+    fake = _FakeServer()
+
+    def post(session, url, **kwargs):
+        return fake(session, url, **kwargs)
+
+    monkeypatch.setattr(base.requests.Session, "post", post)
+    return fake
+
+
+@pytest.mark.unit
+class TestRequestBatching:
+    def test_splits_by_batch_size_and_keeps_order(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_BATCH_SIZE", 3)
+        emb = RemoteEmbeddings("http://host", "m")
+        docs = [str(i) for i in range(8)]
+
+        vectors = emb.embed_documents(docs)
+
+        assert vectors == [[float(i)] for i in range(8)]
+        assert sorted(server.requests) == [["0", "1", "2"], ["3", "4", "5"], ["6", "7"]]
+
+    def test_small_input_is_one_request(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_BATCH_SIZE", 64)
+        emb = RemoteEmbeddings("http://host", "m")
+
+        emb.embed_documents(["1", "2"])
+
+        assert server.requests == [["1", "2"]]
+
+    def test_token_budget_closes_requests(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_BATCH_SIZE", 64)
+        monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_MAX_TOKENS", 5)
+        encoding = MagicMock()
+        encoding.encode_ordinary.side_effect = lambda text: [0] * len(text)
+        monkeypatch.setattr(base, "get_encoding", lambda: encoding)
+        emb = RemoteEmbeddings("http://host", "m")
+
+        # 3 + 2 tokens fit; the 6-token input exceeds the budget on its own.
+        vectors = emb.embed_documents(["111", "22", "333333", "4"])
+
+        assert vectors == [[111.0], [22.0], [333333.0], [4.0]]
+        assert sorted(server.requests) == [["111", "22"], ["333333"], ["4"]]
+
+    def test_concurrency_is_bounded(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_BATCH_SIZE", 1)
+        monkeypatch.setattr(settings, "EMBEDDINGS_MAX_CONCURRENT_REQUESTS", 2)
+        server.delay = 0.02
+        emb = RemoteEmbeddings("http://host", "m")
+
+        emb.embed_documents([str(i) for i in range(6)])
+
+        assert len(server.requests) == 6
+        assert server.max_inflight == 2
+
+    def test_requests_reuse_one_session(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_BATCH_SIZE", 2)
+        emb = RemoteEmbeddings("http://host", "m")
+
+        emb.embed_documents([str(i) for i in range(6)])
+        emb.embed_query("7")
+
+        assert len(server.sessions) == 1
+
+    def test_sub_batch_error_propagates(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_REQUEST_BATCH_SIZE", 2)
+        server.fail = True
+        emb = RemoteEmbeddings("http://host", "m")
+
+        with pytest.raises(ValueError, match="overloaded"):
+            emb.embed_documents(["1", "2", "3"])
+
+
+@pytest.mark.unit
+class TestQueryCoalescing:
+    def _run_concurrently(self, emb, texts):
+        results, errors = {}, []
+        barrier = threading.Barrier(len(texts))
+
+        def worker(text):
+            barrier.wait()
+            try:
+                results[text] = emb.embed_query(text)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_queries_share_a_request(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_QUERY_COALESCE_MS", 50)
+        emb = RemoteEmbeddings("http://host", "m")
+
+        results, errors = self._run_concurrently(emb, ["1", "2", "3", "4"])
+
+        assert not errors
+        assert results == {t: [float(t)] for t in ["1", "2", "3", "4"]}
+        assert len(server.requests) < 4
+
+    def test_failure_reaches_every_waiter(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_QUERY_COALESCE_MS", 50)
+        server.fail = True
+        emb = RemoteEmbeddings("http://host", "m")
+
+        results, errors = self._run_concurrently(emb, ["1", "2", "3"])
+
+        assert results == {}
+        assert len(errors) == 3
+
+    def test_disabled_by_default(self, server, monkeypatch):
+        monkeypatch.setattr(settings, "EMBEDDINGS_QUERY_COALESCE_MS", 0)
+        emb = RemoteEmbeddings("http://host", "m")
+
+        assert emb.embed_query("5") == [5.0]
+        assert server.requests == ["5"]
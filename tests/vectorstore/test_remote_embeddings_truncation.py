@@ -15,7 +15,7 @@ from application.vectorstore.base import RemoteEmbeddings
 
 
 def _capture_post(monkeypatch):
-    """Patch ``requests.post`` and return a dict recording the sent payload."""
+    """Patch the session's ``post`` and return a dict recording the sent payload."""
     captured = {}
 
     def fake_post(url, headers=None, json=None, timeout=None):
@@ -28,7 +28,7 @@ def _capture_post(monkeypatch):
         }
         return resp
 
-    monkeypatch.setattr(base.requests, "post", fake_post)
+    monkeypatch.setattr(base.requests.Session, "post", staticmethod(fake_post))
     return captured
 
 
@@ -16,6 +16,7 @@ backend-facing write depends on.
 
 from __future__ import annotations
 
+import json
 import uuid
 from io import BytesIO
 from unittest.mock import MagicMock
@@ -313,3 +314,167 @@ class TestIngestWorkerDeterministicSourceId:
             (expected,),
         ).fetchone()
         assert result[0] == 1
+
+
+@pytest.mark.unit
+class TestIngestWorkerStreaming:
+    """``INGEST_STREAMING`` feeds parsed files through chunk/embed stages."""
+
+    def test_streams_files_into_the_embed_stage(
+        self, patch_worker_db, task_self, monkeypatch
+    ):
+        from application import worker
+
+        captured: list[dict] = []
+        _patch_ingest_pipeline(monkeypatch, captured)
+        _spy_chunker(monkeypatch)
+        monkeypatch.setattr(worker.settings, "INGEST_STREAMING", True)
+        monkeypatch.setattr(
+            worker,
+            "count_tokens_docs",
+            lambda docs: sum(len(d.page_content) for d in docs),
+        )
+
+        fake_reader = MagicMock(name="reader")
+        fake_reader.directory_structure = {
+            "a.txt": {"type": "text/plain", "size_bytes": 5},
+            "b.txt": {"type": "text/plain", "size_bytes": 5},
+        }
+
+        def _iter_data(progress_callback=None):
+            for done, name in enumerate(["a.txt", "b.txt"], start=1):
+                yield [Document(text=f"{name} body", extra_info={"source": name})]
+                progress_callback(done, 2)
+
+        fake_reader.iter_data.side_effect = _iter_data
+        monkeypatch.setattr(
+            worker, "SimpleDirectoryReader", lambda *a, **kw: fake_reader
+        )
+        monkeypatch.setattr(
+            worker,
+            "embed_and_store_documents",
+            MagicMock(side_effect=AssertionError("list path used")),
+        )
+        streamed: list = []
+
+        def _embed_stream(chunks, full_path, source_id, task, **kw):
+            streamed.extend(chunks)
+            streamed_kwargs.update(kw)
+            return {"hits": 1}
+
+        streamed_kwargs: dict = {}
+        monkeypatch.setattr(worker, "embed_and_store_stream", _embed_stream)
+
+        task_self.request.id = "task-1"
+
+        worker.ingest_worker(
+            task_self,
+            directory="inputs",
+            formats=[".txt"],
+            job_name="job1",
+            file_path="inputs/eve/job1/a.txt",
+            filename="a.txt",
+            user="eve",
+            file_name_map={"a.txt": "Report A.txt"},
+        )
+
+        assert [c.page_content for c in streamed] == ["a.txt body", "b.txt body"]
+        assert streamed[0].metadata["title"] == "Report A.txt"
+        assert "title" not in streamed[1].metadata
+        assert streamed_kwargs["progress_start"] == 50
+        assert streamed_kwargs["progress_end"] == 100
+        assert streamed_kwargs["attempt_id"] == "task-1"
+        # Parse progress comes from the parse stage thread, so it names
+        # the task explicitly rather than relying on Celery's thread-local.
+        parse_updates = [
+            c.kwargs for c in task_self.update_state.call_args_list
+            if c.kwargs.get("meta", {}).get("status") == "Parsing files"
+        ]
+        assert [u["meta"]["current"] for u in parse_updates] == [25, 50]
+        assert all(u["task_id"] == "task-1" for u in parse_updates)
+
+        payload = captured[0]
+        assert payload["tokens"] == len("a.txt body") + len("b.txt body")
+        structure = json.loads(payload["directory_structure"])
+        assert structure["a.txt"]["display_name"] == "Report A.txt"
+
+    def test_streaming_keeps_parallel_parsing(self, monkeypatch, tmp_path):
+        """The first file is parsed on the calling thread, so the reader
+        forks its parse workers there rather than parsing on the stage thread."""
+        import os
+
+        from application import worker
+        from application.parser.file import parse_pool
+
+        if parse_pool.fork_context() is None:
+            pytest.skip("needs the fork start method")
+        monkeypatch.setattr(worker.settings, "INGEST_PARSE_PROCESSES", 2)
+        monkeypatch.setattr(
+            "application.parser.file.bulk.num_tokens_from_string", len
+        )
+        monkeypatch.setattr(worker, "count_tokens_docs", lambda docs: len(docs))
+
+        class _PidParser:
+            parser_config_set = True
+
+            def parse_file(self, path, errors="ignore"):
+                return f"{path.name} parsed in {os.getpid()}"
+
+            def get_file_metadata(self, path):
+                return {}
+
+        for i in range(3):
+            (tmp_path / f"f{i}.md").write_text("body")
+        reader = worker.SimpleDirectoryReader(
+            input_dir=str(tmp_path), file_extractor={".md": _PidParser()}
+        )
+        chunker = MagicMock(name="chunker")
+        chunker.chunk.side_effect = lambda documents: documents
+        streamed: list = []
+
+        def _embed_stream(chunks, full_path, source_id, task, **kw):
+            streamed.extend(chunks)
+            return {}
+
+        monkeypatch.setattr(worker, "embed_and_store_stream", _embed_stream)
+        task = MagicMock(name="task")
+        task.request.id = "task-1"
+
+        _, tokens = worker._stream_upload(
+            task, reader, chunker, None, "src", "eve", str(tmp_path / "out"),
+        )
+
+        texts = [c.page_content for c in streamed]
+        assert [t.split(" ")[0] for t in texts] == ["f0.md", "f1.md", "f2.md"]
+        assert all(not t.endswith(f" {os.getpid()}") for t in texts)
+        assert tokens == 3
+
+
+@pytest.mark.unit
+class TestParseProgressCallback:
+    def test_pins_the_task_id_when_given(self, monkeypatch):
+        from application import worker
+
+        monkeypatch.setattr(worker, "publish_user_event", MagicMock())
+        task = MagicMock()
+        callback = worker._make_parse_progress_callback(
+            task, "eve", "sid", start_pct=1, end_pct=50, task_id="task-1"
+        )
+        callback(1, 2)
+
+        task.update_state.assert_called_once_with(
+            state="PROGRESS",
+            meta={"current": 25, "status": "Parsing files"},
+            task_id="task-1",
+        )
+
+    def test_defaults_to_the_current_request(self, monkeypatch):
+        from application import worker
+
+        monkeypatch.setattr(worker, "publish_user_event", MagicMock())
+        task = MagicMock()
+        worker._make_parse_progress_callback(
+            task, None, "sid", start_pct=1, end_pct=50
+        )(2, 2)
+
+        assert "task_id" not in task.update_state.call_args.kwargs